@@ -4,7 +4,7 @@ Theme Park Downtime Tracker - Daily Aggregation Script
 Runs daily aggregation job with retry logic.
 
 Usage:
-    python aggregate_daily.py [--date YYYY-MM-DD] [--timezone TZ] [--dry-run]
+    python aggregate_daily.py [--date YYYY-MM-DD] [--timezone TZ] [--workers N] [--dry-run]
 
 Scheduled execution (cron) - Run at 5 AM UTC (1 AM Pacific, after PT day ends):
     10 5 * * * /path/to/aggregate_daily.py  # 5:10 AM UTC = 1:10 AM Pacific
@@ -25,6 +25,7 @@ from processor.aggregation_service import AggregationService
 from database.connection import get_db_connection
 from utils.logger import logger
 from utils.timezone import get_today_pacific
+from utils.config import AGGREGATION_WORKERS
 
 
 def main():
@@ -49,6 +50,12 @@ def main():
         default=0,
         help='Retry attempt number (0=first run at 12:10 AM, 1=1:10 AM, 2=2:10 AM)'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=AGGREGATION_WORKERS,
+        help=f'Worker processes for per-timezone aggregation (default: AGGREGATION_WORKERS={AGGREGATION_WORKERS})'
+    )
     parser.add_argument(
         '--dry-run',
         action='store_true',
@@ -70,6 +77,7 @@ def main():
     logger.info(f"Aggregation date: {aggregation_date}")
     logger.info(f"Timezone filter: {args.timezone or 'all'}")
     logger.info(f"Retry attempt: {args.retry}")
+    logger.info(f"Workers: {args.workers}")
 
     # Check if aggregation already succeeded
     with get_db_connection() as conn:
@@ -104,7 +112,8 @@ def main():
 
             result = aggregation_service.aggregate_daily(
                 aggregation_date=aggregation_date,
-                park_timezone=args.timezone
+                park_timezone=args.timezone,
+                max_workers=args.workers
             )
 
             logger.info("=" * 60)
@@ -5,7 +5,7 @@ Safely deletes raw snapshots older than 24 hours after successful aggregation.
 Also cleans up weather observations older than 30 days.
 
 Usage:
-    python cleanup_raw_data.py [--dry-run] [--force]
+    python cleanup_raw_data.py [--dry-run] [--force] [--batch-size N] [--max-runtime SECONDS]
 
 Safety features:
 - Only deletes data AFTER successful aggregation (checks aggregation_log)
@@ -13,18 +13,48 @@ Safety features:
 - Defaults to keeping 48 hours if no successful aggregation found
 - Weather observations retained for 30 days
 - Provides detailed summary before deletion
+
+On partitioned snapshot tables (database/partitioning.py), whole days older
+than the threshold are removed with DROP PARTITION; only the rows of the
+partial day are deleted.
+
+In compact snapshot storage (database/snapshot_storage.py) ride snapshots
+are removed by deleting the intervals that end before the threshold.
+
+With SNAPSHOT_ARCHIVE_DIR set, ride snapshots and status changes are first
+appended to the columnar archive (database/snapshot_archive.py); if that
+fails nothing is deleted. scripts/maintain_partitions.py archives the same
+way before it drops whole expired days, so this run only adds the rest.
+
+Rows are deleted in small primary-key batches that commit separately, with a
+pause between batches (database/chunked_delete.py), so the collector's
+inserts are never blocked for long. With a runtime cap (--max-runtime or
+CLEANUP_MAX_RUNTIME_SECONDS) a large backlog is worked off over several
+runs; each run continues where the previous one stopped.
 """
 
 import sys
 import argparse
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
 
 # Add backend/src to Python path
 backend_src = Path(__file__).parent.parent / 'src'
 sys.path.insert(0, str(backend_src.absolute()))
 
+from database.chunked_delete import ChunkedDeleter
 from database.connection import get_db_connection
+from database.partitioning import SnapshotPartitionManager
+from database.snapshot_archive import SnapshotArchive, SnapshotArchiver
+from database.snapshot_storage import INTERVALS_TABLE, STORAGE_COMPACT, storage_mode
+from utils.config import (
+    CLEANUP_BATCH_SIZE,
+    CLEANUP_BATCH_SLEEP_MS,
+    CLEANUP_MAX_ROWS_PER_SECOND,
+    CLEANUP_MAX_RUNTIME_SECONDS,
+    SNAPSHOT_ARCHIVE_DIR,
+)
 from utils.logger import logger
 from sqlalchemy import text
 
@@ -133,7 +163,9 @@ def preview_deletion(conn, threshold: datetime, weather_threshold: datetime) ->
     }
 
 
-def execute_cleanup(conn, threshold: datetime, weather_threshold: datetime) -> dict:
+def execute_cleanup(conn, threshold: datetime, weather_threshold: datetime,
+                    archive_dir: str = SNAPSHOT_ARCHIVE_DIR,
+                    deleter: Optional[ChunkedDeleter] = None) -> dict:
     """
     Execute cleanup of raw data.
 
@@ -141,53 +173,65 @@ def execute_cleanup(conn, threshold: datetime, weather_threshold: datetime) -> d
         conn: Database connection
         threshold: Deletion threshold for ride/park data
         weather_threshold: Deletion threshold for weather data
+        archive_dir: Archive ride data here before deleting it (empty = no archive)
+        deleter: Chunked deleter (default: CLEANUP_* settings)
 
     Returns:
-        Dictionary with deleted counts
+        Dictionary with deleted counts, plus "complete" (False if the runtime
+        cap stopped the cleanup; the next run continues it)
     """
-    deleted = {}
-
-    # Delete ride status snapshots
-    snapshots_delete = text("""
-        DELETE FROM ride_status_snapshots
-        WHERE recorded_at < :threshold
-    """)
+    if archive_dir:
+        SnapshotArchiver(conn, SnapshotArchive(archive_dir)).archive_before(threshold)
+
+    if deleter is None:
+        deleter = ChunkedDeleter(
+            conn,
+            batch_size=CLEANUP_BATCH_SIZE,
+            batch_sleep_ms=CLEANUP_BATCH_SLEEP_MS,
+            max_rows_per_second=CLEANUP_MAX_ROWS_PER_SECOND,
+            max_runtime_seconds=CLEANUP_MAX_RUNTIME_SECONDS
+        )
 
-    result = conn.execute(snapshots_delete, {"threshold": threshold})
-    deleted["ride_status_snapshots"] = result.rowcount
-    logger.info(f"Deleted {result.rowcount} ride status snapshots")
+    deleted = {}
+    complete = True
+    partitions = SnapshotPartitionManager(conn)
+
+    if storage_mode(conn) == STORAGE_COMPACT:
+        # Ride status snapshots are a view over intervals; delete the runs that
+        # ended before the threshold (counted as ride_status_snapshots)
+        result = deleter.delete_before(INTERVALS_TABLE, "interval_id", "valid_to", threshold)
+        deleted["ride_status_snapshots"] = result["deleted"]
+        complete = complete and result["complete"]
+        logger.info(f"Deleted {result['deleted']} ride status intervals (compact storage)")
+    else:
+        # Delete ride status snapshots (expired day partitions first)
+        dropped = partitions.drop_expired("ride_status_snapshots", threshold)
+        result = deleter.delete_before("ride_status_snapshots", "snapshot_id", "recorded_at", threshold)
+        deleted["ride_status_snapshots"] = dropped + result["deleted"]
+        complete = complete and result["complete"]
+        logger.info(f"Deleted {dropped + result['deleted']} ride status snapshots ({dropped} by dropping partitions)")
 
     # Delete ride status changes
-    changes_delete = text("""
-        DELETE FROM ride_status_changes
-        WHERE changed_at < :threshold
-    """)
-
-    result = conn.execute(changes_delete, {"threshold": threshold})
-    deleted["ride_status_changes"] = result.rowcount
-    logger.info(f"Deleted {result.rowcount} ride status changes")
-
-    # Delete park activity snapshots
-    park_activity_delete = text("""
-        DELETE FROM park_activity_snapshots
-        WHERE recorded_at < :threshold
-    """)
-
-    result = conn.execute(park_activity_delete, {"threshold": threshold})
-    deleted["park_activity_snapshots"] = result.rowcount
-    logger.info(f"Deleted {result.rowcount} park activity snapshots")
+    result = deleter.delete_before("ride_status_changes", "change_id", "changed_at", threshold)
+    deleted["ride_status_changes"] = result["deleted"]
+    complete = complete and result["complete"]
+    logger.info(f"Deleted {result['deleted']} ride status changes")
+
+    # Delete park activity snapshots (expired day partitions first)
+    dropped = partitions.drop_expired("park_activity_snapshots", threshold)
+    result = deleter.delete_before("park_activity_snapshots", "snapshot_id", "recorded_at", threshold)
+    deleted["park_activity_snapshots"] = dropped + result["deleted"]
+    complete = complete and result["complete"]
+    logger.info(f"Deleted {dropped + result['deleted']} park activity snapshots ({dropped} by dropping partitions)")
 
     # Delete weather observations
-    weather_delete = text("""
-        DELETE FROM weather_observations
-        WHERE observation_time < :threshold
-    """)
-
-    result = conn.execute(weather_delete, {"threshold": weather_threshold})
-    deleted["weather_observations"] = result.rowcount
-    logger.info(f"Deleted {result.rowcount} weather observations")
+    result = deleter.delete_before("weather_observations", "observation_id", "observation_time", weather_threshold)
+    deleted["weather_observations"] = result["deleted"]
+    complete = complete and result["complete"]
+    logger.info(f"Deleted {result['deleted']} weather observations")
 
     deleted["total"] = sum(deleted.values())
+    deleted["complete"] = complete
 
     return deleted
 
@@ -207,6 +251,30 @@ def main():
         action='store_true',
         help='Skip confirmation prompt (use with caution)'
     )
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=CLEANUP_BATCH_SIZE,
+        help=f'Rows per DELETE batch (default: {CLEANUP_BATCH_SIZE})'
+    )
+    parser.add_argument(
+        '--sleep-ms',
+        type=int,
+        default=CLEANUP_BATCH_SLEEP_MS,
+        help=f'Pause between batches in milliseconds (default: {CLEANUP_BATCH_SLEEP_MS})'
+    )
+    parser.add_argument(
+        '--max-rows-per-second',
+        type=int,
+        default=CLEANUP_MAX_ROWS_PER_SECOND,
+        help=f'Throttle deletion to this rate, 0 = unthrottled (default: {CLEANUP_MAX_ROWS_PER_SECOND})'
+    )
+    parser.add_argument(
+        '--max-runtime',
+        type=int,
+        default=CLEANUP_MAX_RUNTIME_SECONDS,
+        help=f'Stop after this many seconds, 0 = no cap (default: {CLEANUP_MAX_RUNTIME_SECONDS})'
+    )
 
     args = parser.parse_args()
 
@@ -259,7 +327,14 @@ def main():
         # Execute cleanup
         logger.info("")
         logger.info("Executing cleanup...")
-        deleted = execute_cleanup(conn, threshold, weather_threshold)
+        deleter = ChunkedDeleter(
+            conn,
+            batch_size=args.batch_size,
+            batch_sleep_ms=args.sleep_ms,
+            max_rows_per_second=args.max_rows_per_second,
+            max_runtime_seconds=args.max_runtime
+        )
+        deleted = execute_cleanup(conn, threshold, weather_threshold, deleter=deleter)
 
         logger.info("=" * 60)
         logger.info("CLEANUP COMPLETE")
@@ -270,6 +345,8 @@ def main():
         logger.info(f"Weather observations deleted: {deleted['weather_observations']:,}")
         logger.info(f"TOTAL records deleted: {deleted['total']:,}")
         logger.info("=" * 60)
+        if not deleted['complete']:
+            logger.warning("Runtime cap reached before all expired rows were deleted - the next run continues")
 
         return 0
 
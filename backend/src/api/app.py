@@ -14,7 +14,9 @@ from api.routes.rides import rides_bp
 from api.routes.trends import trends_bp
 from api.routes.audit import audit_bp
 from api.routes.search import search_bp
+from api.routes.metrics import metrics_bp
 from api.middleware.error_handler import register_error_handlers
+from api.middleware.request_timing import register_request_timing
 from models.base import db_session
 
 
@@ -49,10 +51,14 @@ def create_app() -> Flask:
     app.register_blueprint(trends_bp, url_prefix='/api')
     app.register_blueprint(audit_bp, url_prefix='/api')
     app.register_blueprint(search_bp, url_prefix='/api')
+    app.register_blueprint(metrics_bp, url_prefix='/api')
 
     # Register error handlers
     register_error_handlers(app)
 
+    # Server-Timing header and per-request DB/cache/serialization logging
+    register_request_timing(app)
+
     # SQLAlchemy session teardown (remove scoped_session at end of request)
     @app.teardown_appcontext
     def shutdown_session(exception=None):
@@ -76,7 +82,8 @@ def create_app() -> Flask:
                 "rides": "/api/rides",
                 "trends": "/api/trends",
                 "audit": "/api/audit",
-                "search": "/api/search"
+                "search": "/api/search",
+                "metrics": "/api/metrics"
             }
         })
 
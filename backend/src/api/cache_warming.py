@@ -0,0 +1,136 @@
+"""
+Theme Park Downtime Tracker - Cache Warming Registry
+Route modules declare their cacheable GET endpoints and parameter values;
+warm() renders every combination in-process to fill the query cache.
+
+Each route module registers its endpoints next to the route definitions:
+
+    warmable('/parks/downtime', period=PERIODS, filter=FILTERS,
+             sort_by=PARK_SORTS, limit=['50'])
+
+warm() expands every registration into the cartesian product of its
+parameter values and requests each URL through the Flask test client (no
+network) from a bounded thread pool, so at most `concurrency` queries hit
+MySQL at once. Responses go through the normal route handlers, so the
+entries land in whichever cache backend is configured; with the shared
+(sqlite) backend every gunicorn worker sees them.
+
+Warming runs inside utils.cache.warming(): expired entries are recomputed
+synchronously (never served stale) and the compute time of every cache key
+is reported, so the slowest queries are easy to find.
+"""
+
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlencode
+
+from utils.cache import warming
+from utils.config import DB_POOL_SIZE, WARM_CACHE_CONCURRENCY
+from utils.logger import logger
+
+API_PREFIX = '/api'
+
+# Parameter values shared by several route modules
+FILTERS = ['all-parks', 'disney-universal']
+PERIODS = ['live', 'today', 'yesterday', 'last_week', 'last_month']
+HISTORICAL_PERIODS = ['today', 'yesterday', 'last_week', 'last_month']
+
+
+@dataclass(frozen=True)
+class WarmableEndpoint:
+    """A cacheable GET endpoint and the parameter values to warm it with."""
+    path: str
+    params: Dict[str, tuple] = field(default_factory=dict)
+
+    def urls(self) -> List[str]:
+        """Every combination of parameter values as a request URL."""
+        names = sorted(self.params)
+        urls = []
+        for values in itertools.product(*(self.params[name] for name in names)):
+            query = urlencode(list(zip(names, values)))
+            urls.append(f"{API_PREFIX}{self.path}" + (f"?{query}" if query else ""))
+        return urls
+
+
+@dataclass
+class WarmResult:
+    """Outcome of warming one URL."""
+    url: str
+    status: int
+    seconds: float
+    # (cache key, compute seconds) for each value computed; empty = cache hit
+    computed: List[tuple] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 200
+
+
+_REGISTRY: List[WarmableEndpoint] = []
+
+
+def warmable(path: str, **params: Sequence) -> None:
+    """
+    Register a cacheable endpoint for warming.
+
+    Args:
+        path: Route path without the /api prefix (e.g. '/parks/downtime')
+        **params: Query parameter -> values to warm (cartesian product)
+    """
+    endpoint = WarmableEndpoint(path, {name: tuple(str(v) for v in values) for name, values in params.items()})
+    if endpoint not in _REGISTRY:
+        _REGISTRY.append(endpoint)
+
+
+def warm_targets() -> List[str]:
+    """All registered URLs (imports the route modules to register them)."""
+    import api.app  # noqa: F401 - route modules register their endpoints on import
+
+    return [url for endpoint in _REGISTRY for url in endpoint.urls()]
+
+
+def warm(
+    urls: Optional[List[str]] = None,
+    concurrency: Optional[int] = None,
+    app=None
+) -> List[WarmResult]:
+    """
+    Render URLs in-process so their responses are cached.
+
+    Args:
+        urls: URLs to warm (default: every registered combination)
+        concurrency: Parallel requests, i.e. concurrent DB queries
+            (default: WARM_CACHE_CONCURRENCY, capped at the DB pool size)
+        app: Flask app (default: api.app.create_app())
+
+    Returns:
+        One WarmResult per URL, slowest first
+    """
+    if urls is None:
+        urls = warm_targets()
+    if app is None:
+        from api.app import create_app
+        app = create_app()
+    workers = max(1, min(concurrency or WARM_CACHE_CONCURRENCY, DB_POOL_SIZE))
+
+    def warm_one(url: str) -> WarmResult:
+        started = time.monotonic()
+        with warming() as computed:
+            try:
+                with app.test_client() as client:
+                    status = client.get(url).status_code
+                error = None
+            except Exception as e:
+                status, error = 0, str(e)
+        result = WarmResult(url, status, time.monotonic() - started, list(computed), error)
+        if not result.ok:
+            logger.warning(f"Cache warming failed for {url}: {error or f'HTTP {status}'}")
+        return result
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(warm_one, urls))
+    return sorted(results, key=lambda r: r.seconds, reverse=True)
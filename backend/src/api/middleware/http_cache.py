@@ -0,0 +1,158 @@
+"""
+Theme Park Downtime Tracker - Pre-serialized Response Caching
+Caches final JSON bytes (plain and gzip) with an ETag, and answers
+If-None-Match with 304 Not Modified.
+
+Route handlers that cache a response dict pay for jsonify on every hit,
+which dominates hit latency for large payloads (search index, chart data).
+cached_json_response() caches the serialized bytes instead, so a hit costs
+a cache lookup and a conditional check, and a repeat page load transfers
+only headers.
+
+Freshness: the body carries "cached_at" from when it was computed. The
+response age is sent in the standard Age header rather than as a
+cache_age_seconds body field, so the bytes (and ETag) stay stable.
+"""
+
+import dataclasses
+import decimal
+import gzip
+import hashlib
+import json
+import time
+import uuid
+from datetime import date
+from typing import Any, Callable, Optional
+
+from flask import Response, request
+from werkzeug.http import http_date
+
+from api.middleware.request_timing import add_serialize_time
+from utils.cache import QueryCache, with_cache_freshness
+
+# Bodies smaller than this are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+GZIP_LEVEL = 6
+
+
+class SerializedResponse:
+    """
+    Final JSON bytes for a response, computed once and cached.
+
+    Attributes:
+        body: UTF-8 JSON bytes
+        gzip_body: gzip-compressed body, or None if the body is small
+        etag: Content hash of body (used as a weak ETag)
+        cached_at: Epoch seconds when the payload was computed
+    """
+
+    __slots__ = ('body', 'gzip_body', 'etag', 'cached_at')
+
+    def __init__(self, body: bytes, gzip_body: Optional[bytes], etag: str, cached_at: float):
+        self.body = body
+        self.gzip_body = gzip_body
+        self.etag = etag
+        self.cached_at = cached_at
+
+
+def _json_default(o: Any) -> Any:
+    """Serialize the same extra types as Flask's default JSON provider."""
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def serialize_response(payload: dict[str, Any], cached_at: float) -> SerializedResponse:
+    """
+    Serialize a response payload once, as jsonify would.
+
+    Does not need an app context, so it can run in background cache refreshes.
+
+    Args:
+        payload: Response dictionary
+        cached_at: Epoch seconds when the payload was computed
+
+    Returns:
+        SerializedResponse with body, gzip body and ETag
+    """
+    started = time.perf_counter()
+    payload = with_cache_freshness(payload, cached_at)
+    payload.pop("cache_age_seconds", None)
+    # Match Flask's DefaultJSONProvider output (sorted keys, compact, ASCII)
+    body = json.dumps(
+        payload, default=_json_default, sort_keys=True, separators=(',', ':')
+    ).encode('utf-8') + b'\n'
+    gzip_body = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    add_serialize_time(time.perf_counter() - started)
+    return SerializedResponse(body, gzip_body, etag, cached_at)
+
+
+def json_response(serialized: SerializedResponse) -> Response:
+    """
+    Build a 200 (or 304) response from serialized bytes for the current request.
+
+    - If-None-Match matching the ETag returns 304 with no body
+    - Clients accepting gzip get the pre-compressed body
+    - Cache-Control: no-cache makes browsers revalidate with the ETag
+
+    Args:
+        serialized: Cached serialized response
+
+    Returns:
+        Flask Response
+    """
+    if request.if_none_match.contains_weak(serialized.etag):
+        response = Response(status=304)
+    elif serialized.gzip_body is not None and request.accept_encodings['gzip'] > 0:
+        response = Response(serialized.gzip_body, status=200, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(serialized.body, status=200, mimetype='application/json')
+
+    response.set_etag(serialized.etag, weak=True)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['Age'] = str(max(0, int(time.time() - serialized.cached_at)))
+    return response
+
+
+def cached_json_response(
+    cache: QueryCache,
+    key: str,
+    compute_fn: Callable[[], Optional[dict[str, Any]]],
+    **cache_options
+) -> Optional[Response]:
+    """
+    Serve a cached JSON response, computing and serializing it on a miss.
+
+    Serialized entries are stored under their own key suffix, so they never
+    collide with dict entries cached under the same key (e.g. in a shared
+    cache file that outlives a deploy).
+
+    Args:
+        cache: Query cache to store the serialized response in
+        key: Cache key for the response
+        compute_fn: Function returning the response dict (None = not found)
+        **cache_options: Passed to get_or_compute (serve_stale, epoch, ttl, timeout)
+
+    Returns:
+        Flask Response, or None if compute_fn returned None
+    """
+    def compute_serialized() -> Optional[SerializedResponse]:
+        payload = compute_fn()
+        if payload is None:
+            return None
+        return serialize_response(payload, time.time())
+
+    serialized = cache.get_or_compute(f"{key}:json", compute_serialized, **cache_options)
+    if serialized is None:
+        return None
+    return json_response(serialized)
@@ -0,0 +1,200 @@
+"""
+Theme Park Downtime Tracker - Request Timing Middleware
+Measures where each API request spends its time and reports it in a
+Server-Timing header and a structured "API request" log line.
+
+Per request:
+    total      wall time from before_request to after_request
+    db         time inside cursor.execute, and the number of SQL statements
+               (SQLAlchemy before/after_cursor_execute events; statements
+               that raise are counted via handle_error)
+    serialize  time spent turning payloads into JSON (jsonify and
+               http_cache.serialize_response)
+    cache      query cache lookups made by the request (hit / stale / miss)
+
+Example header:
+    Server-Timing: db;dur=41.2;desc="12 statements", serialize;dur=3.1,
+                   cache;desc="miss", total;dur=52.7
+
+Requests that execute more than REQUEST_STATEMENT_WARN_THRESHOLD statements
+are logged as a warning, so N+1 query patterns (one query per park or ride
+in a loop) show up as soon as they land instead of as a slow page later.
+
+The total is also recorded in the request latency histogram (route and
+period labels) exposed by /api/metrics.
+
+Statements are only attributed to the request whose thread runs them;
+background cache refreshes and scripts are not measured.
+"""
+
+import time
+from typing import Optional
+
+from flask import Flask, Response, g, has_request_context, request
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from api.cache_warming import PERIODS
+from utils.cache import record_lookups, stop_recording_lookups
+from utils.config import REQUEST_STATEMENT_WARN_THRESHOLD
+from utils.logger import log_api_request, logger
+from utils.prometheus import request_latency
+
+
+class RequestTiming:
+    """Timing counters for one request (stored on flask.g)."""
+
+    __slots__ = ('started', 'db_seconds', 'statements', 'serialize_seconds', 'lookups')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.db_seconds = 0.0
+        self.statements = 0
+        self.serialize_seconds = 0.0
+        self.lookups = record_lookups()
+
+    @property
+    def cache_outcome(self) -> Optional[str]:
+        """Worst cache outcome of the request (miss > stale > hit), None if no lookups."""
+        for outcome in ('miss', 'stale', 'hit'):
+            if outcome in self.lookups:
+                return outcome
+        return None
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """Timing counters of the current request, or None outside a timed request."""
+    if not has_request_context():
+        return None
+    return g.get('request_timing')
+
+
+def add_serialize_time(seconds: float) -> None:
+    """Attribute serialization time to the current request (no-op outside one)."""
+    timing = current_timing()
+    if timing is not None:
+        timing.serialize_seconds += seconds
+
+
+class TimedJSONProvider(DefaultJSONProvider):
+    """Flask's default JSON provider, timing dumps() for the current request."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        started = time.perf_counter()
+        try:
+            return super().dumps(obj, **kwargs)
+        finally:
+            add_serialize_time(time.perf_counter() - started)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the execution context, which is discarded with the statement -
+    # nothing is left behind when the statement raises
+    if context is not None:
+        context.request_timing_started = time.perf_counter()
+
+
+def _record_statement(context) -> None:
+    """Attribute one finished (or failed) statement to the current request."""
+    started = getattr(context, 'request_timing_started', None)
+    if started is None:
+        return
+    del context.request_timing_started
+    timing = current_timing()
+    if timing is not None:
+        timing.db_seconds += time.perf_counter() - started
+        timing.statements += 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    _record_statement(context)
+
+
+def _handle_error(exception_context):
+    _record_statement(exception_context.execution_context)
+
+
+def _listen_to_engines() -> None:
+    """Time statements on every engine (idempotent)."""
+    if not event.contains(Engine, 'before_cursor_execute', _before_cursor_execute):
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        event.listen(Engine, 'handle_error', _handle_error)
+
+
+def server_timing_header(timing: RequestTiming, total_ms: float) -> str:
+    """Format timing counters as a Server-Timing header value."""
+    metrics = [
+        f'db;dur={timing.db_seconds * 1000:.1f};desc="{timing.statements} statements"',
+        f'serialize;dur={timing.serialize_seconds * 1000:.1f}',
+    ]
+    if timing.cache_outcome is not None:
+        metrics.append(f'cache;desc="{timing.cache_outcome}"')
+    metrics.append(f'total;dur={total_ms:.1f}')
+    return ", ".join(metrics)
+
+
+def _latency_labels(response: Response) -> dict:
+    """Low-cardinality histogram labels: route pattern, not the concrete path."""
+    period = request.args.get('period', '')
+    return {
+        "route": request.url_rule.rule if request.url_rule is not None else "unmatched",
+        "period": period if period in PERIODS or not period else "other",
+        "method": request.method,
+        "status": str(response.status_code),
+    }
+
+
+def register_request_timing(app: Flask):
+    """
+    Register request timing for Flask app.
+
+    Args:
+        app: Flask application instance
+    """
+    _listen_to_engines()
+    app.json = TimedJSONProvider(app)
+
+    @app.before_request
+    def start_timing():
+        g.request_timing = RequestTiming()
+
+    @app.after_request
+    def report_timing(response: Response) -> Response:
+        timing = g.pop('request_timing', None)
+        if timing is None:
+            return response
+        total_seconds = time.perf_counter() - timing.started
+        total_ms = total_seconds * 1000
+        response.headers['Server-Timing'] = server_timing_header(timing, total_ms)
+        request_latency.observe(total_seconds, **_latency_labels(response))
+
+        too_many_statements = 0 < REQUEST_STATEMENT_WARN_THRESHOLD < timing.statements
+        log_api_request(
+            request.method,
+            request.full_path.rstrip('?'),
+            response.status_code,
+            round(total_ms, 1),
+            db_ms=round(timing.db_seconds * 1000, 1),
+            sql_statements=timing.statements,
+            serialize_ms=round(timing.serialize_seconds * 1000, 1),
+            cache=timing.cache_outcome,
+            cache_lookups=len(timing.lookups),
+            too_many_statements=too_many_statements,
+        )
+        if too_many_statements:
+            logger.warning(
+                f"{request.method} {request.path} ran {timing.statements} SQL statements "
+                f"(threshold {REQUEST_STATEMENT_WARN_THRESHOLD}) - possible N+1 query",
+                extra={
+                    "event_type": "too_many_statements",
+                    "path": request.path,
+                    "sql_statements": timing.statements,
+                }
+            )
+        return response
+
+    @app.teardown_request
+    def stop_timing(exception=None):
+        stop_recording_lookups()
@@ -77,6 +77,7 @@ def health_check():
                     AggregationLog.completed_at
                 )
                 .where(AggregationLog.aggregation_type == AggregationType.DAILY)
+                .where(AggregationLog.unit_key.is_(None))
                 .order_by(AggregationLog.aggregation_date.desc(), AggregationLog.completed_at.desc())
                 .limit(1)
             )
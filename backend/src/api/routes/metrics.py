@@ -0,0 +1,122 @@
+"""
+Theme Park Downtime Tracker - Metrics Endpoint
+Prometheus text exposition format metrics for capacity planning.
+
+GET /metrics exposes:
+    themepark_http_request_duration_seconds   latency histogram by route/period
+    themepark_query_cache_*                   QueryCache hit ratio, size, counters
+    themepark_db_pool_*                       QueuePool checked-out, overflow, wait time
+    themepark_cron_job_*                      last run of each cron job (cron_wrapper)
+
+Request, cache-counter and pool metrics are per gunicorn worker and carry a
+worker="<pid>" label; cron job metrics come from the shared state file.
+"""
+
+from typing import Dict, List
+
+from flask import Blueprint, Response
+
+from database.connection import db
+from utils.cache import get_query_cache
+from utils.cron_state import load_job_state
+from utils.logger import logger
+from utils.prometheus import pool_checkout_wait, render_gauges, request_latency, worker_labels
+
+metrics_bp = Blueprint('metrics', __name__)
+
+PREFIX = 'themepark_'
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _cache_metrics(worker: Dict[str, str]) -> List[str]:
+    """QueryCache size and hit counters."""
+    stats = get_query_cache().get_stats()
+    labels = {**worker, "backend": stats["backend"]}
+    lines = []
+    for name, key, help_text in (
+        ('query_cache_hit_ratio', 'hit_rate', 'Fraction of lookups served from the cache (fresh or stale)'),
+        ('query_cache_entries', 'total_entries', 'Entries in the query cache'),
+        ('query_cache_bytes', 'bytes', 'Estimated size of the query cache in bytes'),
+        ('query_cache_max_bytes', 'max_bytes', 'Query cache size bound in bytes'),
+        ('query_cache_inflight', 'inflight', 'Cache keys currently being computed'),
+    ):
+        lines += render_gauges(PREFIX + name, help_text, [(labels, stats[key])])
+    for name, key, help_text in (
+        ('query_cache_hits_total', 'hits', 'Fresh cache hits'),
+        ('query_cache_stale_hits_total', 'stale_hits', 'Stale entries served while refreshing'),
+        ('query_cache_misses_total', 'misses', 'Cache misses'),
+        ('query_cache_evictions_total', 'evictions', 'Entries evicted by the size bounds'),
+        ('query_cache_coalesced_total', 'coalesced', 'Lookups that waited on another computation'),
+    ):
+        lines += render_gauges(PREFIX + name, help_text, [(labels, stats[key])], metric_type='counter')
+    return lines
+
+
+def _pool_metrics(worker: Dict[str, str]) -> List[str]:
+    """SQLAlchemy QueuePool occupancy and checkout wait time."""
+    pool = db.get_engine().pool
+    lines = []
+    for name, value, help_text in (
+        ('db_pool_size', pool.size(), 'Configured pool size (persistent connections)'),
+        ('db_pool_checked_out', pool.checkedout(), 'Connections currently checked out'),
+        ('db_pool_checked_in', pool.checkedin(), 'Idle connections in the pool'),
+        ('db_pool_overflow', pool.overflow(), 'Connections open beyond pool_size (negative = unused capacity)'),
+    ):
+        lines += render_gauges(PREFIX + name, help_text, [(worker, value)])
+    lines += pool_checkout_wait.render(prefix=PREFIX, extra_labels=worker)
+    return lines
+
+
+def _cron_metrics() -> List[str]:
+    """Last run of each cron job from the cron_wrapper state file."""
+    state = load_job_state()
+    jobs = sorted(state.items())
+    lines = []
+    for name, field, help_text in (
+        ('cron_job_last_duration_seconds', 'duration_seconds', 'Duration of the last run'),
+        ('cron_job_last_exit_code', 'exit_code', 'Exit code of the last run (0 = success)'),
+        ('cron_job_last_run_timestamp_seconds', 'finished_at', 'When the last run finished (epoch seconds)'),
+        ('cron_job_last_success_timestamp_seconds', 'last_success_at',
+         'When the last successful run finished (epoch seconds)'),
+    ):
+        lines += render_gauges(
+            PREFIX + name, help_text,
+            [({"job": job}, run.get(field)) for job, run in jobs]
+        )
+    lines += render_gauges(
+        PREFIX + 'cron_job_last_rows', 'Row counts and stats reported by the last run',
+        [
+            ({"job": job, "stat": stat}, value)
+            for job, run in jobs
+            for stat, value in sorted(run.get("rows", {}).items())
+        ]
+    )
+    return lines
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Prometheus scrape endpoint.
+
+    A failing section (e.g. no database configured) is left out rather than
+    failing the scrape.
+
+    Returns:
+        text/plain Prometheus exposition format
+    """
+    worker = worker_labels()
+    lines = request_latency.render(prefix=PREFIX, extra_labels=worker)
+    for section in (_cache_metrics, _pool_metrics):
+        try:
+            lines += section(worker)
+        except Exception as e:
+            logger.warning(f"Metrics section {section.__name__} failed: {e}")
+    try:
+        lines += _cron_metrics()
+    except Exception as e:
+        logger.warning(f"Cron job metrics failed: {e}")
+
+    return Response("\n".join(lines) + "\n", content_type=CONTENT_TYPE,
+                    headers={"Cache-Control": "no-store"})
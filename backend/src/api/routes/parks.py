@@ -26,7 +26,10 @@ from decimal import Decimal
 from database.connection import get_db_connection, get_db_session
 from database.repositories.park_repository import ParkRepository
 from database.repositories.stats_repository import StatsRepository
+from api.middleware.http_cache import cached_json_response
+from api.cache_warming import warmable, FILTERS, PERIODS
 from utils.cache import get_query_cache, generate_cache_key
+from utils.data_epoch import cache_policy_for_period
 from utils.timezone import PERIOD_ALIASES
 
 # New query imports - each file handles one specific data source
@@ -43,6 +46,12 @@ from utils.timezone import get_today_pacific
 
 parks_bp = Blueprint('parks', __name__)
 
+# Cacheable page-load combinations (warmed by scripts/warm_cache.py)
+warmable('/parks/downtime', period=PERIODS, filter=FILTERS, limit=[50],
+         sort_by=['shame_score', 'total_downtime_hours', 'uptime_percentage', 'rides_down'])
+warmable('/parks/downtime', period=['today'], filter=FILTERS, limit=[1])  # Aggregate stats only
+warmable('/parks/waittimes', period=PERIODS, filter=FILTERS, limit=[50])
+
 
 @parks_bp.route('/parks/downtime', methods=['GET'])
 def get_park_downtime_rankings():
@@ -108,123 +117,126 @@ def get_park_downtime_rankings():
         }), 400
 
     try:
-        # Generate cache key - all periods are cached (live data only updates every 5 min anyway)
+        # Cached until the data epoch for the period advances (see utils/data_epoch.py)
+        policy = cache_policy_for_period(period)
         cache_key = generate_cache_key(
             "parks_downtime",
             period=period,
             filter=filter_type,
             limit=str(limit),
             sort_by=sort_by,
-            weighted=str(weighted).lower()
+            weighted=str(weighted).lower(),
+            **policy.key_params
         )
-        cache = get_query_cache()
-        cached_result = cache.get(cache_key)
-        if cached_result is not None:
-            logger.info(f"Cache HIT for park downtime: period={period}, filter={filter_type}")
-            return jsonify(cached_result), 200
 
-        with get_db_connection() as conn:
-            filter_disney_universal = (filter_type == 'disney-universal')
+        def compute_response():
+            with get_db_connection() as conn:
+                filter_disney_universal = (filter_type == 'disney-universal')
 
-            # Route to appropriate query based on period
-            today_pacific = get_today_pacific()
-            if period == 'live':
-                # LIVE: True instantaneous data - rides down RIGHT NOW
-                # Uses pre-aggregated park_live_rankings table for instant performance
-                query = FastLiveParkRankingsQuery(conn)
-                rankings = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit,
-                    sort_by=sort_by
-                )
-            elif period == 'today':
-                # TODAY: Use pre-aggregated hourly stats (live-updating)
-                query = TodayParkRankingsQuery(conn)
-                rankings = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit,
-                    sort_by=sort_by
-                )
-            elif period == 'yesterday':
-                # YESTERDAY: Use pre-aggregated hourly stats (full previous day)
-                query = YesterdayParkRankingsQuery(conn)
-                rankings = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit,
-                    sort_by=sort_by
-                )
-            else:
-                # Historical data from aggregated stats (calendar-based periods)
-                # See: database/queries/rankings/park_downtime_rankings.py
-                query = ParkDowntimeRankingsQuery(conn)
-                if period == 'last_week':
-                    rankings = query.get_weekly(
+                # Route to appropriate query based on period
+                today_pacific = get_today_pacific()
+                if period == 'live':
+                    # LIVE: True instantaneous data - rides down RIGHT NOW
+                    # Uses pre-aggregated park_live_rankings table for instant performance
+                    query = FastLiveParkRankingsQuery(conn)
+                    rankings = query.get_rankings(
                         filter_disney_universal=filter_disney_universal,
                         limit=limit,
                         sort_by=sort_by
                     )
-                else:  # last_month
-                    rankings = query.get_monthly(
+                elif period == 'today':
+                    # TODAY: Use pre-aggregated hourly stats (live-updating)
+                    query = TodayParkRankingsQuery(conn)
+                    rankings = query.get_rankings(
                         filter_disney_universal=filter_disney_universal,
                         limit=limit,
                         sort_by=sort_by
                     )
+                elif period == 'yesterday':
+                    # YESTERDAY: Use pre-aggregated hourly stats (full previous day)
+                    query = YesterdayParkRankingsQuery(conn)
+                    rankings = query.get_rankings(
+                        filter_disney_universal=filter_disney_universal,
+                        limit=limit,
+                        sort_by=sort_by
+                    )
+                else:
+                    # Historical data from aggregated stats (calendar-based periods)
+                    # See: database/queries/rankings/park_downtime_rankings.py
+                    query = ParkDowntimeRankingsQuery(conn)
+                    if period == 'last_week':
+                        rankings = query.get_weekly(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit,
+                            sort_by=sort_by
+                        )
+                    else:  # last_month
+                        rankings = query.get_monthly(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit,
+                            sort_by=sort_by
+                        )
 
-            # Get aggregate stats using ORM (requires Session, not Connection)
-            aggregate_period = PERIOD_ALIASES.get(period, period)
-            with get_db_session() as session:
-                stats_repo = StatsRepository(session)
-                aggregate_stats = stats_repo.get_aggregate_park_stats(
-                    period=aggregate_period,
-                    filter_disney_universal=filter_disney_universal
-                )
-
-            # Add external URLs to rankings
-            rankings_with_urls = []
-            for rank_idx, park in enumerate(rankings, start=1):
-                park_dict = dict(park) if hasattr(park, '_mapping') else dict(park)
-                park_dict['rank'] = rank_idx
-                if 'queue_times_id' in park_dict:
-                    park_dict['queue_times_url'] = f"https://queue-times.com/parks/{park_dict['queue_times_id']}"
-
-                numeric_fields = {
-                    'shame_score': float,
-                    'total_downtime_hours': float,
-                    'weighted_downtime_hours': float,
-                    'rides_operating': int,
-                    'rides_down': int,
-                    'uptime_percentage': float,
-                    'effective_park_weight': float,
-                    'snapshot_count': int,
-                }
-                for field, caster in numeric_fields.items():
-                    if field in park_dict and isinstance(park_dict[field], Decimal):
-                        park_dict[field] = caster(park_dict[field])
-
-                rankings_with_urls.append(park_dict)
+                # Get aggregate stats using ORM (requires Session, not Connection)
+                aggregate_period = PERIOD_ALIASES.get(period, period)
+                with get_db_session() as session:
+                    stats_repo = StatsRepository(session)
+                    aggregate_stats = stats_repo.get_aggregate_park_stats(
+                        period=aggregate_period,
+                        filter_disney_universal=filter_disney_universal
+                    )
 
-            # Build response
-            response = {
-                "success": True,
-                "period": original_period,
-                "filter": filter_type,
-                "weighted": weighted,
-                "sort_by": sort_by,
-                "aggregate_stats": aggregate_stats,
-                "data": rankings_with_urls,
-                "attribution": {
-                    "data_source": "ThemeParks.wiki",
-                    "url": "https://themeparks.wiki"
+                # Add external URLs to rankings
+                rankings_with_urls = []
+                for rank_idx, park in enumerate(rankings, start=1):
+                    park_dict = dict(park) if hasattr(park, '_mapping') else dict(park)
+                    park_dict['rank'] = rank_idx
+                    if 'queue_times_id' in park_dict:
+                        park_dict['queue_times_url'] = f"https://queue-times.com/parks/{park_dict['queue_times_id']}"
+
+                    numeric_fields = {
+                        'shame_score': float,
+                        'total_downtime_hours': float,
+                        'weighted_downtime_hours': float,
+                        'rides_operating': int,
+                        'rides_down': int,
+                        'uptime_percentage': float,
+                        'effective_park_weight': float,
+                        'snapshot_count': int,
+                    }
+                    for field, caster in numeric_fields.items():
+                        if field in park_dict and isinstance(park_dict[field], Decimal):
+                            park_dict[field] = caster(park_dict[field])
+
+                    rankings_with_urls.append(park_dict)
+
+                # Build response
+                response = {
+                    "success": True,
+                    "period": original_period,
+                    "filter": filter_type,
+                    "weighted": weighted,
+                    "sort_by": sort_by,
+                    "aggregate_stats": aggregate_stats,
+                    "data": rankings_with_urls,
+                    "attribution": {
+                        "data_source": "ThemeParks.wiki",
+                        "url": "https://themeparks.wiki"
+                    }
                 }
-            }
 
-            logger.info(f"Park rankings requested: period={period}, filter={filter_type}, weighted={weighted}, sort_by={sort_by}, results={len(rankings_with_urls)}")
+                logger.info(f"Park rankings requested: period={period}, filter={filter_type}, weighted={weighted}, sort_by={sort_by}, results={len(rankings_with_urls)}")
 
-            # Cache the result (5-minute TTL)
-            cache.set(cache_key, response)
-            logger.info(f"Cache STORE for park downtime: period={period}, filter={filter_type}")
+                return response
 
-            return jsonify(response), 200
+        # Single-flight with stale-while-revalidate: after the TTL the previous
+        # response is served while one background refresh recomputes it.
+        # Cached as serialized JSON with an ETag (see api/middleware/http_cache.py)
+        cache = get_query_cache()
+        return cached_json_response(
+            cache, cache_key, compute_response, serve_stale=True,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
     except Exception as e:
         logger.error(f"Error fetching park rankings: {e}")
@@ -280,97 +292,100 @@ def get_park_wait_times():
         }), 400
 
     try:
-        # Generate cache key - all periods are cached (live data only updates every 5 min anyway)
+        # Cached until the data epoch for the period advances (see utils/data_epoch.py)
+        policy = cache_policy_for_period(period)
         cache_key = generate_cache_key(
             "parks_waittimes",
             period=period,
             filter=filter_type,
-            limit=str(limit)
+            limit=str(limit),
+            **policy.key_params
         )
-        cache = get_query_cache()
-        cached_result = cache.get(cache_key)
-        if cached_result is not None:
-            logger.info(f"Cache HIT for park waittimes: period={period}, filter={filter_type}")
-            return jsonify(cached_result), 200
-
-        # Note: Mixed session/connection usage during ORM migration
-        # - TODAY period uses Session (TodayParkWaitTimesQuery converted to ORM)
-        # - Other periods still use Connection (not yet converted)
-        filter_disney_universal = (filter_type == 'disney-universal')
-
-        if period == 'today':
-            # ORM-based query - uses Session
-            with get_db_session() as session:
-                # TODAY data - cumulative from midnight Pacific to now
-                # See: database/queries/today/today_park_wait_times.py
-                query = TodayParkWaitTimesQuery(session)
-                wait_times = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit
-                )
-        elif period == 'live':
-            # ORM-based query - uses Session
-            with get_db_session() as session:
-                # LIVE data - instantaneous current wait times from latest snapshots
-                # See: database/queries/live/live_park_wait_times.py
-                query = LiveParkWaitTimesQuery(session)
-                wait_times = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit
-                )
-        else:
-            # Legacy queries - still use Connection
-            with get_db_connection() as conn:
-                # Route to appropriate query based on period
-                if period == 'yesterday':
-                    # YESTERDAY data - full previous Pacific day
-                    # See: database/queries/yesterday/yesterday_park_wait_times.py
-                    query = YesterdayParkWaitTimesQuery(conn)
+
+        def compute_response():
+            # Note: Mixed session/connection usage during ORM migration
+            # - TODAY period uses Session (TodayParkWaitTimesQuery converted to ORM)
+            # - Other periods still use Connection (not yet converted)
+            filter_disney_universal = (filter_type == 'disney-universal')
+
+            if period == 'today':
+                # ORM-based query - uses Session
+                with get_db_session() as session:
+                    # TODAY data - cumulative from midnight Pacific to now
+                    # See: database/queries/today/today_park_wait_times.py
+                    query = TodayParkWaitTimesQuery(session)
                     wait_times = query.get_rankings(
                         filter_disney_universal=filter_disney_universal,
                         limit=limit
                     )
-                else:
-                    # Historical data from aggregated stats (calendar-based periods)
-                    # See: database/queries/rankings/park_wait_time_rankings.py
-                    query = ParkWaitTimeRankingsQuery(conn)
-                    if period == 'last_week':
-                        wait_times = query.get_weekly(
-                            filter_disney_universal=filter_disney_universal,
-                            limit=limit
-                        )
-                    else:  # last_month
-                        wait_times = query.get_monthly(
+            elif period == 'live':
+                # ORM-based query - uses Session
+                with get_db_session() as session:
+                    # LIVE data - instantaneous current wait times from latest snapshots
+                    # See: database/queries/live/live_park_wait_times.py
+                    query = LiveParkWaitTimesQuery(session)
+                    wait_times = query.get_rankings(
+                        filter_disney_universal=filter_disney_universal,
+                        limit=limit
+                    )
+            else:
+                # Legacy queries - still use Connection
+                with get_db_connection() as conn:
+                    # Route to appropriate query based on period
+                    if period == 'yesterday':
+                        # YESTERDAY data - full previous Pacific day
+                        # See: database/queries/yesterday/yesterday_park_wait_times.py
+                        query = YesterdayParkWaitTimesQuery(conn)
+                        wait_times = query.get_rankings(
                             filter_disney_universal=filter_disney_universal,
                             limit=limit
                         )
+                    else:
+                        # Historical data from aggregated stats (calendar-based periods)
+                        # See: database/queries/rankings/park_wait_time_rankings.py
+                        query = ParkWaitTimeRankingsQuery(conn)
+                        if period == 'last_week':
+                            wait_times = query.get_weekly(
+                                filter_disney_universal=filter_disney_universal,
+                                limit=limit
+                            )
+                        else:  # last_month
+                            wait_times = query.get_monthly(
+                                filter_disney_universal=filter_disney_universal,
+                                limit=limit
+                            )
+
+            # Add external URLs and rank to wait times (applies to all periods)
+            wait_times_with_urls = []
+            for rank_idx, park in enumerate(wait_times, start=1):
+                park_dict = dict(park) if hasattr(park, '_mapping') else dict(park)
+                park_dict['rank'] = rank_idx
+                if 'queue_times_id' in park_dict:
+                    park_dict['queue_times_url'] = f"https://queue-times.com/parks/{park_dict['queue_times_id']}"
+                wait_times_with_urls.append(park_dict)
 
-        # Add external URLs and rank to wait times (applies to all periods)
-        wait_times_with_urls = []
-        for rank_idx, park in enumerate(wait_times, start=1):
-            park_dict = dict(park) if hasattr(park, '_mapping') else dict(park)
-            park_dict['rank'] = rank_idx
-            if 'queue_times_id' in park_dict:
-                park_dict['queue_times_url'] = f"https://queue-times.com/parks/{park_dict['queue_times_id']}"
-            wait_times_with_urls.append(park_dict)
-
-        # Build response
-        response = {
-            "success": True,
-            "period": period,
-            "filter": filter_type,
-            "data": wait_times_with_urls,
-            "attribution": {
-                "data_source": "ThemeParks.wiki",
-                "url": "https://themeparks.wiki"
+            # Build response
+            response = {
+                "success": True,
+                "period": period,
+                "filter": filter_type,
+                "data": wait_times_with_urls,
+                "attribution": {
+                    "data_source": "ThemeParks.wiki",
+                    "url": "https://themeparks.wiki"
+                }
             }
-        }
 
-        logger.info(f"Park wait times requested: period={period}, filter={filter_type}, results={len(wait_times_with_urls)}")
+            logger.info(f"Park wait times requested: period={period}, filter={filter_type}, results={len(wait_times_with_urls)}")
+
+            return response
 
-        # Cache the result (5-minute TTL)
-        cache.set(cache_key, response)
-        logger.info(f"Cache STORE for park waittimes: period={period}, filter={filter_type}")
+        # Single-flight: concurrent requests for this key share one computation
+        cache = get_query_cache()
+        response = cache.get_or_compute(
+            key=cache_key, compute_fn=compute_response,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
         return jsonify(response), 200
 
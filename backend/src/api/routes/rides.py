@@ -27,7 +27,10 @@ import pytz
 from database.connection import get_db_connection, get_db_session
 from database.repositories.stats_repository import StatsRepository
 from database.repositories.ride_repository import RideRepository
+from api.middleware.http_cache import cached_json_response
+from api.cache_warming import warmable, FILTERS, PERIODS
 from utils.cache import get_query_cache, generate_cache_key
+from utils.data_epoch import cache_policy_for_period
 from utils.timezone import get_today_pacific, PERIOD_ALIASES
 
 # New query imports - each file handles one specific data source
@@ -47,6 +50,12 @@ PACIFIC_TZ = pytz.timezone('America/Los_Angeles')
 
 rides_bp = Blueprint('rides', __name__)
 
+# Cacheable page-load combinations (warmed by scripts/warm_cache.py)
+warmable('/live/status-summary', filter=FILTERS)
+warmable('/rides/downtime', period=PERIODS, filter=FILTERS, limit=[100],
+         sort_by=['current_is_open', 'downtime_hours', 'uptime_percentage', 'trend_percentage'])
+warmable('/rides/waittimes', period=PERIODS, filter=FILTERS, limit=[100])
+
 
 def pacific_date_to_utc_range(start_date, end_date):
     """
@@ -244,43 +253,46 @@ def get_live_status_summary():
 
     try:
         # Generate cache key
+        policy = cache_policy_for_period(None)
         cache_key = generate_cache_key(
             "live_status_summary",
             filter=filter_type,
-            park_id=str(park_id) if park_id else "none"
+            park_id=str(park_id) if park_id else "none",
+            **policy.key_params
         )
-        cache = get_query_cache()
-        cached_result = cache.get(cache_key)
-        if cached_result is not None:
-            logger.info(f"Cache HIT for live status summary: filter={filter_type}")
-            return jsonify(cached_result), 200
-
-        with get_db_connection() as conn:
-            # See: database/queries/live/status_summary.py
-            query = StatusSummaryQuery(conn)
-            summary = query.get_summary(
-                filter_disney_universal=(filter_type == 'disney-universal'),
-                park_id=park_id
-            )
 
-            response = {
-                "success": True,
-                "filter": filter_type,
-                "status_summary": summary,
-                "attribution": {
-                    "data_source": "ThemeParks.wiki",
-                    "url": "https://themeparks.wiki"
+        def compute_response():
+            with get_db_connection() as conn:
+                # See: database/queries/live/status_summary.py
+                query = StatusSummaryQuery(conn)
+                summary = query.get_summary(
+                    filter_disney_universal=(filter_type == 'disney-universal'),
+                    park_id=park_id
+                )
+
+                response = {
+                    "success": True,
+                    "filter": filter_type,
+                    "status_summary": summary,
+                    "attribution": {
+                        "data_source": "ThemeParks.wiki",
+                        "url": "https://themeparks.wiki"
+                    }
                 }
-            }
 
-            if park_id:
-                response["park_id"] = park_id
+                if park_id:
+                    response["park_id"] = park_id
 
-            # Cache the result (5-minute TTL)
-            cache.set(cache_key, response)
-            logger.info(f"Cache STORE for live status summary: filter={filter_type}")
+                return response
 
-            return jsonify(response), 200
+        # Single-flight with stale-while-revalidate: after the TTL the previous
+        # response is served while one background refresh recomputes it.
+        # Cached as serialized JSON with an ETag (see api/middleware/http_cache.py)
+        cache = get_query_cache()
+        return cached_json_response(
+            cache, cache_key, compute_response, serve_stale=True,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
     except Exception as e:
         logger.error(f"Error fetching live status summary: {e}", exc_info=True)
@@ -351,97 +363,100 @@ Query Files Used:
         }), 400
 
     try:
-        # Generate cache key - all periods are cached (live data only updates every 5 min anyway)
+        # Cached until the data epoch for the period advances (see utils/data_epoch.py)
+        policy = cache_policy_for_period(period)
         cache_key = generate_cache_key(
             "rides_downtime",
             period=period,
             filter=filter_type,
             limit=str(limit),
-            sort_by=sort_by
+            sort_by=sort_by,
+            **policy.key_params
         )
-        cache = get_query_cache()
-        cached_result = cache.get(cache_key)
-        if cached_result is not None:
-            logger.info(f"Cache HIT for ride downtime: period={period}, filter={filter_type}")
-            return jsonify(cached_result), 200
 
-        filter_disney_universal = (filter_type == 'disney-universal')
+        def compute_response():
+            filter_disney_universal = (filter_type == 'disney-universal')
 
-        if period == 'live':
-            # LIVE: Use ORM query class for real-time snapshot data
-            with get_db_session() as session:
-                query = LiveRideRankingsQuery(session)
-                rankings = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit
-                )
-        elif period == 'today':
-            # TODAY: Use same query as LIVE (both aggregate from midnight Pacific to now)
-            # Previously used pre-aggregated hourly stats, but ride_hourly_stats table was dropped
-            with get_db_session() as session:
-                query = LiveRideRankingsQuery(session)
-                rankings = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit
-                )
-        elif period == 'yesterday':
-            # YESTERDAY: Full previous Pacific day (immutable, highly cacheable)
-            # Uses pre-aggregated ride_daily_stats for sub-second queries
-            with get_db_session() as session:
-                query = YesterdayRideRankingsQuery(session)
-                rankings = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit
-                )
-        else:
-            # Historical data from aggregated stats (calendar-based periods)
-            # See: database/queries/rankings/ride_downtime_rankings.py
-            with get_db_connection() as conn:
-                query = RideDowntimeRankingsQuery(conn)
-                if period == 'last_week':
-                    rankings = query.get_weekly(
+            if period == 'live':
+                # LIVE: Use ORM query class for real-time snapshot data
+                with get_db_session() as session:
+                    query = LiveRideRankingsQuery(session)
+                    rankings = query.get_rankings(
                         filter_disney_universal=filter_disney_universal,
-                        limit=limit,
-                        sort_by=sort_by
+                        limit=limit
                     )
-                else:  # last_month
-                    rankings = query.get_monthly(
+            elif period == 'today':
+                # TODAY: Use same query as LIVE (both aggregate from midnight Pacific to now)
+                # Previously used pre-aggregated hourly stats, but ride_hourly_stats table was dropped
+                with get_db_session() as session:
+                    query = LiveRideRankingsQuery(session)
+                    rankings = query.get_rankings(
                         filter_disney_universal=filter_disney_universal,
-                        limit=limit,
-                        sort_by=sort_by
+                        limit=limit
+                    )
+            elif period == 'yesterday':
+                # YESTERDAY: Full previous Pacific day (immutable, highly cacheable)
+                # Uses pre-aggregated ride_daily_stats for sub-second queries
+                with get_db_session() as session:
+                    query = YesterdayRideRankingsQuery(session)
+                    rankings = query.get_rankings(
+                        filter_disney_universal=filter_disney_universal,
+                        limit=limit
                     )
-
-        # Add external URLs and rank to rankings
-        rankings_with_urls = []
-        for rank_idx, ride in enumerate(rankings, start=1):
-            ride_dict = dict(ride) if hasattr(ride, '_mapping') else dict(ride)
-            ride_dict['rank'] = rank_idx
-            # Generate external URL (legacy queue-times format)
-            if 'queue_times_id' in ride_dict and 'park_queue_times_id' in ride_dict:
-                ride_dict['queue_times_url'] = f"https://queue-times.com/parks/{ride_dict['park_queue_times_id']}/rides/{ride_dict['queue_times_id']}"
             else:
-                ride_dict['queue_times_url'] = None
-            rankings_with_urls.append(ride_dict)
-
-        # Build response
-        response = {
-            "success": True,
-            "period": original_period,
-            "filter": filter_type,
-            "data": rankings_with_urls,
-            "attribution": {
-                "data_source": "ThemeParks.wiki",
-                "url": "https://themeparks.wiki"
+                # Historical data from aggregated stats (calendar-based periods)
+                # See: database/queries/rankings/ride_downtime_rankings.py
+                with get_db_connection() as conn:
+                    query = RideDowntimeRankingsQuery(conn)
+                    if period == 'last_week':
+                        rankings = query.get_weekly(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit,
+                            sort_by=sort_by
+                        )
+                    else:  # last_month
+                        rankings = query.get_monthly(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit,
+                            sort_by=sort_by
+                        )
+
+            # Add external URLs and rank to rankings
+            rankings_with_urls = []
+            for rank_idx, ride in enumerate(rankings, start=1):
+                ride_dict = dict(ride) if hasattr(ride, '_mapping') else dict(ride)
+                ride_dict['rank'] = rank_idx
+                # Generate external URL (legacy queue-times format)
+                if 'queue_times_id' in ride_dict and 'park_queue_times_id' in ride_dict:
+                    ride_dict['queue_times_url'] = f"https://queue-times.com/parks/{ride_dict['park_queue_times_id']}/rides/{ride_dict['queue_times_id']}"
+                else:
+                    ride_dict['queue_times_url'] = None
+                rankings_with_urls.append(ride_dict)
+
+            # Build response
+            response = {
+                "success": True,
+                "period": original_period,
+                "filter": filter_type,
+                "data": rankings_with_urls,
+                "attribution": {
+                    "data_source": "ThemeParks.wiki",
+                    "url": "https://themeparks.wiki"
+                }
             }
-        }
 
-        logger.info(f"Ride rankings requested: period={original_period}, filter={filter_type}, results={len(rankings_with_urls)}")
+            logger.info(f"Ride rankings requested: period={original_period}, filter={filter_type}, results={len(rankings_with_urls)}")
 
-        # Cache the result (5-minute TTL)
-        cache.set(cache_key, response)
-        logger.info(f"Cache STORE for ride downtime: period={original_period}, filter={filter_type}")
+            return response
 
-        return jsonify(response), 200
+        # Single-flight with stale-while-revalidate: after the TTL the previous
+        # response is served while one background refresh recomputes it.
+        # Cached as serialized JSON with an ETag (see api/middleware/http_cache.py)
+        cache = get_query_cache()
+        return cached_json_response(
+            cache, cache_key, compute_response, serve_stale=True,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
     except Exception as e:
         logger.error(f"Error fetching ride rankings: {e}", exc_info=True)
@@ -507,109 +522,112 @@ def get_ride_wait_times():
         }), 400
 
     try:
-        # Generate cache key - all periods are cached (live data only updates every 5 min anyway)
+        # Cached until the data epoch for the period advances (see utils/data_epoch.py)
+        policy = cache_policy_for_period(mode)
         cache_key = generate_cache_key(
             "rides_waittimes",
             period=period,
             mode=mode,
             filter=filter_type,
-            limit=str(limit)
+            limit=str(limit),
+            **policy.key_params
         )
-        cache = get_query_cache()
-        cached_result = cache.get(cache_key)
-        if cached_result is not None:
-            logger.info(f"Cache HIT for ride waittimes: period={period}, filter={filter_type}")
-            return jsonify(cached_result), 200
 
-        with get_db_session() as session:
-            filter_disney_universal = (filter_type == 'disney-universal')
+        def compute_response():
+            with get_db_session() as session:
+                filter_disney_universal = (filter_type == 'disney-universal')
 
-            # Route to appropriate query based on period
-            if mode == 'live':
-                # LIVE data - instantaneous current wait times
-                # TODO: Implement LiveRideWaitTimesQuery similar to LiveParkWaitTimesQuery
-                # For now, return empty data to prevent 500 errors
-                logger.warning("Ride live wait times not yet implemented, returning empty data")
-                wait_times = []
-            elif mode == 'today':
-                # TODAY data - cumulative from midnight Pacific to now
-                # See: database/queries/today/today_ride_wait_times.py
-                query = TodayRideWaitTimesQuery(session)
-                wait_times = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit
-                )
-            elif mode == 'yesterday':
-                # YESTERDAY data - full previous Pacific day (uses pre-aggregated ride_daily_stats)
-                # See: database/queries/yesterday/yesterday_ride_wait_times.py
-                query = YesterdayRideWaitTimesQuery(session)
-                wait_times = query.get_rankings(
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit
-                )
-            elif mode == '7day-average':
-                # TODO: Implement 7-day average wait times query
-                # For now, return empty data to prevent 500 errors
-                logger.warning("Ride 7-day average wait times not yet implemented, returning empty data")
-                wait_times = []
-            elif mode == 'peak-times':
-                # TODO: Implement peak times query
-                # For now, return empty data to prevent 500 errors
-                logger.warning("Ride peak times not yet implemented, returning empty data")
-                wait_times = []
-            else:
-                # Historical data from aggregated stats (calendar-based periods)
-                # See: database/queries/rankings/ride_wait_time_rankings.py
-                query = RideWaitTimeRankingsQuery(session)
-                if mode == 'last_week':
-                    wait_times = query.get_weekly(
+                # Route to appropriate query based on period
+                if mode == 'live':
+                    # LIVE data - instantaneous current wait times
+                    # TODO: Implement LiveRideWaitTimesQuery similar to LiveParkWaitTimesQuery
+                    # For now, return empty data to prevent 500 errors
+                    logger.warning("Ride live wait times not yet implemented, returning empty data")
+                    wait_times = []
+                elif mode == 'today':
+                    # TODAY data - cumulative from midnight Pacific to now
+                    # See: database/queries/today/today_ride_wait_times.py
+                    query = TodayRideWaitTimesQuery(session)
+                    wait_times = query.get_rankings(
                         filter_disney_universal=filter_disney_universal,
                         limit=limit
                     )
-                else:  # last_month
-                    wait_times = query.get_monthly(
+                elif mode == 'yesterday':
+                    # YESTERDAY data - full previous Pacific day (uses pre-aggregated ride_daily_stats)
+                    # See: database/queries/yesterday/yesterday_ride_wait_times.py
+                    query = YesterdayRideWaitTimesQuery(session)
+                    wait_times = query.get_rankings(
                         filter_disney_universal=filter_disney_universal,
                         limit=limit
                     )
-
-            # Add external URLs and rank to wait times
-            wait_times_with_urls = []
-            for rank_idx, ride in enumerate(wait_times, start=1):
-                ride_dict = dict(ride) if hasattr(ride, '_mapping') else dict(ride)
-                ride_dict['rank'] = rank_idx
-                # Generate external URL (legacy queue-times format)
-                if 'queue_times_id' in ride_dict and 'park_queue_times_id' in ride_dict:
-                    ride_dict['queue_times_url'] = f"https://queue-times.com/parks/{ride_dict['park_queue_times_id']}/rides/{ride_dict['queue_times_id']}"
+                elif mode == '7day-average':
+                    # TODO: Implement 7-day average wait times query
+                    # For now, return empty data to prevent 500 errors
+                    logger.warning("Ride 7-day average wait times not yet implemented, returning empty data")
+                    wait_times = []
+                elif mode == 'peak-times':
+                    # TODO: Implement peak times query
+                    # For now, return empty data to prevent 500 errors
+                    logger.warning("Ride peak times not yet implemented, returning empty data")
+                    wait_times = []
                 else:
-                    ride_dict['queue_times_url'] = None
-                if mode == 'live':
-                    current_wait = ride_dict.get('avg_wait_minutes')
-                    if current_wait is None:
-                        ride_dict['current_wait_minutes'] = None
+                    # Historical data from aggregated stats (calendar-based periods)
+                    # See: database/queries/rankings/ride_wait_time_rankings.py
+                    query = RideWaitTimeRankingsQuery(session)
+                    if mode == 'last_week':
+                        wait_times = query.get_weekly(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    else:  # last_month
+                        wait_times = query.get_monthly(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+
+                # Add external URLs and rank to wait times
+                wait_times_with_urls = []
+                for rank_idx, ride in enumerate(wait_times, start=1):
+                    ride_dict = dict(ride) if hasattr(ride, '_mapping') else dict(ride)
+                    ride_dict['rank'] = rank_idx
+                    # Generate external URL (legacy queue-times format)
+                    if 'queue_times_id' in ride_dict and 'park_queue_times_id' in ride_dict:
+                        ride_dict['queue_times_url'] = f"https://queue-times.com/parks/{ride_dict['park_queue_times_id']}/rides/{ride_dict['queue_times_id']}"
                     else:
-                        ride_dict['current_wait_minutes'] = float(current_wait)
-                wait_times_with_urls.append(ride_dict)
-
-            # Build response
-            response = {
-                "success": True,
-                "period": period,
-                "mode": mode,
-                "filter": filter_type,
-                "data": wait_times_with_urls,
-                "attribution": {
-                    "data_source": "ThemeParks.wiki",
-                    "url": "https://themeparks.wiki"
+                        ride_dict['queue_times_url'] = None
+                    if mode == 'live':
+                        current_wait = ride_dict.get('avg_wait_minutes')
+                        if current_wait is None:
+                            ride_dict['current_wait_minutes'] = None
+                        else:
+                            ride_dict['current_wait_minutes'] = float(current_wait)
+                    wait_times_with_urls.append(ride_dict)
+
+                # Build response
+                response = {
+                    "success": True,
+                    "period": period,
+                    "mode": mode,
+                    "filter": filter_type,
+                    "data": wait_times_with_urls,
+                    "attribution": {
+                        "data_source": "ThemeParks.wiki",
+                        "url": "https://themeparks.wiki"
+                    }
                 }
-            }
 
-            logger.info(f"Wait times requested: period={period}, filter={filter_type}, results={len(wait_times_with_urls)}")
+                logger.info(f"Wait times requested: period={period}, filter={filter_type}, results={len(wait_times_with_urls)}")
 
-            # Cache the result (5-minute TTL)
-            cache.set(cache_key, response)
-            logger.info(f"Cache STORE for ride waittimes: period={period}, filter={filter_type}")
+                return response
 
-            return jsonify(response), 200
+        # Single-flight: concurrent requests for this key share one computation
+        cache = get_query_cache()
+        response = cache.get_or_compute(
+            key=cache_key, compute_fn=compute_response,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
+
+        return jsonify(response), 200
 
     except Exception as e:
         logger.error(f"Error fetching wait times: {e}", exc_info=True)
@@ -656,106 +674,112 @@ def get_ride_details(ride_id: int):
 
     try:
         # Generate cache key
+        policy = cache_policy_for_period(period)
         cache_key = generate_cache_key(
             "ride_details",
             ride_id=str(ride_id),
-            period=period
+            period=period,
+            **policy.key_params
         )
-        cache = get_query_cache()
-        cached_result = cache.get(cache_key)
-        if cached_result is not None:
-            logger.info(f"Cache HIT for ride details: ride_id={ride_id}, period={period}")
-            return jsonify(cached_result), 200
-
-        with get_db_session() as session:
-            ride_repo = RideRepository(session)
-
-            # Get ride basic info
-            ride = ride_repo.get_by_id(ride_id)
-            if not ride:
-                return jsonify({
-                    "success": False,
-                    "error": f"Ride {ride_id} not found"
-                }), 404
-
-            # Determine date range based on period
-            today_pacific = get_today_pacific()
-
-            if period == 'today':
-                # Today: midnight Pacific to now
-                start_date = today_pacific
-                end_date = today_pacific
-                is_today = True
-            elif period == 'yesterday':
-                # Yesterday: full previous day
-                start_date = today_pacific - timedelta(days=1)
-                end_date = today_pacific - timedelta(days=1)
-                is_today = False
-            elif period == 'last_week':
-                # Last 7 complete days
-                start_date = today_pacific - timedelta(days=7)
-                end_date = today_pacific - timedelta(days=1)
-                is_today = False
-            else:  # last_month
-                # Last 30 complete days
-                start_date = today_pacific - timedelta(days=30)
-                end_date = today_pacific - timedelta(days=1)
-                is_today = False
-
-            # Get hourly time-series data
-            timeseries_data = _get_ride_timeseries(
-                ride_id, start_date, end_date, period
-            )
 
-            # Get summary statistics
-            summary_stats = _get_ride_summary_stats(
-                ride_id, start_date, end_date, period
-            )
+        def compute_response():
+            with get_db_session() as session:
+                ride_repo = RideRepository(session)
+
+                # Get ride basic info
+                ride = ride_repo.get_by_id(ride_id)
+                if not ride:
+                    # Not cached, so a newly added ride shows up without waiting for expiry
+                    return None
+
+                # Determine date range based on period
+                today_pacific = get_today_pacific()
+
+                if period == 'today':
+                    # Today: midnight Pacific to now
+                    start_date = today_pacific
+                    end_date = today_pacific
+                    is_today = True
+                elif period == 'yesterday':
+                    # Yesterday: full previous day
+                    start_date = today_pacific - timedelta(days=1)
+                    end_date = today_pacific - timedelta(days=1)
+                    is_today = False
+                elif period == 'last_week':
+                    # Last 7 complete days
+                    start_date = today_pacific - timedelta(days=7)
+                    end_date = today_pacific - timedelta(days=1)
+                    is_today = False
+                else:  # last_month
+                    # Last 30 complete days
+                    start_date = today_pacific - timedelta(days=30)
+                    end_date = today_pacific - timedelta(days=1)
+                    is_today = False
+
+                # Get hourly time-series data
+                timeseries_data = _get_ride_timeseries(
+                    ride_id, start_date, end_date, period
+                )
 
-            # Get downtime events
-            downtime_events = _get_ride_downtime_events(
-                ride_id, start_date, end_date, period
-            )
+                # Get summary statistics
+                summary_stats = _get_ride_summary_stats(
+                    ride_id, start_date, end_date, period
+                )
 
-            # Get hourly breakdown (for table display)
-            hourly_breakdown = _get_ride_hourly_breakdown(
-                ride_id, start_date, end_date, period
-            )
+                # Get downtime events
+                downtime_events = _get_ride_downtime_events(
+                    ride_id, start_date, end_date, period
+                )
 
-            # Get park name and tier from ride dataclass (populated via ORM join)
-            park_name = ride.park_name
-            tier = ride.tier
+                # Get hourly breakdown (for table display)
+                hourly_breakdown = _get_ride_hourly_breakdown(
+                    ride_id, start_date, end_date, period
+                )
 
-            # Build response
-            response = {
-                "success": True,
-                "period": period,
-                "ride": {
-                    "ride_id": ride.ride_id,
-                    "name": ride.name,
-                    "park_id": ride.park_id,
-                    "park_name": park_name,
-                    "tier": tier,
-                    "category": ride.category,
-                    "queue_times_url": f"https://queue-times.com/parks/{ride.park_queue_times_id}/rides/{ride.queue_times_id}" if ride.queue_times_id and ride.park_queue_times_id else None
-                },
-                "timeseries": timeseries_data,
-                "summary": summary_stats,
-                "downtime_events": downtime_events,
-                "hourly_breakdown": hourly_breakdown,
-                "attribution": {
-                    "data_source": "ThemeParks.wiki",
-                    "url": "https://themeparks.wiki"
+                # Get park name and tier from ride dataclass (populated via ORM join)
+                park_name = ride.park_name
+                tier = ride.tier
+
+                # Build response
+                response = {
+                    "success": True,
+                    "period": period,
+                    "ride": {
+                        "ride_id": ride.ride_id,
+                        "name": ride.name,
+                        "park_id": ride.park_id,
+                        "park_name": park_name,
+                        "tier": tier,
+                        "category": ride.category,
+                        "queue_times_url": f"https://queue-times.com/parks/{ride.park_queue_times_id}/rides/{ride.queue_times_id}" if ride.queue_times_id and ride.park_queue_times_id else None
+                    },
+                    "timeseries": timeseries_data,
+                    "summary": summary_stats,
+                    "downtime_events": downtime_events,
+                    "hourly_breakdown": hourly_breakdown,
+                    "attribution": {
+                        "data_source": "ThemeParks.wiki",
+                        "url": "https://themeparks.wiki"
+                    }
                 }
-            }
 
-            logger.info(f"Ride details requested: ride_id={ride_id}, period={period}")
+                logger.info(f"Ride details requested: ride_id={ride_id}, period={period}")
+
+                return response
 
-            # Cache the result (5-minute TTL for today, 1-hour TTL for historical)
-            cache.set(cache_key, response)
-            logger.info(f"Cache STORE for ride details: ride_id={ride_id}, period={period}")
+        # Single-flight: concurrent requests for this key share one computation
+        cache = get_query_cache()
+        response = cache.get_or_compute(
+            key=cache_key, compute_fn=compute_response,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
+        if response is None:
+            return jsonify({
+                "success": False,
+                "error": f"Ride {ride_id} not found"
+            }), 404
 
-            return jsonify(response), 200
+        return jsonify(response), 200
 
     except Exception as e:
         logger.error(f"Error fetching ride details for ride {ride_id}: {e}", exc_info=True)
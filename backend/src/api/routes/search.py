@@ -15,11 +15,16 @@ from sqlalchemy import select
 
 from database.connection import get_db_session
 from models import Park, Ride
+from api.middleware.http_cache import cached_json_response
+from api.cache_warming import warmable
 from utils.cache import get_query_cache, generate_cache_key
 from utils.logger import logger
 
 search_bp = Blueprint('search', __name__)
 
+# Cacheable page-load request (warmed by scripts/warm_cache.py)
+warmable('/search/index')
+
 
 @search_bp.route('/search/index', methods=['GET'])
 def get_search_index():
@@ -35,17 +40,13 @@ def get_search_index():
         - rides: List of ride objects with id, name, park_name, park_id, type, url
         - meta: Index metadata (counts, last_updated timestamp)
 
-    Performance: <100ms (cached for 5 minutes)
+    Performance: <100ms (cached for 5 minutes). Cached as serialized
+    (and gzipped) JSON with an ETag; repeat loads get 304 Not Modified.
     """
-    # Check cache first
     cache = get_query_cache()
     cache_key = generate_cache_key("search_index")
 
-    cached_result = cache.get(cache_key)
-    if cached_result:
-        return jsonify(cached_result)
-
-    try:
+    def compute_response():
         with get_db_session() as session:
             # Fetch all active parks using ORM
             parks_stmt = (
@@ -121,10 +122,11 @@ def get_search_index():
             }
         }
 
-        # Cache result (uses default TTL from QueryCache)
-        cache.set(cache_key, response)
+        return response
 
-        return jsonify(response)
+    try:
+        # Uses default TTL from QueryCache
+        return cached_json_response(cache, cache_key, compute_response)
 
     except Exception as e:
         logger.error(f"Error fetching search index: {e}")
@@ -42,12 +42,27 @@ from database.queries.charts import (
 
 from utils.logger import logger
 from utils.timezone import get_today_pacific, get_now_pacific, get_last_week_date_range, get_last_month_date_range, PERIOD_ALIASES
-from utils.cache import get_query_cache, generate_cache_key
+from api.middleware.http_cache import cached_json_response
+from api.cache_warming import warmable, FILTERS, HISTORICAL_PERIODS
+from utils.cache import get_query_cache, generate_cache_key, with_cache_freshness
+from utils.data_epoch import cache_policy_for_period
 from utils.heatmap_helpers import transform_chart_to_heatmap, validate_heatmap_period
 
 # Create Blueprint
 trends_bp = Blueprint('trends', __name__)
 
+# Cacheable page-load combinations (warmed by scripts/warm_cache.py).
+# The frontend shows LIVE trends and charts as TODAY.
+warmable('/trends', period=HISTORICAL_PERIODS, filter=FILTERS, limit=[20],
+         category=['parks-improving', 'parks-declining', 'rides-improving', 'rides-declining'])
+warmable('/trends/chart-data', period=HISTORICAL_PERIODS, filter=FILTERS, type=['parks', 'waittimes'], limit=[4])
+warmable('/trends/chart-data', period=HISTORICAL_PERIODS, filter=FILTERS, type=['rides', 'ridewaittimes'], limit=[5])
+warmable('/trends/heatmap-data', period=HISTORICAL_PERIODS, filter=FILTERS, limit=[10],
+         type=['parks', 'parks-shame', 'rides-downtime', 'rides-waittimes'])
+for _awards_path in ('/trends/longest-wait-times', '/trends/least-reliable'):
+    warmable(_awards_path, period=HISTORICAL_PERIODS, filter=FILTERS, entity=['parks', 'rides'], limit=[10])
+    warmable(_awards_path, period=HISTORICAL_PERIODS, filter=['all-parks'], entity=['parks', 'rides'], limit=[1])
+
 
 @trends_bp.route('/trends', methods=['GET'])
 def get_trends():
@@ -123,46 +138,64 @@ def get_trends():
         period_info = _calculate_period_dates(normalized_period)
         filter_disney_universal = (park_filter == 'disney-universal')
 
-        # Get database connection using context manager
-        # Note: ImprovingParksQuery uses ORM (Session), others still use Core (Connection)
-        if category == 'parks-improving':
-            # See: database/queries/trends/improving_parks.py (ORM)
-            with get_db_session() as session:
-                query = ImprovingParksQuery(session)
-                results = query.get_improving(
-                    period=normalized_period,
-                    filter_disney_universal=filter_disney_universal,
-                    limit=limit
-                )
-        else:
-            with get_db_session() as session:
-                # Route to appropriate query class based on category
-                if category == 'parks-declining':
-                    # See: database/queries/trends/declining_parks.py
-                    query = DecliningParksQuery(session)
-                    results = query.get_declining(
-                        period=normalized_period,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                elif category == 'rides-improving':
-                    # See: database/queries/trends/improving_rides.py
-                    query = ImprovingRidesQuery(session)
+        # PERFORMANCE: Cache trend comparisons (stale-while-revalidate)
+        cache = get_query_cache()
+        policy = cache_policy_for_period(normalized_period)
+        cache_key = generate_cache_key(
+            "trends",
+            period=normalized_period,
+            category=category,
+            filter=park_filter,
+            limit=str(limit),
+            **policy.key_params
+        )
+
+        def compute_results():
+            # Get database connection using context manager
+            # Note: ImprovingParksQuery uses ORM (Session), others still use Core (Connection)
+            if category == 'parks-improving':
+                # See: database/queries/trends/improving_parks.py (ORM)
+                with get_db_session() as session:
+                    query = ImprovingParksQuery(session)
                     results = query.get_improving(
                         period=normalized_period,
                         filter_disney_universal=filter_disney_universal,
                         limit=limit
                     )
-                elif category == 'rides-declining':
-                    # See: database/queries/trends/declining_rides.py
-                    query = DecliningRidesQuery(session)
-                    results = query.get_declining(
-                        period=normalized_period,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-
-        results = _attach_queue_times_urls(category, results)
+            else:
+                with get_db_session() as session:
+                    # Route to appropriate query class based on category
+                    if category == 'parks-declining':
+                        # See: database/queries/trends/declining_parks.py
+                        query = DecliningParksQuery(session)
+                        results = query.get_declining(
+                            period=normalized_period,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    elif category == 'rides-improving':
+                        # See: database/queries/trends/improving_rides.py
+                        query = ImprovingRidesQuery(session)
+                        results = query.get_improving(
+                            period=normalized_period,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    elif category == 'rides-declining':
+                        # See: database/queries/trends/declining_rides.py
+                        query = DecliningRidesQuery(session)
+                        results = query.get_declining(
+                            period=normalized_period,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+
+            return _attach_queue_times_urls(category, results)
+
+        results, cached_at = cache.get_or_compute_with_timestamp(
+            key=cache_key, compute_fn=compute_results, serve_stale=True,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
         # Build response
         response = {
@@ -185,7 +218,7 @@ def get_trends():
         else:
             response['rides'] = results
 
-        return jsonify(response), 200
+        return jsonify(with_cache_freshness(response, cached_at)), 200
 
     except ValueError as e:
         logger.error(f"Validation error in get_trends: {e}")
@@ -272,187 +305,207 @@ def get_chart_data():
             limit = min(max(limit, 1), 20)
 
         today = get_today_pacific()
-        is_mock = False
-        granularity = 'daily'
         filter_disney_universal = (park_filter == 'disney-universal')
 
-        # Get database connection
-        with get_db_session() as session:
-            if period == 'live':
-                # LIVE: 5-minute granularity for recent data (last 60 minutes)
-                granularity = 'minutes'
-                if data_type == 'parks':
-                    # See: database/queries/charts/park_shame_history.py
-                    query = ParkShameHistoryQuery(session)
-                    chart_data = query.get_live(
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit,
-                        minutes=60
-                    )
-                elif data_type == 'waittimes':
-                    query = ParkWaitTimeHistoryQuery(session)
-                    chart_data = query.get_live(
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit,
-                        minutes=60
-                    )
-                elif data_type == 'rides':
-                    query = RideDowntimeHistoryQuery(session)
-                    chart_data = query.get_live(
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit,
-                        minutes=60
-                    )
-                else:  # ridewaittimes
-                    query = RideWaitTimeHistoryQuery(session)
-                    chart_data = query.get_live(
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit,
-                        minutes=60
-                    )
-
-                # Generate mock data if empty for LIVE
-                if not chart_data or not chart_data.get('datasets') or len(chart_data.get('datasets', [])) == 0:
-                    is_mock = True
-                    chart_data = _generate_mock_live_chart_data(data_type, limit)
-
-            elif period == 'today':
-                # TODAY: Hourly data for the full day
-                granularity = 'hourly'
-                if data_type == 'parks':
-                    # See: database/queries/charts/park_shame_history.py
-                    query = ParkShameHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=today,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                elif data_type == 'waittimes':
-                    # See: database/queries/charts/park_waittime_history.py
-                    query = ParkWaitTimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=today,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                elif data_type == 'rides':
-                    # See: database/queries/charts/ride_downtime_history.py
-                    query = RideDowntimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=today,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                else:  # ridewaittimes
-                    # See: database/queries/charts/ride_waittime_history.py
-                    query = RideWaitTimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=today,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-
-                # Generate mock hourly data if empty (for TODAY, limit to current hour)
-                if not chart_data or not chart_data.get('datasets') or len(chart_data.get('datasets', [])) == 0:
-                    is_mock = True
-                    chart_data = _generate_mock_hourly_chart_data(data_type, limit, for_today=True)
-
-            elif period == 'yesterday':
-                # Hourly data for yesterday (similar to today, but for previous day)
-                granularity = 'hourly'
-                yesterday = today - timedelta(days=1)
-                if data_type == 'parks':
-                    query = ParkShameHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=yesterday,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                elif data_type == 'waittimes':
-                    query = ParkWaitTimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=yesterday,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                elif data_type == 'rides':
-                    query = RideDowntimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=yesterday,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                else:  # ridewaittimes
-                    query = RideWaitTimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=yesterday,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-
-                # Generate mock hourly data if empty (for YESTERDAY, show full day)
-                if not chart_data or not chart_data.get('datasets') or len(chart_data.get('datasets', [])) == 0:
-                    is_mock = True
-                    chart_data = _generate_mock_hourly_chart_data(data_type, limit, for_today=False)
+        # PERFORMANCE: Cache chart series (stale-while-revalidate)
+        cache = get_query_cache()
+        policy = cache_policy_for_period(period)
+        cache_key = generate_cache_key(
+            "trends_chart_data",
+            period=period,
+            type=data_type,
+            filter=park_filter,
+            limit=str(limit),
+            **policy.key_params
+        )
 
-            else:
-                # Daily data for last_week/last_month (calendar-based periods)
-                if period == 'last_week':
-                    start_date, end_date, _ = get_last_week_date_range()
-                    days = (end_date - start_date).days + 1  # Include both start and end
-                else:  # last_month
-                    start_date, end_date, _ = get_last_month_date_range()
-                    days = (end_date - start_date).days + 1
-
-                if data_type == 'parks':
-                    # See: database/queries/charts/park_shame_history.py
-                    query = ParkShameHistoryQuery(session)
-                    chart_data = query.get_daily(
-                        days=days,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                elif data_type == 'waittimes':
-                    # See: database/queries/charts/park_waittime_history.py
-                    query = ParkWaitTimeHistoryQuery(session)
-                    chart_data = query.get_daily(
-                        days=days,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                elif data_type == 'rides':
-                    # See: database/queries/charts/ride_downtime_history.py
-                    query = RideDowntimeHistoryQuery(session)
-                    chart_data = query.get_daily(
-                        days=days,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                else:  # ridewaittimes
-                    # See: database/queries/charts/ride_waittime_history.py
-                    query = RideWaitTimeHistoryQuery(session)
-                    chart_data = query.get_daily(
-                        days=days,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
+        def compute_chart():
+            is_mock = False
+            granularity = 'daily'
 
-                # Generate mock daily data if empty
-                if not chart_data or not chart_data.get('datasets') or len(chart_data.get('datasets', [])) == 0:
-                    is_mock = True
-                    chart_data = _generate_mock_chart_data(data_type, days, limit)
+            # Get database connection
+            with get_db_session() as session:
+                if period == 'live':
+                    # LIVE: 5-minute granularity for recent data (last 60 minutes)
+                    granularity = 'minutes'
+                    if data_type == 'parks':
+                        # See: database/queries/charts/park_shame_history.py
+                        query = ParkShameHistoryQuery(session)
+                        chart_data = query.get_live(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit,
+                            minutes=60
+                        )
+                    elif data_type == 'waittimes':
+                        query = ParkWaitTimeHistoryQuery(session)
+                        chart_data = query.get_live(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit,
+                            minutes=60
+                        )
+                    elif data_type == 'rides':
+                        query = RideDowntimeHistoryQuery(session)
+                        chart_data = query.get_live(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit,
+                            minutes=60
+                        )
+                    else:  # ridewaittimes
+                        query = RideWaitTimeHistoryQuery(session)
+                        chart_data = query.get_live(
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit,
+                            minutes=60
+                        )
+
+                    # Generate mock data if empty for LIVE
+                    if not chart_data or not chart_data.get('datasets') or len(chart_data.get('datasets', [])) == 0:
+                        is_mock = True
+                        chart_data = _generate_mock_live_chart_data(data_type, limit)
+
+                elif period == 'today':
+                    # TODAY: Hourly data for the full day
+                    granularity = 'hourly'
+                    if data_type == 'parks':
+                        # See: database/queries/charts/park_shame_history.py
+                        query = ParkShameHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=today,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    elif data_type == 'waittimes':
+                        # See: database/queries/charts/park_waittime_history.py
+                        query = ParkWaitTimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=today,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    elif data_type == 'rides':
+                        # See: database/queries/charts/ride_downtime_history.py
+                        query = RideDowntimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=today,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    else:  # ridewaittimes
+                        # See: database/queries/charts/ride_waittime_history.py
+                        query = RideWaitTimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=today,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+
+                    # Generate mock hourly data if empty (for TODAY, limit to current hour)
+                    if not chart_data or not chart_data.get('datasets') or len(chart_data.get('datasets', [])) == 0:
+                        is_mock = True
+                        chart_data = _generate_mock_hourly_chart_data(data_type, limit, for_today=True)
+
+                elif period == 'yesterday':
+                    # Hourly data for yesterday (similar to today, but for previous day)
+                    granularity = 'hourly'
+                    yesterday = today - timedelta(days=1)
+                    if data_type == 'parks':
+                        query = ParkShameHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=yesterday,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    elif data_type == 'waittimes':
+                        query = ParkWaitTimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=yesterday,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    elif data_type == 'rides':
+                        query = RideDowntimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=yesterday,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    else:  # ridewaittimes
+                        query = RideWaitTimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=yesterday,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+
+                    # Generate mock hourly data if empty (for YESTERDAY, show full day)
+                    if not chart_data or not chart_data.get('datasets') or len(chart_data.get('datasets', [])) == 0:
+                        is_mock = True
+                        chart_data = _generate_mock_hourly_chart_data(data_type, limit, for_today=False)
 
-        return jsonify({
-            "success": True,
-            "period": period,
-            "type": data_type,
-            "filter": park_filter,
-            "chart_data": chart_data,
-            "mock": is_mock,
-            "granularity": granularity,
-            "attribution": "Data powered by ThemeParks.wiki - https://themeparks.wiki",
-            "timestamp": datetime.utcnow().isoformat() + 'Z'
-        }), 200
+                else:
+                    # Daily data for last_week/last_month (calendar-based periods)
+                    if period == 'last_week':
+                        start_date, end_date, _ = get_last_week_date_range()
+                        days = (end_date - start_date).days + 1  # Include both start and end
+                    else:  # last_month
+                        start_date, end_date, _ = get_last_month_date_range()
+                        days = (end_date - start_date).days + 1
+
+                    if data_type == 'parks':
+                        # See: database/queries/charts/park_shame_history.py
+                        query = ParkShameHistoryQuery(session)
+                        chart_data = query.get_daily(
+                            days=days,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    elif data_type == 'waittimes':
+                        # See: database/queries/charts/park_waittime_history.py
+                        query = ParkWaitTimeHistoryQuery(session)
+                        chart_data = query.get_daily(
+                            days=days,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    elif data_type == 'rides':
+                        # See: database/queries/charts/ride_downtime_history.py
+                        query = RideDowntimeHistoryQuery(session)
+                        chart_data = query.get_daily(
+                            days=days,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                    else:  # ridewaittimes
+                        # See: database/queries/charts/ride_waittime_history.py
+                        query = RideWaitTimeHistoryQuery(session)
+                        chart_data = query.get_daily(
+                            days=days,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+
+                    # Generate mock daily data if empty
+                    if not chart_data or not chart_data.get('datasets') or len(chart_data.get('datasets', [])) == 0:
+                        is_mock = True
+                        chart_data = _generate_mock_chart_data(data_type, days, limit)
+
+            return {
+                "success": True,
+                "period": period,
+                "type": data_type,
+                "filter": park_filter,
+                "chart_data": chart_data,
+                "mock": is_mock,
+                "granularity": granularity,
+                "attribution": "Data powered by ThemeParks.wiki - https://themeparks.wiki",
+                "timestamp": datetime.utcnow().isoformat() + 'Z'
+            }
+
+        # Chart series are large, so cache the serialized (and gzipped) JSON
+        return cached_json_response(
+            cache, cache_key, compute_chart, serve_stale=True,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
     except ValueError as e:
         logger.error(f"Validation error in get_chart_data: {e}")
@@ -525,14 +578,16 @@ def get_longest_wait_times():
 
         filter_disney_universal = (park_filter == 'disney-universal')
 
-        # PERFORMANCE: Use 5-minute cache for expensive aggregation queries
+        # PERFORMANCE: Cache expensive aggregation queries until the data epoch advances
         cache = get_query_cache()
+        policy = cache_policy_for_period(period)
         cache_key = generate_cache_key(
             "longest_wait_times",
             period=period,
             filter=park_filter,
             entity=entity,
-            limit=str(limit)
+            limit=str(limit),
+            **policy.key_params
         )
 
         def compute_results():
@@ -551,7 +606,10 @@ def get_longest_wait_times():
                         limit=limit
                     )
 
-        results = cache.get_or_compute(key=cache_key, compute_fn=compute_results)
+        results, cached_at = cache.get_or_compute_with_timestamp(
+            key=cache_key, compute_fn=compute_results, serve_stale=True,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
         # Add rank to results
         ranked_results = []
@@ -559,7 +617,7 @@ def get_longest_wait_times():
             item['rank'] = idx
             ranked_results.append(item)
 
-        return jsonify({
+        return jsonify(with_cache_freshness({
             "success": True,
             "period": period,
             "filter": park_filter,
@@ -569,7 +627,7 @@ def get_longest_wait_times():
             "cached": True,
             "attribution": "Data powered by ThemeParks.wiki - https://themeparks.wiki",
             "timestamp": datetime.utcnow().isoformat() + 'Z'
-        }), 200
+        }, cached_at)), 200
 
     except ValueError as e:
         logger.error(f"Validation error in get_longest_wait_times: {e}")
@@ -639,14 +697,16 @@ def get_least_reliable():
 
         filter_disney_universal = (park_filter == 'disney-universal')
 
-        # PERFORMANCE: Use 5-minute cache for expensive aggregation queries
+        # PERFORMANCE: Cache expensive aggregation queries until the data epoch advances
         cache = get_query_cache()
+        policy = cache_policy_for_period(period)
         cache_key = generate_cache_key(
             "least_reliable",
             period=period,
             filter=park_filter,
             entity=entity,
-            limit=str(limit)
+            limit=str(limit),
+            **policy.key_params
         )
 
         def compute_results():
@@ -665,7 +725,10 @@ def get_least_reliable():
                         limit=limit
                     )
 
-        results = cache.get_or_compute(key=cache_key, compute_fn=compute_results)
+        results, cached_at = cache.get_or_compute_with_timestamp(
+            key=cache_key, compute_fn=compute_results, serve_stale=True,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
         # Add rank to results
         ranked_results = []
@@ -673,7 +736,7 @@ def get_least_reliable():
             item['rank'] = idx
             ranked_results.append(item)
 
-        return jsonify({
+        return jsonify(with_cache_freshness({
             "success": True,
             "period": period,
             "filter": park_filter,
@@ -683,7 +746,7 @@ def get_least_reliable():
             "cached": True,
             "attribution": "Data powered by ThemeParks.wiki - https://themeparks.wiki",
             "timestamp": datetime.utcnow().isoformat() + 'Z'
-        }), 200
+        }, cached_at)), 200
 
     except ValueError as e:
         logger.error(f"Validation error in get_least_reliable: {e}")
@@ -784,110 +847,128 @@ def get_heatmap_data():
         today = get_today_pacific()
         filter_disney_universal = (park_filter == 'disney-universal')
 
-        # Get database connection
-        with get_db_session() as session:
-            # Determine granularity and call appropriate method
-            if period in ['today', 'yesterday']:
-                # Hourly granularity
-                granularity = 'hourly'
-                target_date = today if period == 'today' else today - timedelta(days=1)
-
-                if heatmap_type == 'parks':
-                    query = ParkWaitTimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=target_date,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                    metric = 'avg_wait_time_minutes'
-                    metric_unit = 'minutes'
-                elif heatmap_type == 'parks-shame':
-                    query = ParkShameHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=target_date,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                    metric = 'shame_score'
-                    metric_unit = 'points'
-                elif heatmap_type == 'rides-downtime':
-                    query = RideDowntimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=target_date,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                    metric = 'downtime_hours'
-                    metric_unit = 'hours'
-                else:  # rides-waittimes
-                    query = RideWaitTimeHistoryQuery(session)
-                    chart_data = query.get_hourly(
-                        target_date=target_date,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                    metric = 'avg_wait_time_minutes'
-                    metric_unit = 'minutes'
-
-            else:  # last_week or last_month
-                # Daily granularity
-                granularity = 'daily'
-                if period == 'last_week':
-                    start_date, end_date, _ = get_last_week_date_range()
-                    days = (end_date - start_date).days + 1
-                else:  # last_month
-                    start_date, end_date, _ = get_last_month_date_range()
-                    days = (end_date - start_date).days + 1
-
-                if heatmap_type == 'parks':
-                    query = ParkWaitTimeHistoryQuery(session)
-                    chart_data = query.get_daily(
-                        days=days,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                    metric = 'avg_wait_time_minutes'
-                    metric_unit = 'minutes'
-                elif heatmap_type == 'parks-shame':
-                    query = ParkShameHistoryQuery(session)
-                    chart_data = query.get_daily(
-                        days=days,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                    metric = 'shame_score'
-                    metric_unit = 'points'
-                elif heatmap_type == 'rides-downtime':
-                    query = RideDowntimeHistoryQuery(session)
-                    chart_data = query.get_daily(
-                        days=days,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                    metric = 'downtime_hours'
-                    metric_unit = 'hours'
-                else:  # rides-waittimes
-                    query = RideWaitTimeHistoryQuery(session)
-                    chart_data = query.get_daily(
-                        days=days,
-                        filter_disney_universal=filter_disney_universal,
-                        limit=limit
-                    )
-                    metric = 'avg_wait_time_minutes'
-                    metric_unit = 'minutes'
+        # PERFORMANCE: Cache heatmap matrices (stale-while-revalidate)
+        cache = get_query_cache()
+        policy = cache_policy_for_period(period)
+        cache_key = generate_cache_key(
+            "trends_heatmap_data",
+            period=period,
+            type=heatmap_type,
+            filter=park_filter,
+            limit=str(limit),
+            **policy.key_params
+        )
 
-            # Add granularity to chart_data for transformation
-            chart_data['granularity'] = granularity
+        def compute_heatmap():
+            # Get database connection
+            with get_db_session() as session:
+                # Determine granularity and call appropriate method
+                if period in ['today', 'yesterday']:
+                    # Hourly granularity
+                    granularity = 'hourly'
+                    target_date = today if period == 'today' else today - timedelta(days=1)
+
+                    if heatmap_type == 'parks':
+                        query = ParkWaitTimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=target_date,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                        metric = 'avg_wait_time_minutes'
+                        metric_unit = 'minutes'
+                    elif heatmap_type == 'parks-shame':
+                        query = ParkShameHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=target_date,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                        metric = 'shame_score'
+                        metric_unit = 'points'
+                    elif heatmap_type == 'rides-downtime':
+                        query = RideDowntimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=target_date,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                        metric = 'downtime_hours'
+                        metric_unit = 'hours'
+                    else:  # rides-waittimes
+                        query = RideWaitTimeHistoryQuery(session)
+                        chart_data = query.get_hourly(
+                            target_date=target_date,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                        metric = 'avg_wait_time_minutes'
+                        metric_unit = 'minutes'
+
+                else:  # last_week or last_month
+                    # Daily granularity
+                    granularity = 'daily'
+                    if period == 'last_week':
+                        start_date, end_date, _ = get_last_week_date_range()
+                        days = (end_date - start_date).days + 1
+                    else:  # last_month
+                        start_date, end_date, _ = get_last_month_date_range()
+                        days = (end_date - start_date).days + 1
+
+                    if heatmap_type == 'parks':
+                        query = ParkWaitTimeHistoryQuery(session)
+                        chart_data = query.get_daily(
+                            days=days,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                        metric = 'avg_wait_time_minutes'
+                        metric_unit = 'minutes'
+                    elif heatmap_type == 'parks-shame':
+                        query = ParkShameHistoryQuery(session)
+                        chart_data = query.get_daily(
+                            days=days,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                        metric = 'shame_score'
+                        metric_unit = 'points'
+                    elif heatmap_type == 'rides-downtime':
+                        query = RideDowntimeHistoryQuery(session)
+                        chart_data = query.get_daily(
+                            days=days,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                        metric = 'downtime_hours'
+                        metric_unit = 'hours'
+                    else:  # rides-waittimes
+                        query = RideWaitTimeHistoryQuery(session)
+                        chart_data = query.get_daily(
+                            days=days,
+                            filter_disney_universal=filter_disney_universal,
+                            limit=limit
+                        )
+                        metric = 'avg_wait_time_minutes'
+                        metric_unit = 'minutes'
+
+                # Add granularity to chart_data for transformation
+                chart_data['granularity'] = granularity
+
+                # Transform Chart.js format to Heatmap matrix format
+                heatmap_data = transform_chart_to_heatmap(
+                    chart_data=chart_data,
+                    period=period,
+                    metric=metric,
+                    metric_unit=metric_unit
+                )
 
-            # Transform Chart.js format to Heatmap matrix format
-            heatmap_data = transform_chart_to_heatmap(
-                chart_data=chart_data,
-                period=period,
-                metric=metric,
-                metric_unit=metric_unit
-            )
+            return heatmap_data
 
-        return jsonify(heatmap_data), 200
+        return cached_json_response(
+            cache, cache_key, compute_heatmap, serve_stale=True,
+            epoch=policy.epoch, ttl=policy.ttl_seconds
+        )
 
     except ValueError as e:
         logger.error(f"Validation error in get_heatmap_data: {e}")
@@ -0,0 +1,108 @@
+"""
+Theme Park Downtime Tracker - Last Status Cache
+Persists each ride's latest snapshot between collector runs in a small JSON
+state file, so status-change detection needs no historical scan on startup.
+"""
+
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from utils.logger import logger
+
+
+class LastStatusCache:
+    """
+    JSON-file store of the last snapshot per ride.
+
+    Entries have the same shape as RideStatusSnapshotRepository.get_latest_by_ride()
+    (status, computed_is_open, recorded_at), so they can be fed straight into the
+    collector's change detection. State older than max_age_minutes is treated
+    as missing - the database stays the source of truth after an outage.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str, max_age_minutes: int = 30):
+        """
+        Initialize cache.
+
+        Args:
+            path: State file location
+            max_age_minutes: Maximum age of saved state before it is ignored
+        """
+        self.path = Path(path)
+        self.max_age = timedelta(minutes=max_age_minutes)
+
+    def load(self, now: Optional[datetime] = None) -> Optional[Dict[int, Dict[str, Any]]]:
+        """
+        Load saved latest snapshots.
+
+        Args:
+            now: Current time (defaults to datetime.now())
+
+        Returns:
+            Dict mapping ride_id to snapshot dict, or None if the state file is
+            missing, unreadable, from another format version, or stale
+        """
+        if not self.path.exists():
+            return None
+
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+
+            if state.get('version') != self.FORMAT_VERSION:
+                return None
+
+            saved_at = datetime.fromisoformat(state['saved_at'])
+            if (now or datetime.now()) - saved_at > self.max_age:
+                logger.info(f"Last status cache is stale (saved {saved_at.isoformat()}) - ignoring")
+                return None
+
+            return {
+                int(ride_id): {
+                    'ride_id': int(ride_id),
+                    'status': entry.get('status'),
+                    'computed_is_open': entry['computed_is_open'],
+                    'recorded_at': datetime.fromisoformat(entry['recorded_at']),
+                }
+                for ride_id, entry in state['rides'].items()
+            }
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Could not read last status cache {self.path}: {e}")
+            return None
+
+    def save(self, snapshots: Dict[int, Dict[str, Any]], saved_at: Optional[datetime] = None):
+        """
+        Atomically write latest snapshots to the state file.
+
+        Args:
+            snapshots: Dict mapping ride_id to snapshot dict
+            saved_at: Timestamp recorded as the state's age (defaults to now)
+        """
+        state = {
+            'version': self.FORMAT_VERSION,
+            'saved_at': (saved_at or datetime.now()).isoformat(),
+            'rides': {
+                str(ride_id): {
+                    'status': snapshot.get('status'),
+                    'computed_is_open': bool(snapshot['computed_is_open']),
+                    'recorded_at': snapshot['recorded_at'].isoformat(),
+                }
+                for ride_id, snapshot in snapshots.items()
+            },
+        }
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write last status cache {self.path}: {e}")
@@ -0,0 +1,83 @@
+"""
+Theme Park Downtime Tracker - Ride Identity Map
+Per-collection-cycle lookup of rides by provider ID, loaded with one query.
+"""
+
+from typing import Dict, Optional
+
+from models.ride import Ride
+from database.repositories.ride_repository import RideRepository
+
+
+class RideIdentityMap:
+    """
+    In-memory index of rides keyed by ThemeParks.wiki UUID and Queue-Times ID.
+
+    Mirrors RideRepository's get_by_themeparks_wiki_id/get_by_queue_times_id
+    so it can stand in for the repository during a collection cycle.
+    Only IDs missing from the map (genuinely new or inactive entities) fall
+    back to the database, and those results - including misses - are memoized
+    so a ride is never looked up twice in one cycle.
+
+    Usage:
+        ride_map = RideIdentityMap(ride_repo)
+        ride_map.load()
+        ride = ride_map.get_by_themeparks_wiki_id(entity_id)
+    """
+
+    def __init__(self, ride_repo: RideRepository):
+        """
+        Initialize identity map.
+
+        Args:
+            ride_repo: Ride repository used for loading and DB fallbacks
+        """
+        self.ride_repo = ride_repo
+        self._by_themeparks_wiki_id: Dict[str, Optional[Ride]] = {}
+        self._by_queue_times_id: Dict[int, Optional[Ride]] = {}
+        self.db_fallbacks = 0
+
+    def load(self) -> int:
+        """
+        Load all active rides (with park, tier and category) in one query.
+
+        Returns:
+            Number of rides loaded
+        """
+        identities = self.ride_repo.get_all_active_identities()
+        for themeparks_wiki_id, ride in identities:
+            if themeparks_wiki_id:
+                self._by_themeparks_wiki_id[themeparks_wiki_id] = ride
+            if ride.queue_times_id is not None:
+                self._by_queue_times_id[ride.queue_times_id] = ride
+        return len(identities)
+
+    def get_by_themeparks_wiki_id(self, wiki_id: str) -> Optional[Ride]:
+        """
+        Look up ride by ThemeParks.wiki entity UUID.
+
+        Args:
+            wiki_id: ThemeParks.wiki entity UUID
+
+        Returns:
+            Ride dataclass object or None if not found
+        """
+        if wiki_id not in self._by_themeparks_wiki_id:
+            self.db_fallbacks += 1
+            self._by_themeparks_wiki_id[wiki_id] = self.ride_repo.get_by_themeparks_wiki_id(wiki_id)
+        return self._by_themeparks_wiki_id[wiki_id]
+
+    def get_by_queue_times_id(self, queue_times_id: int) -> Optional[Ride]:
+        """
+        Look up ride by Queue-Times.com ride ID.
+
+        Args:
+            queue_times_id: Queue-Times.com ride ID
+
+        Returns:
+            Ride dataclass object or None if not found
+        """
+        if queue_times_id not in self._by_queue_times_id:
+            self.db_fallbacks += 1
+            self._by_queue_times_id[queue_times_id] = self.ride_repo.get_by_queue_times_id(queue_times_id)
+        return self._by_queue_times_id[queue_times_id]
@@ -11,6 +11,7 @@ Components:
 - anomaly_detector.py: Statistical anomaly detection (Z-scores, sudden changes)
 - computation_trace.py: Step-by-step calculation traces for user audits
 - aggregate_verification.py: Verify aggregates match raw snapshot calculations
+- query_plans.py: Verify the query classes are served by indexes (EXPLAIN)
 
 Usage:
     from database.audit import ValidationChecker, AnomalyDetector
@@ -34,6 +35,7 @@ from .validation_checks import ValidationChecker, VALIDATION_RULES_METADATA
 from .anomaly_detector import AnomalyDetector
 from .computation_trace import ComputationTracer
 from .aggregate_verification import AggregateVerifier, AggregateAuditResult, AuditSummary
+from .query_plans import QueryPlanAuditor, QueryPlanReport, QUERY_CASES
 
 __all__ = [
     "ValidationChecker",
@@ -43,4 +45,7 @@ __all__ = [
     "AggregateVerifier",
     "AggregateAuditResult",
     "AuditSummary",
+    "QueryPlanAuditor",
+    "QueryPlanReport",
+    "QUERY_CASES",
 ]
@@ -12,6 +12,11 @@ Usage:
     if not summary.overall_passed:
         print(f"Verification failed: {summary.issues_found}")
 
+For dates whose raw snapshots were cleaned up, ride_daily_stats can be
+recalculated from the columnar archive (database/snapshot_archive.py):
+
+    verifier = AggregateVerifier(session, archive=SnapshotArchive(SNAPSHOT_ARCHIVE_DIR))
+
 Verification Process:
 1. Calculate expected values from raw snapshots using correct Pacific timezone
 2. Compare against stored values in aggregate tables
@@ -29,6 +34,7 @@ from models.orm_park import Park
 from models.orm_ride import Ride
 from models.orm_snapshots import RideStatusSnapshot, ParkActivitySnapshot
 from models.orm_stats import RideDailyStats, ParkDailyStats, RideHourlyStats, ParkHourlyStats
+from database.snapshot_archive import SnapshotArchive, ride_day_counts
 from utils.timezone import get_pacific_day_range_utc
 from utils.metrics import SNAPSHOT_INTERVAL_MINUTES
 
@@ -152,8 +158,15 @@ class AggregateVerifier:
         }
     }
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, archive: Optional[SnapshotArchive] = None):
+        """
+        Args:
+            session: Database session or connection
+            archive: Recalculate ride_daily_stats from this columnar snapshot
+                     archive instead of the raw snapshot tables
+        """
         self.session = session
+        self.archive = archive
         self.snapshot_interval = SNAPSHOT_INTERVAL_MINUTES
 
     def audit_date(self, target_date: date) -> AuditSummary:
@@ -210,6 +223,88 @@ class AggregateVerifier:
         day_start_utc, day_end_utc = get_pacific_day_range_utc(target_date)
         tolerances = self.TOLERANCES['ride_daily']
 
+        if self.archive is not None:
+            rows = self._ride_daily_rows_from_archive(target_date, day_start_utc, day_end_utc)
+        else:
+            rows = self._ride_daily_rows_from_database(target_date, day_start_utc, day_end_utc)
+
+        # Analyze results
+        total_checked = len(rows)
+        mismatches = []
+        missing_count = 0
+
+        uptime_deltas = []
+        downtime_deltas = []
+
+        for row in rows:
+            if row['missing_from_aggregate']:
+                missing_count += 1
+                mismatches.append(row)
+                continue
+
+            uptime_deltas.append(row['uptime_delta'])
+            downtime_deltas.append(row['downtime_delta'])
+
+            # Check tolerances
+            if (row['uptime_delta'] > tolerances['uptime_minutes'] or
+                row['downtime_delta'] > tolerances['downtime_minutes']):
+                mismatches.append(row)
+
+        match_count = total_checked - len(mismatches)
+        match_rate = match_count / total_checked if total_checked > 0 else 1.0
+
+        # Build result
+        audit_result = AggregateAuditResult(
+            table_name='ride_daily_stats',
+            target_date=target_date,
+            total_records_checked=total_checked,
+            records_matching=match_count,
+            records_mismatched=len(mismatches) - missing_count,
+            records_missing_from_aggregate=missing_count,
+            records_missing_from_raw=0,
+            match_rate=match_rate,
+            max_deviation={
+                'uptime_minutes': max(uptime_deltas) if uptime_deltas else 0,
+                'downtime_minutes': max(downtime_deltas) if downtime_deltas else 0,
+            },
+            avg_deviation={
+                'uptime_minutes': sum(uptime_deltas) / len(uptime_deltas) if uptime_deltas else 0,
+                'downtime_minutes': sum(downtime_deltas) / len(downtime_deltas) if downtime_deltas else 0,
+            },
+            worst_mismatches=mismatches[:10]
+        )
+
+        # Determine severity
+        if len(mismatches) > 0:
+            audit_result.passed = False
+            if len(mismatches) > 10 or missing_count > 5:
+                audit_result.severity = "CRITICAL"
+                audit_result.message = (
+                    f"ride_daily_stats: {len(mismatches)} mismatches "
+                    f"({missing_count} missing, {len(mismatches) - missing_count} wrong values)"
+                )
+            else:
+                audit_result.severity = "WARNING"
+                audit_result.message = (
+                    f"ride_daily_stats: {len(mismatches)} minor discrepancies"
+                )
+        else:
+            audit_result.message = f"ride_daily_stats: All {total_checked} records verified"
+
+        return audit_result
+
+    def _ride_daily_rows_from_database(
+        self,
+        target_date: date,
+        day_start_utc: datetime,
+        day_end_utc: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Stored vs. recalculated ride_daily_stats values, calculated in SQL from raw snapshots.
+
+        Returns:
+            One dict per ride, missing aggregates first, then by largest delta
+        """
         # CTE: Rides that operated at least once during the Pacific day
         rides_operated_today = (
             self.session.query(distinct(RideStatusSnapshot.ride_id).label('ride_id'))
@@ -397,70 +492,71 @@ class AggregateVerifier:
             for row in results
         ]
 
-        # Analyze results
-        total_checked = len(rows)
-        mismatches = []
-        missing_count = 0
-
-        uptime_deltas = []
-        downtime_deltas = []
-
-        for row in rows:
-            if row['missing_from_aggregate']:
-                missing_count += 1
-                mismatches.append(row)
-                continue
-
-            uptime_deltas.append(row['uptime_delta'])
-            downtime_deltas.append(row['downtime_delta'])
-
-            # Check tolerances
-            if (row['uptime_delta'] > tolerances['uptime_minutes'] or
-                row['downtime_delta'] > tolerances['downtime_minutes']):
-                mismatches.append(row)
-
-        match_count = total_checked - len(mismatches)
-        match_rate = match_count / total_checked if total_checked > 0 else 1.0
+        return rows
 
-        # Build result
-        audit_result = AggregateAuditResult(
-            table_name='ride_daily_stats',
-            target_date=target_date,
-            total_records_checked=total_checked,
-            records_matching=match_count,
-            records_mismatched=len(mismatches) - missing_count,
-            records_missing_from_aggregate=missing_count,
-            records_missing_from_raw=0,
-            match_rate=match_rate,
-            max_deviation={
-                'uptime_minutes': max(uptime_deltas) if uptime_deltas else 0,
-                'downtime_minutes': max(downtime_deltas) if downtime_deltas else 0,
-            },
-            avg_deviation={
-                'uptime_minutes': sum(uptime_deltas) / len(uptime_deltas) if uptime_deltas else 0,
-                'downtime_minutes': sum(downtime_deltas) / len(downtime_deltas) if downtime_deltas else 0,
-            },
-            worst_mismatches=mismatches[:10]
+    def _ride_daily_rows_from_archive(
+        self,
+        target_date: date,
+        day_start_utc: datetime,
+        day_end_utc: datetime
+    ) -> List[Dict[str, Any]]:
+        """
+        Same comparison as _ride_daily_rows_from_database, recalculated from the
+        columnar snapshot archive (for dates whose raw rows were cleaned up).
+        """
+        rides = (
+            self.session.query(Ride.ride_id, Ride.park_id, Ride.name.label('ride_name'), Park.name.label('park_name'))
+            .join(Park, Ride.park_id == Park.park_id)
+            .filter(Ride.is_active.is_(True), Ride.category == 'ATTRACTION')
+            .all()
         )
+        stored = {
+            row.ride_id: row
+            for row in self.session.query(
+                RideDailyStats.ride_id,
+                RideDailyStats.uptime_minutes,
+                RideDailyStats.downtime_minutes,
+                RideDailyStats.operating_hours_minutes
+            ).filter(RideDailyStats.stat_date == target_date)
+        }
 
-        # Determine severity
-        if len(mismatches) > 0:
-            audit_result.passed = False
-            if len(mismatches) > 10 or missing_count > 5:
-                audit_result.severity = "CRITICAL"
-                audit_result.message = (
-                    f"ride_daily_stats: {len(mismatches)} mismatches "
-                    f"({missing_count} missing, {len(mismatches) - missing_count} wrong values)"
-                )
-            else:
-                audit_result.severity = "WARNING"
-                audit_result.message = (
-                    f"ride_daily_stats: {len(mismatches)} minor discrepancies"
-                )
-        else:
-            audit_result.message = f"ride_daily_stats: All {total_checked} records verified"
+        rows = []
+        for ride in rides:
+            snapshots = self.archive.ride_snapshots(ride.park_id, ride.ride_id, day_start_utc, day_end_utc)
+            counts = ride_day_counts(snapshots)
+            if counts is None:
+                continue
+            # Downtime only counts for rides that operated during the day
+            calc_uptime = counts['uptime'] * self.snapshot_interval
+            calc_downtime = counts['down'] * self.snapshot_interval if counts['operating'] else 0
+            calc_operating = counts['park_open'] * self.snapshot_interval
+            if calc_uptime == 0 and calc_downtime == 0:
+                continue
 
-        return audit_result
+            aggregate = stored.get(ride.ride_id)
+            stored_uptime = (aggregate.uptime_minutes or 0) if aggregate else 0
+            stored_downtime = (aggregate.downtime_minutes or 0) if aggregate else 0
+            stored_operating = (aggregate.operating_hours_minutes or 0) if aggregate else 0
+            rows.append({
+                'ride_id': ride.ride_id,
+                'ride_name': ride.ride_name,
+                'park_name': ride.park_name,
+                'stored_uptime_minutes': stored_uptime,
+                'stored_downtime_minutes': stored_downtime,
+                'stored_operating_hours_minutes': stored_operating,
+                'calc_uptime_minutes': calc_uptime,
+                'calc_downtime_minutes': calc_downtime,
+                'calc_operating_hours_minutes': calc_operating,
+                'uptime_delta': abs(stored_uptime - calc_uptime),
+                'downtime_delta': abs(stored_downtime - calc_downtime),
+                'operating_hours_delta': abs(stored_operating - calc_operating),
+                'missing_from_aggregate': 0 if aggregate else 1
+            })
+
+        rows.sort(key=lambda row: (
+            -row['missing_from_aggregate'], -max(row['uptime_delta'], row['downtime_delta'])
+        ))
+        return rows
 
     def verify_park_daily_stats(self, target_date: date) -> AggregateAuditResult:
         """
@@ -0,0 +1,424 @@
+"""
+Query Plan Verification
+=======================
+
+Checks that the query classes in database/queries/ are served by indexes.
+
+Indexes are declared in database/schema/*_tables.py (and the ORM models),
+but nothing stops a query edit from wrapping an indexed column in a function
+or dropping the leading key column - the query keeps returning the right
+rows and quietly becomes a full scan of ride_status_snapshots.
+
+For every query class method in QUERY_CASES the verifier runs the method
+against the database with representative parameters, captures the SQL it
+sends, and runs EXPLAIN FORMAT=JSON on each statement. The plans are
+checked for:
+
+- NO_USABLE_INDEX (CRITICAL): full scan of a time-series table with no
+  index that could serve the access at all - the query fell off an index
+- FULL_SCAN (WARNING): full table scan that the optimizer chose although an
+  index exists (often fine on a small seeded database, check with real data)
+- FULL_INDEX_SCAN (WARNING): reads an entire index of a time-series table
+- FILESORT / TEMPORARY_TABLE (WARNING): sort or GROUP BY materialization
+
+For time-series tables read without a covering index the verifier suggests
+one built from the observed access pattern: equality columns, then the
+range column, then the other columns the query reads. Suggestions note
+whether the schema already declares an index with those leading columns
+(then the database is missing it or the optimizer did not pick it).
+
+Usage:
+    auditor = QueryPlanAuditor(session)
+    reports = auditor.audit_all()
+
+    for report in reports:
+        for finding in report.findings:
+            print(report.query, finding.problem, finding.table)
+
+scripts/check_query_plans.py prints the report; tests/golden_data/
+test_golden_query_plans.py fails when a query class errors or has a
+CRITICAL finding.
+"""
+
+import json
+import re
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from database.queries.charts.park_rides_comparison import ParkRidesComparisonQuery
+from database.queries.charts.park_shame_history import ParkShameHistoryQuery
+from database.queries.charts.park_waittime_history import ParkWaitTimeHistoryQuery
+from database.queries.charts.ride_downtime_history import RideDowntimeHistoryQuery
+from database.queries.charts.ride_waittime_history import RideWaitTimeHistoryQuery
+from database.queries.live.fast_live_park_rankings import FastLiveParkRankingsQuery
+from database.queries.live.live_park_rankings import LiveParkRankingsQuery
+from database.queries.live.live_park_wait_times import LiveParkWaitTimesQuery
+from database.queries.live.live_ride_rankings import LiveRideRankingsQuery
+from database.queries.live.status_summary import StatusSummaryQuery
+from database.queries.rankings.park_downtime_rankings import ParkDowntimeRankingsQuery
+from database.queries.rankings.park_wait_time_rankings import ParkWaitTimeRankingsQuery
+from database.queries.rankings.ride_downtime_rankings import RideDowntimeRankingsQuery
+from database.queries.rankings.ride_wait_time_rankings import RideWaitTimeRankingsQuery
+from database.queries.today.today_park_rankings import TodayParkRankingsQuery
+from database.queries.today.today_park_wait_times import TodayParkWaitTimesQuery
+from database.queries.today.today_ride_rankings import TodayRideRankingsQuery
+from database.queries.today.today_ride_wait_times import TodayRideWaitTimesQuery
+from database.queries.trends.declining_parks import DecliningParksQuery
+from database.queries.trends.declining_rides import DecliningRidesQuery
+from database.queries.trends.improving_parks import ImprovingParksQuery
+from database.queries.trends.improving_rides import ImprovingRidesQuery
+from database.queries.trends.least_reliable_rides import LeastReliableRidesQuery
+from database.queries.trends.longest_wait_times import LongestWaitTimesQuery
+from database.queries.yesterday.yesterday_park_rankings import YesterdayParkRankingsQuery
+from database.queries.yesterday.yesterday_park_wait_times import YesterdayParkWaitTimesQuery
+from database.queries.yesterday.yesterday_ride_rankings import YesterdayRideRankingsQuery
+from database.queries.yesterday.yesterday_ride_wait_times import YesterdayRideWaitTimesQuery
+from database.schema import metadata
+from utils.timezone import get_today_pacific
+
+# Tables that grow with time; scanning them is what the indexes exist to avoid
+TIME_SERIES_TABLES = (
+    'ride_status_snapshots',
+    'park_activity_snapshots',
+    'ride_status_changes',
+    'ride_status_intervals',
+    'ride_hourly_stats',
+    'park_hourly_stats',
+    'ride_daily_stats',
+    'park_daily_stats',
+)
+
+# Full scans of other tables are only reported above this many rows
+MIN_REPORTED_ROWS = 1000
+
+# Wider suggestions are reduced to their key columns (not covering)
+MAX_INDEX_COLUMNS = 6
+
+_COLUMN_PREDICATE = re.compile(
+    r"(?:`\w+`\.)?`(?P<alias>\w+)`\.`(?P<column>\w+)`\s*(?P<op><=|>=|<>|=|<|>|between\b|in\b)",
+    re.IGNORECASE,
+)
+_TABLE_REFERENCE = re.compile(
+    r"\b(?:FROM|JOIN)\s+`?(?P<table>\w+)`?(?:\s+(?:AS\s+)?`?(?P<alias>\w+)`?)?",
+    re.IGNORECASE,
+)
+_NOT_AN_ALIAS = {
+    'on', 'where', 'join', 'left', 'right', 'inner', 'outer', 'cross', 'straight_join',
+    'group', 'order', 'limit', 'using', 'union', 'having', 'window', 'for', 'lock', 'natural',
+}
+
+
+@dataclass
+class PlanContext:
+    """Representative parameters for the query cases."""
+
+    park_id: int
+    target_date: date
+
+
+@dataclass
+class QueryCase:
+    """One query class method called with representative parameters."""
+
+    name: str
+    run: Callable[[Session, PlanContext], Any]
+
+
+@dataclass
+class PlanFinding:
+    """A problem in the plan of one statement."""
+
+    problem: str   # NO_USABLE_INDEX, FULL_SCAN, FULL_INDEX_SCAN, FILESORT, TEMPORARY_TABLE
+    severity: str  # CRITICAL, WARNING
+    table: Optional[str]
+    rows: Optional[int] = None
+    detail: str = ""
+
+
+@dataclass
+class IndexSuggestion:
+    """A covering index for an observed access pattern."""
+
+    table: str
+    columns: List[str]
+    covering: bool
+    declared_as: Optional[str] = None  # schema index with the same leading columns
+
+    @property
+    def name(self) -> str:
+        return f"idx_{self.table}_{'_'.join(self.columns)}"[:64]
+
+    @property
+    def ddl(self) -> str:
+        return f"CREATE INDEX {self.name} ON {self.table} ({', '.join(self.columns)})"
+
+
+@dataclass
+class QueryPlanReport:
+    """Plan findings for one query case."""
+
+    query: str
+    statements: int = 0
+    findings: List[PlanFinding] = field(default_factory=list)
+    suggestions: List[IndexSuggestion] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def passed(self) -> bool:
+        return not any(finding.severity == 'CRITICAL' for finding in self.findings)
+
+
+QUERY_CASES: List[QueryCase] = [
+    # Charts
+    QueryCase('charts.park_rides_comparison.downtime_daily', lambda s, c: ParkRidesComparisonQuery(s).get_downtime_daily(
+        c.park_id, c.target_date - timedelta(days=6), c.target_date)),
+    QueryCase('charts.park_rides_comparison.wait_times_daily', lambda s, c: ParkRidesComparisonQuery(s).get_wait_times_daily(
+        c.park_id, c.target_date - timedelta(days=6), c.target_date)),
+    QueryCase('charts.park_rides_comparison.downtime_hourly', lambda s, c: ParkRidesComparisonQuery(s).get_downtime_hourly(
+        c.park_id, c.target_date)),
+    QueryCase('charts.park_rides_comparison.wait_times_hourly', lambda s, c: ParkRidesComparisonQuery(s).get_wait_times_hourly(
+        c.park_id, c.target_date)),
+    QueryCase('charts.park_shame_history.daily', lambda s, c: ParkShameHistoryQuery(s).get_daily()),
+    QueryCase('charts.park_shame_history.hourly', lambda s, c: ParkShameHistoryQuery(s).get_hourly(c.target_date)),
+    QueryCase('charts.park_shame_history.single_park_hourly', lambda s, c: ParkShameHistoryQuery(s).get_single_park_hourly(
+        c.park_id, c.target_date)),
+    QueryCase('charts.park_shame_history.single_park_daily', lambda s, c: ParkShameHistoryQuery(s).get_single_park_daily(
+        c.park_id, c.target_date - timedelta(days=6), c.target_date)),
+    QueryCase('charts.park_shame_history.live', lambda s, c: ParkShameHistoryQuery(s).get_live()),
+    QueryCase('charts.park_waittime_history.daily', lambda s, c: ParkWaitTimeHistoryQuery(s).get_daily()),
+    QueryCase('charts.park_waittime_history.hourly', lambda s, c: ParkWaitTimeHistoryQuery(s).get_hourly(c.target_date)),
+    QueryCase('charts.park_waittime_history.live', lambda s, c: ParkWaitTimeHistoryQuery(s).get_live()),
+    QueryCase('charts.ride_downtime_history.daily', lambda s, c: RideDowntimeHistoryQuery(s).get_daily()),
+    QueryCase('charts.ride_downtime_history.hourly', lambda s, c: RideDowntimeHistoryQuery(s).get_hourly(c.target_date)),
+    QueryCase('charts.ride_downtime_history.live', lambda s, c: RideDowntimeHistoryQuery(s).get_live()),
+    QueryCase('charts.ride_waittime_history.daily', lambda s, c: RideWaitTimeHistoryQuery(s).get_daily()),
+    QueryCase('charts.ride_waittime_history.hourly', lambda s, c: RideWaitTimeHistoryQuery(s).get_hourly(c.target_date)),
+    QueryCase('charts.ride_waittime_history.live', lambda s, c: RideWaitTimeHistoryQuery(s).get_live()),
+    # Live
+    QueryCase('live.fast_live_park_rankings', lambda s, c: FastLiveParkRankingsQuery(s).get_rankings()),
+    QueryCase('live.live_park_rankings', lambda s, c: LiveParkRankingsQuery(s).get_rankings()),
+    QueryCase('live.live_park_wait_times', lambda s, c: LiveParkWaitTimesQuery(s).get_rankings()),
+    QueryCase('live.live_ride_rankings', lambda s, c: LiveRideRankingsQuery(s).get_rankings()),
+    QueryCase('live.status_summary', lambda s, c: StatusSummaryQuery(s).get_summary()),
+    QueryCase('live.status_summary.park', lambda s, c: StatusSummaryQuery(s).get_summary(park_id=c.park_id)),
+    # Rankings
+    QueryCase('rankings.park_downtime.weekly', lambda s, c: ParkDowntimeRankingsQuery(s).get_weekly()),
+    QueryCase('rankings.park_downtime.monthly', lambda s, c: ParkDowntimeRankingsQuery(s).get_monthly()),
+    QueryCase('rankings.park_wait_time.weekly', lambda s, c: ParkWaitTimeRankingsQuery(s).get_weekly()),
+    QueryCase('rankings.park_wait_time.monthly', lambda s, c: ParkWaitTimeRankingsQuery(s).get_monthly()),
+    QueryCase('rankings.ride_downtime.weekly', lambda s, c: RideDowntimeRankingsQuery(s).get_weekly()),
+    QueryCase('rankings.ride_downtime.monthly', lambda s, c: RideDowntimeRankingsQuery(s).get_monthly()),
+    QueryCase('rankings.ride_wait_time.weekly', lambda s, c: RideWaitTimeRankingsQuery(s).get_weekly()),
+    QueryCase('rankings.ride_wait_time.monthly', lambda s, c: RideWaitTimeRankingsQuery(s).get_monthly()),
+    # Today
+    QueryCase('today.park_rankings', lambda s, c: TodayParkRankingsQuery(s).get_rankings()),
+    QueryCase('today.park_wait_times', lambda s, c: TodayParkWaitTimesQuery(s).get_rankings()),
+    QueryCase('today.ride_rankings', lambda s, c: TodayRideRankingsQuery(s).get_rankings()),
+    QueryCase('today.ride_wait_times', lambda s, c: TodayRideWaitTimesQuery(s).get_rankings()),
+    # Trends
+    QueryCase('trends.declining_parks', lambda s, c: DecliningParksQuery(s).get_weekly()),
+    QueryCase('trends.declining_rides', lambda s, c: DecliningRidesQuery(s).get_weekly()),
+    QueryCase('trends.improving_parks', lambda s, c: ImprovingParksQuery(s).get_weekly()),
+    QueryCase('trends.improving_rides', lambda s, c: ImprovingRidesQuery(s).get_weekly()),
+    QueryCase('trends.least_reliable_rides.today', lambda s, c: LeastReliableRidesQuery(s).get_rankings('today')),
+    QueryCase('trends.least_reliable_rides.last_week', lambda s, c: LeastReliableRidesQuery(s).get_rankings('last_week')),
+    QueryCase('trends.least_reliable_parks.today', lambda s, c: LeastReliableRidesQuery(s).get_park_rankings('today')),
+    QueryCase('trends.longest_wait_times.today', lambda s, c: LongestWaitTimesQuery(s).get_rankings('today')),
+    QueryCase('trends.longest_wait_times.last_week', lambda s, c: LongestWaitTimesQuery(s).get_rankings('last_week')),
+    QueryCase('trends.longest_wait_parks.today', lambda s, c: LongestWaitTimesQuery(s).get_park_rankings('today')),
+    # Yesterday
+    QueryCase('yesterday.park_rankings', lambda s, c: YesterdayParkRankingsQuery(s).get_rankings()),
+    QueryCase('yesterday.park_wait_times', lambda s, c: YesterdayParkWaitTimesQuery(s).get_rankings()),
+    QueryCase('yesterday.ride_rankings', lambda s, c: YesterdayRideRankingsQuery(s).get_rankings()),
+    QueryCase('yesterday.ride_wait_times', lambda s, c: YesterdayRideWaitTimesQuery(s).get_rankings()),
+]
+
+
+def table_aliases(sql: str) -> Dict[str, str]:
+    """Alias -> table for the FROM/JOIN references of a statement (tables map to themselves)."""
+    aliases = {}
+    for match in _TABLE_REFERENCE.finditer(sql):
+        table, alias = match.group('table'), match.group('alias')
+        aliases[table] = table
+        if alias and alias.lower() not in _NOT_AN_ALIAS:
+            aliases[alias] = table
+    return aliases
+
+
+def iter_plan_nodes(plan: Any) -> Iterator[Dict[str, Any]]:
+    """Every dict in an EXPLAIN FORMAT=JSON document, depth first."""
+    if isinstance(plan, dict):
+        yield plan
+        for value in plan.values():
+            yield from iter_plan_nodes(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from iter_plan_nodes(item)
+
+
+def access_pattern(node: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """
+    Columns of a plan table node compared by equality and by range.
+
+    Read from the key lookup (used_key_parts) and the attached condition.
+    """
+    alias = node.get('table_name')
+    equality, ranges = [], []
+    if node.get('access_type') in ('ref', 'eq_ref', 'const'):
+        equality.extend(node.get('used_key_parts', []))
+    for match in _COLUMN_PREDICATE.finditer(node.get('attached_condition', '')):
+        if match.group('alias') != alias:
+            continue
+        target = equality if match.group('op') == '=' else ranges
+        if match.group('column') not in target:
+            target.append(match.group('column'))
+    return equality, [column for column in ranges if column not in equality]
+
+
+def declared_indexes(table: str) -> Dict[str, List[str]]:
+    """Index name -> columns declared for a table in database/schema (PRIMARY included)."""
+    schema_table = metadata.tables.get(table)
+    if schema_table is None:
+        return {}
+    indexes = {index.name: [column.name for column in index.columns] for index in schema_table.indexes}
+    if schema_table.primary_key.columns:
+        indexes['PRIMARY'] = [column.name for column in schema_table.primary_key.columns]
+    return indexes
+
+
+def suggest_index(table: str, node: Dict[str, Any]) -> Optional[IndexSuggestion]:
+    """Covering index for a plan table node, or None without an indexable predicate."""
+    equality, ranges = access_pattern(node)
+    key = equality + ranges[:1]
+    if not key:
+        return None
+    rest = [column for column in node.get('used_columns', []) if column not in key]
+    covering = len(key) + len(rest) <= MAX_INDEX_COLUMNS
+    suggestion = IndexSuggestion(table=table, columns=key + rest if covering else key, covering=covering)
+    for name, columns in declared_indexes(table).items():
+        if columns[:len(key)] == key:
+            suggestion.declared_as = name
+            break
+    return suggestion
+
+
+def analyze_plan(sql: str, plan: Dict[str, Any], min_rows: int = MIN_REPORTED_ROWS) -> Tuple[List[PlanFinding], List[IndexSuggestion]]:
+    """
+    Findings and index suggestions for one EXPLAIN FORMAT=JSON plan.
+
+    Args:
+        sql: The explained statement (to resolve table aliases)
+        plan: Parsed EXPLAIN FORMAT=JSON output
+        min_rows: Report full scans of non time-series tables from this many rows
+
+    Returns:
+        (findings, suggestions)
+    """
+    aliases = table_aliases(sql)
+    findings: List[PlanFinding] = []
+    suggestions: List[IndexSuggestion] = []
+
+    for node in iter_plan_nodes(plan):
+        if node.get('using_filesort'):
+            findings.append(PlanFinding('FILESORT', 'WARNING', None, detail='ORDER BY / GROUP BY sorted without an index'))
+        if node.get('using_temporary_table'):
+            findings.append(PlanFinding('TEMPORARY_TABLE', 'WARNING', None, detail='GROUP BY / DISTINCT materialized in a temporary table'))
+
+        alias = node.get('table_name')
+        if 'access_type' not in node or not alias or alias.startswith('<'):
+            continue
+        table = aliases.get(alias, alias)
+        time_series = table in TIME_SERIES_TABLES
+        access = node['access_type']
+        rows = node.get('rows_examined_per_scan')
+
+        if access == 'ALL' and time_series and not node.get('possible_keys'):
+            findings.append(PlanFinding('NO_USABLE_INDEX', 'CRITICAL', table, rows,
+                                        f"no index can serve {node.get('attached_condition', 'the access')}"))
+        elif access == 'ALL' and (time_series or (rows or 0) >= min_rows):
+            findings.append(PlanFinding('FULL_SCAN', 'WARNING', table, rows,
+                                        f"possible keys {', '.join(node.get('possible_keys', []))} not used"))
+        elif access == 'index' and time_series:
+            findings.append(PlanFinding('FULL_INDEX_SCAN', 'WARNING', table, rows, f"reads all of {node.get('key')}"))
+
+        if time_series and (access in ('ALL', 'index') or not node.get('using_index')):
+            suggestion = suggest_index(table, node)
+            if suggestion and suggestion.columns not in [s.columns for s in suggestions if s.table == table]:
+                suggestions.append(suggestion)
+
+    return findings, suggestions
+
+
+@contextmanager
+def capture_statements(session: Session) -> Iterator[List[Tuple[str, Any]]]:
+    """Collect the SELECT statements (with driver parameters) a session executes."""
+    engine = session.get_bind()
+    statements: List[Tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().lstrip('(').upper().startswith(('SELECT', 'WITH')):
+            statements.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+class QueryPlanAuditor:
+    """Runs the query cases and checks the plans of the SQL they send."""
+
+    def __init__(self, session: Session, min_rows: int = MIN_REPORTED_ROWS):
+        """
+        Initialize auditor.
+
+        Args:
+            session: Session on a seeded MySQL database
+            min_rows: Report full scans of non time-series tables from this many rows
+        """
+        self.session = session
+        self.min_rows = min_rows
+
+    def representative_context(self) -> PlanContext:
+        """The park with the most active rides and the latest aggregated day."""
+        park_id = self.session.execute(text("""
+            SELECT park_id FROM rides
+            WHERE is_active = 1
+            GROUP BY park_id
+            ORDER BY COUNT(*) DESC, park_id
+            LIMIT 1
+        """)).scalar()
+        target_date = self.session.execute(text("SELECT MAX(stat_date) FROM ride_daily_stats")).scalar()
+        return PlanContext(park_id=park_id or 1, target_date=target_date or get_today_pacific())
+
+    def explain(self, statement: str, parameters: Any) -> Dict[str, Any]:
+        """EXPLAIN FORMAT=JSON of a captured statement."""
+        result = self.session.connection().exec_driver_sql(f"EXPLAIN FORMAT=JSON {statement}", parameters)
+        return json.loads(result.scalar())
+
+    def audit_case(self, case: QueryCase, context: PlanContext) -> QueryPlanReport:
+        """Run one query case and check every statement it sent."""
+        report = QueryPlanReport(query=case.name)
+        try:
+            with capture_statements(self.session) as statements:
+                case.run(self.session, context)
+            report.statements = len(statements)
+            for statement, parameters in statements:
+                findings, suggestions = analyze_plan(statement, self.explain(statement, parameters), self.min_rows)
+                report.findings.extend(findings)
+                report.suggestions.extend(s for s in suggestions if s not in report.suggestions)
+        except Exception as e:
+            self.session.rollback()
+            report.error = f"{type(e).__name__}: {e}"
+        return report
+
+    def audit_all(self, cases: Optional[List[QueryCase]] = None) -> List[QueryPlanReport]:
+        """Reports for all query cases (default: QUERY_CASES)."""
+        context = self.representative_context()
+        return [self.audit_case(case, context) for case in (cases or QUERY_CASES)]
@@ -0,0 +1,174 @@
+"""
+Theme Park Downtime Tracker - Chunked Deletes
+Deletes expired rows in small primary-key batches instead of one big DELETE.
+
+A single DELETE ... WHERE recorded_at < threshold holds its row and gap
+locks until it commits. After an outage delays cleanup that can be millions
+of rows, and the collector's inserts into the same tables wait behind it.
+
+ChunkedDeleter walks the primary key from the oldest row up to the newest
+expired one. Each batch deletes the expired rows of one primary-key range
+of batch_size rows and commits on its own, then pauses:
+
+    batch_sleep_ms        fixed pause after every batch
+    max_rows_per_second   pause longer when deleting faster than this
+
+A run stops early when max_runtime_seconds is reached. Committed batches
+are gone, so the next run simply starts from the oldest remaining row -
+an interrupted or capped cleanup resumes where it stopped.
+
+All limits use 0 for "no limit".
+"""
+
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from utils.logger import logger
+
+# Log progress every this many batches
+PROGRESS_EVERY = 20
+
+
+class ChunkedDeleter:
+    """Batched, throttled deletion of rows older than a threshold."""
+
+    def __init__(
+        self,
+        conn: Connection,
+        batch_size: int = 5000,
+        batch_sleep_ms: int = 0,
+        max_rows_per_second: int = 0,
+        max_runtime_seconds: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize deleter.
+
+        Args:
+            conn: Database connection (committed after every batch)
+            batch_size: Primary-key rows covered by one batch
+            batch_sleep_ms: Pause after each batch
+            max_rows_per_second: Throttle deletion to this rate (0 = unthrottled)
+            max_runtime_seconds: Stop once this much time has been spent, across
+                all delete_before() calls of this deleter (0 = no cap)
+            clock: Monotonic clock (for tests)
+            sleep: Sleep function (for tests)
+        """
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+        self.conn = conn
+        self.batch_size = batch_size
+        self.batch_sleep = batch_sleep_ms / 1000
+        self.max_rows_per_second = max_rows_per_second
+        self.clock = clock
+        self.sleep = sleep
+        self.started = clock()
+        self.deadline = self.started + max_runtime_seconds if max_runtime_seconds else None
+
+    @property
+    def out_of_time(self) -> bool:
+        """True once the runtime cap has been reached."""
+        return self.deadline is not None and self.clock() >= self.deadline
+
+    def _expired_key_range(self, table: str, key: str, time_column: str, threshold) -> Optional[Tuple[int, int]]:
+        """(first, last) primary key that can hold expired rows, or None if there are none."""
+        row = self.conn.execute(text(f"""
+            SELECT MIN({key}) AS first_key, MAX({key}) AS last_key
+            FROM {table}
+            WHERE {time_column} < :threshold
+        """), {"threshold": threshold}).fetchone()
+        if row is None or row.first_key is None:
+            return None
+        return row.first_key, row.last_key
+
+    def _batch_end(self, table: str, key: str, start, last) -> Optional[int]:
+        """Primary key batch_size rows after start (exclusive end), or None past last."""
+        return self.conn.execute(text(f"""
+            SELECT {key}
+            FROM {table}
+            WHERE {key} >= :start AND {key} <= :last
+            ORDER BY {key}
+            LIMIT 1 OFFSET {self.batch_size}
+        """), {"start": start, "last": last}).scalar()
+
+    def _pause(self, deleted: int, elapsed: float) -> None:
+        """Sleep after a batch: the fixed pause, or longer to stay under the rate cap."""
+        pause = self.batch_sleep
+        if self.max_rows_per_second:
+            pause = max(pause, deleted / self.max_rows_per_second - elapsed)
+        if self.deadline is not None:
+            pause = min(pause, max(self.deadline - self.clock(), 0))
+        if pause > 0:
+            self.sleep(pause)
+
+    def delete_before(self, table: str, key: str, time_column: str, threshold) -> Dict[str, object]:
+        """
+        Delete rows of a table whose time column is before the threshold.
+
+        Args:
+            table: Table name
+            key: Integer primary key column (walked in batches)
+            time_column: Column compared with the threshold
+            threshold: Rows before this value are deleted
+
+        Returns:
+            {deleted, batches, seconds, rows_per_second, complete}; complete is
+            False if the runtime cap stopped the run before the last batch
+        """
+        stats = {"deleted": 0, "batches": 0, "seconds": 0.0, "rows_per_second": 0.0, "complete": True}
+        started = self.clock()
+
+        if self.out_of_time:
+            stats["complete"] = False
+            return stats
+        key_range = self._expired_key_range(table, key, time_column, threshold)
+        if key_range is None:
+            return stats
+        start, last = key_range
+
+        delete = text(f"""
+            DELETE FROM {table}
+            WHERE {key} >= :start AND {key} < :end
+                AND {time_column} < :threshold
+        """)
+        delete_tail = text(f"""
+            DELETE FROM {table}
+            WHERE {key} >= :start AND {key} <= :last
+                AND {time_column} < :threshold
+        """)
+
+        while start is not None:
+            if self.out_of_time:
+                stats["complete"] = False
+                break
+
+            batch_started = self.clock()
+            end = self._batch_end(table, key, start, last)
+            if end is None:
+                result = self.conn.execute(delete_tail, {"start": start, "last": last, "threshold": threshold})
+            else:
+                result = self.conn.execute(delete, {"start": start, "end": end, "threshold": threshold})
+            self.conn.commit()
+
+            stats["deleted"] += result.rowcount
+            stats["batches"] += 1
+            if stats["batches"] % PROGRESS_EVERY == 0:
+                logger.info(f"{table}: deleted {stats['deleted']:,} rows in {stats['batches']} batches")
+
+            start = end
+            if start is not None:
+                self._pause(result.rowcount, self.clock() - batch_started)
+
+        stats["seconds"] = round(self.clock() - started, 3)
+        if stats["seconds"] > 0:
+            stats["rows_per_second"] = round(stats["deleted"] / stats["seconds"], 1)
+        logger.info(
+            f"{table}: deleted {stats['deleted']:,} rows in {stats['batches']} batches, "
+            f"{stats['seconds']:.1f}s ({stats['rows_per_second']:,.0f} rows/sec)"
+            + ("" if stats["complete"] else " - runtime cap reached, the next run continues")
+        )
+        return stats
@@ -8,6 +8,7 @@ Migration Note:
 - Both use the same underlying engine for connection pooling
 """
 
+import time
 from contextlib import contextmanager
 from sqlalchemy import create_engine, text
 from sqlalchemy.pool import QueuePool
@@ -21,6 +22,18 @@ from utils.config import (
     config
 )
 from utils.logger import logger, log_database_error
+from utils.prometheus import pool_checkout_wait
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool recording how long each checkout waits (exposed by /api/metrics)."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - started)
 
 
 class DatabaseConnection:
@@ -68,7 +81,7 @@ class DatabaseConnection:
                 # Create engine with connection pooling
                 self._engine = create_engine(
                     connection_url,
-                    poolclass=QueuePool,
+                    poolclass=TimedQueuePool,
                     pool_size=DB_POOL_SIZE,  # 10 connections
                     max_overflow=DB_POOL_MAX_OVERFLOW,  # +20 overflow
                     pool_recycle=DB_POOL_RECYCLE,  # Recycle after 1 hour
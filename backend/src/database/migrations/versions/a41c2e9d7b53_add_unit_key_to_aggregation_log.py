@@ -0,0 +1,47 @@
+"""add_unit_key_to_aggregation_log
+
+Revision ID: a41c2e9d7b53
+Revises: e7b787f62d36
+Create Date: 2026-01-06 09:14:37.512840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41c2e9d7b53'
+down_revision: Union[str, Sequence[str], None] = 'e7b787f62d36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add unit_key to aggregation_log for per-unit scheduler entries.
+
+    Run-level entries keep unit_key NULL. The parallel aggregation scheduler
+    writes one additional entry per work unit (e.g. 'tz:America/New_York',
+    'recompute:2025-12-01:v1') so failed units can be identified and retried.
+    """
+    op.add_column(
+        'aggregation_log',
+        sa.Column(
+            'unit_key',
+            sa.String(100),
+            nullable=True,
+            comment='Work unit identifier (NULL for run-level entries)'
+        )
+    )
+    op.create_index(
+        'idx_aggregation_unit',
+        'aggregation_log',
+        ['aggregation_date', 'aggregation_type', 'unit_key']
+    )
+
+
+def downgrade() -> None:
+    """Remove unit_key (per-unit entries become indistinguishable from run-level ones)."""
+    op.drop_index('idx_aggregation_unit', table_name='aggregation_log')
+    op.drop_column('aggregation_log', 'unit_key')
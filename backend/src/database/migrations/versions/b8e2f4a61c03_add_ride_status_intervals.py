@@ -0,0 +1,54 @@
+"""add_ride_status_intervals
+
+Revision ID: b8e2f4a61c03
+Revises: f3a9c1d7e482
+Create Date: 2026-01-14 09:12:47.530961
+
+Adds ride_status_intervals for the compact (change-only) snapshot storage
+mode (database/snapshot_storage.py). The table stays empty until the
+database is switched with scripts/convert_snapshot_storage.py --to compact.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f4a61c03'
+down_revision: Union[str, Sequence[str], None] = 'f3a9c1d7e482'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create ride_status_intervals."""
+    op.create_table(
+        'ride_status_intervals',
+        sa.Column('interval_id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('ride_id', sa.Integer(), nullable=False),
+        sa.Column('valid_from', sa.DateTime(), nullable=False,
+                  comment='UTC recorded_at of the first snapshot in the run'),
+        sa.Column('valid_to', sa.DateTime(), nullable=False,
+                  comment='UTC recorded_at of the last snapshot in the run'),
+        sa.Column('is_open', sa.Boolean(), nullable=True),
+        sa.Column('status', sa.Enum('OPERATING', 'DOWN', 'CLOSED', 'REFURBISHMENT',
+                                    name='ride_status_enum'), nullable=True),
+        sa.Column('wait_time', sa.Integer(), nullable=True,
+                  comment='Wait time of the first snapshot in the run'),
+        sa.Column('computed_is_open', sa.Boolean(), nullable=False, server_default=sa.text('0')),
+        sa.Column('last_updated_api', sa.DateTime(), nullable=False,
+                  comment='Latest Queue-Times.com update timestamp in the run'),
+        sa.Column('samples', sa.Integer(), nullable=False, server_default=sa.text('1'),
+                  comment='Number of snapshots in the run'),
+        sa.PrimaryKeyConstraint('interval_id'),
+    )
+    op.create_index('idx_interval_ride_valid_to', 'ride_status_intervals', ['ride_id', 'valid_to'])
+    op.create_index('idx_interval_valid_to', 'ride_status_intervals', ['valid_to'])
+
+
+def downgrade() -> None:
+    """Drop ride_status_intervals (convert back to full storage first)."""
+    op.drop_index('idx_interval_valid_to', table_name='ride_status_intervals')
+    op.drop_index('idx_interval_ride_valid_to', table_name='ride_status_intervals')
+    op.drop_table('ride_status_intervals')
@@ -0,0 +1,47 @@
+"""add_wait_time_samples_to_ride_live_rankings
+
+Revision ID: c5d81f0e2a64
+Revises: a41c2e9d7b53
+Create Date: 2026-01-08 11:02:19.204417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d81f0e2a64'
+down_revision: Union[str, Sequence[str], None] = 'a41c2e9d7b53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ('ride_live_rankings', 'ride_live_rankings_staging')
+
+
+def upgrade() -> None:
+    """Add wait_time_samples so avg_wait_time can be maintained incrementally.
+
+    The collector's incremental live rankings update folds each cycle's wait
+    time into the running average, which needs the number of samples behind
+    it. Both tables get the column because they are swapped by RENAME.
+    """
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                'wait_time_samples',
+                sa.Integer(),
+                nullable=False,
+                server_default='0',
+                comment='Snapshots with wait_time > 0 today (avg_wait_time denominator)'
+            )
+        )
+
+
+def downgrade() -> None:
+    """Remove wait_time_samples from both live ranking tables."""
+    for table in TABLES:
+        op.drop_column(table, 'wait_time_samples')
@@ -0,0 +1,92 @@
+"""partition_snapshot_tables_by_day
+
+Revision ID: f3a9c1d7e482
+Revises: c5d81f0e2a64
+Create Date: 2026-01-12 10:41:03.118274
+
+Range-partitions ride_status_snapshots and park_activity_snapshots by UTC day
+on recorded_at (see database/partitioning.py). Hot queries filter these
+tables by recorded_at ranges and get partition pruning; expiring old data
+becomes DROP PARTITION instead of large DELETEs.
+
+MySQL requirements for partitioned InnoDB tables:
+- The partitioning column must be part of every unique key, so the primary
+  key becomes (snapshot_id, recorded_at). snapshot_id stays AUTO_INCREMENT
+  and unique in practice.
+- Partitioned tables cannot have foreign keys, so the ride_id / park_id
+  foreign keys (ON DELETE CASCADE) are dropped. Rides and parks are never
+  hard-deleted by the application, and orphaned snapshots age out with
+  their partition.
+
+The tables are rebuilt once by the ALTER; with raw data retention of a few
+days this takes seconds to minutes. Run it outside a collection cycle.
+
+Only applies to MySQL; other dialects (e.g. SQLite test databases) are
+left unchanged.
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import inspect
+
+from database.partitioning import PARTITIONED_TABLES, partition_by_clause
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3a9c1d7e482'
+down_revision: Union[str, Sequence[str], None] = 'c5d81f0e2a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Parent table of each snapshot table's foreign key
+PARENTS = {
+    'ride_status_snapshots': ('ride_id', 'rides'),
+    'park_activity_snapshots': ('park_id', 'parks'),
+}
+
+# Future days to pre-create (scripts/maintain_partitions.py keeps extending)
+DAYS_AHEAD = 3
+
+
+def upgrade() -> None:
+    """Partition both snapshot tables by day on recorded_at.
+
+    Creates one partition per day from the oldest stored snapshot through
+    DAYS_AHEAD days from now, plus a p_future catch-all.
+    """
+    connection = op.get_bind()
+    if connection.dialect.name != 'mysql':
+        return
+
+    inspector = inspect(connection)
+    today = connection.execute(sa.text("SELECT UTC_DATE()")).scalar()
+
+    for table in PARTITIONED_TABLES:
+        for fk in inspector.get_foreign_keys(table):
+            op.drop_constraint(fk['name'], table, type_='foreignkey')
+
+        op.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (snapshot_id, recorded_at)")
+
+        oldest = connection.execute(sa.text(f"SELECT DATE(MIN(recorded_at)) FROM {table}")).scalar()
+        first = min(oldest, today) if oldest else today
+        days = [first + timedelta(days=n) for n in range((today - first).days + DAYS_AHEAD + 1)]
+        op.execute(f"ALTER TABLE {table} {partition_by_clause(days)}")
+
+
+def downgrade() -> None:
+    """Merge partitions back into one table and restore the original keys."""
+    connection = op.get_bind()
+    if connection.dialect.name != 'mysql':
+        return
+
+    for table in PARTITIONED_TABLES:
+        op.execute(f"ALTER TABLE {table} REMOVE PARTITIONING")
+        op.execute(f"ALTER TABLE {table} DROP PRIMARY KEY, ADD PRIMARY KEY (snapshot_id)")
+
+        column, parent = PARENTS[table]
+        op.create_foreign_key(
+            None, table, parent, [column], [column], ondelete='CASCADE'
+        )
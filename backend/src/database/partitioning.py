@@ -0,0 +1,235 @@
+"""
+Theme Park Downtime Tracker - Snapshot Table Partitioning
+Daily RANGE COLUMNS partitions on recorded_at for the raw snapshot tables.
+
+ride_status_snapshots and park_activity_snapshots are partitioned by UTC day
+(migration f3a9c1d7e482):
+
+    PARTITION p20260114 VALUES LESS THAN ('2026-01-15 00:00:00'),
+    PARTITION p20260115 VALUES LESS THAN ('2026-01-16 00:00:00'),
+    ...
+    PARTITION p_future  VALUES LESS THAN (MAXVALUE)
+
+Queries filtering on recorded_at ranges only touch the matching days
+(partition pruning), and expiring a day is DROP PARTITION - a metadata
+operation - instead of a DELETE that locks index ranges the collector is
+inserting into.
+
+scripts/maintain_partitions.py runs SnapshotPartitionManager.maintain()
+daily: it splits day partitions for the next few days out of p_future and
+drops days that are entirely older than the cleanup threshold.
+scripts/cleanup_raw_data.py drops expired partitions the same way before
+deleting the remaining rows of the partial day.
+
+Tables that are not partitioned (e.g. before the migration, or on a
+database where it was never applied) are left alone.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from utils.logger import logger
+
+PARTITIONED_TABLES = ('ride_status_snapshots', 'park_activity_snapshots')
+
+# Catch-all partition for rows past the last pre-created day
+FUTURE_PARTITION = 'p_future'
+
+_DAY_PARTITION = re.compile(r'^p(\d{8})$')
+
+
+def partition_name(day: date) -> str:
+    """Name of the partition holding a UTC day (e.g. p20260115)."""
+    return f"p{day:%Y%m%d}"
+
+
+def partition_day(name: str) -> Optional[date]:
+    """UTC day held by a day partition (None for p_future or foreign names)."""
+    match = _DAY_PARTITION.match(name)
+    if not match:
+        return None
+    return datetime.strptime(match.group(1), '%Y%m%d').date()
+
+
+def partition_definition(day: date) -> str:
+    """PARTITION clause for a day: rows with recorded_at before the next midnight."""
+    upper = day + timedelta(days=1)
+    return f"PARTITION {partition_name(day)} VALUES LESS THAN ('{upper:%Y-%m-%d} 00:00:00')"
+
+
+def future_partition_definition() -> str:
+    """PARTITION clause for the catch-all partition."""
+    return f"PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)"
+
+
+def partition_by_clause(days: List[date]) -> str:
+    """
+    Full PARTITION BY clause for a set of days plus the catch-all.
+
+    The first day's partition also holds anything older than it.
+    """
+    definitions = [partition_definition(day) for day in sorted(days)]
+    definitions.append(future_partition_definition())
+    return "PARTITION BY RANGE COLUMNS(recorded_at) (\n    " + ",\n    ".join(definitions) + "\n)"
+
+
+def days_to_create(existing: List[date], today: date, days_ahead: int) -> List[date]:
+    """
+    Days to split out of p_future so partitions exist through today + days_ahead.
+
+    Args:
+        existing: Days that already have a partition
+        today: Current UTC day
+        days_ahead: Future days to pre-create
+
+    Returns:
+        Missing days after the last existing one, oldest first
+    """
+    start = max(existing) + timedelta(days=1) if existing else today
+    end = today + timedelta(days=days_ahead)
+    return [start + timedelta(days=n) for n in range((end - start).days + 1)]
+
+
+def days_to_drop(existing: List[date], threshold: datetime) -> List[date]:
+    """
+    Days whose rows are all older than the deletion threshold.
+
+    A day is only dropped once its whole range (up to the next midnight) is
+    before the threshold; the partial day is left to row deletes.
+    """
+    return sorted(
+        day for day in existing
+        if datetime.combine(day + timedelta(days=1), datetime.min.time()) <= threshold
+    )
+
+
+class SnapshotPartitionManager:
+    """Creates and drops daily partitions of the snapshot tables."""
+
+    def __init__(self, conn: Connection):
+        """
+        Initialize manager.
+
+        Args:
+            conn: Database connection (MySQL)
+        """
+        self.conn = conn
+
+    def partitions(self, table: str) -> List[str]:
+        """Partition names of a table in order (empty if not partitioned)."""
+        result = self.conn.execute(text("""
+            SELECT PARTITION_NAME AS name
+            FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE()
+                AND TABLE_NAME = :table
+                AND PARTITION_NAME IS NOT NULL
+            ORDER BY PARTITION_ORDINAL_POSITION
+        """), {"table": table})
+        return [row.name for row in result]
+
+    def partition_days(self, table: str) -> List[date]:
+        """Days that have a partition."""
+        return sorted(day for day in map(partition_day, self.partitions(table)) if day is not None)
+
+    def is_partitioned(self, table: str) -> bool:
+        """True if the table has the daily partition layout."""
+        return FUTURE_PARTITION in self.partitions(table)
+
+    def create_partitions(self, table: str, days: List[date]) -> None:
+        """
+        Split day partitions out of p_future.
+
+        p_future normally holds no rows, so the reorganize only rewrites
+        metadata; rows collected past the last day are moved into their day.
+        """
+        if not days:
+            return
+        definitions = [partition_definition(day) for day in sorted(days)]
+        definitions.append(future_partition_definition())
+        self.conn.execute(text(
+            f"ALTER TABLE {table} REORGANIZE PARTITION {FUTURE_PARTITION} INTO (\n    "
+            + ",\n    ".join(definitions) + "\n)"
+        ))
+        logger.info(f"Created {len(days)} partitions on {table} ({partition_name(min(days))}..{partition_name(max(days))})")
+
+    def count_rows(self, table: str, days: List[date]) -> int:
+        """Rows stored in the given day partitions."""
+        if not days:
+            return 0
+        names = ", ".join(partition_name(day) for day in days)
+        return self.conn.execute(text(f"SELECT COUNT(*) FROM {table} PARTITION ({names})")).scalar() or 0
+
+    def drop_partitions(self, table: str, days: List[date]) -> int:
+        """
+        Drop day partitions and the rows in them.
+
+        Returns:
+            Number of rows dropped
+        """
+        if not days:
+            return 0
+        rows = self.count_rows(table, days)
+        names = ", ".join(partition_name(day) for day in days)
+        self.conn.execute(text(f"ALTER TABLE {table} DROP PARTITION {names}"))
+        logger.info(f"Dropped {len(days)} partitions ({rows:,} rows) from {table}")
+        return rows
+
+    def drop_expired(self, table: str, threshold: datetime, dry_run: bool = False) -> int:
+        """
+        Drop every day partition entirely older than the threshold.
+
+        Args:
+            table: Partitioned table
+            threshold: Rows older than this may be removed
+            dry_run: Only count the rows that would be dropped
+
+        Returns:
+            Rows dropped (or that would be dropped); 0 if not partitioned
+        """
+        if not self.is_partitioned(table):
+            return 0
+        expired = days_to_drop(self.partition_days(table), threshold)
+        if dry_run:
+            return self.count_rows(table, expired)
+        return self.drop_partitions(table, expired)
+
+    def maintain(
+        self,
+        threshold: datetime,
+        today: date,
+        days_ahead: int,
+        dry_run: bool = False,
+        tables: Sequence[str] = PARTITIONED_TABLES
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Pre-create future partitions and drop expired ones on every table.
+
+        Args:
+            threshold: Rows older than this may be removed
+            today: Current UTC day
+            days_ahead: Future days to pre-create
+            dry_run: Report what would change without altering tables
+            tables: Tables to maintain
+
+        Returns:
+            Table -> {created, dropped, rows_dropped}; unpartitioned tables are skipped
+        """
+        stats = {}
+        for table in tables:
+            if not self.is_partitioned(table):
+                logger.warning(f"{table} is not partitioned - skipping (run alembic upgrade head)")
+                continue
+            existing = self.partition_days(table)
+            create = days_to_create(existing, today, days_ahead)
+            drop = days_to_drop(existing, threshold)
+            if dry_run:
+                rows = self.count_rows(table, drop)
+            else:
+                self.create_partitions(table, create)
+                rows = self.drop_partitions(table, drop)
+            stats[table] = {"created": len(create), "dropped": len(drop), "rows_dropped": rows}
+        return stats
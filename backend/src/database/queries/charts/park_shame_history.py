@@ -31,7 +31,7 @@ How to Modify:
 """
 
 from datetime import date, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from sqlalchemy import select, func, and_, or_, case, literal_column, desc, null, text
 from sqlalchemy.orm import Session
@@ -54,6 +54,7 @@ from models import (
 )
 from models.orm_stats import ParkHourlyStats as ParkHourlyStatsORM
 from models.orm_schedule import ParkSchedule
+from database.repositories.schedule_repository import ScheduleIndex
 
 
 class ParkShameHistoryQuery:
@@ -65,7 +66,8 @@ class ParkShameHistoryQuery:
     - Slow path: GROUP BY HOUR on raw park_activity_snapshots (rollback)
     """
 
-    def __init__(self, session: Session, use_hourly_tables: bool = None):
+    def __init__(self, session: Session, use_hourly_tables: bool = None,
+                 schedule_index: Optional[ScheduleIndex] = None):
         """
         Initialize query handler.
 
@@ -74,9 +76,12 @@ class ParkShameHistoryQuery:
             use_hourly_tables: If True, use park_hourly_stats (fast path).
                              If False, use GROUP BY HOUR on raw snapshots (rollback).
                              If None, uses global USE_HOURLY_TABLES flag (default).
+            schedule_index: Optional preloaded ScheduleIndex; schedule lookups for
+                           dates it covers are served from memory.
         """
         self.session = session
         self.use_hourly_tables = use_hourly_tables if use_hourly_tables is not None else USE_HOURLY_TABLES
+        self.schedule_index = schedule_index
 
     def _get_schedule_for_date(self, park_id: int, target_date: date) -> Dict[str, Any]:
         """
@@ -93,6 +98,9 @@ class ParkShameHistoryQuery:
             Dict with 'opening_time' and 'closing_time' as datetime objects,
             or None if no schedule exists.
         """
+        if self.schedule_index is not None and self.schedule_index.covers(target_date):
+            return self.schedule_index.get_operating_hours(park_id, target_date)
+
         stmt = (
             select(
                 ParkSchedule.opening_time,
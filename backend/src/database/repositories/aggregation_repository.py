@@ -3,7 +3,7 @@ Theme Park Downtime Tracker - Aggregation Log Repository
 Provides data access layer for aggregation job tracking and verification.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 from datetime import date, datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import select, func
@@ -60,7 +60,8 @@ class AggregationLogRepository:
                 started_at=log_data['started_at'],
                 status=status,
                 parks_processed=log_data.get('parks_processed', 0),
-                rides_processed=log_data.get('rides_processed', 0)
+                rides_processed=log_data.get('rides_processed', 0),
+                unit_key=log_data.get('unit_key')
             )
 
             self.session.add(log_entry)
@@ -163,7 +164,8 @@ class AggregationLogRepository:
             select(AggregationLog)
             .where(
                 AggregationLog.aggregation_date == aggregation_date,
-                AggregationLog.aggregation_type == agg_type
+                AggregationLog.aggregation_type == agg_type,
+                AggregationLog.unit_key.is_(None)
             )
             .order_by(AggregationLog.started_at.desc())
             .limit(1)
@@ -360,13 +362,90 @@ class AggregationLogRepository:
             .where(
                 AggregationLog.aggregation_date == aggregation_date,
                 AggregationLog.aggregation_type == agg_type,
-                AggregationLog.status == AggregationStatus.SUCCESS
+                AggregationLog.status == AggregationStatus.SUCCESS,
+                AggregationLog.unit_key.is_(None)
             )
         )
 
         count = self.session.execute(stmt).scalar()
         return count > 0 if count else False
 
+    def record_completed_unit(
+        self,
+        aggregation_date: date,
+        unit_key: str,
+        aggregation_type: str = 'daily',
+        parks_processed: int = 0,
+        rides_processed: int = 0
+    ) -> int:
+        """
+        Record a finished work unit (checkpoint) as a successful log entry.
+
+        Written in the caller's transaction so the checkpoint commits
+        atomically with the unit's results.
+
+        Args:
+            aggregation_date: Date the unit belongs to
+            unit_key: Work unit identifier (e.g. 'recompute:v1:rides:1-250')
+            aggregation_type: Type (daily, weekly, monthly, yearly)
+            parks_processed: Parks processed by the unit
+            rides_processed: Rides processed by the unit
+
+        Returns:
+            log_id of inserted record
+        """
+        now = datetime.now()
+        log_entry = AggregationLog(
+            aggregation_date=aggregation_date,
+            aggregation_type=AggregationType(aggregation_type),
+            started_at=now,
+            completed_at=now,
+            status=AggregationStatus.SUCCESS,
+            parks_processed=parks_processed,
+            rides_processed=rides_processed,
+            unit_key=unit_key
+        )
+
+        self.session.add(log_entry)
+        self.session.flush()
+        return log_entry.log_id
+
+    def get_completed_unit_keys(
+        self,
+        start_date: date,
+        end_date: date,
+        unit_key_prefix: str,
+        aggregation_type: str = 'daily'
+    ) -> Dict[date, Set[str]]:
+        """
+        Get successfully completed work units in a date range.
+
+        Used by resumable backfills to skip units finished by an earlier run.
+
+        Args:
+            start_date: First date (inclusive)
+            end_date: Last date (inclusive)
+            unit_key_prefix: Only return unit keys starting with this prefix
+            aggregation_type: Type (daily, weekly, monthly, yearly)
+
+        Returns:
+            Dictionary mapping date to the set of completed unit keys
+        """
+        stmt = (
+            select(AggregationLog.aggregation_date, AggregationLog.unit_key)
+            .where(
+                AggregationLog.aggregation_type == AggregationType(aggregation_type),
+                AggregationLog.aggregation_date.between(start_date, end_date),
+                AggregationLog.status == AggregationStatus.SUCCESS,
+                AggregationLog.unit_key.like(f"{unit_key_prefix}%")
+            )
+        )
+
+        completed: Dict[date, Set[str]] = {}
+        for aggregation_date, unit_key in self.session.execute(stmt):
+            completed.setdefault(aggregation_date, set()).add(unit_key)
+        return completed
+
     def get_aggregation_status(
         self,
         aggregation_date: date,
@@ -404,7 +483,8 @@ class AggregationLogRepository:
             select(AggregationLog)
             .where(
                 AggregationLog.aggregation_type == agg_type,
-                AggregationLog.status == AggregationStatus.SUCCESS
+                AggregationLog.status == AggregationStatus.SUCCESS,
+                AggregationLog.unit_key.is_(None)
             )
             .order_by(AggregationLog.aggregation_date.desc())
             .limit(1)
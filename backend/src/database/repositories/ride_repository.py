@@ -4,7 +4,7 @@ Provides data access layer for rides table using SQLAlchemy ORM.
 Maintains API compatibility by returning dataclass Ride objects.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import select, and_, or_, func, case, text
 from datetime import datetime, timedelta
@@ -173,6 +173,31 @@ class RideRepository:
         results = self.session.execute(query).all()
         return [self._orm_to_dataclass(ride_orm, park_qtid, park_name) for ride_orm, park_qtid, park_name in results]
 
+    def get_all_active_identities(self) -> List[Tuple[Optional[str], RideDataclass]]:
+        """
+        Fetch all active rides paired with their ThemeParks.wiki entity UUID.
+
+        Single query used to build the collector's per-cycle ride identity map.
+
+        Returns:
+            List of (themeparks_wiki_id, Ride dataclass) tuples
+        """
+        query = (
+            select(
+                RideORM,
+                ParkORM.queue_times_id.label('park_queue_times_id'),
+                ParkORM.name.label('park_name')
+            )
+            .join(ParkORM, RideORM.park_id == ParkORM.park_id)
+            .where(RideORM.is_active.is_(True))
+        )
+
+        results = self.session.execute(query).all()
+        return [
+            (ride_orm.themeparks_wiki_id, self._orm_to_dataclass(ride_orm, park_qtid, park_name))
+            for ride_orm, park_qtid, park_name in results
+        ]
+
     def get_unclassified_rides(self) -> List[RideDataclass]:
         """
         Fetch rides that have no tier classification yet.
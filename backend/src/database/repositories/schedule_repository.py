@@ -9,7 +9,8 @@ This replaces the hacky "park_appears_open" heuristic that inferred park status
 from ride counts. Now we use actual schedule data from the API.
 """
 
-from typing import List, Optional, Dict, Any
+from bisect import bisect_right
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, date, timedelta
 from dateutil import parser as date_parser
 import pytz
@@ -23,6 +24,121 @@ from collector.themeparks_wiki_client import get_themeparks_wiki_client
 from utils.logger import logger, log_database_error
 
 
+class ScheduleIndex:
+    """
+    In-memory index of OPERATING schedule intervals for a date window.
+
+    Loaded once (e.g. per collection cycle) via ScheduleRepository.load_index(),
+    then answers open/closed and has-recent-schedule questions for any park
+    and timestamp without further queries. Intervals are kept sorted by
+    opening time and searched with bisect; a running max of closing times
+    handles overlapping entries.
+
+    Mirrors ScheduleRepository.is_park_open_now()/has_recent_schedule() so it
+    can stand in for the repository.
+    """
+
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        intervals: List[Tuple[int, date, datetime, datetime]],
+        last_fetched: Dict[int, datetime]
+    ):
+        """
+        Build the index.
+
+        Args:
+            start_date: First schedule_date covered (inclusive)
+            end_date: Last schedule_date covered (inclusive)
+            intervals: (park_id, schedule_date, opening_time, closing_time) tuples in UTC
+            last_fetched: park_id -> most recent fetched_at across all schedule rows
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self._last_fetched = last_fetched
+        self._openings: Dict[int, List[datetime]] = {}
+        self._max_closings: Dict[int, List[datetime]] = {}
+        self._by_date: Dict[Tuple[int, date], Dict[str, datetime]] = {}
+
+        per_park: Dict[int, List[Tuple[datetime, datetime]]] = {}
+        for park_id, schedule_date, opening, closing in intervals:
+            per_park.setdefault(park_id, []).append((opening, closing))
+            existing = self._by_date.get((park_id, schedule_date))
+            if existing is None or opening < existing['opening_time']:
+                self._by_date[(park_id, schedule_date)] = {'opening_time': opening, 'closing_time': closing}
+
+        for park_id, park_intervals in per_park.items():
+            park_intervals.sort()
+            openings, max_closings = [], []
+            running_max = None
+            for opening, closing in park_intervals:
+                running_max = closing if running_max is None else max(running_max, closing)
+                openings.append(opening)
+                max_closings.append(running_max)
+            self._openings[park_id] = openings
+            self._max_closings[park_id] = max_closings
+
+    def covers(self, target_date: date) -> bool:
+        """Return True if target_date falls inside the loaded window."""
+        return self.start_date <= target_date <= self.end_date
+
+    def is_park_open_now(self, park_id: int, now_utc: Optional[datetime] = None) -> bool:
+        """
+        Check if a park is within any OPERATING interval at a point in time.
+
+        Args:
+            park_id: Internal park ID
+            now_utc: Time to check in UTC (defaults to now)
+
+        Returns:
+            True if park is within operating hours, False otherwise
+        """
+        if now_utc is None:
+            now_utc = datetime.utcnow()
+
+        openings = self._openings.get(park_id)
+        if not openings:
+            return False
+
+        # Last interval opening at or before now; open if any interval up to
+        # it closes at or after now
+        idx = bisect_right(openings, now_utc) - 1
+        return idx >= 0 and self._max_closings[park_id][idx] >= now_utc
+
+    def has_recent_schedule(self, park_id: int, max_age_hours: int = 24,
+                            now_utc: Optional[datetime] = None) -> bool:
+        """
+        Check if schedule data was fetched for a park within the time limit.
+
+        Args:
+            park_id: Internal park ID
+            max_age_hours: Maximum age of schedule data in hours
+            now_utc: Reference time in UTC (defaults to now)
+
+        Returns:
+            True if we have schedule data fetched within the time limit
+        """
+        last_fetched = self._last_fetched.get(park_id)
+        if last_fetched is None:
+            return False
+        cutoff_time = (now_utc or datetime.utcnow()) - timedelta(hours=max_age_hours)
+        return last_fetched >= cutoff_time
+
+    def get_operating_hours(self, park_id: int, schedule_date: date) -> Optional[Dict[str, datetime]]:
+        """
+        Get the earliest OPERATING interval for a park on a date.
+
+        Args:
+            park_id: Internal park ID
+            schedule_date: Date to look up
+
+        Returns:
+            Dict with 'opening_time' and 'closing_time' (UTC), or None
+        """
+        return self._by_date.get((park_id, schedule_date))
+
+
 class ScheduleRepository:
     """
     Repository for park schedule operations.
@@ -245,6 +361,51 @@ class ScheduleRepository:
 
         return False
 
+    def load_index(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> ScheduleIndex:
+        """
+        Load all OPERATING intervals in a date window into a ScheduleIndex.
+
+        Two queries total, regardless of park count. Defaults to yesterday
+        through today (UTC), matching is_park_open_now()'s lookback for parks
+        open past midnight.
+
+        Args:
+            start_date: First schedule_date to load (inclusive)
+            end_date: Last schedule_date to load (inclusive)
+
+        Returns:
+            ScheduleIndex for the window
+        """
+        today = datetime.utcnow().date()
+        end_date = end_date or today
+        start_date = start_date or (end_date - timedelta(days=1))
+
+        interval_stmt = (
+            select(
+                ParkSchedule.park_id,
+                ParkSchedule.schedule_date,
+                ParkSchedule.opening_time,
+                ParkSchedule.closing_time
+            )
+            .where(ParkSchedule.schedule_date.between(start_date, end_date))
+            .where(ParkSchedule.schedule_type == 'OPERATING')
+            .where(ParkSchedule.opening_time.is_not(None))
+            .where(ParkSchedule.closing_time.is_not(None))
+        )
+        intervals = [tuple(row) for row in self.session.execute(interval_stmt)]
+
+        fetched_stmt = (
+            select(ParkSchedule.park_id, func.max(ParkSchedule.fetched_at))
+            .group_by(ParkSchedule.park_id)
+        )
+        last_fetched = {park_id: fetched_at for park_id, fetched_at in self.session.execute(fetched_stmt)}
+
+        return ScheduleIndex(start_date, end_date, intervals, last_fetched)
+
     def get_schedule_for_date(
         self,
         park_id: int,
@@ -6,12 +6,18 @@ Provides data access layer for ride status and park activity snapshots using SQL
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import select, and_, func
+from sqlalchemy import select, insert, and_, func
 
+from database.snapshot_storage import STORAGE_COMPACT, RideStatusIntervalRepository
 from models import RideStatusSnapshot, ParkActivitySnapshot, Ride, Park
+from utils.config import SNAPSHOT_STORAGE_MODE, SNAPSHOT_WAIT_TIME_TOLERANCE
 from utils.logger import logger, log_database_error
 
 
+# Rows per multi-row INSERT statement for bulk paths (keeps packets well under max_allowed_packet)
+INSERT_BATCH_SIZE = 1000
+
+
 class RideStatusSnapshotRepository:
     """
     Repository for ride status snapshot operations using SQLAlchemy ORM.
@@ -20,16 +26,21 @@ class RideStatusSnapshotRepository:
     - CRUD operations for ride_status_snapshots table
     - Latest snapshot queries for current status
     - Historical snapshot queries
+
+    In compact storage mode, insert_many() writes change-only intervals
+    (database/snapshot_storage.py) and reads go through the expanding view.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, storage_mode: str = SNAPSHOT_STORAGE_MODE):
         """
         Initialize repository with SQLAlchemy session.
 
         Args:
             session: SQLAlchemy session object
+            storage_mode: 'full' or 'compact' (SNAPSHOT_STORAGE_MODE)
         """
         self.session = session
+        self.storage_mode = storage_mode
 
     def insert(self, snapshot_data: Dict[str, Any]) -> int:
         """
@@ -45,22 +56,7 @@ class RideStatusSnapshotRepository:
             DatabaseError: If insertion fails
         """
         try:
-            # Parse ISO 8601 timestamp if provided as string (e.g., '2024-03-19T03:04:01Z')
-            last_updated_api = snapshot_data.get('last_updated_api')
-            if last_updated_api and isinstance(last_updated_api, str):
-                # Remove 'Z' suffix and parse ISO format
-                ts = last_updated_api.replace('Z', '+00:00')
-                last_updated_api = datetime.fromisoformat(ts).replace(tzinfo=None)
-
-            snapshot = RideStatusSnapshot(
-                ride_id=snapshot_data['ride_id'],
-                recorded_at=snapshot_data['recorded_at'],
-                wait_time=snapshot_data.get('wait_time'),
-                is_open=snapshot_data.get('is_open'),
-                computed_is_open=snapshot_data.get('computed_is_open', False),
-                status=snapshot_data.get('status'),
-                last_updated_api=last_updated_api or datetime.utcnow()
-            )
+            snapshot = RideStatusSnapshot(**self._to_row(snapshot_data))
 
             self.session.add(snapshot)
             self.session.flush()  # Get snapshot_id without committing
@@ -70,6 +66,68 @@ class RideStatusSnapshotRepository:
             log_database_error(e, "Failed to insert ride status snapshot")
             raise
 
+    def insert_many(self, snapshots: List[Dict[str, Any]], batch_size: int = INSERT_BATCH_SIZE) -> int:
+        """
+        Bulk insert ride status snapshots using multi-row INSERT statements.
+
+        Unlike insert(), no per-row flush is issued to fetch snapshot_id, so a
+        whole park or collection cycle is written in a handful of round trips.
+        In compact storage mode the snapshots extend or start intervals instead.
+
+        Args:
+            snapshots: List of snapshot dictionaries (same fields as insert())
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            DatabaseError: If insertion fails
+        """
+        if not snapshots:
+            return 0
+
+        try:
+            rows = [self._to_row(snapshot_data) for snapshot_data in snapshots]
+            if self.storage_mode == STORAGE_COMPACT:
+                intervals = RideStatusIntervalRepository(self.session, SNAPSHOT_WAIT_TIME_TOLERANCE)
+                return intervals.record(rows, batch_size)
+            for start in range(0, len(rows), batch_size):
+                self.session.execute(insert(RideStatusSnapshot).values(rows[start:start + batch_size]))
+            return len(rows)
+
+        except Exception as e:
+            log_database_error(e, "Failed to bulk insert ride status snapshots")
+            raise
+
+    @staticmethod
+    def _to_row(snapshot_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize snapshot input into ride_status_snapshots column values.
+
+        Args:
+            snapshot_data: Dictionary with snapshot fields
+
+        Returns:
+            Dictionary keyed by column name
+        """
+        # Parse ISO 8601 timestamp if provided as string (e.g., '2024-03-19T03:04:01Z')
+        last_updated_api = snapshot_data.get('last_updated_api')
+        if last_updated_api and isinstance(last_updated_api, str):
+            # Remove 'Z' suffix and parse ISO format
+            ts = last_updated_api.replace('Z', '+00:00')
+            last_updated_api = datetime.fromisoformat(ts).replace(tzinfo=None)
+
+        return {
+            'ride_id': snapshot_data['ride_id'],
+            'recorded_at': snapshot_data['recorded_at'],
+            'wait_time': snapshot_data.get('wait_time'),
+            'is_open': snapshot_data.get('is_open'),
+            'computed_is_open': snapshot_data.get('computed_is_open', False),
+            'status': snapshot_data.get('status'),
+            'last_updated_api': last_updated_api or datetime.utcnow()
+        }
+
     def get_latest_by_ride(self, ride_id: int) -> Optional[Dict[str, Any]]:
         """
         Get most recent snapshot for a specific ride.
@@ -103,6 +161,64 @@ class RideStatusSnapshotRepository:
             'last_updated_api': result.last_updated_api
         }
 
+    def get_latest_by_rides(self, park_id: Optional[int] = None,
+                            since: Optional[datetime] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the most recent snapshot for every ride in one set-based query.
+
+        Batched replacement for calling get_latest_by_ride() once per ride.
+        The (ride_id, MAX(recorded_at)) derived table is served by the
+        idx_ride_recorded composite index.
+
+        Args:
+            park_id: Optional park ID to limit results to one park's rides
+            since: Optional lower bound on recorded_at to limit the scan
+
+        Returns:
+            Dict mapping ride_id to snapshot dict (same shape as get_latest_by_ride())
+        """
+        latest = (
+            select(
+                RideStatusSnapshot.ride_id,
+                func.max(RideStatusSnapshot.recorded_at).label('max_recorded_at')
+            )
+            .group_by(RideStatusSnapshot.ride_id)
+        )
+        if park_id is not None:
+            latest = latest.where(
+                RideStatusSnapshot.ride_id.in_(select(Ride.ride_id).where(Ride.park_id == park_id))
+            )
+        if since is not None:
+            latest = latest.where(RideStatusSnapshot.recorded_at >= since)
+        latest = latest.subquery()
+
+        stmt = (
+            select(RideStatusSnapshot)
+            .join(
+                latest,
+                and_(
+                    RideStatusSnapshot.ride_id == latest.c.ride_id,
+                    RideStatusSnapshot.recorded_at == latest.c.max_recorded_at
+                )
+            )
+            # Duplicate recorded_at per ride: highest snapshot_id wins below
+            .order_by(RideStatusSnapshot.snapshot_id)
+        )
+
+        snapshots = {}
+        for result in self.session.execute(stmt).scalars():
+            snapshots[result.ride_id] = {
+                'snapshot_id': result.snapshot_id,
+                'ride_id': result.ride_id,
+                'recorded_at': result.recorded_at,
+                'wait_time': result.wait_time,
+                'is_open': result.is_open,
+                'computed_is_open': result.computed_is_open,
+                'status': result.status,
+                'last_updated_api': result.last_updated_api
+            }
+        return snapshots
+
     def get_latest_all_rides(self, park_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get most recent snapshot for each ride, optionally filtered by park.
@@ -215,17 +331,7 @@ class ParkActivitySnapshotRepository:
             DatabaseError: If insertion fails
         """
         try:
-            snapshot = ParkActivitySnapshot(
-                park_id=activity_data['park_id'],
-                recorded_at=activity_data['recorded_at'],
-                total_rides_tracked=activity_data.get('total_rides_tracked', 0),
-                rides_open=activity_data.get('rides_open', 0),
-                rides_closed=activity_data.get('rides_closed', 0),
-                avg_wait_time=activity_data.get('avg_wait_time'),
-                max_wait_time=activity_data.get('max_wait_time'),
-                park_appears_open=activity_data.get('park_appears_open', False),
-                shame_score=activity_data.get('shame_score')
-            )
+            snapshot = ParkActivitySnapshot(**self._to_row(activity_data))
 
             self.session.add(snapshot)
             self.session.flush()  # Get snapshot_id without committing
@@ -235,6 +341,56 @@ class ParkActivitySnapshotRepository:
             log_database_error(e, "Failed to insert park activity snapshot")
             raise
 
+    def insert_many(self, activities: List[Dict[str, Any]], batch_size: int = INSERT_BATCH_SIZE) -> int:
+        """
+        Bulk insert park activity snapshots using multi-row INSERT statements.
+
+        Args:
+            activities: List of activity dictionaries (same fields as insert())
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            DatabaseError: If insertion fails
+        """
+        if not activities:
+            return 0
+
+        try:
+            rows = [self._to_row(activity_data) for activity_data in activities]
+            for start in range(0, len(rows), batch_size):
+                self.session.execute(insert(ParkActivitySnapshot).values(rows[start:start + batch_size]))
+            return len(rows)
+
+        except Exception as e:
+            log_database_error(e, "Failed to bulk insert park activity snapshots")
+            raise
+
+    @staticmethod
+    def _to_row(activity_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Normalize activity input into park_activity_snapshots column values.
+
+        Args:
+            activity_data: Dictionary with activity fields
+
+        Returns:
+            Dictionary keyed by column name
+        """
+        return {
+            'park_id': activity_data['park_id'],
+            'recorded_at': activity_data['recorded_at'],
+            'total_rides_tracked': activity_data.get('total_rides_tracked', 0),
+            'rides_open': activity_data.get('rides_open', 0),
+            'rides_closed': activity_data.get('rides_closed', 0),
+            'avg_wait_time': activity_data.get('avg_wait_time'),
+            'max_wait_time': activity_data.get('max_wait_time'),
+            'park_appears_open': activity_data.get('park_appears_open', False),
+            'shame_score': activity_data.get('shame_score')
+        }
+
     def get_latest_by_park(self, park_id: int) -> Optional[Dict[str, Any]]:
         """
         Get most recent activity snapshot for a specific park.
@@ -6,10 +6,11 @@ Provides data access layer for ride status change events (up/down transitions).
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func, case, and_, desc
+from sqlalchemy import select, insert, func, case, and_, desc
 
 from models import RideStatusChange, Ride, Park
 from utils.logger import logger, log_database_error
+from database.repositories.snapshot_repository import INSERT_BATCH_SIZE
 
 
 def _to_dict(obj) -> Dict[str, Any]:
@@ -64,6 +65,46 @@ class RideStatusChangeRepository:
             log_database_error(e, "Failed to insert ride status change")
             raise
 
+    def insert_many(self, changes: List[Dict[str, Any]], batch_size: int = INSERT_BATCH_SIZE) -> int:
+        """
+        Bulk insert ride status change events using multi-row INSERT statements.
+
+        Keys that are not ride_status_changes columns (e.g. the collector's
+        previous_status_enum/new_status_enum context) are ignored.
+
+        Args:
+            changes: List of change dictionaries
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Number of rows inserted
+
+        Raises:
+            DatabaseError: If insertion fails
+        """
+        if not changes:
+            return 0
+
+        try:
+            rows = [
+                {
+                    'ride_id': change_data['ride_id'],
+                    'changed_at': change_data['changed_at'],
+                    'previous_status': change_data['previous_status'],
+                    'new_status': change_data['new_status'],
+                    'duration_in_previous_status': change_data.get('duration_in_previous_status') or 0,
+                    'wait_time_at_change': change_data.get('wait_time_at_change')
+                }
+                for change_data in changes
+            ]
+            for start in range(0, len(rows), batch_size):
+                self.session.execute(insert(RideStatusChange).values(rows[start:start + batch_size]))
+            return len(rows)
+
+        except Exception as e:
+            log_database_error(e, "Failed to bulk insert ride status changes")
+            raise
+
     def get_latest_by_ride(self, ride_id: int) -> Optional[Dict[str, Any]]:
         """
         Get most recent status change for a specific ride.
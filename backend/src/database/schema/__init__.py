@@ -12,7 +12,8 @@ Usage:
 
 Tables are organized into three modules:
 - core_tables: parks, rides, ride_classifications (domain entities)
-- snapshot_tables: ride_status_snapshots, park_activity_snapshots, ride_status_changes (raw data)
+- snapshot_tables: ride_status_snapshots, park_activity_snapshots, ride_status_changes,
+  ride_status_intervals (raw data)
 - stats_tables: *_daily_stats, *_weekly_stats, etc. (aggregated statistics)
 
 How to Add a New Table:
@@ -27,6 +28,7 @@ from .snapshot_tables import (
     ride_status_snapshots,
     ride_status_changes,
     park_activity_snapshots,
+    ride_status_intervals,
 )
 from .stats_tables import (
     aggregation_log,
@@ -55,6 +57,7 @@ __all__ = [
     "ride_status_snapshots",
     "ride_status_changes",
     "park_activity_snapshots",
+    "ride_status_intervals",
     # Aggregated statistics
     "aggregation_log",
     "park_operating_sessions",
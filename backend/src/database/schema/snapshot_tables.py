@@ -9,6 +9,7 @@ Tables:
 - ride_status_snapshots: Current ride status (every 5 minutes)
 - ride_status_changes: Status transition events
 - park_activity_snapshots: Park-level activity summary
+- ride_status_intervals: Change-only ride status runs (compact storage mode)
 
 Database: MySQL/MariaDB
 Source: migrations/002_raw_data_tables.sql, 008_themeparks_wiki.sql
@@ -50,14 +51,21 @@ from .metadata import metadata
 #   - Aggregation service (calculates daily stats)
 #
 # Retention: 24 hours (cleanup job removes older data)
+#
+# MySQL: partitioned by day on recorded_at (migration f3a9c1d7e482,
+# database/partitioning.py) - primary key (snapshot_id, recorded_at), no
+# foreign key, as declared here.
+#
+# Compact storage mode: a read-only view expanding ride_status_intervals
+# (database/snapshot_storage.py) with the same columns.
 # =============================================================================
 
 ride_status_snapshots = Table(
     "ride_status_snapshots",
     metadata,
     Column("snapshot_id", BigInteger, primary_key=True, autoincrement=True),
-    Column("ride_id", Integer, ForeignKey("rides.ride_id", ondelete="CASCADE"), nullable=False),
-    Column("recorded_at", DateTime, nullable=False),
+    Column("ride_id", Integer, nullable=False),  # rides.ride_id, no foreign key
+    Column("recorded_at", DateTime, primary_key=True),
     Column("is_open", Boolean, nullable=True),  # Raw from Queue-Times API
     Column(
         "status",
@@ -134,14 +142,16 @@ ride_status_changes = Table(
 #   - Park-aware status calculations (a ride at a closed park shows as PARK_CLOSED, not DOWN)
 #
 # Retention: 24 hours
+#
+# MySQL: partitioned by day on recorded_at, like ride_status_snapshots.
 # =============================================================================
 
 park_activity_snapshots = Table(
     "park_activity_snapshots",
     metadata,
     Column("snapshot_id", BigInteger, primary_key=True, autoincrement=True),
-    Column("park_id", Integer, ForeignKey("parks.park_id", ondelete="CASCADE"), nullable=False),
-    Column("recorded_at", DateTime, nullable=False),
+    Column("park_id", Integer, nullable=False),  # parks.park_id, no foreign key
+    Column("recorded_at", DateTime, primary_key=True),
     Column("total_rides_tracked", Integer, nullable=False, server_default="0"),
     Column("rides_open", Integer, nullable=False, server_default="0"),
     Column("rides_closed", Integer, nullable=False, server_default="0"),
@@ -153,3 +163,41 @@ park_activity_snapshots = Table(
     Index("idx_pas_recorded_at", "recorded_at"),
     Index("idx_park_open", "park_id", "park_appears_open", "recorded_at"),
 )
+
+
+# =============================================================================
+# RIDE_STATUS_INTERVALS TABLE
+# =============================================================================
+# Compact (change-only) storage of ride status snapshots: one row per run of
+# identical snapshots, valid from the first to the last collection cycle of
+# the run (inclusive).
+#
+# Used by:
+#   - Collector writes in SNAPSHOT_STORAGE_MODE=compact
+#   - ride_status_snapshots view (expands runs over park_activity_snapshots)
+#
+# Retention: same as ride_status_snapshots (runs ending before the cleanup
+# threshold are deleted)
+# =============================================================================
+
+ride_status_intervals = Table(
+    "ride_status_intervals",
+    metadata,
+    Column("interval_id", BigInteger, primary_key=True, autoincrement=True),
+    Column("ride_id", Integer, nullable=False),
+    Column("valid_from", DateTime, nullable=False),
+    Column("valid_to", DateTime, nullable=False),
+    Column("is_open", Boolean, nullable=True),
+    Column(
+        "status",
+        Enum("OPERATING", "DOWN", "CLOSED", "REFURBISHMENT", name="ride_status_enum"),
+        nullable=True,
+    ),
+    Column("wait_time", Integer, nullable=True),  # First value of the run
+    Column("computed_is_open", Boolean, nullable=False),
+    Column("last_updated_api", DateTime, nullable=False),  # Latest value of the run
+    Column("samples", Integer, nullable=False, server_default="1"),
+    # Indexes
+    Index("idx_interval_ride_valid_to", "ride_id", "valid_to"),
+    Index("idx_interval_valid_to", "valid_to"),
+)
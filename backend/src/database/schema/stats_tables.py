@@ -23,6 +23,7 @@ from sqlalchemy import (
     Date,
     Numeric,
     Text,
+    String,
     Enum,
     ForeignKey,
     Index,
@@ -50,7 +51,7 @@ aggregation_log = Table(
     Column("aggregation_date", Date, nullable=False),
     Column(
         "aggregation_type",
-        Enum("daily", "weekly", "monthly", "yearly", name="aggregation_type_enum"),
+        Enum("hourly", "daily", "weekly", "monthly", "yearly", name="aggregation_type_enum"),
         nullable=False,
     ),
     Column("started_at", DateTime, nullable=False),
@@ -65,10 +66,12 @@ aggregation_log = Table(
     Column("error_message", Text, nullable=True),
     Column("parks_processed", Integer, server_default="0"),
     Column("rides_processed", Integer, server_default="0"),
-    # Constraints and indexes
-    UniqueConstraint("aggregation_date", "aggregation_type", name="unique_aggregation"),
+    Column("unit_key", String(100), nullable=True, comment="Work unit identifier (NULL for run-level entries)"),
+    # Indexes. (date, type) is not unique: hourly runs log one entry per hour
+    # and per-unit checkpoints share the date and type of their run-level entry
     Index("idx_agg_status", "status", "aggregation_date"),
     Index("idx_agg_completed", "completed_at"),
+    Index("idx_aggregation_unit", "aggregation_date", "aggregation_type", "unit_key"),
 )
 
 
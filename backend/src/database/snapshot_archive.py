@@ -0,0 +1,495 @@
+"""
+Theme Park Downtime Tracker - Columnar Snapshot Archive
+Cold storage of raw ride snapshots and status changes, one NumPy file per column.
+
+scripts/cleanup_raw_data.py deletes raw snapshots once the daily aggregation
+covers them (scripts/maintain_partitions.py drops whole expired days before
+that). With SNAPSHOT_ARCHIVE_DIR set both first append everything they are
+about to remove to the archive, so historical recomputes
+(scripts/recompute_daily_stats.py --source archive) and audits
+(scripts/verify_aggregates.py --archive-dir) keep working after cleanup.
+
+Layout (UTC day of recorded_at / changed_at, then park):
+
+    <root>/2026-01-14/manifest.json
+    <root>/2026-01-14/park_12/v3/snapshots.recorded_at.npy
+    <root>/2026-01-14/park_12/v3/snapshots.ride_id.npy
+    ...
+    <root>/2026-01-14/park_12/v3/changes.changed_at.npy
+
+Each snapshot row is denormalized with park_appears_open from the park's
+activity row for the same cycle (-1 if there was none), so reads need no
+join. Rows are sorted by (ride_id, time) and columns are loaded with
+mmap_mode='r': a ride's rows are found with a binary search and only the
+pages holding them are read.
+
+Integers use -1 for NULL; status is stored as a code (STATUS_CODES).
+Appending to a park writes a new version directory and then swaps the
+manifest entry (atomic rename), so readers never see half-written columns.
+
+NumPy is an optional dependency: it is only needed when archiving is
+enabled or the archive is read.
+"""
+
+import calendar
+import json
+import os
+import shutil
+from datetime import date, datetime, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from utils.logger import logger
+
+ARCHIVE_FORMAT = 1
+MANIFEST = 'manifest.json'
+
+NULL = -1
+STATUS_CODES = {'OPERATING': 0, 'DOWN': 1, 'CLOSED': 2, 'REFURBISHMENT': 3}
+
+SNAPSHOT_COLUMNS = {
+    'recorded_at': 'int64',        # UTC epoch seconds
+    'ride_id': 'int32',
+    'status': 'int8',              # STATUS_CODES, -1 = NULL
+    'computed_is_open': 'int8',
+    'is_open': 'int8',             # -1 = NULL
+    'wait_time': 'int32',          # -1 = NULL
+    'park_appears_open': 'int8',   # -1 = no park activity row for the cycle
+}
+CHANGE_COLUMNS = {
+    'changed_at': 'int64',         # UTC epoch seconds
+    'ride_id': 'int32',
+    'new_status': 'int8',
+    'duration_in_previous_status': 'int32',
+}
+# (table, time column) per archived row kind
+KINDS = {
+    'snapshots': (SNAPSHOT_COLUMNS, 'recorded_at'),
+    'changes': (CHANGE_COLUMNS, 'changed_at'),
+}
+
+
+def _require_numpy():
+    """Fail with a clear message when the optional dependency is missing."""
+    if np is None:
+        raise RuntimeError("The snapshot archive requires numpy (pip install numpy)")
+
+
+def to_epoch(value: datetime) -> int:
+    """Naive UTC datetime -> epoch seconds."""
+    return calendar.timegm(value.timetuple())
+
+
+def _day_start(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def _nullable(value: Any) -> int:
+    return NULL if value is None else int(value)
+
+
+def encode_snapshots(rows: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+    """
+    Column arrays for snapshot rows.
+
+    Args:
+        rows: Rows with SNAPSHOT_COLUMNS keys (datetimes, status strings, NULLs)
+
+    Returns:
+        Column name -> numpy array
+    """
+    _require_numpy()
+    values = {column: [] for column in SNAPSHOT_COLUMNS}
+    for row in rows:
+        values['recorded_at'].append(to_epoch(row['recorded_at']))
+        values['ride_id'].append(row['ride_id'])
+        values['status'].append(STATUS_CODES.get(row['status'], NULL))
+        values['computed_is_open'].append(int(bool(row['computed_is_open'])))
+        values['is_open'].append(_nullable(row['is_open']))
+        values['wait_time'].append(_nullable(row['wait_time']))
+        values['park_appears_open'].append(_nullable(row['park_appears_open']))
+    return {column: np.array(values[column], dtype=dtype) for column, dtype in SNAPSHOT_COLUMNS.items()}
+
+
+def encode_changes(rows: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Column arrays for ride_status_changes rows."""
+    _require_numpy()
+    values = {column: [] for column in CHANGE_COLUMNS}
+    for row in rows:
+        values['changed_at'].append(to_epoch(row['changed_at']))
+        values['ride_id'].append(row['ride_id'])
+        values['new_status'].append(int(bool(row['new_status'])))
+        values['duration_in_previous_status'].append(_nullable(row['duration_in_previous_status']))
+    return {column: np.array(values[column], dtype=dtype) for column, dtype in CHANGE_COLUMNS.items()}
+
+
+def merge_columns(existing: Optional[Dict[str, Any]], new: Dict[str, Any], time_column: str) -> Dict[str, Any]:
+    """Concatenate column sets and sort rows by (ride_id, time)."""
+    if existing:
+        new = {column: np.concatenate([existing[column], new[column]]) for column in new}
+    order = np.lexsort((new[time_column], new['ride_id']))
+    return {column: array[order] for column, array in new.items()}
+
+
+def _round_decimal(value: Decimal, scale: int) -> Decimal:
+    """
+    MySQL-compatible rounding of a decimal division result.
+
+    MySQL carries 4 extra digits of scale through division/AVG before ROUND.
+    """
+    intermediate = value.quantize(Decimal(1).scaleb(-(scale + 4)), rounding=ROUND_HALF_UP)
+    return intermediate.quantize(Decimal(1).scaleb(-scale), rounding=ROUND_HALF_UP)
+
+
+def ride_day_counts(snapshots: Dict[str, Any]) -> Optional[Dict[str, int]]:
+    """
+    Snapshot counts behind a ride's daily uptime/downtime (used by AggregateVerifier).
+
+    Only cycles with a park activity row count, like the SQL inner join.
+
+    Returns:
+        {snapshots, park_open, uptime, down, operating}, or None without joined snapshots:
+        uptime = park open and ride computed open; down = park open and status
+        DOWN (or no status and not computed open); operating = park open and
+        status OPERATING (or no status and computed open)
+    """
+    joined = snapshots['park_appears_open'] != NULL
+    if not joined.any():
+        return None
+    park_open = snapshots['park_appears_open'] == 1
+    computed_open = snapshots['computed_is_open'] == 1
+    status = snapshots['status']
+    no_status = status == NULL
+    return {
+        'snapshots': int(np.count_nonzero(joined)),
+        'park_open': int(np.count_nonzero(park_open)),
+        'uptime': int(np.count_nonzero(park_open & computed_open)),
+        'down': int(np.count_nonzero(park_open & ((status == STATUS_CODES['DOWN']) | (no_status & ~computed_open)))),
+        'operating': int(np.count_nonzero(park_open & ((status == STATUS_CODES['OPERATING']) | (no_status & computed_open)))),
+    }
+
+
+def ride_daily_stats(
+    snapshots: Dict[str, Any],
+    changes: Dict[str, Any],
+    interval_minutes: int
+) -> Optional[SimpleNamespace]:
+    """
+    Daily ride statistics from archived rows (same rules as recompute_daily_stats).
+
+    Args:
+        snapshots: One ride's snapshot columns for the day
+        changes: The ride's status change columns for the day
+        interval_minutes: Minutes represented by one snapshot
+
+    Returns:
+        Namespace with the ride_daily_stats values, or None without snapshots
+    """
+    if len(snapshots['ride_id']) == 0:
+        return None
+
+    # Only cycles with a park activity row count (inner join in SQL)
+    joined = snapshots['park_appears_open'] != NULL
+    park_open = snapshots['park_appears_open'] == 1
+    computed_open = (snapshots['computed_is_open'] == 1) & joined
+    status = snapshots['status']
+    down = park_open & (
+        (status == STATUS_CODES['DOWN'])
+        | ((status == NULL) & (snapshots['computed_is_open'] == 0))
+    )
+
+    operated = bool(computed_open.any())
+    uptime = int(np.count_nonzero(park_open & computed_open)) * interval_minutes
+    operating = int(np.count_nonzero(park_open)) * interval_minutes
+    downtime = int(np.count_nonzero(down)) * interval_minutes if operated else 0
+    uptime_percentage = (
+        _round_decimal(Decimal(100 * uptime) / Decimal(operating), 2)
+        if operating > 0 and operated else Decimal(0)
+    )
+
+    wait = snapshots['wait_time']
+    has_wait = (wait != NULL) & joined
+    open_waits = wait[has_wait & computed_open]
+
+    new_status = changes['new_status'] == 1
+    downtimes = changes['duration_in_previous_status'][new_status]
+
+    return SimpleNamespace(
+        uptime_minutes=uptime,
+        downtime_minutes=downtime,
+        uptime_percentage=uptime_percentage,
+        operating_hours_minutes=operating,
+        avg_wait_time=(
+            _round_decimal(Decimal(int(open_waits.sum())) / Decimal(len(open_waits)), 2)
+            if len(open_waits) else None
+        ),
+        min_wait_time=int(open_waits.min()) if len(open_waits) else None,
+        max_wait_time=int(open_waits.max()) if len(open_waits) else None,
+        peak_wait_time=int(wait[has_wait].max()) if has_wait.any() else None,
+        status_changes=len(changes['ride_id']),
+        longest_downtime=int(downtimes.max()) if len(downtimes) else None,
+    )
+
+
+class SnapshotArchive:
+    """Reads and appends the columnar archive under one directory."""
+
+    def __init__(self, root: str):
+        """
+        Initialize archive.
+
+        Args:
+            root: Archive directory (created on first write)
+        """
+        _require_numpy()
+        self.root = Path(root)
+        self._parks: Dict[Tuple[date, int], Optional[Dict[str, Dict[str, Any]]]] = {}
+
+    def day_dir(self, day: date) -> Path:
+        return self.root / day.isoformat()
+
+    def days(self) -> List[date]:
+        """UTC days present in the archive."""
+        if not self.root.exists():
+            return []
+        return sorted(
+            date.fromisoformat(path.name) for path in self.root.iterdir()
+            if (path / MANIFEST).exists()
+        )
+
+    def read_manifest(self, day: date) -> Dict[str, Any]:
+        """Manifest of a day ({format, parks: {park_id: entry}}); empty if not archived."""
+        path = self.day_dir(day) / MANIFEST
+        if not path.exists():
+            return {"format": ARCHIVE_FORMAT, "parks": {}}
+        return json.loads(path.read_text())
+
+    def _write_manifest(self, day: date, manifest: Dict[str, Any]) -> None:
+        path = self.day_dir(day) / MANIFEST
+        tmp_path = path.with_name(f"{MANIFEST}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        os.replace(tmp_path, path)
+
+    def archived_until(self, day: date, park_id: int) -> Optional[datetime]:
+        """End of the archived range of a park's day (exclusive), if any."""
+        entry = self.read_manifest(day)["parks"].get(str(park_id))
+        return datetime.fromisoformat(entry["archived_until"]) if entry else None
+
+    def load_park(self, day: date, park_id: int) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Memory-mapped columns of a park's day.
+
+        Returns:
+            {'snapshots': {column: array}, 'changes': {column: array}}, or None
+        """
+        key = (day, park_id)
+        if key not in self._parks:
+            entry = self.read_manifest(day)["parks"].get(str(park_id))
+            if not entry or entry.get("version") is None:
+                self._parks[key] = None
+            else:
+                version_dir = self.day_dir(day) / f"park_{park_id}" / f"v{entry['version']}"
+                self._parks[key] = {
+                    kind: {
+                        column: np.load(version_dir / f"{kind}.{column}.npy", mmap_mode='r')
+                        for column in columns
+                    }
+                    for kind, (columns, _) in KINDS.items()
+                }
+        return self._parks[key]
+
+    def append_park(
+        self,
+        day: date,
+        park_id: int,
+        snapshots: Dict[str, Any],
+        changes: Dict[str, Any],
+        archived_until: datetime
+    ) -> None:
+        """
+        Append rows to a park's day and advance its archived_until.
+
+        Args:
+            day: UTC day the rows belong to
+            park_id: Park
+            snapshots: encode_snapshots() columns
+            changes: encode_changes() columns
+            archived_until: Rows before this time are now archived
+        """
+        manifest = self.read_manifest(day)
+        entry = manifest["parks"].get(str(park_id), {})
+        old_version = entry.get("version")
+
+        if len(snapshots['ride_id']) or len(changes['ride_id']):
+            existing = self.load_park(day, park_id) if old_version is not None else None
+            merged = {
+                kind: merge_columns(existing and existing[kind], new, KINDS[kind][1])
+                for kind, new in (('snapshots', snapshots), ('changes', changes))
+            }
+            version = (old_version or 0) + 1
+            version_dir = self.day_dir(day) / f"park_{park_id}" / f"v{version}"
+            version_dir.mkdir(parents=True, exist_ok=True)
+            for kind, columns in merged.items():
+                for column, array in columns.items():
+                    np.save(version_dir / f"{kind}.{column}.npy", array)
+            entry = {
+                "version": version,
+                "snapshots": len(merged['snapshots']['ride_id']),
+                "changes": len(merged['changes']['ride_id']),
+            }
+        else:
+            self.day_dir(day).mkdir(parents=True, exist_ok=True)
+            version = old_version
+
+        entry["archived_until"] = archived_until.isoformat()
+        manifest["parks"][str(park_id)] = entry
+        self._write_manifest(day, manifest)
+        self._parks.pop((day, park_id), None)
+
+        if old_version is not None and version != old_version:
+            shutil.rmtree(self.day_dir(day) / f"park_{park_id}" / f"v{old_version}", ignore_errors=True)
+
+    def _ride_rows(self, kind: str, park_id: int, ride_id: int, start: datetime, end: datetime) -> Dict[str, Any]:
+        """A ride's rows of one kind with time in [start, end), across UTC days."""
+        columns, time_column = KINDS[kind]
+        start_epoch, end_epoch = to_epoch(start), to_epoch(end)
+        parts = []
+        day = start.date()
+        while _day_start(day) < end:
+            park = self.load_park(day, park_id)
+            if park is not None:
+                rows = park[kind]
+                lo = np.searchsorted(rows['ride_id'], ride_id, side='left')
+                hi = np.searchsorted(rows['ride_id'], ride_id, side='right')
+                times = rows[time_column][lo:hi]
+                first = lo + np.searchsorted(times, start_epoch, side='left')
+                last = lo + np.searchsorted(times, end_epoch, side='left')
+                parts.append({column: rows[column][first:last] for column in columns})
+            day += timedelta(days=1)
+        if not parts:
+            return {column: np.empty(0, dtype=dtype) for column, dtype in columns.items()}
+        return {column: np.concatenate([part[column] for part in parts]) for column in columns}
+
+    def ride_snapshots(self, park_id: int, ride_id: int, start: datetime, end: datetime) -> Dict[str, Any]:
+        """A ride's snapshot columns with recorded_at in [start, end)."""
+        return self._ride_rows('snapshots', park_id, ride_id, start, end)
+
+    def ride_changes(self, park_id: int, ride_id: int, start: datetime, end: datetime) -> Dict[str, Any]:
+        """A ride's status change columns with changed_at in [start, end)."""
+        return self._ride_rows('changes', park_id, ride_id, start, end)
+
+    def ride_daily_stats(
+        self,
+        park_id: int,
+        ride_id: int,
+        start: datetime,
+        end: datetime,
+        interval_minutes: int
+    ) -> Optional[SimpleNamespace]:
+        """ride_daily_stats() for a ride over [start, end)."""
+        return ride_daily_stats(
+            self.ride_snapshots(park_id, ride_id, start, end),
+            self.ride_changes(park_id, ride_id, start, end),
+            interval_minutes
+        )
+
+
+class SnapshotArchiver:
+    """Exports raw snapshots and status changes from MySQL into a SnapshotArchive."""
+
+    def __init__(self, conn: Connection, archive: SnapshotArchive):
+        """
+        Initialize archiver.
+
+        Args:
+            conn: Database connection
+            archive: Target archive
+        """
+        self.conn = conn
+        self.archive = archive
+
+    def _fetch_snapshots(self, park_id: int, since: datetime, until: datetime) -> List[Mapping[str, Any]]:
+        return self.conn.execute(text("""
+            SELECT rss.recorded_at, rss.ride_id, rss.status, rss.computed_is_open,
+                   rss.is_open, rss.wait_time, pas.park_appears_open
+            FROM ride_status_snapshots rss
+            JOIN rides r ON r.ride_id = rss.ride_id
+            LEFT JOIN park_activity_snapshots pas
+                ON pas.park_id = r.park_id
+                AND pas.recorded_at = rss.recorded_at
+            WHERE r.park_id = :park_id
+                AND rss.recorded_at >= :since
+                AND rss.recorded_at < :until
+        """), {"park_id": park_id, "since": since, "until": until}).mappings().all()
+
+    def _fetch_changes(self, park_id: int, since: datetime, until: datetime) -> List[Mapping[str, Any]]:
+        return self.conn.execute(text("""
+            SELECT rsc.changed_at, rsc.ride_id, rsc.new_status, rsc.duration_in_previous_status
+            FROM ride_status_changes rsc
+            JOIN rides r ON r.ride_id = rsc.ride_id
+            WHERE r.park_id = :park_id
+                AND rsc.changed_at >= :since
+                AND rsc.changed_at < :until
+        """), {"park_id": park_id, "since": since, "until": until}).mappings().all()
+
+    def archive_before(self, threshold: datetime) -> Dict[str, int]:
+        """
+        Archive every row older than the threshold that is not archived yet.
+
+        Resumes per park and day from the manifest's archived_until, so it is
+        safe to rerun after a failure.
+
+        Args:
+            threshold: Rows before this time are archived (the cleanup threshold)
+
+        Returns:
+            {days, snapshots, changes} archived in this run
+        """
+        oldest = self.conn.execute(text("""
+            SELECT LEAST(
+                COALESCE((SELECT MIN(recorded_at) FROM ride_status_snapshots), :threshold),
+                COALESCE((SELECT MIN(changed_at) FROM ride_status_changes), :threshold)
+            )
+        """), {"threshold": threshold}).scalar()
+        park_ids = [row.park_id for row in self.conn.execute(text("SELECT DISTINCT park_id FROM rides ORDER BY park_id"))]
+
+        stats = {"days": 0, "snapshots": 0, "changes": 0}
+        if oldest is None or oldest >= threshold:
+            return stats
+
+        day = oldest.date()
+        while _day_start(day) < threshold:
+            until = min(_day_start(day + timedelta(days=1)), threshold)
+            archived_any = False
+            for park_id in park_ids:
+                previous = self.archive.archived_until(day, park_id)
+                since = max(_day_start(day), previous or _day_start(day))
+                if since >= until:
+                    continue
+                snapshots = self._fetch_snapshots(park_id, since, until)
+                changes = self._fetch_changes(park_id, since, until)
+                if not snapshots and not changes and previous is None:
+                    continue
+                self.archive.append_park(day, park_id, encode_snapshots(snapshots), encode_changes(changes), until)
+                stats["snapshots"] += len(snapshots)
+                stats["changes"] += len(changes)
+                archived_any = archived_any or bool(snapshots or changes)
+            if archived_any:
+                stats["days"] += 1
+            day += timedelta(days=1)
+
+        logger.info(
+            f"Archived {stats['snapshots']:,} snapshots and {stats['changes']:,} status changes "
+            f"({stats['days']} days) to {self.archive.root}"
+        )
+        return stats
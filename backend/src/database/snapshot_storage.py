@@ -0,0 +1,410 @@
+"""
+Theme Park Downtime Tracker - Compact (Change-Only) Snapshot Storage
+Run-length encoding of ride_status_snapshots as validity intervals.
+
+Most rides report the same status every collection cycle for hours, so in
+'compact' storage mode (SNAPSHOT_STORAGE_MODE=compact) the collector writes
+a row to ride_status_intervals only when a ride's state changes:
+
+    ride_id | valid_from | valid_to | status    | computed_is_open | wait_time | samples
+    101     | 09:00      | 11:40    | OPERATING | 1                | 35        | 33
+    101     | 11:45      | 12:30    | DOWN      | 0                | NULL      | 10
+
+A cycle with the same status, computed_is_open, is_open and wait time (within
+SNAPSHOT_WAIT_TIME_TOLERANCE minutes of the interval's first value) extends
+the ride's open interval to the new recorded_at instead.
+
+Readers are unchanged: scripts/convert_snapshot_storage.py replaces the
+ride_status_snapshots table with a view (EXPANDED_SNAPSHOTS_SQL) that expands
+each interval back into one row per collection cycle. A park's cycles are its
+park_activity_snapshots rows, which the collector writes every cycle with the
+same recorded_at as the ride snapshots, so joins on recorded_at keep working.
+
+An interval is only extended if it ended at the park's previous cycle. A ride
+missing from a cycle therefore starts a new interval, and the view never
+yields a row for a cycle in which the ride was not reported.
+
+Differences from full storage:
+- snapshot_id is synthetic (seconds since 2000-01-01 * 1,000,000 + ride_id):
+  unique, and increasing with recorded_at like the AUTO_INCREMENT id.
+- last_updated_api is the latest value of the interval.
+- With a tolerance > 0, wait_time is the first value of the interval.
+- A ride row is only visible once its park's activity row for the cycle is
+  written (end of the collection cycle).
+- The view is read-only; only the collector writes in compact mode.
+"""
+
+from bisect import bisect_left
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from models import RideStatusInterval
+from utils.logger import logger
+
+STORAGE_FULL = 'full'
+STORAGE_COMPACT = 'compact'
+STORAGE_MODES = (STORAGE_FULL, STORAGE_COMPACT)
+
+SNAPSHOTS_TABLE = 'ride_status_snapshots'
+INTERVALS_TABLE = 'ride_status_intervals'
+# The (empty) original table is kept under this name while the view is active
+FULL_TABLE_BACKUP = 'ride_status_snapshots_full'
+
+# Columns stored per interval, in addition to ride_id / valid_from / valid_to
+STATE_COLUMNS = ('status', 'computed_is_open', 'is_open', 'wait_time')
+
+# Rows per multi-row INSERT
+INTERVAL_BATCH_SIZE = 1000
+
+EXPANDED_SNAPSHOTS_SQL = f"""
+    SELECT
+        TIMESTAMPDIFF(SECOND, '2000-01-01', pas.recorded_at) * 1000000 + i.ride_id AS snapshot_id,
+        i.ride_id AS ride_id,
+        pas.recorded_at AS recorded_at,
+        i.is_open AS is_open,
+        i.status AS status,
+        i.wait_time AS wait_time,
+        i.last_updated_api AS last_updated_api,
+        i.computed_is_open AS computed_is_open
+    FROM {INTERVALS_TABLE} i
+    JOIN rides r ON r.ride_id = i.ride_id
+    JOIN park_activity_snapshots pas
+        ON pas.park_id = r.park_id
+        AND pas.recorded_at BETWEEN i.valid_from AND i.valid_to
+"""
+
+
+def same_state(interval: Mapping[str, Any], snapshot: Mapping[str, Any], tolerance: int = 0) -> bool:
+    """
+    True if a snapshot can be folded into an interval.
+
+    Args:
+        interval: Interval row (status, computed_is_open, is_open, wait_time)
+        snapshot: Snapshot row with the same keys
+        tolerance: Allowed wait time difference in minutes from the interval's value
+
+    Returns:
+        True if status, computed_is_open and is_open match and the wait time is within tolerance
+    """
+    if interval['status'] != snapshot['status']:
+        return False
+    if bool(interval['computed_is_open']) != bool(snapshot['computed_is_open']):
+        return False
+    if _optional_bool(interval['is_open']) != _optional_bool(snapshot['is_open']):
+        return False
+    stored, current = interval['wait_time'], snapshot['wait_time']
+    if stored is None or current is None:
+        return stored is None and current is None
+    return abs(stored - current) <= tolerance
+
+
+def _optional_bool(value: Any) -> Optional[bool]:
+    """Normalize MySQL 0/1 and Python booleans, keeping NULL."""
+    return None if value is None else bool(value)
+
+
+def plan_intervals(
+    snapshots: Iterable[Mapping[str, Any]],
+    open_intervals: Mapping[int, Mapping[str, Any]],
+    tolerance: int = 0
+) -> List[Dict[str, Any]]:
+    """
+    Interval rows to upsert for one collection cycle.
+
+    Args:
+        snapshots: ride_status_snapshots rows (ride_id, recorded_at, state, last_updated_api)
+        open_intervals: ride_id -> interval ending at the park's previous cycle
+        tolerance: Wait time tolerance in minutes
+
+    Returns:
+        Rows for ride_status_intervals; extensions carry the interval_id
+        being extended, new intervals have interval_id None
+    """
+    rows = []
+    for snapshot in snapshots:
+        interval = open_intervals.get(snapshot['ride_id'])
+        if interval is not None and same_state(interval, snapshot, tolerance):
+            rows.append({
+                'interval_id': interval['interval_id'],
+                'ride_id': snapshot['ride_id'],
+                'valid_from': interval['valid_from'],
+                'valid_to': snapshot['recorded_at'],
+                **{column: interval[column] for column in STATE_COLUMNS},
+                'last_updated_api': snapshot['last_updated_api'],
+                'samples': interval['samples'] + 1,
+            })
+        else:
+            rows.append({'interval_id': None, **_new_interval(snapshot)})
+    return rows
+
+
+def _new_interval(snapshot: Mapping[str, Any]) -> Dict[str, Any]:
+    """Interval row covering a single snapshot."""
+    return {
+        'ride_id': snapshot['ride_id'],
+        'valid_from': snapshot['recorded_at'],
+        'valid_to': snapshot['recorded_at'],
+        **{column: snapshot[column] for column in STATE_COLUMNS},
+        'last_updated_api': snapshot['last_updated_api'],
+        'samples': 1,
+    }
+
+
+def compact_snapshots(
+    snapshots: Iterable[Mapping[str, Any]],
+    park_cycles: Mapping[int, Sequence[datetime]],
+    tolerance: int = 0
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Run-length encode stored snapshots (used when converting to compact storage).
+
+    Applies the same rule as the collector: a snapshot extends the ride's
+    current interval only if the interval ended at the park's previous cycle.
+
+    Args:
+        snapshots: Rows with park_id, ride_id, recorded_at, state and
+            last_updated_api, ordered by ride_id, recorded_at
+        park_cycles: park_id -> sorted park_activity_snapshots recorded_at values
+        tolerance: Wait time tolerance in minutes
+
+    Returns:
+        (interval rows without interval_id, snapshots skipped because their
+        park has no activity row for that cycle and the view could not show them)
+    """
+    intervals = []
+    skipped = 0
+    current = None
+    for snapshot in snapshots:
+        cycles = park_cycles.get(snapshot['park_id'], ())
+        position = bisect_left(cycles, snapshot['recorded_at'])
+        if position == len(cycles) or cycles[position] != snapshot['recorded_at']:
+            skipped += 1
+            continue
+        previous_cycle = cycles[position - 1] if position else None
+        if (current is not None
+                and current['ride_id'] == snapshot['ride_id']
+                and current['valid_to'] == previous_cycle
+                and same_state(current, snapshot, tolerance)):
+            current['valid_to'] = snapshot['recorded_at']
+            current['last_updated_api'] = snapshot['last_updated_api']
+            current['samples'] += 1
+            continue
+        if current is not None:
+            intervals.append(current)
+        current = _new_interval(snapshot)
+    if current is not None:
+        intervals.append(current)
+    return intervals, skipped
+
+
+def expand_intervals(
+    intervals: Iterable[Mapping[str, Any]],
+    ride_parks: Mapping[int, int],
+    park_cycles: Mapping[int, Sequence[datetime]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Python equivalent of EXPANDED_SNAPSHOTS_SQL: one snapshot per covered cycle.
+
+    Args:
+        intervals: Interval rows
+        ride_parks: ride_id -> park_id
+        park_cycles: park_id -> sorted park_activity_snapshots recorded_at values
+
+    Yields:
+        Snapshot rows (ride_id, recorded_at, state, last_updated_api)
+    """
+    for interval in intervals:
+        cycles = park_cycles.get(ride_parks.get(interval['ride_id']), ())
+        for recorded_at in cycles[bisect_left(cycles, interval['valid_from']):]:
+            if recorded_at > interval['valid_to']:
+                break
+            yield {
+                'ride_id': interval['ride_id'],
+                'recorded_at': recorded_at,
+                **{column: interval[column] for column in STATE_COLUMNS},
+                'last_updated_api': interval['last_updated_api'],
+            }
+
+
+class RideStatusIntervalRepository:
+    """Writes ride snapshots as change-only intervals (compact storage mode)."""
+
+    def __init__(self, session: Session, tolerance: int = 0):
+        """
+        Initialize repository with SQLAlchemy session.
+
+        Args:
+            session: SQLAlchemy session object
+            tolerance: Wait time tolerance in minutes
+        """
+        self.session = session
+        self.tolerance = tolerance
+
+    def get_open_intervals(self, ride_ids: List[int], recorded_at: datetime) -> Dict[int, Dict[str, Any]]:
+        """
+        Intervals that may be extended by a cycle at recorded_at.
+
+        Only intervals ending exactly at the park's previous cycle (latest
+        park_activity_snapshots row before recorded_at) qualify.
+
+        Returns:
+            ride_id -> interval row
+        """
+        if not ride_ids:
+            return {}
+        result = self.session.execute(text(f"""
+            SELECT i.interval_id, i.ride_id, i.valid_from, i.valid_to, i.samples,
+                   i.status, i.computed_is_open, i.is_open, i.wait_time
+            FROM {INTERVALS_TABLE} i
+            JOIN rides r ON r.ride_id = i.ride_id
+            WHERE i.ride_id IN :ride_ids
+                AND i.valid_to = (
+                    SELECT MAX(pas.recorded_at)
+                    FROM park_activity_snapshots pas
+                    WHERE pas.park_id = r.park_id
+                        AND pas.recorded_at < :recorded_at
+                )
+        """).bindparams(bindparam('ride_ids', expanding=True)), {"ride_ids": ride_ids, "recorded_at": recorded_at})
+        return {row.ride_id: dict(row._mapping) for row in result}
+
+    def record(self, rows: List[Dict[str, Any]], batch_size: int = INTERVAL_BATCH_SIZE) -> int:
+        """
+        Fold snapshot rows into intervals.
+
+        Args:
+            rows: ride_status_snapshots column values (RideStatusSnapshotRepository._to_row)
+            batch_size: Maximum rows per INSERT statement
+
+        Returns:
+            Number of snapshots recorded
+        """
+        by_cycle: Dict[datetime, List[Dict[str, Any]]] = {}
+        for row in rows:
+            by_cycle.setdefault(row['recorded_at'], []).append(row)
+
+        for recorded_at in sorted(by_cycle):
+            cycle = by_cycle[recorded_at]
+            open_intervals = self.get_open_intervals(sorted({row['ride_id'] for row in cycle}), recorded_at)
+            planned = plan_intervals(cycle, open_intervals, self.tolerance)
+            for start in range(0, len(planned), batch_size):
+                stmt = mysql_insert(RideStatusInterval).values(planned[start:start + batch_size])
+                stmt = stmt.on_duplicate_key_update(
+                    valid_to=stmt.inserted.valid_to,
+                    last_updated_api=stmt.inserted.last_updated_api,
+                    samples=stmt.inserted.samples,
+                )
+                self.session.execute(stmt)
+        return len(rows)
+
+
+def storage_mode(conn: Connection) -> str:
+    """
+    Storage mode the database is in: 'compact' if ride_status_snapshots is the interval view.
+    """
+    table_type = conn.execute(text("""
+        SELECT TABLE_TYPE
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = :table
+    """), {"table": SNAPSHOTS_TABLE}).scalar()
+    return STORAGE_COMPACT if table_type == 'VIEW' else STORAGE_FULL
+
+
+def convert_to_compact(
+    conn: Connection,
+    tolerance: int = 0,
+    batch_size: int = INTERVAL_BATCH_SIZE,
+    allow_drop: bool = False
+) -> Dict[str, int]:
+    """
+    Move stored snapshots into intervals and replace the table with the view.
+
+    The emptied table is kept as ride_status_snapshots_full (with its
+    partitions) for convert_to_full().
+
+    Snapshots whose park has no park_activity_snapshots row for their cycle
+    cannot be represented (the view only yields rows for park cycles). They
+    would be lost with the emptied table, so the conversion refuses to run
+    while there are any unless allow_drop is set.
+
+    Args:
+        conn: Database connection (MySQL)
+        tolerance: Wait time tolerance in minutes
+        batch_size: Rows per INSERT statement
+        allow_drop: Convert even if snapshots without a park cycle are dropped
+
+    Returns:
+        {snapshots, intervals, skipped}
+
+    Raises:
+        RuntimeError: If snapshots would be dropped without allow_drop, or the
+            expanded intervals do not reproduce the stored snapshots
+    """
+    park_cycles: Dict[int, List[datetime]] = {}
+    for row in conn.execute(text(
+        "SELECT park_id, recorded_at FROM park_activity_snapshots ORDER BY park_id, recorded_at"
+    )):
+        park_cycles.setdefault(row.park_id, []).append(row.recorded_at)
+
+    snapshots = conn.execute(text(f"""
+        SELECT r.park_id, rss.ride_id, rss.recorded_at, rss.status, rss.computed_is_open,
+               rss.is_open, rss.wait_time, rss.last_updated_api
+        FROM {SNAPSHOTS_TABLE} rss
+        JOIN rides r ON r.ride_id = rss.ride_id
+        ORDER BY rss.ride_id, rss.recorded_at
+    """)).mappings()
+    intervals, skipped = compact_snapshots(snapshots, park_cycles, tolerance)
+    total = conn.execute(text(f"SELECT COUNT(*) FROM {SNAPSHOTS_TABLE}")).scalar()
+    if skipped and not allow_drop:
+        raise RuntimeError(
+            f"{skipped:,} snapshots have no park activity row for their cycle and would be dropped - "
+            "aborted (allow_drop to convert anyway)"
+        )
+
+    conn.execute(text(f"DELETE FROM {INTERVALS_TABLE}"))
+    for start in range(0, len(intervals), batch_size):
+        conn.execute(
+            RideStatusInterval.__table__.insert(),
+            intervals[start:start + batch_size]
+        )
+
+    expanded = conn.execute(text(f"SELECT COUNT(*) FROM ({EXPANDED_SNAPSHOTS_SQL}) expanded")).scalar()
+    if expanded != total - skipped:
+        conn.execute(text(f"DELETE FROM {INTERVALS_TABLE}"))
+        raise RuntimeError(f"Intervals expand to {expanded:,} snapshots, expected {total - skipped:,} - aborted")
+
+    conn.execute(text(f"RENAME TABLE {SNAPSHOTS_TABLE} TO {FULL_TABLE_BACKUP}"))
+    conn.execute(text(f"CREATE VIEW {SNAPSHOTS_TABLE} AS {EXPANDED_SNAPSHOTS_SQL}"))
+    conn.execute(text(f"TRUNCATE TABLE {FULL_TABLE_BACKUP}"))
+    logger.info(f"Compacted {total:,} snapshots into {len(intervals):,} intervals ({skipped:,} skipped)")
+    return {"snapshots": total, "intervals": len(intervals), "skipped": skipped}
+
+
+def convert_to_full(conn: Connection) -> Dict[str, int]:
+    """
+    Materialize the view back into the ride_status_snapshots table.
+
+    Args:
+        conn: Database connection (MySQL)
+
+    Returns:
+        {snapshots}
+    """
+    conn.execute(text(f"""
+        INSERT INTO {FULL_TABLE_BACKUP}
+            (ride_id, recorded_at, is_open, status, wait_time, last_updated_api, computed_is_open)
+        SELECT ride_id, recorded_at, is_open, status, wait_time, last_updated_api, computed_is_open
+        FROM ({EXPANDED_SNAPSHOTS_SQL}) expanded
+        ORDER BY recorded_at, ride_id
+    """))
+    total = conn.execute(text(f"SELECT COUNT(*) FROM {FULL_TABLE_BACKUP}")).scalar()
+    conn.execute(text(f"DROP VIEW {SNAPSHOTS_TABLE}"))
+    conn.execute(text(f"RENAME TABLE {FULL_TABLE_BACKUP} TO {SNAPSHOTS_TABLE}"))
+    conn.execute(text(f"DELETE FROM {INTERVALS_TABLE}"))
+    logger.info(f"Expanded intervals into {total:,} snapshots")
+    return {"snapshots": total}
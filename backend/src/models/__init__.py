@@ -8,7 +8,7 @@ from .orm_park import Park
 from .orm_ride import Ride
 from .orm_classification import RideClassification
 from .orm_schedule import ParkSchedule
-from .orm_snapshots import RideStatusSnapshot, ParkActivitySnapshot
+from .orm_snapshots import RideStatusSnapshot, ParkActivitySnapshot, RideStatusInterval
 from .orm_status_change import RideStatusChange
 from .orm_stats import (
     RideDailyStats, ParkDailyStats, RideWeeklyStats, ParkWeeklyStats,
@@ -31,6 +31,7 @@ __all__ = [
     'Ride',
     'RideClassification',
     'RideStatusSnapshot',
+    'RideStatusInterval',
     'RideStatusChange',
     'ParkActivitySnapshot',
     'RideDailyStats',
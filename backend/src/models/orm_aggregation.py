@@ -3,7 +3,7 @@ SQLAlchemy ORM Model: AggregationLog
 Tracks aggregation job execution status for safe cleanup operations.
 """
 
-from sqlalchemy import Integer, Date, Enum, DateTime, Text, Index
+from sqlalchemy import Integer, Date, Enum, DateTime, Text, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 from models.base import Base
 from datetime import date, datetime
@@ -97,11 +97,20 @@ class AggregationLog(Base):
         comment="Number of rides successfully aggregated"
     )
 
+    # Parallel scheduler work unit (NULL for run-level entries)
+    unit_key: Mapped[Optional[str]] = mapped_column(
+        String(100),
+        nullable=True,
+        comment="Work unit identifier (NULL for run-level entries)"
+    )
+
     # Composite Indexes for Performance
+    # (date, type) is not unique: hourly runs log one entry per hour and
+    # per-unit checkpoints share the date and type of their run-level entry
     __table_args__ = (
-        Index('unique_aggregation', 'aggregation_date', 'aggregation_type', unique=True),
         Index('idx_status', 'status', 'aggregation_date'),
         Index('idx_completed', 'completed_at'),
+        Index('idx_aggregation_unit', 'aggregation_date', 'aggregation_type', 'unit_key'),
         {'extend_existing': True}
     )
 
@@ -93,6 +93,7 @@ class Park(Base):
     )
     park_snapshots: Mapped[List["ParkActivitySnapshot"]] = relationship(
         "ParkActivitySnapshot",
+        primaryjoin="Park.park_id == foreign(ParkActivitySnapshot.park_id)",
         back_populates="park",
         lazy="select"
     )
@@ -87,6 +87,7 @@ class Ride(Base):
     )
     ride_snapshots: Mapped[List["RideStatusSnapshot"]] = relationship(
         "RideStatusSnapshot",
+        primaryjoin="Ride.ride_id == foreign(RideStatusSnapshot.ride_id)",
         back_populates="ride",
         lazy="select"
     )
@@ -1,9 +1,10 @@
 """
 SQLAlchemy ORM Models: Snapshot Tables
-RideStatusSnapshot and ParkActivitySnapshot for time-series data.
+RideStatusSnapshot and ParkActivitySnapshot for time-series data, and
+RideStatusInterval for compact (change-only) snapshot storage.
 """
 
-from sqlalchemy import String, Boolean, Integer, ForeignKey, DateTime, Float, Index, Enum, or_, BigInteger, Numeric, text
+from sqlalchemy import String, Boolean, Integer, DateTime, Float, Index, Enum, or_, BigInteger, Numeric, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
 from models.base import Base
@@ -16,26 +17,24 @@ class RideStatusSnapshot(Base):
     """
     Ride status point-in-time snapshot from Queue-Times.com API.
     Collected every 10 minutes, retained for 24 hours before aggregation.
+
+    Partitioned by day on recorded_at (migration f3a9c1d7e482): the primary
+    key is (snapshot_id, recorded_at) and ride_id has no foreign key.
     """
     __tablename__ = "ride_status_snapshots"
 
-    # Primary Key
-    snapshot_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
-
-    # Foreign Keys
-    ride_id: Mapped[int] = mapped_column(
-        ForeignKey("rides.ride_id", ondelete="CASCADE"),
-        nullable=False
-    )
-
-    # Snapshot Metadata
+    # Primary Key (recorded_at is the partitioning column)
+    snapshot_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     recorded_at: Mapped[datetime] = mapped_column(
         DateTime,
-        nullable=False,
+        primary_key=True,
         index=True,
         comment="UTC timestamp when snapshot was collected"
     )
 
+    # References rides.ride_id (no foreign key on partitioned tables)
+    ride_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
     # Queue-Times.com Raw Data
     is_open: Mapped[Optional[bool]] = mapped_column(
         Boolean,
@@ -75,6 +74,7 @@ class RideStatusSnapshot(Base):
     # Relationships
     ride: Mapped["Ride"] = relationship(
         "Ride",
+        primaryjoin="foreign(RideStatusSnapshot.ride_id) == Ride.ride_id",
         back_populates="ride_snapshots"
     )
 
@@ -120,26 +120,24 @@ class ParkActivitySnapshot(Base):
     """
     Park operating hours snapshot derived from ride activity.
     Used to determine when parks are actually open (vs. scheduled hours).
+
+    Partitioned by day on recorded_at like ride_status_snapshots: primary
+    key (snapshot_id, recorded_at), no foreign key on park_id.
     """
     __tablename__ = "park_activity_snapshots"
 
-    # Primary Key
-    snapshot_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
-
-    # Foreign Keys
-    park_id: Mapped[int] = mapped_column(
-        ForeignKey("parks.park_id", ondelete="CASCADE"),
-        nullable=False
-    )
-
-    # Snapshot Metadata
+    # Primary Key (recorded_at is the partitioning column)
+    snapshot_id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     recorded_at: Mapped[datetime] = mapped_column(
         DateTime,
-        nullable=False,
+        primary_key=True,
         index=True,
         comment="UTC timestamp when snapshot was analyzed"
     )
 
+    # References parks.park_id (no foreign key on partitioned tables)
+    park_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
     # Park Activity Metrics
     total_rides_tracked: Mapped[int] = mapped_column(
         Integer,
@@ -193,8 +191,66 @@ class ParkActivitySnapshot(Base):
     # Relationships
     park: Mapped["Park"] = relationship(
         "Park",
+        primaryjoin="foreign(ParkActivitySnapshot.park_id) == Park.park_id",
         back_populates="park_snapshots"
     )
 
     def __repr__(self) -> str:
         return f"<ParkActivitySnapshot(snapshot_id={self.snapshot_id}, park_id={self.park_id}, open={self.park_appears_open}, time={self.recorded_at})>"
+
+
+class RideStatusInterval(Base):
+    """
+    Run of identical ride status snapshots (compact storage mode).
+    One row per change; valid_from/valid_to are the first and last collection
+    cycle of the run (see database/snapshot_storage.py).
+    """
+    __tablename__ = "ride_status_intervals"
+
+    # Primary Key
+    interval_id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+
+    ride_id: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    # Validity Interval (inclusive collection cycle timestamps)
+    valid_from: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        comment="UTC recorded_at of the first snapshot in the run"
+    )
+    valid_to: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        comment="UTC recorded_at of the last snapshot in the run"
+    )
+
+    # Snapshot State (same meaning as ride_status_snapshots)
+    is_open: Mapped[Optional[bool]] = mapped_column(Boolean)
+    status: Mapped[Optional[str]] = mapped_column(
+        Enum('OPERATING', 'DOWN', 'CLOSED', 'REFURBISHMENT', name='ride_status_enum')
+    )
+    wait_time: Mapped[Optional[int]] = mapped_column(
+        Integer,
+        comment="Wait time of the first snapshot in the run"
+    )
+    computed_is_open: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    last_updated_api: Mapped[datetime] = mapped_column(
+        DateTime,
+        nullable=False,
+        comment="Latest Queue-Times.com update timestamp in the run"
+    )
+    samples: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        comment="Number of snapshots in the run"
+    )
+
+    __table_args__ = (
+        Index('idx_interval_ride_valid_to', 'ride_id', 'valid_to'),
+        Index('idx_interval_valid_to', 'valid_to'),
+        {'extend_existing': True}
+    )
+
+    def __repr__(self) -> str:
+        return f"<RideStatusInterval(interval_id={self.interval_id}, ride_id={self.ride_id}, status='{self.status}', {self.valid_from}..{self.valid_to})>"
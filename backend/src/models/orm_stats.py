@@ -987,6 +987,7 @@ class RideLiveRankings(Base):
     downtime_incidents: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     avg_wait_time: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 1))
     max_wait_time: Mapped[Optional[int]] = mapped_column(Integer)
+    wait_time_samples: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     calculated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, index=True)
 
     __table_args__ = ({'extend_existing': True},)
@@ -1020,6 +1021,7 @@ class RideLiveRankingsStaging(Base):
     downtime_incidents: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     avg_wait_time: Mapped[Optional[Decimal]] = mapped_column(Numeric(6, 1))
     max_wait_time: Mapped[Optional[int]] = mapped_column(Integer)
+    wait_time_samples: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     calculated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
     __table_args__ = ({'extend_existing': True},)
@@ -0,0 +1,291 @@
+"""
+Theme Park Downtime Tracker - Parallel Aggregation Scheduler
+
+Fans independent aggregation work units (one timezone, one date) out to a
+process pool. Each unit is recorded in aggregation_log with its own unit_key
+so a failed timezone or date can be identified and retried without rerunning
+the whole job.
+
+Usage:
+    scheduler = AggregationScheduler(aggregate_daily_timezone_unit, max_workers=4)
+    results = scheduler.run([
+        WorkUnit(day, AggregationType.DAILY, f"tz:{tz}", {"aggregation_date": day, "timezone": tz})
+        for tz in timezones
+    ])
+
+Worker functions must be importable module-level callables (they are pickled
+by reference). They receive the unit params as keyword arguments, open their
+own database session, and return a dict of counters; 'parks_processed' and
+'rides_processed' are copied onto the unit's aggregation_log entry.
+"""
+
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from models import AggregationType
+from utils.config import AGGREGATION_WORKERS, AGGREGATION_MAX_ATTEMPTS
+from utils.logger import logger
+
+
+@dataclass
+class WorkUnit:
+    """One independently retryable piece of an aggregation job."""
+    aggregation_date: date
+    aggregation_type: AggregationType
+    unit_key: str
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class UnitResult:
+    """Outcome of a work unit after all attempts."""
+    unit: WorkUnit
+    status: str  # 'success' | 'failed'
+    attempts: int
+    result: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status == 'success'
+
+
+class AggregationUnitsFailed(Exception):
+    """Raised when one or more work units exhausted their attempts."""
+
+    def __init__(self, failed: List[UnitResult]):
+        self.failed = failed
+        keys = ", ".join(r.unit.unit_key for r in failed)
+        super().__init__(f"{len(failed)} aggregation unit(s) failed: {keys}")
+
+
+def _init_worker() -> None:
+    """
+    Give each worker process its own connection pool and session registry.
+
+    Forked workers inherit the parent's engine; pooled MySQL connections must
+    not be shared across processes, so drop them (without closing the
+    parent's sockets) and let the worker open fresh ones on first use.
+    """
+    from database.connection import db
+    from models.base import db_session
+
+    db.get_engine().dispose(close=False)
+    db_session.registry.clear()
+
+
+def _run_unit(
+    worker_fn: Callable[..., Optional[Dict[str, Any]]],
+    params: Dict[str, Any]
+) -> Tuple[bool, Dict[str, Any], Optional[str], float]:
+    """
+    Execute a worker function and capture its outcome.
+
+    Exceptions are converted to strings here so unpicklable exception types
+    (e.g. driver errors holding connection state) never cross the process
+    boundary.
+
+    Returns:
+        Tuple of (ok, result, error, elapsed_seconds)
+    """
+    started = time.monotonic()
+    try:
+        result = worker_fn(**params) or {}
+        return True, result, None, time.monotonic() - started
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        logger.debug(traceback.format_exc())
+        return False, {}, error, time.monotonic() - started
+
+
+class AggregationScheduler:
+    """
+    Runs aggregation work units in parallel with per-unit logging and retry.
+
+    - Parallelism: up to max_workers processes (1 = run inline, no pool)
+    - Isolation: every worker process gets its own engine pool and session
+    - Logging: one aggregation_log row per unit (running -> success/failed)
+    - Retry: failed units are resubmitted until max_attempts is reached
+    """
+
+    def __init__(
+        self,
+        worker_fn: Callable[..., Optional[Dict[str, Any]]],
+        max_workers: int = AGGREGATION_WORKERS,
+        max_attempts: int = AGGREGATION_MAX_ATTEMPTS,
+        log_units: bool = True,
+        on_result: Optional[Callable[[UnitResult], None]] = None
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            worker_fn: Module-level callable executed once per unit attempt
+            max_workers: Maximum worker processes
+            max_attempts: Attempts per unit before it is marked failed
+            log_units: If True, record each unit in aggregation_log
+            on_result: Optional callback invoked in the parent as each unit finishes
+        """
+        self.worker_fn = worker_fn
+        self.max_workers = max(1, max_workers)
+        self.max_attempts = max(1, max_attempts)
+        self.log_units = log_units
+        self.on_result = on_result
+
+    def run(self, units: List[WorkUnit]) -> List[UnitResult]:
+        """
+        Execute all units and return their results in input order.
+
+        Failed units do not raise; callers inspect UnitResult.succeeded
+        (or raise AggregationUnitsFailed) once every unit has finished.
+        """
+        if not units:
+            return []
+
+        log_ids = {unit.unit_key: self._start_unit_log(unit) for unit in units}
+        workers = min(self.max_workers, len(units))
+
+        logger.info(f"Scheduling {len(units)} aggregation units on {workers} worker(s)")
+
+        if workers == 1:
+            results = self._run_inline(units)
+        else:
+            results = self._run_pool(units, workers)
+
+        for result in results.values():
+            self._finish_unit_log(log_ids[result.unit.unit_key], result)
+
+        failed = [r for r in results.values() if not r.succeeded]
+        if failed:
+            logger.error(f"{len(failed)}/{len(units)} aggregation units failed after retries")
+
+        return [results[unit.unit_key] for unit in units]
+
+    def _run_inline(self, units: List[WorkUnit]) -> Dict[str, UnitResult]:
+        """Run units sequentially in the current process."""
+        results = {}
+        for unit in units:
+            elapsed = 0.0
+            for attempt in range(1, self.max_attempts + 1):
+                ok, payload, error, took = _run_unit(self.worker_fn, unit.params)
+                elapsed += took
+                if ok or attempt == self.max_attempts:
+                    break
+                self._log_retry(unit, attempt, error)
+            results[unit.unit_key] = self._record(unit, ok, attempt, payload, error, elapsed)
+        return results
+
+    def _run_pool(self, units: List[WorkUnit], workers: int) -> Dict[str, UnitResult]:
+        """Run units on a process pool, resubmitting failures as they complete."""
+        results = {}
+        attempts = {unit.unit_key: 0 for unit in units}
+        elapsed = {unit.unit_key: 0.0 for unit in units}
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            def submit(unit: WorkUnit):
+                attempts[unit.unit_key] += 1
+                return pool.submit(_run_unit, self.worker_fn, unit.params)
+
+            pending = {submit(unit): unit for unit in units}
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    unit = pending.pop(future)
+                    try:
+                        ok, payload, error, took = future.result()
+                    except Exception as e:
+                        # Worker process died or the call could not be pickled
+                        ok, payload, error, took = False, {}, f"{type(e).__name__}: {e}", 0.0
+                    elapsed[unit.unit_key] += took
+
+                    if not ok and attempts[unit.unit_key] < self.max_attempts:
+                        self._log_retry(unit, attempts[unit.unit_key], error)
+                        pending[submit(unit)] = unit
+                        continue
+
+                    results[unit.unit_key] = self._record(
+                        unit, ok, attempts[unit.unit_key], payload, error, elapsed[unit.unit_key]
+                    )
+
+        return results
+
+    def _record(
+        self,
+        unit: WorkUnit,
+        ok: bool,
+        attempts: int,
+        payload: Dict[str, Any],
+        error: Optional[str],
+        elapsed: float
+    ) -> UnitResult:
+        """Build the final result for a unit and notify the caller."""
+        result = UnitResult(
+            unit=unit,
+            status='success' if ok else 'failed',
+            attempts=attempts,
+            result=payload,
+            error=error,
+            elapsed_seconds=elapsed
+        )
+        if self.on_result is not None:
+            self.on_result(result)
+        return result
+
+    def _log_retry(self, unit: WorkUnit, attempt: int, error: Optional[str]) -> None:
+        logger.warning(
+            f"Aggregation unit {unit.unit_key} ({unit.aggregation_date}) failed "
+            f"attempt {attempt}/{self.max_attempts}: {error} - retrying"
+        )
+
+    def _start_unit_log(self, unit: WorkUnit) -> Optional[int]:
+        """Create the unit's aggregation_log entry in 'running' state."""
+        if not self.log_units:
+            return None
+
+        from database.connection import get_db_session
+        from database.repositories.aggregation_repository import AggregationLogRepository
+
+        try:
+            with get_db_session() as session:
+                return AggregationLogRepository(session).insert({
+                    'aggregation_date': unit.aggregation_date,
+                    'aggregation_type': unit.aggregation_type,
+                    'started_at': datetime.now(),
+                    'status': 'running',
+                    'unit_key': unit.unit_key
+                })
+        except Exception as e:
+            # Unit logging is bookkeeping; never block the aggregation on it
+            logger.warning(f"Could not create aggregation log for unit {unit.unit_key}: {e}")
+            return None
+
+    def _finish_unit_log(self, log_id: Optional[int], result: UnitResult) -> None:
+        """Mark the unit's aggregation_log entry as success or failed."""
+        if log_id is None:
+            return
+
+        from database.connection import get_db_session
+        from database.repositories.aggregation_repository import AggregationLogRepository
+
+        try:
+            with get_db_session() as session:
+                repo = AggregationLogRepository(session)
+                if result.succeeded:
+                    repo.mark_complete(
+                        log_id,
+                        parks_processed=result.result.get('parks_processed', 0),
+                        rides_processed=result.result.get('rides_processed', 0)
+                    )
+                else:
+                    repo.mark_failed(
+                        log_id,
+                        f"{result.error} (after {result.attempts} attempts)"
+                    )
+        except Exception as e:
+            logger.warning(f"Could not update aggregation log for unit {result.unit.unit_key}: {e}")
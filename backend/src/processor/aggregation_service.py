@@ -6,7 +6,7 @@ Converted to SQLAlchemy 2.0 ORM (Phase 20).
 """
 
 from datetime import datetime, date, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 from sqlalchemy import select, func, case, and_, or_
 from sqlalchemy.orm import Session
@@ -31,6 +31,10 @@ from models import (
 )
 
 
+# Rows per multi-row INSERT ... ON DUPLICATE KEY UPDATE statement
+UPSERT_BATCH_SIZE = 1000
+
+
 class AggregationService:
     """
     Aggregates raw snapshot data into permanent statistics tables.
@@ -42,23 +46,30 @@ class AggregationService:
     - Retry logic support (3 attempts)
     - Operating hours detection
     - Status change calculation
+    - Batch mode (default): one grouped query and multi-row upserts per
+      timezone/week/month instead of a SELECT + upsert per ride or park
     """
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, batch_mode: bool = True):
         """
         Initialize aggregation service.
 
         Args:
             session: SQLAlchemy session object
+            batch_mode: If True, aggregate all rides/parks of a timezone, week or
+                       month with grouped queries and multi-row upserts.
+                       If False, issue one SELECT + upsert per ride/park.
         """
         self.session = session
+        self.batch_mode = batch_mode
         self.hours_detector = OperatingHoursDetector(session)
         self.change_detector = StatusChangeDetector(session)
 
     def aggregate_daily(
         self,
         aggregation_date: date,
-        park_timezone: Optional[str] = None
+        park_timezone: Optional[str] = None,
+        max_workers: int = 1
     ) -> Dict[str, Any]:
         """
         Run daily aggregation for a specific date.
@@ -66,6 +77,9 @@ class AggregationService:
         Args:
             aggregation_date: Date to aggregate (in park's local timezone)
             park_timezone: Optional specific timezone (or None for all timezones)
+            max_workers: Worker processes for per-timezone units. With more than
+                         one worker, each timezone runs in its own process and
+                         session via AggregationScheduler (logged per unit).
 
         Returns:
             Dictionary with aggregation results
@@ -85,11 +99,16 @@ class AggregationService:
             parks_processed = 0
             rides_processed = 0
 
-            # Aggregate each timezone separately
-            for tz in timezones:
-                tz_results = self._aggregate_daily_for_timezone(aggregation_date, tz)
-                parks_processed += tz_results['parks_count']
-                rides_processed += tz_results['rides_count']
+            if max_workers > 1 and len(timezones) > 1:
+                parks_processed, rides_processed = self._aggregate_daily_parallel(
+                    aggregation_date, timezones, max_workers
+                )
+            else:
+                # Aggregate each timezone separately
+                for tz in timezones:
+                    tz_results = self._aggregate_daily_for_timezone(aggregation_date, tz)
+                    parks_processed += tz_results['parks_count']
+                    rides_processed += tz_results['rides_count']
 
             # Calculate aggregated_until_ts (end of the day in UTC for the last timezone)
             last_tz = ZoneInfo(timezones[-1])
@@ -213,6 +232,47 @@ class AggregationService:
             logger.error(f"Monthly aggregation failed for {year}-{month:02d}: {e}", exc_info=True)
             raise
 
+    def _aggregate_daily_parallel(
+        self,
+        aggregation_date: date,
+        timezones: List[str],
+        max_workers: int
+    ) -> Tuple[int, int]:
+        """
+        Aggregate timezones concurrently, one scheduler unit per timezone.
+
+        Each unit commits independently; if any unit exhausts its retries the
+        whole-day run is failed so the cron retry picks it up again (upserts
+        make re-running the successful timezones safe).
+
+        Returns:
+            Tuple of (parks_processed, rides_processed)
+        """
+        from processor.aggregation_scheduler import (
+            AggregationScheduler, AggregationUnitsFailed, WorkUnit
+        )
+
+        units = [
+            WorkUnit(
+                aggregation_date=aggregation_date,
+                aggregation_type=AggregationType.DAILY,
+                unit_key=f"tz:{tz}",
+                params={'aggregation_date': aggregation_date, 'timezone': tz}
+            )
+            for tz in timezones
+        ]
+        results = AggregationScheduler(
+            aggregate_daily_timezone_unit, max_workers=max_workers
+        ).run(units)
+
+        failed = [r for r in results if not r.succeeded]
+        if failed:
+            raise AggregationUnitsFailed(failed)
+
+        parks_processed = sum(r.result.get('parks_processed', 0) for r in results)
+        rides_processed = sum(r.result.get('rides_processed', 0) for r in results)
+        return parks_processed, rides_processed
+
     def _aggregate_daily_for_timezone(
         self,
         aggregation_date: date,
@@ -243,6 +303,7 @@ class AggregationService:
 
         parks_count = 0
         rides_count = 0
+        park_sessions: Dict[int, Dict[str, Any]] = {}
 
         for park in parks:
             # Detect operating session
@@ -259,6 +320,11 @@ class AggregationService:
                 self._aggregate_park_daily_stats(park['park_id'], aggregation_date, timezone, session)
                 parks_count += 1
 
+                if self.batch_mode:
+                    # Rides for all parks in this timezone are aggregated together below
+                    park_sessions[park['park_id']] = session
+                    continue
+
                 # Aggregate ride stats for this park
                 ride_count = self._aggregate_rides_daily_stats(
                     park['park_id'],
@@ -268,6 +334,9 @@ class AggregationService:
                 )
                 rides_count += ride_count
 
+        if park_sessions:
+            rides_count += self._aggregate_rides_daily_stats_batch(aggregation_date, park_sessions)
+
         return {
             "parks_count": parks_count,
             "rides_count": rides_count
@@ -501,6 +570,89 @@ class AggregationService:
 
         return len(ride_ids)
 
+    def _aggregate_rides_daily_stats_batch(
+        self,
+        stat_date: date,
+        park_sessions: Dict[int, Dict[str, Any]]
+    ) -> int:
+        """
+        Calculate and save daily ride statistics for all rides in a set of parks.
+
+        Batch equivalent of calling _aggregate_rides_daily_stats() per park: one
+        grouped query over every active ride (each park's snapshots limited to
+        its own operating session), one snapshot scan for status changes, and
+        multi-row upserts.
+
+        Args:
+            stat_date: Local date
+            park_sessions: park_id -> operating session data (session_start_utc,
+                           session_end_utc, operating_minutes)
+
+        Returns:
+            Number of rides processed
+        """
+        session_windows = [
+            and_(
+                Ride.park_id == park_id,
+                RideStatusSnapshot.recorded_at >= operating_session['session_start_utc'],
+                RideStatusSnapshot.recorded_at <= operating_session['session_end_utc']
+            )
+            for park_id, operating_session in park_sessions.items()
+        ]
+
+        stmt = (
+            select(
+                Ride.ride_id,
+                Ride.park_id,
+                func.count(RideStatusSnapshot.snapshot_id).label('total_snapshots'),
+                func.sum(case((RideStatusSnapshot.computed_is_open == True, 1), else_=0)).label('uptime_snapshots'),
+                func.sum(case((RideStatusSnapshot.computed_is_open == False, 1), else_=0)).label('downtime_snapshots'),
+                func.avg(case((RideStatusSnapshot.wait_time > 0, RideStatusSnapshot.wait_time))).label('avg_wait_time'),
+                func.min(case((RideStatusSnapshot.wait_time > 0, RideStatusSnapshot.wait_time))).label('min_wait_time'),
+                func.max(RideStatusSnapshot.wait_time).label('max_wait_time')
+            )
+            .select_from(Ride)
+            .outerjoin(
+                RideStatusSnapshot,
+                and_(
+                    Ride.ride_id == RideStatusSnapshot.ride_id,
+                    or_(*session_windows)
+                )
+            )
+            .where(Ride.park_id.in_(list(park_sessions)))
+            .where(Ride.is_active == True)
+            .group_by(Ride.ride_id, Ride.park_id)
+            .order_by(Ride.ride_id)
+        )
+
+        ride_rows = self.session.execute(stmt).all()
+
+        # Status changes only matter for rides with snapshots
+        ride_windows = {
+            row.ride_id: (
+                park_sessions[row.park_id]['session_start_utc'],
+                park_sessions[row.park_id]['session_end_utc']
+            )
+            for row in ride_rows
+            if row.total_snapshots
+        }
+        changes_by_ride = self.change_detector.detect_status_changes_for_rides(ride_windows)
+
+        rows = [
+            self._build_ride_daily_stats_row(
+                ride_id=row.ride_id,
+                stat_date=stat_date,
+                stats=row,
+                operating_minutes=park_sessions[row.park_id]['operating_minutes'],
+                changes=changes_by_ride.get(row.ride_id, [])
+            )
+            for row in ride_rows
+        ]
+        self._upsert_many(RideDailyStats, rows, key_columns=('ride_id', 'stat_date'))
+
+        logger.debug(f"Aggregated {len(rows)} rides across {len(park_sessions)} parks for {stat_date}")
+        return len(rows)
+
     def _aggregate_single_ride_daily_stats(
         self,
         ride_id: int,
@@ -527,54 +679,71 @@ class AggregationService:
 
         result = self.session.execute(stmt)
         row = result.one()
-        total_snapshots = row.total_snapshots or 0
 
-        # Always create a record, even with zero snapshots (data consistency)
-        if total_snapshots == 0:
-            # No snapshots for this ride - create record with zeros
-            zero_stmt = mysql_insert(RideDailyStats).values(
-                ride_id=ride_id,
-                stat_date=stat_date,
-                uptime_minutes=0,
-                downtime_minutes=0,
-                uptime_percentage=0.0,
-                operating_hours_minutes=0,
-                avg_wait_time=None,
-                min_wait_time=None,
-                max_wait_time=None,
-                peak_wait_time=None,
-                status_changes=0,
-                longest_downtime_minutes=None
-            )
+        # Get status changes (only rides with snapshots can have any)
+        changes = []
+        if row.total_snapshots:
+            changes = self.change_detector.detect_status_changes(ride_id, utc_start, utc_end)
 
-            zero_stmt = zero_stmt.on_duplicate_key_update(
-                uptime_minutes=zero_stmt.inserted.uptime_minutes,
-                downtime_minutes=zero_stmt.inserted.downtime_minutes,
-                uptime_percentage=zero_stmt.inserted.uptime_percentage,
-                operating_hours_minutes=zero_stmt.inserted.operating_hours_minutes,
-                avg_wait_time=zero_stmt.inserted.avg_wait_time,
-                min_wait_time=zero_stmt.inserted.min_wait_time,
-                max_wait_time=zero_stmt.inserted.max_wait_time,
-                peak_wait_time=zero_stmt.inserted.peak_wait_time,
-                status_changes=zero_stmt.inserted.status_changes,
-                longest_downtime_minutes=zero_stmt.inserted.longest_downtime_minutes
-            )
+        upsert_row = self._build_ride_daily_stats_row(
+            ride_id=ride_id,
+            stat_date=stat_date,
+            stats=row,
+            operating_minutes=operating_minutes,
+            changes=changes
+        )
+        self._upsert_many(RideDailyStats, [upsert_row], key_columns=('ride_id', 'stat_date'))
 
-            self.session.execute(zero_stmt)
+    def _build_ride_daily_stats_row(
+        self,
+        ride_id: int,
+        stat_date: date,
+        stats: Any,
+        operating_minutes: float,
+        changes: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Build a ride_daily_stats row from aggregated snapshot counts.
+
+        Args:
+            ride_id: Ride ID
+            stat_date: Local date
+            stats: Row with total/uptime/downtime snapshot counts and avg/min/max wait
+            operating_minutes: Park operating minutes for the day
+            changes: Status changes detected for the ride during the session
+
+        Returns:
+            Column -> value dict for RideDailyStats
+        """
+        total_snapshots = stats.total_snapshots or 0
+
+        # Always create a record, even with zero snapshots (data consistency)
+        if total_snapshots == 0:
             logger.debug(f"Created zero-snapshot record for ride {ride_id} on {stat_date}")
-            return
+            return {
+                'ride_id': ride_id,
+                'stat_date': stat_date,
+                'uptime_minutes': 0,
+                'downtime_minutes': 0,
+                'uptime_percentage': 0.0,
+                'operating_hours_minutes': 0,
+                'avg_wait_time': None,
+                'min_wait_time': None,
+                'max_wait_time': None,
+                'peak_wait_time': None,
+                'status_changes': 0,
+                'longest_downtime_minutes': None
+            }
 
-        uptime_snapshots = row.uptime_snapshots or 0
-        downtime_snapshots = row.downtime_snapshots or 0
+        uptime_snapshots = stats.uptime_snapshots or 0
 
         # Calculate uptime/downtime minutes
-        uptime_ratio = float(uptime_snapshots) / float(total_snapshots) if total_snapshots > 0 else 0.0
+        uptime_ratio = float(uptime_snapshots) / float(total_snapshots)
         uptime_minutes = float(operating_minutes) * uptime_ratio
         downtime_minutes = float(operating_minutes) - uptime_minutes
         uptime_percentage = uptime_ratio * 100.0
 
-        # Get status changes count
-        changes = self.change_detector.detect_status_changes(ride_id, utc_start, utc_end)
+        # Status changes count (transitions to closed)
         status_changes = len([c for c in changes if c['new_status'] is False])
 
         # Find longest downtime
@@ -585,39 +754,23 @@ class AggregationService:
 
         # Handle NULL wait times safely
         avg_wait = None
-        if row.avg_wait_time is not None:
-            avg_wait = round(float(row.avg_wait_time), 2)
+        if stats.avg_wait_time is not None:
+            avg_wait = round(float(stats.avg_wait_time), 2)
 
-        # Insert/update ride daily stats
-        upsert_stmt = mysql_insert(RideDailyStats).values(
-            ride_id=ride_id,
-            stat_date=stat_date,
-            uptime_minutes=int(uptime_minutes),
-            downtime_minutes=int(downtime_minutes),
-            uptime_percentage=round(uptime_percentage, 2),
-            operating_hours_minutes=int(operating_minutes),
-            avg_wait_time=avg_wait,
-            min_wait_time=row.min_wait_time,
-            max_wait_time=row.max_wait_time,
-            peak_wait_time=row.max_wait_time,
-            status_changes=status_changes,
-            longest_downtime_minutes=longest_downtime
-        )
-
-        upsert_stmt = upsert_stmt.on_duplicate_key_update(
-            uptime_minutes=upsert_stmt.inserted.uptime_minutes,
-            downtime_minutes=upsert_stmt.inserted.downtime_minutes,
-            uptime_percentage=upsert_stmt.inserted.uptime_percentage,
-            operating_hours_minutes=upsert_stmt.inserted.operating_hours_minutes,
-            avg_wait_time=upsert_stmt.inserted.avg_wait_time,
-            min_wait_time=upsert_stmt.inserted.min_wait_time,
-            max_wait_time=upsert_stmt.inserted.max_wait_time,
-            peak_wait_time=upsert_stmt.inserted.peak_wait_time,
-            status_changes=upsert_stmt.inserted.status_changes,
-            longest_downtime_minutes=upsert_stmt.inserted.longest_downtime_minutes
-        )
-
-        self.session.execute(upsert_stmt)
+        return {
+            'ride_id': ride_id,
+            'stat_date': stat_date,
+            'uptime_minutes': int(uptime_minutes),
+            'downtime_minutes': int(downtime_minutes),
+            'uptime_percentage': round(uptime_percentage, 2),
+            'operating_hours_minutes': int(operating_minutes),
+            'avg_wait_time': avg_wait,
+            'min_wait_time': stats.min_wait_time,
+            'max_wait_time': stats.max_wait_time,
+            'peak_wait_time': stats.max_wait_time,
+            'status_changes': status_changes,
+            'longest_downtime_minutes': longest_downtime
+        }
 
     def _aggregate_rides_weekly_stats(
         self,
@@ -639,6 +792,9 @@ class AggregationService:
         # Calculate date range for the week (Monday to Sunday)
         week_end_date = week_start_date + timedelta(days=6)
 
+        if self.batch_mode:
+            return self._aggregate_rides_weekly_stats_batch(year, week_number, week_start_date, week_end_date)
+
         # Get all rides that have daily stats in this week
         stmt = (
             select(RideDailyStats.ride_id)
@@ -775,16 +931,7 @@ class AggregationService:
         Returns:
             Percentage change (e.g., 20.75 for +20.75%) or None if no previous data
         """
-        # Calculate previous week
-        # Handle year boundary (week 1 -> previous year's last week)
-        if current_week == 1:
-            previous_year = current_year - 1
-            # Get last week of previous year (usually 52, sometimes 53)
-            previous_week_date = datetime.strptime(f'{previous_year}-12-28', '%Y-%m-%d').date()
-            previous_week = previous_week_date.isocalendar()[1]
-        else:
-            previous_year = current_year
-            previous_week = current_week - 1
+        previous_year, previous_week = self._previous_iso_week(current_year, current_week)
 
         # Query previous week's downtime
         stmt = (
@@ -822,6 +969,9 @@ class AggregationService:
         Returns:
             Number of parks processed
         """
+        if self.batch_mode:
+            return self._aggregate_parks_weekly_stats_batch(year, week_number, week_start_date)
+
         # Get all parks that have ride weekly stats
         stmt = (
             select(Ride.park_id)
@@ -951,14 +1101,7 @@ class AggregationService:
         Returns:
             Percentage change or None if no previous data
         """
-        # Calculate previous week
-        if current_week == 1:
-            previous_year = current_year - 1
-            previous_week_date = datetime.strptime(f'{previous_year}-12-28', '%Y-%m-%d').date()
-            previous_week = previous_week_date.isocalendar()[1]
-        else:
-            previous_year = current_year
-            previous_week = current_week - 1
+        previous_year, previous_week = self._previous_iso_week(current_year, current_week)
 
         # Query previous week's downtime
         stmt = (
@@ -1000,6 +1143,9 @@ class AggregationService:
         last_day_num = calendar.monthrange(year, month)[1]
         last_day = date(year, month, last_day_num)
 
+        if self.batch_mode:
+            return self._aggregate_rides_monthly_stats_batch(year, month, first_day, last_day)
+
         # Get all rides that have daily stats in this month
         stmt = (
             select(RideDailyStats.ride_id)
@@ -1134,13 +1280,7 @@ class AggregationService:
         Returns:
             Percentage change (e.g., 20.75 for +20.75%) or None if no previous data
         """
-        # Calculate previous month (handle year boundary)
-        if current_month == 1:
-            previous_year = current_year - 1
-            previous_month = 12
-        else:
-            previous_year = current_year
-            previous_month = current_month - 1
+        previous_year, previous_month = self._previous_month(current_year, current_month)
 
         # Query previous month's downtime
         stmt = (
@@ -1176,6 +1316,9 @@ class AggregationService:
         Returns:
             Number of parks processed
         """
+        if self.batch_mode:
+            return self._aggregate_parks_monthly_stats_batch(year, month)
+
         # Get all parks that have ride monthly stats
         stmt = (
             select(Ride.park_id)
@@ -1300,13 +1443,7 @@ class AggregationService:
         Returns:
             Percentage change or None if no previous data
         """
-        # Calculate previous month (handle year boundary)
-        if current_month == 1:
-            previous_year = current_year - 1
-            previous_month = 12
-        else:
-            previous_year = current_year
-            previous_month = current_month - 1
+        previous_year, previous_month = self._previous_month(current_year, current_month)
 
         # Query previous month's downtime
         stmt = (
@@ -1327,6 +1464,368 @@ class AggregationService:
         trend = ((float(current_downtime_hours) - prev_downtime) / prev_downtime) * 100.0
         return round(trend, 2)
 
+    def _aggregate_rides_weekly_stats_batch(
+        self,
+        year: int,
+        week_number: int,
+        week_start_date: date,
+        week_end_date: date
+    ) -> int:
+        """
+        Aggregate weekly stats for every ride with one grouped query and multi-row upserts.
+
+        Batch equivalent of _aggregate_single_ride_weekly_stats() per ride.
+
+        Args:
+            year: Year
+            week_number: ISO week number
+            week_start_date: Monday of the ISO week
+            week_end_date: Sunday of the ISO week
+
+        Returns:
+            Number of rides processed
+        """
+        ride_rows = self._sum_ride_daily_stats(week_start_date, week_end_date)
+
+        previous_year, previous_week = self._previous_iso_week(year, week_number)
+        previous_downtime = self._get_previous_downtime(
+            select(RideWeeklyStats.ride_id, RideWeeklyStats.downtime_minutes)
+            .where(RideWeeklyStats.year == previous_year)
+            .where(RideWeeklyStats.week_number == previous_week)
+        )
+
+        rows = []
+        for row in ride_rows:
+            if row.uptime_minutes is None:
+                continue
+            uptime_percentage, avg_wait_time = self._ride_period_metrics(row)
+            rows.append({
+                'ride_id': row.ride_id,
+                'year': year,
+                'week_number': week_number,
+                'week_start_date': week_start_date,
+                'uptime_minutes': row.uptime_minutes,
+                'downtime_minutes': row.downtime_minutes,
+                'uptime_percentage': uptime_percentage,
+                'operating_hours_minutes': row.operating_hours_minutes,
+                'avg_wait_time': avg_wait_time,
+                'peak_wait_time': row.peak_wait_time,
+                'status_changes': row.status_changes,
+                'trend_vs_previous_week': self._percentage_change(
+                    row.downtime_minutes, previous_downtime.get(row.ride_id)
+                )
+            })
+
+        self._upsert_many(RideWeeklyStats, rows, key_columns=('ride_id', 'year', 'week_number'))
+
+        logger.info(f"Processed {len(ride_rows)} rides for weekly aggregation")
+        return len(ride_rows)
+
+    def _aggregate_parks_weekly_stats_batch(
+        self,
+        year: int,
+        week_number: int,
+        week_start_date: date
+    ) -> int:
+        """
+        Aggregate weekly stats for every park with one grouped query and multi-row upserts.
+
+        Batch equivalent of _aggregate_single_park_weekly_stats() per park.
+
+        Args:
+            year: Year
+            week_number: ISO week number
+            week_start_date: Monday of the ISO week
+
+        Returns:
+            Number of parks processed
+        """
+        park_rows = self._sum_ride_period_stats_by_park(
+            RideWeeklyStats,
+            RideWeeklyStats.year == year,
+            RideWeeklyStats.week_number == week_number
+        )
+
+        previous_year, previous_week = self._previous_iso_week(year, week_number)
+        previous_downtime = self._get_previous_downtime(
+            select(ParkWeeklyStats.park_id, ParkWeeklyStats.total_downtime_hours)
+            .where(ParkWeeklyStats.year == previous_year)
+            .where(ParkWeeklyStats.week_number == previous_week)
+        )
+
+        rows = [
+            {
+                'park_id': row.park_id,
+                'year': year,
+                'week_number': week_number,
+                'week_start_date': week_start_date,
+                **self._park_period_values(row),
+                'trend_vs_previous_week': self._percentage_change(
+                    row.total_downtime_hours, previous_downtime.get(row.park_id)
+                )
+            }
+            for row in park_rows
+        ]
+
+        self._upsert_many(ParkWeeklyStats, rows, key_columns=('park_id', 'year', 'week_number'))
+
+        logger.info(f"Processed {len(rows)} parks for weekly aggregation")
+        return len(rows)
+
+    def _aggregate_rides_monthly_stats_batch(
+        self,
+        year: int,
+        month: int,
+        month_start: date,
+        month_end: date
+    ) -> int:
+        """
+        Aggregate monthly stats for every ride with one grouped query and multi-row upserts.
+
+        Batch equivalent of _aggregate_single_ride_monthly_stats() per ride.
+
+        Args:
+            year: Year
+            month: Month number (1-12)
+            month_start: First day of the month
+            month_end: Last day of the month
+
+        Returns:
+            Number of rides processed
+        """
+        ride_rows = self._sum_ride_daily_stats(month_start, month_end)
+
+        previous_year, previous_month = self._previous_month(year, month)
+        previous_downtime = self._get_previous_downtime(
+            select(RideMonthlyStats.ride_id, RideMonthlyStats.downtime_minutes)
+            .where(RideMonthlyStats.year == previous_year)
+            .where(RideMonthlyStats.month == previous_month)
+        )
+
+        rows = []
+        for row in ride_rows:
+            if row.uptime_minutes is None:
+                continue
+            uptime_percentage, avg_wait_time = self._ride_period_metrics(row)
+            rows.append({
+                'ride_id': row.ride_id,
+                'year': year,
+                'month': month,
+                'uptime_minutes': row.uptime_minutes,
+                'downtime_minutes': row.downtime_minutes,
+                'uptime_percentage': uptime_percentage,
+                'operating_hours_minutes': row.operating_hours_minutes,
+                'avg_wait_time': avg_wait_time,
+                'peak_wait_time': row.peak_wait_time,
+                'status_changes': row.status_changes,
+                'trend_vs_previous_month': self._percentage_change(
+                    row.downtime_minutes, previous_downtime.get(row.ride_id)
+                )
+            })
+
+        self._upsert_many(RideMonthlyStats, rows, key_columns=('ride_id', 'year', 'month'))
+
+        logger.info(f"Processed {len(ride_rows)} rides for monthly aggregation")
+        return len(ride_rows)
+
+    def _aggregate_parks_monthly_stats_batch(
+        self,
+        year: int,
+        month: int
+    ) -> int:
+        """
+        Aggregate monthly stats for every park with one grouped query and multi-row upserts.
+
+        Batch equivalent of _aggregate_single_park_monthly_stats() per park.
+
+        Args:
+            year: Year
+            month: Month number (1-12)
+
+        Returns:
+            Number of parks processed
+        """
+        park_rows = self._sum_ride_period_stats_by_park(
+            RideMonthlyStats,
+            RideMonthlyStats.year == year,
+            RideMonthlyStats.month == month
+        )
+
+        previous_year, previous_month = self._previous_month(year, month)
+        previous_downtime = self._get_previous_downtime(
+            select(ParkMonthlyStats.park_id, ParkMonthlyStats.total_downtime_hours)
+            .where(ParkMonthlyStats.year == previous_year)
+            .where(ParkMonthlyStats.month == previous_month)
+        )
+
+        rows = [
+            {
+                'park_id': row.park_id,
+                'year': year,
+                'month': month,
+                **self._park_period_values(row),
+                'trend_vs_previous_month': self._percentage_change(
+                    row.total_downtime_hours, previous_downtime.get(row.park_id)
+                )
+            }
+            for row in park_rows
+        ]
+
+        self._upsert_many(ParkMonthlyStats, rows, key_columns=('park_id', 'year', 'month'))
+
+        logger.info(f"Processed {len(rows)} parks for monthly aggregation")
+        return len(rows)
+
+    def _sum_ride_daily_stats(self, start_date: date, end_date: date) -> List[Any]:
+        """
+        Sum ride_daily_stats per ride over a date range (one grouped query).
+
+        Args:
+            start_date: First stat_date (inclusive)
+            end_date: Last stat_date (inclusive)
+
+        Returns:
+            Rows with ride_id and the same sums as the per-ride weekly/monthly queries
+        """
+        stmt = (
+            select(
+                RideDailyStats.ride_id,
+                func.sum(RideDailyStats.uptime_minutes).label('uptime_minutes'),
+                func.sum(RideDailyStats.downtime_minutes).label('downtime_minutes'),
+                func.sum(RideDailyStats.operating_hours_minutes).label('operating_hours_minutes'),
+                func.sum(RideDailyStats.status_changes).label('status_changes'),
+                func.max(RideDailyStats.peak_wait_time).label('peak_wait_time'),
+                func.sum(RideDailyStats.avg_wait_time * RideDailyStats.operating_hours_minutes).label('weighted_wait_sum'),
+                func.sum(RideDailyStats.operating_hours_minutes).label('total_operating_minutes')
+            )
+            .where(RideDailyStats.stat_date >= start_date)
+            .where(RideDailyStats.stat_date <= end_date)
+            .group_by(RideDailyStats.ride_id)
+            .order_by(RideDailyStats.ride_id)
+        )
+        return self.session.execute(stmt).all()
+
+    def _sum_ride_period_stats_by_park(self, model: Any, *period_filters: Any) -> List[Any]:
+        """
+        Roll up ride weekly/monthly stats per park (one grouped query).
+
+        Args:
+            model: RideWeeklyStats or RideMonthlyStats
+            period_filters: Conditions selecting the week or month
+
+        Returns:
+            Rows with park_id and the same aggregates as the per-park queries
+        """
+        stmt = (
+            select(
+                Ride.park_id,
+                func.count(func.distinct(model.ride_id)).label('total_rides_tracked'),
+                func.avg(model.uptime_percentage).label('avg_uptime_percentage'),
+                (func.sum(model.downtime_minutes) / 60.0).label('total_downtime_hours'),
+                func.sum(case((model.downtime_minutes > 0, 1), else_=0)).label('rides_with_downtime'),
+                func.sum(model.avg_wait_time * model.operating_hours_minutes).label('weighted_wait_sum'),
+                func.sum(model.operating_hours_minutes).label('total_operating_minutes'),
+                func.max(model.peak_wait_time).label('peak_wait_time')
+            )
+            .select_from(model)
+            .join(Ride, model.ride_id == Ride.ride_id)
+            .where(*period_filters)
+            .where(Ride.is_active == True)
+            .group_by(Ride.park_id)
+            .order_by(Ride.park_id)
+        )
+        return self.session.execute(stmt).all()
+
+    def _get_previous_downtime(self, stmt: Any) -> Dict[int, Any]:
+        """Run an (id, downtime) query for the previous period and return it as a dict."""
+        return {row[0]: row[1] for row in self.session.execute(stmt)}
+
+    @staticmethod
+    def _ride_period_metrics(row: Any) -> Tuple[float, Optional[float]]:
+        """Uptime percentage and weighted average wait for a summed ride period row."""
+        total_operating = int(row.operating_hours_minutes) if row.operating_hours_minutes else 0
+        uptime_percentage = 0.0
+        if total_operating > 0:
+            uptime_percentage = (float(row.uptime_minutes) / float(total_operating)) * 100.0
+
+        avg_wait_time = None
+        if row.total_operating_minutes and row.total_operating_minutes > 0 and row.weighted_wait_sum:
+            avg_wait_time = round(float(row.weighted_wait_sum) / float(row.total_operating_minutes), 2)
+
+        return round(uptime_percentage, 2), avg_wait_time
+
+    @staticmethod
+    def _park_period_values(row: Any) -> Dict[str, Any]:
+        """Park weekly/monthly stats columns from a rolled-up park row (trend excluded)."""
+        avg_wait_time = None
+        if row.total_operating_minutes and row.total_operating_minutes > 0 and row.weighted_wait_sum:
+            avg_wait_time = round(float(row.weighted_wait_sum) / float(row.total_operating_minutes), 2)
+
+        return {
+            'total_rides_tracked': row.total_rides_tracked,
+            'avg_uptime_percentage': round(float(row.avg_uptime_percentage), 2) if row.avg_uptime_percentage else None,
+            'total_downtime_hours': round(float(row.total_downtime_hours), 2),
+            'rides_with_downtime': row.rides_with_downtime,
+            'avg_wait_time': avg_wait_time,
+            'peak_wait_time': row.peak_wait_time
+        }
+
+    @staticmethod
+    def _percentage_change(current: Any, previous: Any) -> Optional[float]:
+        """
+        Period-over-period percentage change, e.g. 20.75 for +20.75%.
+
+        Returns None when there is no previous value or it is zero.
+        """
+        if previous is None or float(previous) == 0:
+            return None
+        previous = float(previous)
+        return round(((float(current) - previous) / previous) * 100.0, 2)
+
+    @staticmethod
+    def _previous_iso_week(year: int, week_number: int) -> Tuple[int, int]:
+        """Previous ISO (year, week), handling the year boundary (week 1 -> last week of previous year)."""
+        if week_number == 1:
+            previous_year = year - 1
+            # Last week of previous year (usually 52, sometimes 53)
+            previous_week = date(previous_year, 12, 28).isocalendar()[1]
+            return previous_year, previous_week
+        return year, week_number - 1
+
+    @staticmethod
+    def _previous_month(year: int, month: int) -> Tuple[int, int]:
+        """Previous (year, month), handling the year boundary."""
+        if month == 1:
+            return year - 1, 12
+        return year, month - 1
+
+    def _upsert_many(
+        self,
+        model: Any,
+        rows: List[Dict[str, Any]],
+        key_columns: Sequence[str]
+    ) -> None:
+        """
+        Write rows with multi-row INSERT ... ON DUPLICATE KEY UPDATE statements.
+
+        Every non-key column present in the rows is updated on conflict.
+
+        Args:
+            model: ORM model class
+            rows: Column -> value dicts (all with the same keys)
+            key_columns: Unique key columns (not updated)
+        """
+        if not rows:
+            return
+
+        update_columns = [column for column in rows[0] if column not in key_columns]
+        for offset in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = mysql_insert(model).values(rows[offset:offset + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_duplicate_key_update(
+                {column: stmt.inserted[column] for column in update_columns}
+            )
+            self.session.execute(stmt)
+
     def _get_distinct_timezones(self) -> List[str]:
         """Get list of distinct timezones from active parks."""
         stmt = (
@@ -1379,6 +1878,7 @@ class AggregationService:
                 select(AggregationLog.log_id)
                 .where(AggregationLog.aggregation_date == aggregation_date)
                 .where(AggregationLog.aggregation_type == aggregation_type)
+                .where(AggregationLog.unit_key.is_(None))
             )
             log_id = self.session.execute(select_stmt).scalar()
             return log_id
@@ -1429,6 +1929,7 @@ class AggregationService:
             select(AggregationLog)
             .where(AggregationLog.aggregation_type == aggregation_type)
             .where(AggregationLog.status == AggregationStatus.SUCCESS)
+            .where(AggregationLog.unit_key.is_(None))
             .order_by(AggregationLog.aggregated_until_ts.desc())
             .limit(1)
         )
@@ -1452,3 +1953,20 @@ class AggregationService:
             "rides_processed": log.rides_processed,
             "error_message": log.error_message
         }
+
+
+def aggregate_daily_timezone_unit(aggregation_date: date, timezone: str) -> Dict[str, int]:
+    """
+    Scheduler work unit: aggregate one timezone for one date in its own session.
+
+    Module-level so it can be pickled to AggregationScheduler worker processes.
+    """
+    from database.connection import get_db_session
+
+    with get_db_session() as session:
+        tz_results = AggregationService(session)._aggregate_daily_for_timezone(aggregation_date, timezone)
+
+    return {
+        'parks_processed': tz_results['parks_count'],
+        'rides_processed': tz_results['rides_count']
+    }
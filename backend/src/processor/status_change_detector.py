@@ -4,7 +4,7 @@ Detects ride status transitions (open ↔ closed) and calculates downtime durati
 """
 
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from sqlalchemy import select, insert, func
 from sqlalchemy.orm import Session
 
@@ -65,6 +65,79 @@ class StatusChangeDetector:
         result = self.session.execute(stmt)
         snapshots = [dict(row._mapping) for row in result]
 
+        return self._changes_from_snapshots(ride_id, snapshots)
+
+    def detect_status_changes_for_rides(
+        self,
+        ride_windows: Dict[int, Tuple[datetime, datetime]]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Detect status changes for many rides, each within its own time range.
+
+        Reads all snapshots for the rides in one query spanning the union of
+        the windows, then applies each ride's window in Python. Results match
+        calling detect_status_changes() once per ride.
+
+        Args:
+            ride_windows: ride_id -> (start_time, end_time) in UTC
+
+        Returns:
+            Dictionary mapping ride_id to list of changes (rides without changes omitted)
+        """
+        if not ride_windows:
+            return {}
+
+        span_start = min(start for start, _ in ride_windows.values())
+        span_end = max(end for _, end in ride_windows.values())
+
+        stmt = (
+            select(
+                RideStatusSnapshot.snapshot_id,
+                RideStatusSnapshot.ride_id,
+                RideStatusSnapshot.recorded_at,
+                RideStatusSnapshot.computed_is_open
+            )
+            .where(
+                RideStatusSnapshot.ride_id.in_(list(ride_windows)),
+                RideStatusSnapshot.recorded_at >= span_start,
+                RideStatusSnapshot.recorded_at <= span_end
+            )
+            .order_by(RideStatusSnapshot.ride_id.asc(), RideStatusSnapshot.recorded_at.asc())
+        )
+
+        snapshots_by_ride: Dict[int, List[Dict[str, Any]]] = {}
+        for row in self.session.execute(stmt):
+            snapshot = dict(row._mapping)
+            # Convert string datetime to datetime object if needed (SQLite compatibility)
+            if isinstance(snapshot['recorded_at'], str):
+                snapshot['recorded_at'] = datetime.fromisoformat(snapshot['recorded_at'].replace(' ', 'T'))
+            start_time, end_time = ride_windows[row.ride_id]
+            if start_time <= snapshot['recorded_at'] <= end_time:
+                snapshots_by_ride.setdefault(row.ride_id, []).append(snapshot)
+
+        all_changes = {}
+        for ride_id, snapshots in snapshots_by_ride.items():
+            changes = self._changes_from_snapshots(ride_id, snapshots)
+            if changes:
+                all_changes[ride_id] = changes
+
+        return all_changes
+
+    def _changes_from_snapshots(
+        self,
+        ride_id: int,
+        snapshots: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Find status transitions in a ride's time-ordered snapshots.
+
+        Args:
+            ride_id: Ride ID
+            snapshots: Snapshot dicts (recorded_at, computed_is_open) ordered by recorded_at
+
+        Returns:
+            List of status change dictionaries
+        """
         if len(snapshots) < 2:
             return []
 
@@ -28,6 +28,7 @@ backend_src = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_src.absolute()))
 
 from utils.logger import logger
+from utils.cron_state import report_job_stats
 from utils.timezone import get_today_pacific, get_pacific_day_range_utc
 from utils.metrics import SNAPSHOT_INTERVAL_MINUTES
 from database.repositories.park_repository import ParkRepository
@@ -112,6 +113,10 @@ class DailyAggregator:
             # Step 4: Print summary
             self._print_summary()
 
+            # Step 5: Publish static JSON snapshots (if STATIC_SNAPSHOT_DIR is set)
+            from scripts.publish_static import publish_static_snapshots
+            publish_static_snapshots()
+
             logger.info("=" * 60)
             logger.info("DAILY AGGREGATION - Complete ✓")
             logger.info("=" * 60)
@@ -748,6 +753,7 @@ def main():
 
     aggregator = DailyAggregator(target_date=target_date, force=args.force)
     aggregator.run()
+    report_job_stats(aggregator.stats)
 
 
 if __name__ == '__main__':
@@ -25,10 +25,12 @@ Pre-computes hourly statistics from raw snapshots for fast chart queries.
 This script should be run at :05 past each hour to aggregate the previous completed hour.
 
 Usage:
-    python -m scripts.aggregate_hourly [--hour YYYY-MM-DD-HH]
+    python -m scripts.aggregate_hourly [--hour YYYY-MM-DD-HH] [--per-ride]
 
 Options:
-    --hour    Specific hour to aggregate (default: previous completed hour in UTC)
+    --hour       Specific hour to aggregate (default: previous completed hour in UTC)
+    --per-ride   Use the legacy one-statement-per-ride/park path instead of the
+                 set-based GROUP BY statements
 
 Cron example (every hour at :05):
     5 * * * * cd /path/to/backend && python -m scripts.aggregate_hourly
@@ -37,13 +39,16 @@ Performance:
     - Aggregates ~12 snapshots per park per hour (5-min collection)
     - Stores to park_hourly_stats and ride_hourly_stats
     - Target: <10 seconds for 80 parks × 4200 rides
+    - Set-based mode (default) aggregates rides in chunks of RIDE_CHUNK_SIZE
+      with one GROUP BY ride_id statement each, and all parks in one
+      GROUP BY park_id statement, instead of 2 statements per ride/park
 """
 
 import sys
 import argparse
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Optional, Tuple, List
 import pytz
 
 # Add src to path
@@ -51,13 +56,14 @@ backend_src = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_src.absolute()))
 
 from utils.logger import logger
+from utils.cron_state import report_job_stats
 from utils.sql_helpers import RideStatusSQL, ParkStatusSQL
 from utils.metrics import SNAPSHOT_INTERVAL_MINUTES
 from database.repositories.park_repository import ParkRepository
 from database.repositories.ride_repository import RideRepository
 from database.repositories.aggregation_repository import AggregationLogRepository
 from database.connection import get_db_session
-from sqlalchemy import text, select, func, distinct, and_, or_
+from sqlalchemy import text, select, func, distinct, and_, or_, bindparam
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 from models import (
     Park, Ride,
@@ -67,6 +73,10 @@ from models import (
 )
 
 
+# Rides per set-based INSERT ... SELECT statement (bounds IN-list size and lock time)
+RIDE_CHUNK_SIZE = 1000
+
+
 def get_pacific_day_range_utc(utc_dt: datetime) -> Tuple[datetime, datetime]:
     """
     For a given UTC datetime, find the start and end of the corresponding
@@ -99,13 +109,21 @@ class HourlyAggregator:
     Replicates DailyAggregator pattern but for hourly granularity.
     """
 
-    def __init__(self, target_hour: Optional[datetime] = None):
+    def __init__(
+        self,
+        target_hour: Optional[datetime] = None,
+        set_based: bool = True,
+        ride_chunk_size: int = RIDE_CHUNK_SIZE
+    ):
         """
         Initialize the aggregator.
 
         Args:
             target_hour: Hour to aggregate (default: previous completed hour in UTC)
                         Must be on hour boundary (minutes=0, seconds=0)
+            set_based: If True, aggregate with chunked GROUP BY statements.
+                      If False, use the per-ride/per-park statements.
+            ride_chunk_size: Rides per statement in set-based mode
         """
         if target_hour is None:
             # Default to previous completed hour
@@ -117,6 +135,8 @@ class HourlyAggregator:
 
         self.target_hour = target_hour
         self.hour_end = target_hour + timedelta(hours=1)
+        self.set_based = set_based
+        self.ride_chunk_size = ride_chunk_size
 
         self.stats = {
             'parks_processed': 0,
@@ -297,6 +317,11 @@ class HourlyAggregator:
                 # Get all active rides
                 rides = ride_repo.get_all_active()
 
+                if self.set_based:
+                    self._aggregate_rides_set_based(session, rides, operated_today_ride_ids)
+                    logger.info(f"  ✓ Aggregated {self.stats['rides_processed']} rides")
+                    return
+
                 for ride in rides:
                     try:
                         self._aggregate_ride(session, ride, operated_today_ride_ids)
@@ -440,6 +465,112 @@ class HourlyAggregator:
             'ride_operated': 1 if ride_id in operated_today_ride_ids else 0
         })
 
+    def _aggregate_rides_set_based(self, session, rides: List, operated_today_ride_ids: set):
+        """
+        Aggregate statistics for many rides with one GROUP BY statement per chunk.
+
+        Produces the same ride_hourly_stats rows as calling _aggregate_ride()
+        for each ride: rides with no joined snapshots in the hour produce no
+        group and are skipped, matching the per-ride existence check.
+
+        Args:
+            session: Database session
+            rides: Ride model objects to aggregate
+            operated_today_ride_ids: Set of ride IDs that operated anywhere during the Pacific calendar day
+        """
+        # Use centralized SQL helpers for consistent business logic (SINGLE SOURCE OF TRUTH)
+        is_down_sql = RideStatusSQL.is_down("rss", parks_alias="p")
+        park_open_sql = ParkStatusSQL.park_appears_open_filter("pas", with_fallback=True)
+
+        stmt = text(f"""
+            INSERT INTO ride_hourly_stats (
+                ride_id,
+                park_id,
+                hour_start_utc,
+                avg_wait_time_minutes,
+                operating_snapshots,
+                down_snapshots,
+                downtime_hours,
+                uptime_percentage,
+                snapshot_count,
+                ride_operated,
+                created_at
+            )
+            SELECT
+                rss.ride_id,
+                r.park_id,
+                :hour_start,
+
+                ROUND(AVG(CASE WHEN rss.computed_is_open AND rss.wait_time IS NOT NULL
+                          THEN rss.wait_time END), 2) as avg_wait_time_minutes,
+
+                SUM(CASE WHEN rss.computed_is_open THEN 1 ELSE 0 END) as operating_snapshots,
+
+                SUM(CASE
+                    WHEN {park_open_sql} AND ({is_down_sql})
+                    THEN 1
+                    ELSE 0
+                END) as down_snapshots,
+
+                ROUND(SUM(CASE
+                    WHEN {park_open_sql} AND ({is_down_sql})
+                    THEN {SNAPSHOT_INTERVAL_MINUTES} / 60.0
+                    ELSE 0
+                END), 2) as downtime_hours,
+
+                CASE
+                    WHEN COUNT(*) > 0
+                    THEN ROUND(100.0 * SUM(CASE WHEN rss.computed_is_open THEN 1 ELSE 0 END) / COUNT(*), 2)
+                    ELSE 0
+                END as uptime_percentage,
+
+                COUNT(*) as snapshot_count,
+
+                -- Rule 2 - HOURLY: operated-today set pre-calculated in _aggregate_rides()
+                CASE WHEN rss.ride_id IN :operated_ride_ids THEN 1 ELSE 0 END as ride_operated,
+
+                NOW()
+
+            FROM ride_status_snapshots rss
+            JOIN rides r ON rss.ride_id = r.ride_id
+            JOIN parks p ON r.park_id = p.park_id
+            JOIN park_activity_snapshots pas ON r.park_id = pas.park_id
+                AND pas.recorded_at = rss.recorded_at
+            WHERE rss.ride_id IN :ride_ids
+              AND rss.recorded_at >= :hour_start
+              AND rss.recorded_at < :hour_end
+            GROUP BY rss.ride_id, r.park_id
+            ON DUPLICATE KEY UPDATE
+                avg_wait_time_minutes = VALUES(avg_wait_time_minutes),
+                operating_snapshots = VALUES(operating_snapshots),
+                down_snapshots = VALUES(down_snapshots),
+                downtime_hours = VALUES(downtime_hours),
+                uptime_percentage = VALUES(uptime_percentage),
+                snapshot_count = VALUES(snapshot_count),
+                ride_operated = VALUES(ride_operated),
+                updated_at = NOW()
+        """).bindparams(
+            bindparam('ride_ids', expanding=True),
+            bindparam('operated_ride_ids', expanding=True)
+        )
+
+        ride_ids = [ride.ride_id for ride in rides]
+        for offset in range(0, len(ride_ids), self.ride_chunk_size):
+            chunk = ride_ids[offset:offset + self.ride_chunk_size]
+            # Sentinel keeps the IN-list non-empty (no ride has ride_id 0)
+            operated_in_chunk = [ride_id for ride_id in chunk if ride_id in operated_today_ride_ids] or [0]
+            try:
+                session.execute(stmt, {
+                    'ride_ids': chunk,
+                    'operated_ride_ids': operated_in_chunk,
+                    'hour_start': self.target_hour,
+                    'hour_end': self.hour_end
+                })
+                self.stats['rides_processed'] += len(chunk)
+            except Exception as e:
+                logger.error(f"Error aggregating rides {chunk[0]}..{chunk[-1]}: {e}")
+                self.stats['errors'] += 1
+
     def _aggregate_parks(self, park_repo: ParkRepository):
         """
         Aggregate statistics for all parks.
@@ -452,6 +583,11 @@ class HourlyAggregator:
                 # Get all active parks
                 parks = park_repo.get_all_active()
 
+                if self.set_based:
+                    self._aggregate_parks_set_based(session, parks)
+                    logger.info(f"  ✓ Aggregated {self.stats['parks_processed']} parks")
+                    return
+
                 for park in parks:
                     try:
                         self._aggregate_park(session, park)
@@ -640,6 +776,112 @@ class HourlyAggregator:
             'hour_end': self.hour_end
         })
 
+    def _aggregate_parks_set_based(self, session, parks: List):
+        """
+        Aggregate statistics for all parks with a single GROUP BY statement.
+
+        Produces the same park_hourly_stats rows as calling _aggregate_park()
+        for each park. The per-park correlated subqueries over ride_hourly_stats
+        become one derived table grouped by park_id, so ride_hourly_stats must
+        already be populated for the hour (Step 1).
+
+        Args:
+            session: Database session
+            parks: Park model objects to aggregate
+        """
+        park_ids = [park.park_id for park in parks]
+        if not park_ids:
+            return
+
+        park_open_sql = ParkStatusSQL.park_appears_open_filter("pas")
+
+        stmt = text(f"""
+            INSERT INTO park_hourly_stats (
+                park_id,
+                hour_start_utc,
+                shame_score,
+                avg_wait_time_minutes,
+                rides_operating,
+                rides_down,
+                total_downtime_hours,
+                weighted_downtime_hours,
+                effective_park_weight,
+                snapshot_count,
+                park_was_open,
+                created_at
+            )
+            SELECT
+                pas.park_id,
+                :hour_start,
+
+                -- Shame score: (weighted_downtime / effective_park_weight) * 10
+                -- for rides that operated TODAY (ride_operated = 1)
+                ROUND(
+                    CASE
+                        WHEN COALESCE(MAX(rw.effective_park_weight), 0) > 0
+                        THEN COALESCE(MAX(rw.weighted_downtime_hours), 0)
+                             / COALESCE(MAX(rw.effective_park_weight), 0)
+                             * 10
+                        ELSE 0
+                    END,
+                    1
+                ) as shame_score,
+
+                ROUND(AVG(CASE WHEN {park_open_sql} THEN pas.avg_wait_time END), 2) as avg_wait_time_minutes,
+                ROUND(AVG(CASE WHEN {park_open_sql} THEN pas.rides_open END), 0) as rides_operating,
+                ROUND(AVG(CASE WHEN {park_open_sql} THEN pas.rides_closed END), 0) as rides_down,
+
+                COALESCE(MAX(rw.total_downtime_hours), 0) as total_downtime_hours,
+                COALESCE(MAX(rw.weighted_downtime_hours), 0) as weighted_downtime_hours,
+                COALESCE(MAX(rw.effective_park_weight), 0) as effective_park_weight,
+
+                COUNT(*) as snapshot_count,
+                MAX(CASE WHEN {park_open_sql} THEN 1 ELSE 0 END) as park_was_open,
+
+                NOW()
+
+            FROM park_activity_snapshots pas
+            LEFT JOIN (
+                SELECT
+                    rhs.park_id,
+                    SUM(rhs.downtime_hours) as total_downtime_hours,
+                    SUM(rhs.downtime_hours * COALESCE(rc.tier_weight, 2)) as weighted_downtime_hours,
+                    SUM(COALESCE(rc.tier_weight, 2)) as effective_park_weight
+                FROM ride_hourly_stats rhs
+                JOIN rides r ON rhs.ride_id = r.ride_id
+                LEFT JOIN ride_classifications rc ON r.ride_id = rc.ride_id
+                WHERE rhs.hour_start_utc = :hour_start
+                  AND rhs.ride_operated = 1
+                GROUP BY rhs.park_id
+            ) rw ON rw.park_id = pas.park_id
+            WHERE pas.park_id IN :park_ids
+              AND pas.recorded_at >= :hour_start
+              AND pas.recorded_at < :hour_end
+            GROUP BY pas.park_id
+            ON DUPLICATE KEY UPDATE
+                shame_score = VALUES(shame_score),
+                avg_wait_time_minutes = VALUES(avg_wait_time_minutes),
+                rides_operating = VALUES(rides_operating),
+                rides_down = VALUES(rides_down),
+                total_downtime_hours = VALUES(total_downtime_hours),
+                weighted_downtime_hours = VALUES(weighted_downtime_hours),
+                effective_park_weight = VALUES(effective_park_weight),
+                snapshot_count = VALUES(snapshot_count),
+                park_was_open = VALUES(park_was_open),
+                updated_at = NOW()
+        """).bindparams(bindparam('park_ids', expanding=True))
+
+        try:
+            session.execute(stmt, {
+                'park_ids': park_ids,
+                'hour_start': self.target_hour,
+                'hour_end': self.hour_end
+            })
+            self.stats['parks_processed'] += len(park_ids)
+        except Exception as e:
+            logger.error(f"Error aggregating parks: {e}")
+            self.stats['errors'] += 1
+
     def _complete_aggregation_log(self, log_id: int, aggregation_repo: AggregationLogRepository):
         """
         Mark aggregation as successfully completed.
@@ -703,6 +945,12 @@ def main():
         help='Hour to aggregate (YYYY-MM-DD-HH format, default: previous completed hour UTC)'
     )
 
+    parser.add_argument(
+        '--per-ride',
+        action='store_true',
+        help='Use per-ride/per-park statements instead of set-based GROUP BY statements'
+    )
+
     args = parser.parse_args()
 
     target_hour = None
@@ -713,8 +961,9 @@ def main():
             logger.error(f"Invalid hour format: {args.hour}. Use YYYY-MM-DD-HH (e.g., 2025-12-05-13)")
             sys.exit(1)
 
-    aggregator = HourlyAggregator(target_hour=target_hour)
+    aggregator = HourlyAggregator(target_hour=target_hour, set_based=not args.per_ride)
     aggregator.run()
+    report_job_stats(aggregator.stats)
 
 
 if __name__ == '__main__':
@@ -13,37 +13,260 @@ Run after collect_snapshots.py completes:
     python -m scripts.aggregate_live_rankings
 
 Expected runtime: ~10 seconds for all parks and rides.
+
+Incremental mode:
+    collect_snapshots passes the cycle it just wrote (LiveCycleResult). Current
+    state columns (rides_down, shame_score, is_down, current_status, ...) are
+    taken straight from the cycle, and the cumulative "today" columns
+    (downtime hours, wait stats) are advanced by the cycle's delta with
+    upserts against the live tables. The full rebuild, which scans the whole
+    Pacific day of snapshots, runs only once per LIVE_RANKINGS_FULL_REBUILD_MINUTES
+    (and on the first cycle of a new day) as a consistency check, so refresh
+    cost no longer grows through the day.
 """
 
 import sys
 import time
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from decimal import Decimal
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
 
 # Add src to path
 backend_src = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_src.absolute()))
 
 from sqlalchemy import select, func, and_, or_, case, text, literal, literal_column, Integer, insert
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from database.connection import get_db_session
 from models import (
     Park, Ride, RideClassification,
     RideStatusSnapshot, ParkActivitySnapshot, RideStatusChange,
+    ParkLiveRankings, RideLiveRankings,
     ParkLiveRankingsStaging, RideLiveRankingsStaging
 )
+from utils.config import COLLECTION_INTERVAL_MINUTES, LIVE_RANKINGS_FULL_REBUILD_MINUTES
 from utils.logger import logger
-from utils.timezone import get_today_pacific, get_pacific_day_range_utc
+from utils.cron_state import report_job_stats
+from utils.timezone import get_today_pacific, get_now_pacific, get_pacific_day_range_utc
 from utils.metrics import LIVE_WINDOW_HOURS
 
+# Minutes of downtime credited per down snapshot (shared by full rebuild and
+# incremental updates so the two paths agree)
+DOWNTIME_MINUTES_PER_SNAPSHOT = 5
+
+# Rides eligible for rankings must have operated within this many days
+ACTIVE_RIDE_DAYS = 7
+
+
+@dataclass
+class LiveCycleResult:
+    """
+    What one collection cycle wrote, kept in memory by SnapshotCollector.
+
+    parks: park_id -> {'park_appears_open': bool, 'shame_score': float|None}
+    rides: ride_id -> {'status': str|None, 'computed_is_open': bool, 'wait_time': int|None}
+    status_changes: ride_id -> changed_at of the change detected this cycle
+    """
+    recorded_at: datetime
+    parks: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    rides: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+    status_changes: Dict[int, datetime] = field(default_factory=dict)
+
+
+def is_ride_down(status: Optional[str], computed_is_open: Any, strict_down: bool) -> bool:
+    """
+    Park-type aware down check (mirrors the SQL is_down CASE).
+
+    Disney/Universal (strict_down) only count DOWN; other parks also count
+    CLOSED, or no status with computed_is_open false.
+    """
+    if strict_down:
+        return status == 'DOWN'
+    return status in ('DOWN', 'CLOSED') or (status is None and computed_is_open is not None and not computed_is_open)
+
+
+def _round(value: Any, places: int) -> Decimal:
+    return round(Decimal(str(value or 0)), places)
+
+
+def _eligible(ride: Dict[str, Any], now_utc: datetime) -> bool:
+    """Ride operated within ACTIVE_RIDE_DAYS (counts toward park weight and ride rankings)."""
+    last_operated = ride.get('last_operated_at')
+    return last_operated is not None and last_operated >= now_utc - timedelta(days=ACTIVE_RIDE_DAYS)
+
+
+def _tier_weight(ride: Dict[str, Any]) -> Decimal:
+    return Decimal(str(ride['tier_weight'])) if ride.get('tier_weight') is not None else Decimal(2)
+
+
+def _cycle_downtime_minutes(cycle: LiveCycleResult, ride: Dict[str, Any]) -> int:
+    """Downtime minutes this cycle contributes for a ride (0 if up or park closed)."""
+    state = cycle.rides.get(ride['ride_id'])
+    park_state = cycle.parks.get(ride['park_id'])
+    if state is None or not park_state or not park_state.get('park_appears_open'):
+        return 0
+    strict = bool(ride['is_disney'] or ride['is_universal'])
+    if is_ride_down(state.get('status'), state.get('computed_is_open'), strict):
+        return DOWNTIME_MINUTES_PER_SNAPSHOT
+    return 0
+
+
+def build_park_rows(
+    cycle: LiveCycleResult,
+    rides: Dict[int, Dict[str, Any]],
+    existing: Dict[int, Any],
+    calculated_at: datetime
+) -> List[Dict[str, Any]]:
+    """
+    Compute park_live_rankings rows for the cycle's parks.
+
+    rides_down, total_rides, total_park_weight and shame_score describe the
+    cycle's state; total/weighted downtime hours add this cycle's down
+    snapshots to the existing row. Rounding to the column scale can drift
+    by up to 0.005h per cycle; the periodic full rebuild resets it.
+    """
+    by_park: Dict[int, List[Dict[str, Any]]] = {}
+    for ride in rides.values():
+        by_park.setdefault(ride['park_id'], []).append(ride)
+
+    rows = []
+    for park_id, park_state in cycle.parks.items():
+        park_rides = by_park.get(park_id, [])
+        eligible = [ride for ride in park_rides if _eligible(ride, calculated_at)]
+        reported = [ride for ride in park_rides if ride['ride_id'] in cycle.rides]
+        # Full rebuild only ranks parks with 7-day-active rides and snapshots today
+        if not eligible or not reported:
+            continue
+
+        down_minutes = 0
+        weighted_down_minutes = Decimal(0)
+        for ride in reported:
+            minutes = _cycle_downtime_minutes(cycle, ride)
+            down_minutes += minutes
+            weighted_down_minutes += minutes * _tier_weight(ride)
+
+        rides_down = sum(1 for ride in eligible if _cycle_downtime_minutes(cycle, ride) > 0)
+        previous = existing.get(park_id)
+        meta = park_rides[0]
+        location = (
+            f"{meta['city']}, {meta['state_province']}"
+            if meta['city'] is not None and meta['state_province'] is not None else None
+        )
+
+        rows.append({
+            'park_id': park_id,
+            'queue_times_id': meta['park_queue_times_id'],
+            'park_name': meta['park_name'],
+            'location': location,
+            'timezone': meta['timezone'],
+            'is_disney': meta['is_disney'],
+            'is_universal': meta['is_universal'],
+            'rides_down': rides_down,
+            'total_rides': len(eligible),
+            'shame_score': _round(park_state.get('shame_score'), 1),
+            'park_is_open': True,
+            'total_downtime_hours': _round(
+                (previous.total_downtime_hours if previous else 0) + Decimal(down_minutes) / 60, 2
+            ),
+            'weighted_downtime_hours': _round(
+                (previous.weighted_downtime_hours if previous else 0) + weighted_down_minutes / 60, 2
+            ),
+            'total_park_weight': _round(sum(_tier_weight(ride) for ride in eligible), 2),
+            'calculated_at': calculated_at,
+        })
+    return rows
+
+
+def build_ride_rows(
+    cycle: LiveCycleResult,
+    rides: Dict[int, Dict[str, Any]],
+    existing: Dict[int, Any],
+    day_stats: Dict[int, Dict[str, Any]],
+    calculated_at: datetime
+) -> List[Dict[str, Any]]:
+    """
+    Compute ride_live_rankings rows for the cycle's rides.
+
+    Existing rows take the cycle's current status and fold its downtime and
+    wait time into the running totals. Rides without a row only enter the
+    table once they have downtime today (matching the full rebuild's
+    HAVING downtime_hours > 0), seeded from day_stats.
+    """
+    rows = []
+    for ride_id, state in cycle.rides.items():
+        ride = rides.get(ride_id)
+        if ride is None or not _eligible(ride, calculated_at):
+            continue
+
+        minutes = _cycle_downtime_minutes(cycle, ride)
+        previous = existing.get(ride_id)
+        wait_time = state.get('wait_time')
+
+        if previous is not None:
+            samples = previous.wait_time_samples or 0
+            avg_wait = previous.avg_wait_time
+            if wait_time is not None and wait_time > 0:
+                avg_wait = (Decimal(str(avg_wait or 0)) * samples + wait_time) / (samples + 1)
+                samples += 1
+            max_wait = max(
+                (value for value in (previous.max_wait_time, wait_time) if value is not None),
+                default=None
+            )
+            downtime_hours = Decimal(str(previous.downtime_hours or 0)) + Decimal(minutes) / 60
+            last_change = previous.last_status_change
+        elif minutes > 0:
+            # Seeded from today's snapshots, which already include this cycle
+            seed = day_stats.get(ride_id, {})
+            samples = seed.get('wait_time_samples') or 0
+            avg_wait = seed.get('avg_wait_time')
+            max_wait = seed.get('max_wait_time')
+            downtime_hours = Decimal(minutes) / 60
+            last_change = seed.get('last_status_change')
+        else:
+            continue
+
+        park_state = cycle.parks.get(ride['park_id']) or {}
+        strict = bool(ride['is_disney'] or ride['is_universal'])
+        rows.append({
+            'ride_id': ride_id,
+            'park_id': ride['park_id'],
+            'queue_times_id': ride['queue_times_id'],
+            'ride_name': ride['name'],
+            'park_name': ride['park_name'],
+            'tier': ride['tier'] if ride.get('tier') is not None else 3,
+            'tier_weight': _tier_weight(ride),
+            'category': ride['category'],
+            'is_disney': ride['is_disney'],
+            'is_universal': ride['is_universal'],
+            'is_down': bool(park_state.get('park_appears_open')) and is_ride_down(
+                state.get('status'), state.get('computed_is_open'), strict
+            ),
+            'current_status': state.get('status'),
+            'current_wait_time': wait_time,
+            'last_status_change': cycle.status_changes.get(ride_id, last_change),
+            'downtime_hours': _round(downtime_hours, 2),
+            'downtime_incidents': 0,
+            'avg_wait_time': _round(avg_wait, 1) if avg_wait is not None else None,
+            'max_wait_time': max_wait,
+            'wait_time_samples': samples,
+            'calculated_at': calculated_at,
+        })
+    return rows
+
 
 class LiveRankingsAggregator:
     """
     Aggregates live and today rankings into pre-computed tables.
 
-    Uses atomic table swap for zero-downtime updates:
+    Full rebuild uses atomic table swap for zero-downtime updates:
     1. Truncate staging table
     2. Insert aggregated data into staging
     3. RENAME staging <-> live (atomic swap)
+
+    Incremental mode (run(cycle=...)) upserts the cycle's parks and rides
+    directly into the live tables.
     """
 
     def __init__(self):
@@ -52,11 +275,19 @@ class LiveRankingsAggregator:
             "rides_aggregated": 0,
             "park_time_seconds": 0,
             "ride_time_seconds": 0,
+            "mode": None,
             "errors": [],
         }
 
-    def run(self):
-        """Main execution method."""
+    def run(self, cycle: Optional[LiveCycleResult] = None):
+        """
+        Main execution method.
+
+        Args:
+            cycle: Results of the collection cycle that just completed. When
+                   given, the cycle is applied incrementally unless a full
+                   rebuild is due (see needs_full_rebuild()).
+        """
         logger.info("=" * 60)
         logger.info(f"LIVE RANKINGS AGGREGATION - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         logger.info("=" * 60)
@@ -65,11 +296,17 @@ class LiveRankingsAggregator:
 
         try:
             with get_db_session() as session:
-                # Aggregate parks
-                self._aggregate_park_rankings(session)
+                if cycle is not None and not self.needs_full_rebuild(session):
+                    self.stats["mode"] = "incremental"
+                    self._apply_cycle(session, cycle)
+                else:
+                    self.stats["mode"] = "full"
+
+                    # Aggregate parks
+                    self._aggregate_park_rankings(session)
 
-                # Aggregate rides
-                self._aggregate_ride_rankings(session)
+                    # Aggregate rides
+                    self._aggregate_ride_rankings(session)
 
                 # Commit all changes
                 session.commit()
@@ -82,7 +319,7 @@ class LiveRankingsAggregator:
         total_time = time.time() - start_time
 
         logger.info("=" * 60)
-        logger.info("AGGREGATION COMPLETE")
+        logger.info(f"AGGREGATION COMPLETE ({self.stats['mode']})")
         logger.info(f"  Parks: {self.stats['parks_aggregated']} ({self.stats['park_time_seconds']:.1f}s)")
         logger.info(f"  Rides: {self.stats['rides_aggregated']} ({self.stats['ride_time_seconds']:.1f}s)")
         logger.info(f"  Total time: {total_time:.1f}s")
@@ -90,6 +327,156 @@ class LiveRankingsAggregator:
 
         return self.stats
 
+    def needs_full_rebuild(self, session) -> bool:
+        """
+        Decide whether this cycle runs the full snapshot-scan rebuild.
+
+        True when incremental updates are disabled, when the cycle falls in
+        the first collection interval of a rebuild period (Pacific clock), or
+        when park_live_rankings has nothing calculated since the start of the
+        Pacific day (first cycle of the day, or empty table).
+        """
+        if LIVE_RANKINGS_FULL_REBUILD_MINUTES <= 0:
+            return True
+
+        now_pacific = get_now_pacific()
+        minute_of_day = now_pacific.hour * 60 + now_pacific.minute
+        if minute_of_day % LIVE_RANKINGS_FULL_REBUILD_MINUTES < COLLECTION_INTERVAL_MINUTES:
+            return True
+
+        start_utc, _ = get_pacific_day_range_utc(now_pacific.date())
+        last_calculated = session.execute(
+            select(func.max(ParkLiveRankings.calculated_at))
+        ).scalar()
+        return last_calculated is None or last_calculated < start_utc.replace(tzinfo=None)
+
+    def _apply_cycle(self, session, cycle: LiveCycleResult):
+        """
+        Apply one collection cycle to the live tables without scanning the day.
+
+        Reads only per-cycle-sized inputs: ride metadata for the cycle's parks
+        and the current live rows for those parks/rides. Parks and rides not
+        in the cycle keep their rows until the next full rebuild.
+        """
+        start = time.time()
+        calculated_at = datetime.utcnow()
+
+        rides = self._load_ride_metadata(session, cycle.parks.keys())
+        existing_parks = {
+            row.park_id: row for row in session.execute(
+                select(ParkLiveRankings.park_id,
+                       ParkLiveRankings.total_downtime_hours,
+                       ParkLiveRankings.weighted_downtime_hours)
+                .where(ParkLiveRankings.park_id.in_(list(cycle.parks) or [0]))
+            )
+        }
+
+        park_rows = build_park_rows(cycle, rides, existing_parks, calculated_at)
+        self._upsert(session, ParkLiveRankings, park_rows)
+        self.stats["parks_aggregated"] = len(park_rows)
+        self.stats["park_time_seconds"] = time.time() - start
+
+        start = time.time()
+        cycle_ride_ids = [ride_id for ride_id in cycle.rides if ride_id in rides]
+        existing_rides = {
+            row.ride_id: row for row in session.execute(
+                select(RideLiveRankings.ride_id,
+                       RideLiveRankings.downtime_hours,
+                       RideLiveRankings.avg_wait_time,
+                       RideLiveRankings.max_wait_time,
+                       RideLiveRankings.wait_time_samples,
+                       RideLiveRankings.last_status_change)
+                .where(RideLiveRankings.ride_id.in_(cycle_ride_ids or [0]))
+            )
+        }
+
+        # Rides entering the table this cycle need today's wait stats once
+        new_ride_ids = [
+            ride_id for ride_id in cycle_ride_ids
+            if ride_id not in existing_rides and _cycle_downtime_minutes(cycle, rides[ride_id]) > 0
+        ]
+        day_stats = self._load_day_ride_stats(session, new_ride_ids)
+
+        ride_rows = build_ride_rows(cycle, rides, existing_rides, day_stats, calculated_at)
+        self._upsert(session, RideLiveRankings, ride_rows)
+        self.stats["rides_aggregated"] = len(ride_rows)
+        self.stats["ride_time_seconds"] = time.time() - start
+
+        logger.info(f"  Incremental update: {len(park_rows)} parks, {len(ride_rows)} rides "
+                    f"({len(new_ride_ids)} new today)")
+
+    def _load_ride_metadata(self, session, park_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """Active attractions (with park and tier data) for the cycle's parks."""
+        park_ids = list(park_ids)
+        if not park_ids:
+            return {}
+
+        stmt = (
+            select(
+                Ride.ride_id, Ride.park_id, Ride.queue_times_id, Ride.name, Ride.category,
+                Ride.last_operated_at,
+                Park.queue_times_id.label('park_queue_times_id'),
+                Park.name.label('park_name'), Park.city, Park.state_province, Park.timezone,
+                Park.is_disney, Park.is_universal,
+                RideClassification.tier, RideClassification.tier_weight
+            )
+            .join(Park, Ride.park_id == Park.park_id)
+            .outerjoin(RideClassification, Ride.ride_id == RideClassification.ride_id)
+            .where(Ride.park_id.in_(park_ids))
+            .where(Ride.is_active == True)
+            .where(Ride.category == 'ATTRACTION')
+            .where(Park.is_active == True)
+        )
+        return {row.ride_id: dict(row._mapping) for row in session.execute(stmt)}
+
+    def _load_day_ride_stats(self, session, ride_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Today's wait stats and last status change for rides new to the table.
+
+        Only called for rides that just recorded their first downtime of the
+        day, so it touches a handful of rides per cycle.
+        """
+        if not ride_ids:
+            return {}
+
+        start_utc, end_utc = get_pacific_day_range_utc(get_today_pacific())
+        wait_stmt = (
+            select(
+                RideStatusSnapshot.ride_id,
+                func.avg(case((RideStatusSnapshot.wait_time > 0, RideStatusSnapshot.wait_time))).label('avg_wait_time'),
+                func.max(RideStatusSnapshot.wait_time).label('max_wait_time'),
+                func.count(case((RideStatusSnapshot.wait_time > 0, 1))).label('wait_time_samples')
+            )
+            .where(RideStatusSnapshot.ride_id.in_(ride_ids))
+            .where(RideStatusSnapshot.recorded_at >= start_utc)
+            .where(RideStatusSnapshot.recorded_at < end_utc)
+            .group_by(RideStatusSnapshot.ride_id)
+        )
+        stats = {row.ride_id: dict(row._mapping) for row in session.execute(wait_stmt)}
+
+        change_stmt = (
+            select(RideStatusChange.ride_id, func.max(RideStatusChange.changed_at).label('last_status_change'))
+            .where(RideStatusChange.ride_id.in_(ride_ids))
+            .where(RideStatusChange.changed_at >= start_utc)
+            .group_by(RideStatusChange.ride_id)
+        )
+        for row in session.execute(change_stmt):
+            stats.setdefault(row.ride_id, {})['last_status_change'] = row.last_status_change
+
+        return stats
+
+    @staticmethod
+    def _upsert(session, model, rows: List[Dict[str, Any]]):
+        """Multi-row INSERT ... ON DUPLICATE KEY UPDATE of every non-key column."""
+        if not rows:
+            return
+        stmt = mysql_insert(model).values(rows)
+        key = model.__table__.primary_key.columns.keys()[0]
+        stmt = stmt.on_duplicate_key_update({
+            column: stmt.inserted[column] for column in rows[0] if column != key
+        })
+        session.execute(stmt)
+
     def _aggregate_park_rankings(self, session):
         """
         Aggregate park rankings into park_live_rankings table.
@@ -258,7 +645,7 @@ class LiveRankingsAggregator:
                                     ParkActivitySnapshot.park_appears_open == True,
                                     is_down
                                 ),
-                                5
+                                DOWNTIME_MINUTES_PER_SNAPSHOT
                             ),
                             else_=0
                         )
@@ -275,7 +662,7 @@ class LiveRankingsAggregator:
                                     ParkActivitySnapshot.park_appears_open == True,
                                     is_down
                                 ),
-                                5 * func.coalesce(RideClassification.tier_weight, 2)
+                                DOWNTIME_MINUTES_PER_SNAPSHOT * func.coalesce(RideClassification.tier_weight, 2)
                             ),
                             else_=0
                         )
@@ -384,7 +771,7 @@ class LiveRankingsAggregator:
                  tier, tier_weight, category, is_disney, is_universal,
                  is_down, current_status, current_wait_time, last_status_change,
                  downtime_hours, downtime_incidents, avg_wait_time, max_wait_time,
-                 calculated_at)
+                 wait_time_samples, calculated_at)
             WITH latest_snapshot AS (
                 SELECT ride_id, MAX(recorded_at) AS latest_recorded_at
                 FROM ride_status_snapshots
@@ -440,11 +827,12 @@ class LiveRankingsAggregator:
                             ELSE rss.status IN ('DOWN', 'CLOSED')
                                 OR (rss.status IS NULL AND rss.computed_is_open = FALSE)
                         END
-                    ) THEN 5 ELSE 0
+                    ) THEN :snapshot_minutes ELSE 0
                 END) / 60.0, 2) AS downtime_hours,
                 0 AS downtime_incidents,
                 ROUND(AVG(CASE WHEN rss.wait_time > 0 THEN rss.wait_time END), 1) AS avg_wait_time,
                 MAX(rss.wait_time) AS max_wait_time,
+                COUNT(CASE WHEN rss.wait_time > 0 THEN 1 END) AS wait_time_samples,
                 :calculated_at AS calculated_at
             FROM rides r
             INNER JOIN parks p ON r.park_id = p.park_id
@@ -473,13 +861,14 @@ class LiveRankingsAggregator:
                         ELSE rss.status IN ('DOWN', 'CLOSED')
                             OR (rss.status IS NULL AND rss.computed_is_open = FALSE)
                     END
-                ) THEN 5 ELSE 0
+                ) THEN :snapshot_minutes ELSE 0
             END) / 60.0, 2) > 0
         """)
         session.execute(insert_sql, {
             'start_utc': start_utc,
             'end_utc': end_utc,
             'live_hours': LIVE_WINDOW_HOURS,
+            'snapshot_minutes': DOWNTIME_MINUTES_PER_SNAPSHOT,
             'calculated_at': calculated_at
         })
 
@@ -508,6 +897,7 @@ def main():
     aggregator = LiveRankingsAggregator()
     try:
         stats = aggregator.run()
+        report_job_stats(stats)
         if stats["errors"]:
             sys.exit(1)
     except Exception as e:
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Theme Park Downtime Tracker - Query Plan Check Script
+Verifies that the query classes in database/queries/ are served by indexes.
+
+Runs every query case with representative parameters, EXPLAINs the SQL it
+sends and reports full scans, filesorts and temporary tables, with covering
+index suggestions for the time-series tables (database/audit/query_plans.py).
+
+Run it against a seeded database (e.g. the golden dataset or a production
+mirror); on a nearly empty database the optimizer prefers table scans.
+
+Usage:
+    python -m scripts.check_query_plans
+    python -m scripts.check_query_plans --query today.
+    python -m scripts.check_query_plans --json
+
+Options:
+    --query PREFIX       Only check query cases whose name starts with PREFIX
+    --min-rows N         Report full scans of other tables from N rows (default: 1000)
+    --json               Output results as JSON
+
+Exit codes:
+    0 = No critical findings
+    1 = A query has no usable index on a time-series table, or failed
+    2 = Warnings found (but no critical findings)
+"""
+
+import sys
+import argparse
+import json
+from dataclasses import asdict
+from pathlib import Path
+
+# Add src to path
+backend_src = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_src.absolute()))
+
+from utils.logger import logger
+from database.connection import get_db_session
+from database.audit.query_plans import MIN_REPORTED_ROWS, QUERY_CASES, QueryPlanAuditor
+
+
+def print_report(reports) -> None:
+    """Print findings and suggestions per query case."""
+    for report in reports:
+        status = "ERROR" if report.error else ("PASS" if report.passed else "FAIL")
+        print(f"[{status}] {report.query} ({report.statements} statements)")
+        if report.error:
+            print(f"    {report.error}")
+        for finding in report.findings:
+            rows = f", ~{finding.rows:,} rows" if finding.rows else ""
+            print(f"    {finding.severity:8} {finding.problem} {finding.table or ''}{rows} {finding.detail}")
+        for suggestion in report.suggestions:
+            note = f" (declared as {suggestion.declared_as})" if suggestion.declared_as else ""
+            kind = "covering" if suggestion.covering else "key only"
+            print(f"    SUGGEST  {suggestion.ddl}; -- {kind}{note}")
+
+    suggestions = {s.ddl: s for report in reports for s in report.suggestions}
+    if suggestions:
+        print()
+        print("Suggested indexes (all queries):")
+        for ddl in sorted(suggestions):
+            print(f"    {ddl};")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Check that the query classes are served by indexes (EXPLAIN FORMAT=JSON)'
+    )
+    parser.add_argument(
+        '--query',
+        type=str,
+        default='',
+        help='Only check query cases whose name starts with this prefix'
+    )
+    parser.add_argument(
+        '--min-rows',
+        type=int,
+        default=MIN_REPORTED_ROWS,
+        help=f'Report full scans of non time-series tables from this many rows (default: {MIN_REPORTED_ROWS})'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Output results as JSON'
+    )
+    args = parser.parse_args()
+
+    cases = [case for case in QUERY_CASES if case.name.startswith(args.query)]
+    if not cases:
+        logger.error(f"No query cases match '{args.query}'")
+        return 1
+
+    with get_db_session() as session:
+        reports = QueryPlanAuditor(session, min_rows=args.min_rows).audit_all(cases)
+        session.rollback()
+
+    if args.json:
+        print(json.dumps([{**asdict(report), 'passed': report.passed} for report in reports], indent=2, default=str))
+    else:
+        print_report(reports)
+
+    if any(report.error or not report.passed for report in reports):
+        return 1
+    if any(report.findings for report in reports):
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except Exception as e:
+        logger.error(f"Query plan check failed: {e}", exc_info=True)
+        sys.exit(1)
@@ -9,6 +9,13 @@ Supports two data providers:
 
 Parks with themeparks_wiki_id will use ThemeParks.wiki; others use Queue-Times.
 
+Each cycle runs in two stages:
+1. Fetch stage - live data for every park is pulled concurrently (bounded
+   worker pool with a per-host concurrency limit), so a cycle takes roughly
+   as long as the slowest park instead of the sum of all parks.
+2. Write stage - parks are processed in order on a single DB session, all
+   sharing one snapshot_timestamp for the cycle.
+
 This script should be run every 10 minutes via cron or similar scheduler.
 
 Usage:
@@ -19,6 +26,10 @@ Cron example (every 10 minutes):
 """
 
 import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional, Any
@@ -31,19 +42,41 @@ backend_src = Path(__file__).parent.parent
 sys.path.insert(0, str(backend_src.absolute()))
 
 from utils.logger import logger
+from utils.cron_state import report_job_stats
+from utils.config import (
+    COLLECTOR_FETCH_WORKERS, COLLECTOR_MAX_CONCURRENT_PER_HOST,
+    COLLECTOR_STATE_FILE, COLLECTOR_STATE_MAX_AGE_MINUTES
+)
 from models import Ride, RideClassification
 from collector.queue_times_client import QueueTimesClient
 from collector.themeparks_wiki_client import get_themeparks_wiki_client
 from collector.status_calculator import computed_is_open, validate_wait_time
+from collector.ride_identity_map import RideIdentityMap
+from collector.last_status_cache import LastStatusCache
 from database.connection import get_db_connection, get_db_session
 from database.repositories.park_repository import ParkRepository
 from database.repositories.ride_repository import RideRepository
 from database.repositories.snapshot_repository import RideStatusSnapshotRepository, ParkActivitySnapshotRepository
 from database.repositories.status_change_repository import RideStatusChangeRepository
-from database.repositories.schedule_repository import ScheduleRepository
+from database.repositories.schedule_repository import ScheduleRepository, ScheduleIndex
 from database.repositories.data_quality_repository import DataQualityRepository
 
 
+# Provider keys double as host keys for per-host concurrency limits
+PROVIDER_THEMEPARKS_WIKI = 'themeparks_wiki'
+PROVIDER_QUEUE_TIMES = 'queue_times'
+
+
+@dataclass
+class ParkFetchResult:
+    """Raw provider payload for one park, produced by the concurrent fetch stage."""
+    park_id: int
+    provider: str
+    data: Any = None
+    error: Optional[Exception] = None
+    elapsed_seconds: float = 0.0
+
+
 class SnapshotCollector:
     """
     Collects real-time wait time snapshots from ThemeParks.wiki or Queue-Times.com.
@@ -56,10 +89,20 @@ class SnapshotCollector:
     # Buzz Lightyear case: data was 5+ months old!
     STALE_DATA_THRESHOLD_MINUTES = 60
 
-    def __init__(self):
+    def __init__(self, max_workers: int = COLLECTOR_FETCH_WORKERS,
+                 max_concurrent_per_host: int = COLLECTOR_MAX_CONCURRENT_PER_HOST,
+                 state_file: str = COLLECTOR_STATE_FILE):
         self.queue_times_client = QueueTimesClient()
         self.themeparks_wiki_client = get_themeparks_wiki_client()
 
+        # Fetch stage concurrency: bounded pool + per-host semaphores so we
+        # never hammer a single upstream with more than N requests at once
+        self.max_workers = max(1, max_workers)
+        self._host_semaphores = {
+            PROVIDER_THEMEPARKS_WIKI: threading.BoundedSemaphore(max(1, max_concurrent_per_host)),
+            PROVIDER_QUEUE_TIMES: threading.BoundedSemaphore(max(1, max_concurrent_per_host)),
+        }
+
         self.stats = {
             'parks_processed': 0,
             'parks_themeparks_wiki': 0,
@@ -73,6 +116,30 @@ class SnapshotCollector:
         # Cache for previous ride statuses (to detect status changes)
         self.previous_statuses = {}
 
+        # Per-cycle ride lookup by provider ID (loaded in run())
+        self.ride_map: Optional[RideIdentityMap] = None
+
+        # Per-cycle schedule intervals for open/closed checks (loaded in run())
+        self.schedule_index: Optional[ScheduleIndex] = None
+
+        # Latest persisted snapshot per ride, prefetched once per run so change
+        # detection doesn't query per ride. None = not prefetched (per-ride lookups).
+        self.latest_snapshots: Optional[Dict[int, Dict[str, Any]]] = None
+        self.status_cache = LastStatusCache(state_file, COLLECTOR_STATE_MAX_AGE_MINUTES) if state_file else None
+
+        # Write buffers - flushed with multi-row INSERTs instead of one
+        # INSERT + flush round trip per row
+        self._pending_snapshots: List[Dict[str, Any]] = []
+        self._pending_status_changes: List[Dict[str, Any]] = []
+        self._pending_park_activity: List[Dict[str, Any]] = []
+
+        # What this cycle successfully wrote, handed to the live rankings
+        # aggregator so it can update incrementally instead of rescanning the day
+        self._cycle_recorded_at: Optional[datetime] = None
+        self._cycle_parks: Dict[int, Dict[str, Any]] = {}
+        self._cycle_rides: Dict[int, Dict[str, Any]] = {}
+        self._cycle_status_changes: Dict[int, datetime] = {}
+
     def run(self):
         """Main execution method."""
         logger.info("=" * 60)
@@ -93,19 +160,53 @@ class SnapshotCollector:
                 parks = park_repo.get_all_active()
                 logger.info(f"Processing {len(parks)} active parks...")
 
-                # Step 1.5: Refresh schedules for parks that need it (every 24 hours)
-                self._refresh_schedules_if_needed(parks, schedule_repo)
+                # Step 1.5: Refresh schedules for parks that need it (every 24 hours),
+                # then index all OPERATING intervals once for the whole cycle
+                self.schedule_index = schedule_repo.load_index()
+                if self._refresh_schedules_if_needed(parks, schedule_repo):
+                    self.schedule_index = schedule_repo.load_index()
+
+                # Step 1.6: Load ride identity map once instead of 2 lookups per ride
+                self.ride_map = RideIdentityMap(ride_repo)
+                rides_loaded = self.ride_map.load()
+                logger.info(f"Loaded {rides_loaded} active rides into identity map")
+
+                # Step 1.7: Prefetch each ride's last status for change detection
+                self._load_latest_snapshots(snapshot_repo)
+
+                # CRITICAL: Single timestamp for ALL snapshots in this collection cycle
+                # This ensures park_activity_snapshots and ride_status_snapshots have
+                # EXACTLY matching recorded_at values, enabling fast exact-match joins
+                # instead of slow DATE_FORMAT minute-level matching.
+                snapshot_timestamp = datetime.now()
+                self._cycle_recorded_at = snapshot_timestamp
+
+                # Step 2: Fetch live data for all parks concurrently (no DB access)
+                fetch_results = self._fetch_all_parks(parks)
 
-                # Step 2: Process each park
+                # Step 3: Process each park in order (single-threaded DB writes)
                 for park in parks:
-                    self._process_park(park, park_activity_repo, ride_repo, snapshot_repo, status_change_repo, schedule_repo, data_quality_repo)
+                    self._process_park(park, fetch_results.get(park.park_id), park_activity_repo,
+                                       ride_repo, snapshot_repo, status_change_repo, schedule_repo,
+                                       data_quality_repo, snapshot_timestamp)
 
-            # Step 3: Print summary
+                # Park activity rows for the whole cycle go out in one INSERT
+                self._flush_park_activity(park_activity_repo)
+
+            # Persist last statuses only after the cycle's writes are committed
+            if self.status_cache is not None and self.latest_snapshots is not None:
+                self.status_cache.save(self.latest_snapshots, saved_at=snapshot_timestamp)
+
+            # Step 4: Print summary
             self._print_summary()
 
-            # Step 4: Pre-aggregate live rankings for instant API responses
+            # Step 5: Pre-aggregate live rankings for instant API responses
             self._aggregate_live_rankings()
 
+            # Step 6: Publish static JSON snapshots (if STATIC_SNAPSHOT_DIR is set)
+            from scripts.publish_static import publish_static_snapshots
+            publish_static_snapshots()
+
             logger.info("=" * 60)
             logger.info("SNAPSHOT COLLECTION - Complete ✓")
             logger.info("=" * 60)
@@ -114,7 +215,7 @@ class SnapshotCollector:
             logger.error(f"Fatal error during snapshot collection: {e}", exc_info=True)
             sys.exit(1)
 
-    def _refresh_schedules_if_needed(self, parks: List, schedule_repo: ScheduleRepository):
+    def _refresh_schedules_if_needed(self, parks: List, schedule_repo: ScheduleRepository) -> int:
         """
         Refresh park schedules from ThemeParks.wiki API if stale (>24 hours).
 
@@ -123,7 +224,11 @@ class SnapshotCollector:
         Args:
             parks: List of park objects
             schedule_repo: Schedule repository
+
+        Returns:
+            Number of parks whose schedule was refreshed
         """
+        schedules = self._get_schedule_source(schedule_repo)
         MAX_REFRESHES_PER_RUN = 5  # Limit API calls per collection run
 
         refresh_count = 0
@@ -139,7 +244,7 @@ class SnapshotCollector:
                 continue
 
             # Check if schedule needs refresh
-            if schedule_repo.has_recent_schedule(park_id, max_age_hours=24):
+            if schedules.has_recent_schedule(park_id, max_age_hours=24):
                 continue
 
             try:
@@ -150,85 +255,286 @@ class SnapshotCollector:
             except Exception as e:
                 logger.warning(f"Failed to refresh schedule for {park.name}: {e}")
 
-    def _process_park(self, park: Dict, park_activity_repo: ParkActivitySnapshotRepository,
+        return refresh_count
+
+    def _load_latest_snapshots(self, snapshot_repo: RideStatusSnapshotRepository):
+        """
+        Prefetch the latest snapshot of every ride.
+
+        Uses the persistent last-status cache when it is fresh, otherwise one
+        set-based query over ride_status_snapshots.
+
+        Args:
+            snapshot_repo: Ride status snapshot repository
+        """
+        if self.status_cache is not None:
+            self.latest_snapshots = self.status_cache.load()
+            if self.latest_snapshots is not None:
+                logger.info(f"Loaded last status for {len(self.latest_snapshots)} rides from {self.status_cache.path}")
+                return
+
+        self.latest_snapshots = snapshot_repo.get_latest_by_rides()
+        logger.info(f"Prefetched latest snapshot for {len(self.latest_snapshots)} rides")
+
+    def _get_previous_snapshot(self, ride_id: int,
+                               snapshot_repo: RideStatusSnapshotRepository) -> Optional[Dict[str, Any]]:
+        """
+        Get the last persisted snapshot for a ride.
+
+        Served from the prefetched map when available (a missing entry means
+        the ride has no history); otherwise falls back to a per-ride query.
+
+        Args:
+            ride_id: Database ride ID
+            snapshot_repo: Ride status snapshot repository
+
+        Returns:
+            Snapshot dict or None if the ride has no prior snapshot
+        """
+        if self.latest_snapshots is not None:
+            return self.latest_snapshots.get(ride_id)
+        return snapshot_repo.get_latest_by_ride(ride_id)
+
+    def _get_schedule_source(self, schedule_repo: ScheduleRepository):
+        """
+        Get the schedule source for open/closed checks.
+
+        Returns the cycle's ScheduleIndex when loaded, otherwise the repository
+        (both expose is_park_open_now() and has_recent_schedule()).
+
+        Args:
+            schedule_repo: Schedule repository
+
+        Returns:
+            ScheduleIndex or ScheduleRepository
+        """
+        return self.schedule_index if self.schedule_index is not None else schedule_repo
+
+    def _get_ride_map(self, ride_repo: RideRepository) -> RideIdentityMap:
+        """
+        Get the cycle's ride identity map.
+
+        Falls back to an empty (DB-backed, memoizing) map when run() has not
+        loaded one, e.g. when a single park is processed directly.
+
+        Args:
+            ride_repo: Ride repository
+
+        Returns:
+            RideIdentityMap for this cycle
+        """
+        if self.ride_map is None:
+            self.ride_map = RideIdentityMap(ride_repo)
+        return self.ride_map
+
+    def _fetch_all_parks(self, parks: List) -> Dict[int, ParkFetchResult]:
+        """
+        Fetch live data for all parks concurrently.
+
+        Network I/O only - no database access happens on worker threads.
+        Failures are captured per park and surfaced in the write stage.
+
+        Args:
+            parks: List of park objects
+
+        Returns:
+            Dict mapping park_id to its ParkFetchResult
+        """
+        results: Dict[int, ParkFetchResult] = {}
+        if not parks:
+            return results
+
+        start = time.monotonic()
+        workers = min(self.max_workers, len(parks))
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='park-fetch') as executor:
+            future_to_park = {executor.submit(self._fetch_park, park): park for park in parks}
+            for future in as_completed(future_to_park):
+                result = future.result()
+                results[result.park_id] = result
+
+        elapsed = time.monotonic() - start
+        slowest = max(results.values(), key=lambda r: r.elapsed_seconds)
+        failed = sum(1 for r in results.values() if r.error is not None)
+        self.stats['fetch_seconds'] = round(elapsed, 2)
+        logger.info(f"Fetched live data for {len(results)} parks in {elapsed:.1f}s "
+                    f"({workers} workers, {failed} failed, slowest park_id={slowest.park_id} "
+                    f"at {slowest.elapsed_seconds:.1f}s)")
+        return results
+
+    def _fetch_park(self, park) -> ParkFetchResult:
+        """
+        Fetch raw live data for a single park from its provider.
+
+        Runs on a worker thread; holds the provider's host semaphore for the
+        duration of the request (including tenacity retries).
+
+        Args:
+            park: Park record from database
+
+        Returns:
+            ParkFetchResult with data or the captured exception
+        """
+        themeparks_wiki_id = getattr(park, 'themeparks_wiki_id', None)
+        provider = PROVIDER_THEMEPARKS_WIKI if themeparks_wiki_id else PROVIDER_QUEUE_TIMES
+        result = ParkFetchResult(park_id=park.park_id, provider=provider)
+
+        start = time.monotonic()
+        try:
+            with self._host_semaphores[provider]:
+                if themeparks_wiki_id:
+                    result.data = self.themeparks_wiki_client.get_park_live_data(themeparks_wiki_id)
+                else:
+                    result.data = self.queue_times_client.get_park_wait_times(park.queue_times_id)
+        except Exception as e:
+            result.error = e
+        result.elapsed_seconds = time.monotonic() - start
+        return result
+
+    def _process_park(self, park: Dict, fetch_result: Optional[ParkFetchResult],
+                      park_activity_repo: ParkActivitySnapshotRepository,
                       ride_repo: RideRepository, snapshot_repo: RideStatusSnapshotRepository,
                       status_change_repo: RideStatusChangeRepository, schedule_repo: ScheduleRepository,
-                      data_quality_repo: DataQualityRepository):
+                      data_quality_repo: DataQualityRepository,
+                      snapshot_timestamp: Optional[datetime] = None):
         """
-        Process a single park: fetch wait times and store snapshots.
+        Process a single park: store snapshots from its prefetched wait times.
 
         Uses ThemeParks.wiki if park has themeparks_wiki_id, otherwise Queue-Times.com.
 
         Args:
             park: Park record from database
+            fetch_result: Prefetched provider payload from the fetch stage
             park_activity_repo: Park activity snapshot repository
             ride_repo: Ride repository
             snapshot_repo: Ride status snapshot repository
             status_change_repo: Ride status change repository
             schedule_repo: Schedule repository for checking park hours
             data_quality_repo: Data quality issue tracking repository
+            snapshot_timestamp: Synchronized timestamp for this collection cycle
         """
         park_id = park.park_id
         park_name = park.name
-        queue_times_id = park.queue_times_id
         themeparks_wiki_id = getattr(park, 'themeparks_wiki_id', None)
+        snapshot_timestamp = snapshot_timestamp or datetime.now()
 
         try:
             self.stats['parks_processed'] += 1
 
+            if fetch_result is None:
+                fetch_result = self._fetch_park(park)
+            if fetch_result.error is not None:
+                raise fetch_result.error
+
             # Route to appropriate provider
             if themeparks_wiki_id:
                 logger.info(f"Processing: {park_name} [ThemeParks.wiki]")
                 self.stats['parks_themeparks_wiki'] += 1
                 self._process_park_themeparks_wiki(
-                    park, themeparks_wiki_id, park_activity_repo,
+                    park, fetch_result.data, park_activity_repo,
                     ride_repo, snapshot_repo, status_change_repo, schedule_repo,
-                    data_quality_repo
+                    data_quality_repo, snapshot_timestamp
                 )
             else:
                 logger.info(f"Processing: {park_name} [Queue-Times]")
                 self.stats['parks_queue_times'] += 1
                 self._process_park_queue_times(
-                    park, queue_times_id, park_activity_repo,
-                    ride_repo, snapshot_repo, status_change_repo, schedule_repo
+                    park, fetch_result.data, park_activity_repo,
+                    ride_repo, snapshot_repo, status_change_repo, schedule_repo,
+                    snapshot_timestamp
                 )
 
         except Exception as e:
             logger.error(f"Error processing park {park_name}: {e}")
             self.stats['errors'] += 1
 
-    def _process_park_themeparks_wiki(self, park: Dict, wiki_id: str,
+        # Write the park's buffered ride snapshots and status changes
+        self._flush_ride_writes(snapshot_repo, status_change_repo)
+
+    def _flush_ride_writes(self, snapshot_repo: RideStatusSnapshotRepository,
+                           status_change_repo: RideStatusChangeRepository):
+        """
+        Write buffered ride snapshots and status changes with bulk INSERTs.
+
+        Args:
+            snapshot_repo: Ride status snapshot repository
+            status_change_repo: Ride status change repository
+        """
+        snapshots, self._pending_snapshots = self._pending_snapshots, []
+        changes, self._pending_status_changes = self._pending_status_changes, []
+
+        if snapshots:
+            try:
+                self.stats['snapshots_created'] += snapshot_repo.insert_many(snapshots)
+                if self.latest_snapshots is not None:
+                    for snapshot in snapshots:
+                        self.latest_snapshots[snapshot['ride_id']] = snapshot
+                for snapshot in snapshots:
+                    self._cycle_rides[snapshot['ride_id']] = {
+                        'status': snapshot['status'],
+                        'computed_is_open': snapshot['computed_is_open'],
+                        'wait_time': snapshot['wait_time'],
+                    }
+            except Exception as e:
+                logger.error(f"Failed to store {len(snapshots)} ride snapshots: {e}")
+                self.stats['errors'] += 1
+
+        if changes:
+            try:
+                self.stats['status_changes'] += status_change_repo.insert_many(changes)
+                for change in changes:
+                    self._cycle_status_changes[change['ride_id']] = change['changed_at']
+            except Exception as e:
+                logger.error(f"Failed to store {len(changes)} status changes: {e}")
+                self.stats['errors'] += 1
+
+    def _flush_park_activity(self, park_activity_repo: ParkActivitySnapshotRepository):
+        """
+        Write buffered park activity snapshots with a bulk INSERT.
+
+        Args:
+            park_activity_repo: Park activity snapshot repository
+        """
+        activities, self._pending_park_activity = self._pending_park_activity, []
+        if not activities:
+            return
+
+        try:
+            park_activity_repo.insert_many(activities)
+            for activity in activities:
+                self._cycle_parks[activity['park_id']] = {
+                    'park_appears_open': activity['park_appears_open'],
+                    'shame_score': activity['shame_score'],
+                }
+        except Exception as e:
+            logger.error(f"Failed to store {len(activities)} park activity snapshots: {e}")
+            self.stats['errors'] += 1
+
+    def _process_park_themeparks_wiki(self, park: Dict, live_data: List,
                                        park_activity_repo: ParkActivitySnapshotRepository,
                                        ride_repo: RideRepository,
                                        snapshot_repo: RideStatusSnapshotRepository,
                                        status_change_repo: RideStatusChangeRepository,
                                        schedule_repo: ScheduleRepository,
-                                       data_quality_repo: DataQualityRepository):
+                                       data_quality_repo: DataQualityRepository,
+                                       snapshot_timestamp: datetime):
         """
-        Process park using ThemeParks.wiki API.
+        Process park using ThemeParks.wiki live data.
 
         Args:
             park: Park record from database
-            wiki_id: ThemeParks.wiki entity UUID
+            live_data: LiveRideData list prefetched from ThemeParks.wiki
             park_activity_repo: Park activity snapshot repository
             ride_repo: Ride repository
             snapshot_repo: Ride status snapshot repository
             status_change_repo: Ride status change repository
             schedule_repo: Schedule repository for checking park hours
             data_quality_repo: Data quality issue tracking repository
+            snapshot_timestamp: Synchronized timestamp for this collection cycle
         """
         park_id = park.park_id
         park_name = park.name
 
-        # CRITICAL: Single timestamp for ALL snapshots in this collection cycle
-        # This ensures park_activity_snapshots and ride_status_snapshots have
-        # EXACTLY matching recorded_at values, enabling fast exact-match joins
-        # instead of slow DATE_FORMAT minute-level matching.
-        snapshot_timestamp = datetime.now()
-
-        # Fetch live data from ThemeParks.wiki
-        live_data = self.themeparks_wiki_client.get_park_live_data(wiki_id)
-
         if not live_data:
             logger.warning(f"  No ride data returned for {park_name}")
             return
@@ -241,8 +547,9 @@ class SnapshotCollector:
 
         # Use schedule-based park open detection (SINGLE SOURCE OF TRUTH)
         # If no schedule, park is CLOSED - we don't trust API status alone
-        park_appears_open = schedule_repo.is_park_open_now(park_id)
-        if not park_appears_open and not schedule_repo.has_recent_schedule(park_id, max_age_hours=48):
+        schedules = self._get_schedule_source(schedule_repo)
+        park_appears_open = schedules.is_park_open_now(park_id)
+        if not park_appears_open and not schedules.has_recent_schedule(park_id, max_age_hours=48):
             # No schedule data available - log warning but keep park as CLOSED
             # We can't trust API "OPERATING" status because some parks report
             # rides as OPERATING even when the park is closed for the season
@@ -262,8 +569,9 @@ class SnapshotCollector:
         down_ride_ids = []
         if down_entity_ids:
             # Look up database ride_ids from ThemeParks.wiki entity IDs
+            ride_map = self._get_ride_map(ride_repo)
             for entity_id in down_entity_ids:
-                ride = ride_repo.get_by_themeparks_wiki_id(entity_id)
+                ride = ride_map.get_by_themeparks_wiki_id(entity_id)
                 if ride:
                     down_ride_ids.append(ride.ride_id)
 
@@ -304,8 +612,8 @@ class SnapshotCollector:
             snapshot_timestamp: Synchronized timestamp for this collection cycle
         """
         try:
-            # Find ride in database by themeparks_wiki_id
-            ride = ride_repo.get_by_themeparks_wiki_id(ride_data.entity_id)
+            # Find ride by themeparks_wiki_id (identity map, DB fallback for new entities)
+            ride = self._get_ride_map(ride_repo).get_by_themeparks_wiki_id(ride_data.entity_id)
             if not ride:
                 # Try fuzzy match by name if not mapped yet
                 logger.debug(f"  Ride not mapped: {ride_data.name} [{ride_data.entity_id[:8]}...]")
@@ -360,7 +668,7 @@ class SnapshotCollector:
 
             # Retrieve previous snapshot BEFORE inserting the new one so change
             # detection compares against the prior persisted state.
-            previous_snapshot = snapshot_repo.get_latest_by_ride(ride_id)
+            previous_snapshot = self._get_previous_snapshot(ride_id, snapshot_repo)
 
             # Detect status change using rich status
             self._detect_status_change_rich(
@@ -383,7 +691,9 @@ class SnapshotCollector:
                                      snapshot_repo: RideStatusSnapshotRepository,
                                      snapshot_timestamp: datetime):
         """
-        Store ride status snapshot with rich status enum.
+        Buffer ride status snapshot with rich status enum.
+
+        Rows are written by _flush_ride_writes() once the park is processed.
 
         Args:
             ride_id: Database ride ID
@@ -409,8 +719,7 @@ class SnapshotCollector:
                 'last_updated_api': effective_last_updated
             }
 
-            snapshot_repo.insert(snapshot_record)
-            self.stats['snapshots_created'] += 1
+            self._pending_snapshots.append(snapshot_record)
 
         except Exception as e:
             logger.error(f"Failed to store snapshot for ride {ride_id}: {e}")
@@ -436,7 +745,7 @@ class SnapshotCollector:
 
             # Get previous status from cache or database
             if ride_id not in self.previous_statuses:
-                last_snapshot = previous_snapshot if previous_snapshot is not None else snapshot_repo.get_latest_by_ride(ride_id)
+                last_snapshot = previous_snapshot if previous_snapshot is not None else self._get_previous_snapshot(ride_id, snapshot_repo)
                 if last_snapshot:
                     prev_status = last_snapshot.get('status') or \
                                  ('OPERATING' if last_snapshot['computed_is_open'] else 'DOWN')
@@ -474,8 +783,7 @@ class SnapshotCollector:
                     'wait_time_at_change': None
                 }
 
-                status_change_repo.insert(change_record)
-                self.stats['status_changes'] += 1
+                self._pending_status_changes.append(change_record)
 
                 logger.info(f"  ⚠ Status change: {previous_status} → {current_status}")
 
@@ -488,37 +796,30 @@ class SnapshotCollector:
         except Exception as e:
             logger.error(f"Failed to detect status change for ride {ride_id}: {e}")
 
-    def _process_park_queue_times(self, park: Dict, queue_times_id: int,
+    def _process_park_queue_times(self, park: Dict, api_response: Optional[Dict],
                                    park_activity_repo: ParkActivitySnapshotRepository,
                                    ride_repo: RideRepository,
                                    snapshot_repo: RideStatusSnapshotRepository,
                                    status_change_repo: RideStatusChangeRepository,
-                                   schedule_repo: ScheduleRepository):
+                                   schedule_repo: ScheduleRepository,
+                                   snapshot_timestamp: datetime):
         """
-        Process park using Queue-Times.com API (legacy provider).
+        Process park using Queue-Times.com data (legacy provider).
 
         Args:
             park: Park record from database
-            queue_times_id: Queue-Times.com park ID
+            api_response: Wait times payload prefetched from Queue-Times API
             park_activity_repo: Park activity snapshot repository
             ride_repo: Ride repository
             snapshot_repo: Ride status snapshot repository
             status_change_repo: Ride status change repository
             schedule_repo: Schedule repository for checking park hours
+            snapshot_timestamp: Synchronized timestamp for this collection cycle
         """
         park_id = park.park_id
         park_name = park.name
 
-        # CRITICAL: Single timestamp for ALL snapshots in this collection cycle
-        # This ensures park_activity_snapshots and ride_status_snapshots have
-        # EXACTLY matching recorded_at values, enabling fast exact-match joins
-        # instead of slow DATE_FORMAT minute-level matching.
-        snapshot_timestamp = datetime.now()
-
         try:
-            # Fetch current wait times from Queue-Times API
-            api_response = self.queue_times_client.get_park_wait_times(queue_times_id)
-
             # Extract rides from nested lands structure (Disney/Universal parks use this)
             rides_data = []
             if api_response:
@@ -564,8 +865,9 @@ class SnapshotCollector:
 
             # Use schedule-based park open detection (SINGLE SOURCE OF TRUTH)
             # If no schedule, park is CLOSED - we don't trust API status alone
-            park_appears_open = schedule_repo.is_park_open_now(park_id)
-            if not park_appears_open and not schedule_repo.has_recent_schedule(park_id, max_age_hours=48):
+            schedules = self._get_schedule_source(schedule_repo)
+            park_appears_open = schedules.is_park_open_now(park_id)
+            if not park_appears_open and not schedules.has_recent_schedule(park_id, max_age_hours=48):
                 # No schedule data available - log warning but keep park as CLOSED
                 logger.warning(f"  No schedule data for {park_name} - treating as CLOSED")
                 park_appears_open = False
@@ -582,8 +884,9 @@ class SnapshotCollector:
             down_ride_ids = []
             if down_queue_times_ids:
                 # Look up database ride_ids from Queue-Times IDs
+                ride_map = self._get_ride_map(ride_repo)
                 for qt_id in down_queue_times_ids:
-                    ride = ride_repo.get_by_queue_times_id(qt_id)
+                    ride = ride_map.get_by_queue_times_id(qt_id)
                     if ride:
                         down_ride_ids.append(ride.ride_id)
 
@@ -612,7 +915,9 @@ class SnapshotCollector:
                              shame_score: Optional[float] = None,
                              snapshot_timestamp: Optional[datetime] = None):
         """
-        Store park activity snapshot with pre-calculated shame score.
+        Buffer park activity snapshot with pre-calculated shame score.
+
+        Rows are written by _flush_park_activity() at the end of the cycle.
 
         Args:
             park_id: Database park ID
@@ -641,7 +946,7 @@ class SnapshotCollector:
                 'shame_score': shame_score
             }
 
-            park_activity_repo.insert(activity_record)
+            self._pending_park_activity.append(activity_record)
 
         except Exception as e:
             logger.error(f"Failed to store park activity: {e}")
@@ -729,8 +1034,8 @@ class SnapshotCollector:
         try:
             queue_times_id = ride_data.get('id')
 
-            # Find ride in database
-            ride = ride_repo.get_by_queue_times_id(queue_times_id)
+            # Find ride (identity map, DB fallback for new entities)
+            ride = self._get_ride_map(ride_repo).get_by_queue_times_id(queue_times_id)
             if not ride:
                 logger.warning(f"  Ride ID {queue_times_id} not found in database (may need to run collect_parks)")
                 return
@@ -759,7 +1064,7 @@ class SnapshotCollector:
 
             # Look up the previous snapshot BEFORE inserting the new one so
             # change detection compares against the last persisted state.
-            previous_snapshot = snapshot_repo.get_latest_by_ride(ride_id)
+            previous_snapshot = self._get_previous_snapshot(ride_id, snapshot_repo)
 
             # Detect status change using the previous snapshot
             self._detect_status_change(
@@ -782,7 +1087,9 @@ class SnapshotCollector:
                        snapshot_repo: RideStatusSnapshotRepository,
                        snapshot_timestamp: Optional[datetime] = None):
         """
-        Store ride status snapshot.
+        Buffer ride status snapshot.
+
+        Rows are written by _flush_ride_writes() once the park is processed.
 
         Args:
             ride_id: Database ride ID
@@ -809,8 +1116,7 @@ class SnapshotCollector:
                 'last_updated_api': effective_last_updated
             }
 
-            snapshot_repo.insert(snapshot_record)
-            self.stats['snapshots_created'] += 1
+            self._pending_snapshots.append(snapshot_record)
 
         except Exception as e:
             logger.error(f"Failed to store snapshot for ride {ride_id}: {e}")
@@ -833,7 +1139,7 @@ class SnapshotCollector:
         try:
             # Get previous status from cache or database
             if ride_id not in self.previous_statuses:
-                last_snapshot = previous_snapshot if previous_snapshot is not None else snapshot_repo.get_latest_by_ride(ride_id)
+                last_snapshot = previous_snapshot if previous_snapshot is not None else self._get_previous_snapshot(ride_id, snapshot_repo)
                 if last_snapshot:
                     self.previous_statuses[ride_id] = {
                         'status': last_snapshot['computed_is_open'],
@@ -870,8 +1176,7 @@ class SnapshotCollector:
                     'wait_time_at_change': None  # Could be populated from current snapshot
                 }
 
-                status_change_repo.insert(change_record)
-                self.stats['status_changes'] += 1
+                self._pending_status_changes.append(change_record)
 
                 status_text = "OPEN → CLOSED" if not current_status else "CLOSED → OPEN"
                 logger.info(f"  ⚠ Status change detected for ride {ride_id}: {status_text}")
@@ -906,10 +1211,12 @@ class SnapshotCollector:
         """Print collection summary statistics."""
         logger.info("")
         logger.info(f"Parks processed:     {self.stats['parks_processed']}")
+        logger.info(f"Fetch stage:         {self.stats.get('fetch_seconds', 0)}s")
         logger.info(f"Rides processed:     {self.stats['rides_processed']}")
         logger.info(f"Snapshots created:   {self.stats['snapshots_created']}")
         logger.info(f"Status changes:      {self.stats['status_changes']}")
         logger.info(f"Last operated updates: {self.stats.get('last_operated_updates', 0)}")
+        logger.info(f"Ride lookup DB fallbacks: {self.ride_map.db_fallbacks if self.ride_map else 0}")
         logger.info(f"Schedules refreshed: {self.stats.get('schedules_refreshed', 0)}")
         logger.info(f"Stale data issues:   {self.stats.get('stale_data_issues', 0)}")
         logger.info(f"Errors:              {self.stats['errors']}")
@@ -919,19 +1226,30 @@ class SnapshotCollector:
         Pre-aggregate live rankings for instant API responses.
 
         Runs after snapshot collection to populate park_live_rankings
-        and ride_live_rankings tables. Uses atomic table swap for
-        zero-downtime updates.
+        and ride_live_rankings tables. The cycle's in-memory results are
+        applied incrementally; the aggregator falls back to its full rebuild
+        (atomic table swap) periodically or when no cycle was recorded.
         """
         try:
-            from scripts.aggregate_live_rankings import LiveRankingsAggregator
+            from scripts.aggregate_live_rankings import LiveRankingsAggregator, LiveCycleResult
+
+            cycle = None
+            if self._cycle_recorded_at is not None and self._cycle_parks:
+                cycle = LiveCycleResult(
+                    recorded_at=self._cycle_recorded_at,
+                    parks=self._cycle_parks,
+                    rides=self._cycle_rides,
+                    status_changes=self._cycle_status_changes
+                )
 
             logger.info("")
             logger.info("Pre-aggregating live rankings...")
             aggregator = LiveRankingsAggregator()
-            stats = aggregator.run()
+            stats = aggregator.run(cycle=cycle)
 
             self.stats['parks_aggregated'] = stats.get('parks_aggregated', 0)
             self.stats['rides_aggregated'] = stats.get('rides_aggregated', 0)
+            self.stats['live_rankings_mode'] = stats.get('mode')
 
         except Exception as e:
             logger.error(f"Failed to aggregate live rankings: {e}", exc_info=True)
@@ -944,6 +1262,7 @@ def main():
     """Main entry point."""
     collector = SnapshotCollector()
     collector.run()
+    report_job_stats(collector.stats)
 
 
 if __name__ == '__main__':
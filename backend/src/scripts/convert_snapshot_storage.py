@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Snapshot Storage Conversion
+===========================
+
+Switches ride_status_snapshots between full storage (one row per ride per
+collection cycle) and compact, change-only storage (database/snapshot_storage.py):
+
+    --to compact  Run-length encodes the stored snapshots into
+                  ride_status_intervals and replaces the table with a view
+                  that expands them back into snapshots.
+    --to full     Materializes the view back into the table.
+
+Snapshots whose park has no park activity row for their cycle cannot be
+compacted; --to compact aborts if there are any unless --allow-drop is given.
+
+Stop the collector cron job while converting, then set SNAPSHOT_STORAGE_MODE
+to the new mode before re-enabling it.
+
+Usage:
+    python -m scripts.convert_snapshot_storage --to compact
+    python -m scripts.convert_snapshot_storage --to compact --allow-drop
+    python -m scripts.convert_snapshot_storage --to full
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add src to path
+backend_src = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_src.absolute()))
+
+from database.connection import get_db_connection
+from database.snapshot_storage import (
+    STORAGE_COMPACT,
+    STORAGE_MODES,
+    convert_to_compact,
+    convert_to_full,
+    storage_mode,
+)
+from utils.config import SNAPSHOT_STORAGE_MODE, SNAPSHOT_WAIT_TIME_TOLERANCE
+from utils.logger import logger
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Convert ride snapshots between full and compact (change-only) storage'
+    )
+    parser.add_argument(
+        '--to',
+        required=True,
+        choices=STORAGE_MODES,
+        help='Target storage mode'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=int,
+        default=SNAPSHOT_WAIT_TIME_TOLERANCE,
+        help=f'Wait time tolerance in minutes when compacting (default: {SNAPSHOT_WAIT_TIME_TOLERANCE})'
+    )
+    parser.add_argument(
+        '--allow-drop',
+        action='store_true',
+        help='Compact even if snapshots without a park activity row for their cycle are deleted'
+    )
+    args = parser.parse_args()
+
+    with get_db_connection() as conn:
+        current = storage_mode(conn)
+        if current == args.to:
+            logger.info(f"Snapshot storage is already {current}")
+            return 0
+
+        if args.to == STORAGE_COMPACT:
+            stats = convert_to_compact(conn, tolerance=args.tolerance, allow_drop=args.allow_drop)
+            if stats['snapshots']:
+                logger.info(f"Compression: {stats['snapshots'] / max(stats['intervals'], 1):.1f} snapshots per interval")
+            if stats['skipped']:
+                logger.warning(f"{stats['skipped']:,} snapshots had no park activity row for their cycle and were dropped")
+        else:
+            convert_to_full(conn)
+
+    if SNAPSHOT_STORAGE_MODE != args.to:
+        logger.warning(f"Set SNAPSHOT_STORAGE_MODE={args.to} before the next collection run "
+                       f"(currently {SNAPSHOT_STORAGE_MODE})")
+    return 0
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main())
+    except Exception as e:
+        logger.error(f"Snapshot storage conversion failed: {e}", exc_info=True)
+        sys.exit(1)
@@ -10,6 +10,8 @@ This wrapper:
 - Sends immediate alert email on non-zero exit
 - Logs to structured JSON format
 - Includes last 50 lines of output in alert
+- Records duration, exit code and the job's reported row counts as its
+  last run in the cron state file (CRON_STATE_FILE, read by /api/metrics)
 
 Usage:
     python -m src.scripts.cron_wrapper <script_name> --timeout=<seconds>
@@ -36,6 +38,7 @@ import os
 import socket
 import subprocess
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -43,6 +46,7 @@ from typing import Optional
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from utils.cron_state import JOB_STATS_ENV, read_job_stats, record_job_run
 from utils.email_utils import send_alert_email
 
 
@@ -87,6 +91,17 @@ class CronJobWrapper:
         self.start_time = datetime.now(timezone.utc)
         logger.info(f"Starting cron job: {self.script_name} (timeout: {self.timeout}s)")
 
+        # The job reports its row counts here (utils.cron_state.report_job_stats)
+        stats_fd, stats_path = tempfile.mkstemp(prefix=f"{self.script_name}-", suffix=".json")
+        os.close(stats_fd)
+        try:
+            return self._run(stats_path)
+        finally:
+            self._record_run(stats_path)
+            os.unlink(stats_path)
+
+    def _run(self, stats_path: str) -> int:
+        """Run the script and handle failures."""
         try:
             # Execute the script as a Python module
             result = subprocess.run(
@@ -94,7 +109,8 @@ class CronJobWrapper:
                 capture_output=True,
                 text=True,
                 timeout=self.timeout,
-                cwd=Path(__file__).parent.parent.parent  # backend directory
+                cwd=Path(__file__).parent.parent.parent,  # backend directory
+                env={**os.environ, JOB_STATS_ENV: stats_path}
             )
 
             self.exit_code = result.returncode
@@ -129,6 +145,20 @@ class CronJobWrapper:
             self._send_failure_alert()
             return self.exit_code
 
+    def _record_run(self, stats_path: str):
+        """Record this run in the cron state file (never raises)."""
+        end_time = self.end_time or datetime.now(timezone.utc)
+        try:
+            record_job_run(
+                self.script_name,
+                exit_code=self.exit_code if self.exit_code is not None else 1,
+                duration_seconds=(end_time - self.start_time).total_seconds(),
+                finished_at=end_time.timestamp(),
+                rows=read_job_stats(stats_path)
+            )
+        except Exception as e:
+            logger.error(f"Failed to record cron job state: {e}")
+
     def _log_success(self):
         """Log successful execution."""
         duration = (self.end_time - self.start_time).total_seconds()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Snapshot Partition Maintenance
+==============================
+
+Keeps the daily partitions of ride_status_snapshots and
+park_activity_snapshots (database/partitioning.py) rolling:
+
+- Pre-creates partitions for the next SNAPSHOT_PARTITION_DAYS_AHEAD days so
+  the collector never writes into the p_future catch-all.
+- Drops partitions whose whole day is older than the safe deletion
+  threshold (latest successful daily aggregation, or 48 hours if none) -
+  the same threshold scripts/cleanup_raw_data.py uses for row deletes.
+
+With SNAPSHOT_ARCHIVE_DIR set, ride snapshots and status changes older than
+the threshold are appended to the columnar archive (database/snapshot_archive.py)
+before any partition is dropped - this job runs before cleanup_raw_data, so
+the dropped days would otherwise never reach the archive. If archiving fails
+nothing is dropped. The archive resumes from where it stopped, so the later
+cleanup run only adds the rows of the partial day.
+
+Run daily via cron (after aggregate_daily):
+    python -m src.scripts.cron_wrapper maintain_partitions --timeout=600
+
+Manual:
+    python -m scripts.maintain_partitions --dry-run
+"""
+
+import argparse
+import sys
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict
+
+# Add src to path
+backend_src = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_src.absolute()))
+
+from sqlalchemy import text
+
+from database.connection import get_db_connection
+from database.partitioning import PARTITIONED_TABLES, SnapshotPartitionManager
+from database.snapshot_archive import SnapshotArchive, SnapshotArchiver
+from database.snapshot_storage import SNAPSHOTS_TABLE, STORAGE_COMPACT, storage_mode
+from utils.config import SNAPSHOT_ARCHIVE_DIR, SNAPSHOT_PARTITION_DAYS_AHEAD
+from utils.cron_state import report_job_stats
+from utils.logger import logger
+
+# Keep this much raw data if no daily aggregation has succeeded yet
+FALLBACK_RETENTION_HOURS = 48
+
+
+def get_safe_deletion_threshold(conn) -> datetime:
+    """
+    Snapshots older than this are covered by a successful daily aggregation.
+
+    Returns:
+        UTC timestamp
+    """
+    safe_threshold = conn.execute(text("""
+        SELECT MAX(aggregated_until_ts) AS safe_threshold
+        FROM aggregation_log
+        WHERE aggregation_type = 'daily'
+            AND status = 'success'
+    """)).scalar()
+    if safe_threshold:
+        return safe_threshold
+    threshold = datetime.utcnow() - timedelta(hours=FALLBACK_RETENTION_HOURS)
+    logger.warning(f"No successful aggregation found - using {FALLBACK_RETENTION_HOURS}-hour safety buffer: {threshold}")
+    return threshold
+
+
+def run_maintenance(
+    conn,
+    threshold: datetime,
+    today: date,
+    days_ahead: int,
+    dry_run: bool = False,
+    archive_dir: str = SNAPSHOT_ARCHIVE_DIR
+) -> Dict[str, Dict[str, int]]:
+    """
+    Archive expired raw data, then pre-create and drop partitions.
+
+    Args:
+        conn: Database connection
+        threshold: Rows older than this may be removed
+        today: Current UTC day
+        days_ahead: Future days to pre-create
+        dry_run: Report what would change without altering tables or the archive
+        archive_dir: Archive ride data here before dropping it (empty = no archive)
+
+    Returns:
+        Table -> {created, dropped, rows_dropped}
+    """
+    if archive_dir and not dry_run:
+        SnapshotArchiver(conn, SnapshotArchive(archive_dir)).archive_before(threshold)
+
+    tables = PARTITIONED_TABLES
+    if storage_mode(conn) == STORAGE_COMPACT:
+        # ride_status_snapshots is a view over ride_status_intervals
+        tables = tuple(table for table in tables if table != SNAPSHOTS_TABLE)
+
+    return SnapshotPartitionManager(conn).maintain(
+        threshold, today, days_ahead, dry_run=dry_run, tables=tables
+    )
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Pre-create and drop daily snapshot partitions'
+    )
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='Report what would change without altering tables'
+    )
+    parser.add_argument(
+        '--days-ahead',
+        type=int,
+        default=SNAPSHOT_PARTITION_DAYS_AHEAD,
+        help=f'Future days to pre-create (default: {SNAPSHOT_PARTITION_DAYS_AHEAD})'
+    )
+    args = parser.parse_args()
+
+    with get_db_connection() as conn:
+        threshold = get_safe_deletion_threshold(conn)
+        today = datetime.utcnow().date()
+        logger.info(f"Maintaining snapshot partitions (drop before {threshold}, create through "
+                    f"{today + timedelta(days=args.days_ahead)}){' - DRY RUN' if args.dry_run else ''}")
+
+        stats = run_maintenance(conn, threshold, today, args.days_ahead, dry_run=args.dry_run)
+
+    totals = {"partitions_created": 0, "partitions_dropped": 0, "rows_dropped": 0}
+    for table, table_stats in stats.items():
+        logger.info(
+            f"{table}: {table_stats['created']} created, {table_stats['dropped']} dropped "
+            f"({table_stats['rows_dropped']:,} rows)"
+        )
+        totals["partitions_created"] += table_stats['created']
+        totals["partitions_dropped"] += table_stats['dropped']
+        totals["rows_dropped"] += table_stats['rows_dropped']
+    report_job_stats(totals)
+
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        logger.error(f"Partition maintenance failed: {e}", exc_info=True)
+        sys.exit(1)
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Static Snapshot Publisher
+=========================
+
+Renders the page-load API responses (the warm_cache.py endpoint list plus
+the search index) in-process and publishes them as static JSON files that
+Apache serves without touching Flask or MySQL.
+
+Run after collect_snapshots / aggregate_daily (both call it automatically
+when STATIC_SNAPSHOT_DIR is set):
+    python -m scripts.publish_static
+
+How:
+    - Each endpoint is rendered by its Flask route handler through the test
+      client (no network), against a private in-memory query cache, so the
+      files are byte-identical to fresh API responses.
+    - Files go into a new version directory, releases/<version>/, followed
+      by manifest.json. The "current" symlink is then swapped atomically,
+      so readers see either the previous set or the new one, never a mix.
+    - With STATIC_SNAPSHOT_PRECOMPRESS, each file also gets a .json.gz (and
+      a .json.br when the brotli package is installed) for Apache to serve
+      to clients that accept them.
+    - Only the last STATIC_SNAPSHOT_KEEP versions are kept.
+
+Layout (STATIC_SNAPSHOT_DIR=/opt/themeparkhallofshame/static-api):
+    current -> releases/20260101T120000Z-1234
+    releases/20260101T120000Z-1234/manifest.json
+    releases/20260101T120000Z-1234/parks/downtime/filter=all-parks,limit=50,period=live.json
+
+The file name for an endpoint is its path plus its query parameters sorted
+by name and joined with commas ("default" when there are none); the
+frontend api-client.js builds the same name. Endpoints that fail to render
+are left out, and the frontend falls back to the API for them. It also
+falls back once the manifest's generated_at is older than
+STATIC_MAX_AGE_SECONDS (config.js), i.e. when publishing has stopped.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+# Add src to path
+backend_src = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_src.absolute()))
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from scripts.warm_cache import ENDPOINTS as WARM_ENDPOINTS
+from utils.cache import QueryCache, set_query_cache
+from utils.config import STATIC_SNAPSHOT_DIR, STATIC_SNAPSHOT_KEEP, STATIC_SNAPSHOT_PRECOMPRESS
+from utils.logger import logger
+
+# Page-load requests to publish
+PUBLISHED_ENDPOINTS = WARM_ENDPOINTS + [
+    "/api/search/index",
+]
+
+# Concurrent renders (each runs its own queries)
+RENDER_WORKERS = 4
+
+API_PREFIX = "/api"
+
+
+def static_path(endpoint: str) -> str:
+    """
+    Relative file path for an endpoint's static snapshot.
+
+    Example:
+        >>> static_path("/api/parks/downtime?period=live&filter=all-parks&limit=50")
+        'parks/downtime/filter=all-parks,limit=50,period=live.json'
+    """
+    parts = urlsplit(endpoint)
+    path = parts.path[len(API_PREFIX):] if parts.path.startswith(API_PREFIX) else parts.path
+    params = sorted(parse_qsl(parts.query))
+    name = ",".join(f"{key}={value}" for key, value in params) or "default"
+    return f"{path.strip('/')}/{name}.json"
+
+
+class StaticSnapshotPublisher:
+    """Renders API responses in-process and publishes them as a static version."""
+
+    def __init__(
+        self,
+        root_dir: str,
+        endpoints: Optional[List[str]] = None,
+        keep: int = STATIC_SNAPSHOT_KEEP,
+        precompress: bool = STATIC_SNAPSHOT_PRECOMPRESS,
+        workers: int = RENDER_WORKERS
+    ):
+        """
+        Initialize publisher.
+
+        Args:
+            root_dir: Directory holding releases/ and the current symlink
+            endpoints: API endpoints to publish (default: PUBLISHED_ENDPOINTS)
+            keep: Number of versions to keep (at least 1)
+            precompress: Also write gzip (and brotli, if available) copies
+            workers: Concurrent renders
+        """
+        self.root = Path(root_dir)
+        self.endpoints = endpoints if endpoints is not None else PUBLISHED_ENDPOINTS
+        self.keep = max(1, keep)
+        self.precompress = precompress
+        self.workers = workers
+        self.stats = {
+            'published': 0,
+            'failed': 0,
+            'bytes': 0,
+            'pruned': 0,
+        }
+
+    def run(self) -> Dict:
+        """
+        Render all endpoints and publish them as the current version.
+
+        Returns:
+            Stats dict (published, failed, bytes, pruned, version, seconds)
+        """
+        start = time.time()
+        version = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{os.getpid()}"
+        release_dir = self.root / "releases" / version
+
+        rendered = self._render_all()
+        if not rendered:
+            # Keep serving the previous version rather than an empty one
+            logger.warning("No static snapshots rendered, keeping the current version")
+            return self.stats
+
+        files = {}
+        for endpoint, body in rendered:
+            relative = static_path(endpoint)
+            self._write_file(release_dir / relative, body)
+            files[relative] = endpoint
+            self.stats['published'] += 1
+            self.stats['bytes'] += len(body)
+
+        manifest = {
+            "version": version,
+            "generated_at": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z'),
+            "files": files,
+        }
+        self._write_file(release_dir / "manifest.json", json.dumps(manifest, sort_keys=True).encode('utf-8'))
+
+        self._activate(version)
+        self.stats['pruned'] = self._prune(version)
+        self.stats['version'] = version
+        self.stats['seconds'] = round(time.time() - start, 2)
+
+        logger.info(
+            f"Published {self.stats['published']} static snapshots "
+            f"({self.stats['failed']} failed, {self.stats['bytes']} bytes) as {version}"
+        )
+        return self.stats
+
+    def _render_all(self) -> List[Tuple[str, bytes]]:
+        """Render every endpoint against a private, empty query cache."""
+        from api.app import create_app
+
+        app = create_app()
+        previous = set_query_cache(QueryCache(ttl_seconds=300))
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(executor.map(lambda ep: self._render(app, ep), self.endpoints))
+        finally:
+            set_query_cache(previous)
+        self.stats['failed'] = sum(1 for _, body in results if body is None)
+        return [(endpoint, body) for endpoint, body in results if body is not None]
+
+    def _render(self, app, endpoint: str) -> Tuple[str, Optional[bytes]]:
+        """Render one endpoint through its route handler (None = failed)."""
+        try:
+            with app.test_client() as client:
+                response = client.get(endpoint)
+            if response.status_code == 200:
+                return endpoint, response.get_data()
+            logger.warning(f"Static snapshot skipped for {endpoint}: HTTP {response.status_code}")
+        except Exception as e:
+            logger.warning(f"Static snapshot skipped for {endpoint}: {e}")
+        return endpoint, None
+
+    def _write_file(self, path: Path, body: bytes):
+        """Write a file and, if enabled, its pre-compressed copies."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(body)
+        if self.precompress:
+            path.with_name(path.name + ".gz").write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+            if brotli is not None:
+                path.with_name(path.name + ".br").write_bytes(brotli.compress(body))
+
+    def _activate(self, version: str):
+        """Point the current symlink at a version (atomic rename over the old link)."""
+        link = self.root / "current"
+        tmp_link = self.root / f".current-{os.getpid()}"
+        if tmp_link.is_symlink():
+            tmp_link.unlink()
+        tmp_link.symlink_to(Path("releases") / version)
+        os.replace(tmp_link, link)
+
+    def _prune(self, current_version: str) -> int:
+        """Delete all but the newest `keep` versions (never the current one)."""
+        releases = sorted(
+            (p for p in (self.root / "releases").iterdir() if p.is_dir()),
+            key=lambda p: p.name,
+            reverse=True
+        )
+        pruned = 0
+        for old in releases[self.keep:]:
+            if old.name == current_version:
+                continue
+            shutil.rmtree(old, ignore_errors=True)
+            pruned += 1
+        return pruned
+
+
+def publish_static_snapshots() -> Optional[Dict]:
+    """
+    Publish static snapshots if STATIC_SNAPSHOT_DIR is configured.
+
+    Called at the end of collect_snapshots and aggregate_daily.
+    Failures are logged, never raised: the API keeps serving regardless.
+
+    Returns:
+        Publisher stats, or None if disabled or failed
+    """
+    if not STATIC_SNAPSHOT_DIR:
+        return None
+    try:
+        return StaticSnapshotPublisher(STATIC_SNAPSHOT_DIR).run()
+    except Exception as e:
+        logger.error(f"Failed to publish static snapshots: {e}", exc_info=True)
+        return None
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(
+        description='Publish page-load API responses as static JSON files'
+    )
+    parser.add_argument(
+        '--dir',
+        type=str,
+        default=STATIC_SNAPSHOT_DIR,
+        help='Output directory (default: STATIC_SNAPSHOT_DIR)'
+    )
+
+    args = parser.parse_args()
+    if not args.dir:
+        logger.error("No output directory: set STATIC_SNAPSHOT_DIR or pass --dir")
+        sys.exit(1)
+
+    stats = StaticSnapshotPublisher(args.dir).run()
+    if stats['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,6 +14,8 @@ Usage:
     python -m scripts.recompute_daily_stats --days 90
     python -m scripts.recompute_daily_stats --start-date 2025-12-01 --dry-run
     python -m scripts.recompute_daily_stats --start-date 2025-12-01 --metrics-version 2
+    python -m scripts.recompute_daily_stats --days 90 --workers 8
+    python -m scripts.recompute_daily_stats --start-date 2025-06-01 --source archive
 
 Options:
     --start-date    Start date for recomputation (YYYY-MM-DD)
@@ -22,6 +24,20 @@ Options:
     --metrics-version   Version number for side-by-side comparison (default: 1)
     --dry-run       Preview changes without writing to database
     --force         Continue on errors instead of stopping
+    --workers       Worker processes, one date per unit (default: AGGREGATION_WORKERS)
+    --no-resume     Ignore checkpoints and recompute every chunk
+    --chunk-size    Rides per checkpointed chunk (default: 250)
+    --source        database (raw snapshot tables) or archive (columnar
+                    archive written by cleanup_raw_data, for dates whose raw
+                    rows were already deleted)
+    --archive-dir   Archive directory (default: SNAPSHOT_ARCHIVE_DIR)
+
+Checkpointing:
+    Each (date, metrics_version, ride chunk) unit - plus the per-date park
+    rollup - commits together with a success row in aggregation_log
+    (unit_key 'recompute:v<N>:rides:<first>-<last>' / 'recompute:v<N>:parks').
+    A rerun over the same range skips completed units, so an interrupted
+    backfill resumes where it stopped.
 
 Feature 003-orm-refactoring, Task T034-T037
 """
@@ -31,7 +47,7 @@ import argparse
 import time
 from pathlib import Path
 from datetime import datetime, timedelta, date
-from typing import Optional, Generator
+from typing import Optional, Generator, Dict, List, Set
 
 # Add src to path
 backend_src = Path(__file__).parent.parent
@@ -40,17 +56,29 @@ sys.path.insert(0, str(backend_src.absolute()))
 from utils.logger import logger
 from utils.timezone import get_today_pacific, get_pacific_day_range_utc
 from utils.metrics import SNAPSHOT_INTERVAL_MINUTES
+from utils.config import AGGREGATION_WORKERS, SNAPSHOT_ARCHIVE_DIR
+from database.snapshot_archive import SnapshotArchive
 from database.repositories.park_repository import ParkRepository
 from database.repositories.ride_repository import RideRepository
+from database.repositories.aggregation_repository import AggregationLogRepository
 from database.connection import get_db_session
+from processor.aggregation_scheduler import (
+    AggregationScheduler, AggregationUnitsFailed, UnitResult, WorkUnit
+)
 from sqlalchemy import select, func, case, and_
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 
 from models import (
-    Ride, RideStatusSnapshot, ParkActivitySnapshot,
+    AggregationType, Ride, RideStatusSnapshot, ParkActivitySnapshot,
     RideDailyStats, ParkDailyStats, RideStatusChange, RideClassification
 )
 
+# Rides per checkpointed chunk; a killed run redoes at most one chunk per worker
+RECOMPUTE_CHUNK_SIZE = 250
+
+# Minimum seconds between progress lines (in addition to every 10 days)
+PROGRESS_INTERVAL_SECONDS = 60
+
 
 def date_range(start: date, end: date) -> Generator[date, None, None]:
     """
@@ -79,6 +107,8 @@ class DailyStatsRecomputer:
     - Dry-run mode for previewing changes
     - Progress tracking with estimated completion time
     - Idempotent UPSERT (safe to run multiple times)
+    - Optional process-pool parallelism (one date per work unit)
+    - Resumable: (date, metrics_version, ride chunk) checkpoints in aggregation_log
     """
 
     def __init__(
@@ -87,7 +117,11 @@ class DailyStatsRecomputer:
         end_date: date,
         metrics_version: int = 1,
         dry_run: bool = False,
-        force: bool = False
+        force: bool = False,
+        workers: int = 1,
+        resume: bool = True,
+        chunk_size: int = RECOMPUTE_CHUNK_SIZE,
+        archive_dir: Optional[str] = None
     ):
         """
         Initialize the recomputer.
@@ -98,16 +132,31 @@ class DailyStatsRecomputer:
             metrics_version: Version number for metrics comparison
             dry_run: If True, preview changes without writing
             force: If True, continue on errors
+            workers: Worker processes; >1 recomputes dates in parallel,
+                     each date in its own process and transaction
+            resume: If True, skip chunks checkpointed by earlier runs
+            chunk_size: Rides per checkpointed chunk
+            archive_dir: Read ride snapshots and status changes from this
+                         columnar archive instead of the raw tables
         """
         self.start_date = start_date
         self.end_date = end_date
         self.metrics_version = metrics_version
         self.dry_run = dry_run
         self.force = force
+        self.workers = workers
+        self.resume = resume
+        self.chunk_size = max(1, chunk_size)
+        self.archive_dir = archive_dir
+        self.archive = SnapshotArchive(archive_dir) if archive_dir else None
+        self._last_progress_at = time.time()
 
         self.stats = {
             'days_processed': 0,
             'days_total': (end_date - start_date).days + 1,
+            'days_skipped': 0,
+            'chunks_processed': 0,
+            'chunks_skipped': 0,
             'rides_processed': 0,
             'parks_processed': 0,
             'errors': 0,
@@ -125,33 +174,42 @@ class DailyStatsRecomputer:
         logger.info(f"Total days: {self.stats['days_total']}")
         logger.info(f"Metrics version: {self.metrics_version}")
         logger.info(f"Dry run: {self.dry_run}")
+        logger.info(f"Workers: {self.workers}")
+        logger.info(f"Resume from checkpoints: {self.resume}")
+        logger.info(f"Source: {'archive ' + self.archive_dir if self.archive else 'database'}")
         logger.info("=" * 60)
 
         if self.dry_run:
             logger.info("*** DRY RUN MODE - No changes will be written ***")
 
         try:
+            completed_units = self._load_checkpoints()
+
+            if self.workers > 1 and self.stats['days_total'] > 1:
+                self._run_parallel(completed_units)
+                self._print_summary()
+                return
+
             with get_db_session() as session:
                 ride_repo = RideRepository(session)
                 park_repo = ParkRepository(session)
 
-                # Process each date
+                # Process each date (each chunk commits with its checkpoint)
                 for current_date in date_range(self.start_date, self.end_date):
                     try:
-                        self._process_date(session, current_date, ride_repo, park_repo)
-                        self.stats['days_processed'] += 1
-
-                        # Progress update every 10 days
-                        if self.stats['days_processed'] % 10 == 0:
-                            self._print_progress()
+                        did_work = self._process_date(
+                            session, current_date, ride_repo, park_repo,
+                            completed_units.get(current_date, set())
+                        )
+                        self._record_day(did_work)
 
                     except Exception as e:
                         logger.error(f"Error processing {current_date}: {e}")
                         self.stats['errors'] += 1
+                        session.rollback()
                         if not self.force:
                             raise
 
-                # Commit all changes (unless dry run)
                 if not self.dry_run:
                     session.commit()
                     logger.info("Changes committed to database")
@@ -165,50 +223,208 @@ class DailyStatsRecomputer:
             logger.error(f"Fatal error: {e}", exc_info=True)
             sys.exit(1)
 
-    def _process_date(self, session, target_date: date, ride_repo: RideRepository, park_repo: ParkRepository):
+    def _load_checkpoints(self) -> Dict[date, Set[str]]:
+        """
+        Load chunk units completed by earlier runs of this metrics_version.
+
+        Returns:
+            Dictionary mapping date to completed unit keys (empty if not resuming)
+        """
+        if not self.resume:
+            return {}
+
+        with get_db_session() as session:
+            completed = AggregationLogRepository(session).get_completed_unit_keys(
+                self.start_date, self.end_date, self._unit_key_prefix()
+            )
+
+        if completed:
+            chunk_count = sum(len(keys) for keys in completed.values())
+            logger.info(f"Resuming: {chunk_count} completed chunks across {len(completed)} days will be skipped")
+        return completed
+
+    def _unit_key_prefix(self) -> str:
+        return f"recompute:v{self.metrics_version}:"
+
+    def _run_parallel(self, completed_units: Dict[date, Set[str]]):
+        """
+        Recompute dates on AggregationScheduler worker processes.
+
+        Each date runs in its own process, checkpointing chunk by chunk, and
+        gets its own aggregation_log unit entry (skipped in dry-run) so failed
+        dates can be retried alone. Unlike the sequential path, all dates run
+        before failures are raised.
+        """
+        units = [
+            WorkUnit(
+                aggregation_date=current_date,
+                aggregation_type=AggregationType.DAILY,
+                unit_key=f"recompute:{current_date}:v{self.metrics_version}",
+                params={
+                    'target_date': current_date,
+                    'metrics_version': self.metrics_version,
+                    'dry_run': self.dry_run,
+                    'force': self.force,
+                    'chunk_size': self.chunk_size,
+                    'archive_dir': self.archive_dir,
+                    'completed_units': sorted(completed_units.get(current_date, set()))
+                }
+            )
+            for current_date in date_range(self.start_date, self.end_date)
+        ]
+
+        scheduler = AggregationScheduler(
+            recompute_date_unit,
+            max_workers=self.workers,
+            log_units=not self.dry_run,
+            on_result=self._on_unit_result
+        )
+        results = scheduler.run(units)
+
+        failed = [r for r in results if not r.succeeded]
+        if failed and not self.force:
+            raise AggregationUnitsFailed(failed)
+
+    def _on_unit_result(self, result: UnitResult):
+        """Fold a finished date unit into the run totals."""
+        if not result.succeeded:
+            logger.error(f"Error processing {result.unit.aggregation_date}: {result.error}")
+            self.stats['errors'] += 1
+            return
+
+        for key in ('rides_processed', 'parks_processed', 'errors', 'chunks_processed', 'chunks_skipped'):
+            self.stats[key] += result.result.get(key, 0)
+        self._record_day(result.result.get('did_work', True))
+
+    def _record_day(self, did_work: bool):
+        """Count a finished date and report progress periodically."""
+        self.stats['days_processed'] += 1
+        if not did_work:
+            self.stats['days_skipped'] += 1
+
+        now = time.time()
+        if (self.stats['days_processed'] % 10 == 0
+                or now - self._last_progress_at >= PROGRESS_INTERVAL_SECONDS):
+            self._print_progress()
+            self._last_progress_at = now
+
+    def _process_date(
+        self,
+        session,
+        target_date: date,
+        ride_repo: RideRepository,
+        park_repo: ParkRepository,
+        completed_units: Optional[Set[str]] = None
+    ) -> bool:
         """
-        Process a single date.
+        Process a single date in checkpointed chunks.
+
+        Rides are recomputed in chunks of chunk_size (ordered by ride_id),
+        then parks roll up the ride stats. Each chunk commits together with
+        its checkpoint entry; chunks already in completed_units are skipped.
+        Parks are recomputed whenever any ride chunk was.
 
         Args:
             session: Database session
             target_date: Date to process
             ride_repo: Ride repository
             park_repo: Park repository
+            completed_units: Unit keys already completed for this date
+
+        Returns:
+            True if any chunk was recomputed, False if the date was fully checkpointed
         """
+        completed_units = completed_units or set()
         logger.info(f"Processing {target_date}...")
 
         # Calculate UTC range for the Pacific date
         day_start_utc, day_end_utc = get_pacific_day_range_utc(target_date)
 
-        # Get all active rides
-        rides = ride_repo.get_all_active()
+        # Get all active rides in stable chunk order
+        rides = sorted(ride_repo.get_all_active(), key=lambda ride: ride.ride_id)
         rides_this_date = 0
-
-        for ride in rides:
-            try:
-                if self._recompute_ride(session, ride, target_date, day_start_utc, day_end_utc):
-                    rides_this_date += 1
-                    self.stats['rides_processed'] += 1
-            except Exception as e:
-                logger.error(f"Error recomputing ride {ride.name}: {e}")
-                self.stats['errors'] += 1
-                if not self.force:
-                    raise
+        did_work = False
+
+        for offset in range(0, len(rides), self.chunk_size):
+            chunk = rides[offset:offset + self.chunk_size]
+            unit_key = f"{self._unit_key_prefix()}rides:{chunk[0].ride_id}-{chunk[-1].ride_id}"
+            if unit_key in completed_units:
+                self.stats['chunks_skipped'] += 1
+                continue
+
+            chunk_rides = 0
+            chunk_errors = 0
+            for ride in chunk:
+                try:
+                    if self._recompute_ride(session, ride, target_date, day_start_utc, day_end_utc):
+                        chunk_rides += 1
+                        self.stats['rides_processed'] += 1
+                except Exception as e:
+                    logger.error(f"Error recomputing ride {ride.name}: {e}")
+                    self.stats['errors'] += 1
+                    chunk_errors += 1
+                    if not self.force:
+                        raise
+
+            rides_this_date += chunk_rides
+            did_work = True
+            self._checkpoint(session, target_date, unit_key, chunk_errors == 0, rides_processed=chunk_rides)
+
+        parks_key = f"{self._unit_key_prefix()}parks"
+        if not did_work and parks_key in completed_units:
+            self.stats['chunks_skipped'] += 1
+            logger.info(f"  ✓ {target_date} already completed (checkpoint)")
+            return False
 
         # Get all active parks
         parks = park_repo.get_all_active()
+        parks_this_date = 0
+        park_errors = 0
 
         for park in parks:
             try:
                 if self._recompute_park(session, park, target_date):
+                    parks_this_date += 1
                     self.stats['parks_processed'] += 1
             except Exception as e:
                 logger.error(f"Error recomputing park {park.name}: {e}")
                 self.stats['errors'] += 1
+                park_errors += 1
                 if not self.force:
                     raise
 
+        self._checkpoint(session, target_date, parks_key, park_errors == 0, parks_processed=parks_this_date)
+
         logger.info(f"  ✓ {rides_this_date} rides aggregated for {target_date}")
+        return True
+
+    def _checkpoint(
+        self,
+        session,
+        target_date: date,
+        unit_key: str,
+        clean: bool,
+        parks_processed: int = 0,
+        rides_processed: int = 0
+    ):
+        """
+        Commit a finished chunk, recording it as completed if it had no errors.
+
+        Chunks with (forced-through) errors are committed but not
+        checkpointed, so the next run retries them. Dry runs never commit.
+        """
+        self.stats['chunks_processed'] += 1
+        if self.dry_run:
+            return
+
+        if clean:
+            AggregationLogRepository(session).record_completed_unit(
+                target_date,
+                unit_key,
+                parks_processed=parks_processed,
+                rides_processed=rides_processed
+            )
+        session.commit()
 
     def _recompute_ride(self, session, ride, target_date: date, day_start_utc: datetime, day_end_utc: datetime) -> bool:
         """
@@ -218,6 +434,59 @@ class DailyStatsRecomputer:
         """
         ride_id = ride.ride_id
 
+        if self.archive is not None:
+            result = self.archive.ride_daily_stats(
+                ride.park_id, ride_id, day_start_utc, day_end_utc, SNAPSHOT_INTERVAL_MINUTES
+            )
+        else:
+            result = self._query_ride_stats(session, ride_id, day_start_utc, day_end_utc)
+
+        if result is None:
+            return False
+
+        if self.dry_run:
+            logger.debug(f"  Would upsert ride {ride.name}: uptime={result.uptime_percentage}%, downtime={result.downtime_minutes}min")
+            return True
+
+        # UPSERT (idempotent)
+        stmt = mysql_insert(RideDailyStats).values(
+            ride_id=ride_id,
+            stat_date=target_date,
+            uptime_minutes=int(result.uptime_minutes or 0),
+            downtime_minutes=int(result.downtime_minutes or 0),
+            uptime_percentage=float(result.uptime_percentage or 0),
+            operating_hours_minutes=int(result.operating_hours_minutes or 0),
+            avg_wait_time=float(result.avg_wait_time) if result.avg_wait_time is not None else None,
+            min_wait_time=result.min_wait_time,
+            max_wait_time=result.max_wait_time,
+            peak_wait_time=result.peak_wait_time,
+            status_changes=int(result.status_changes or 0),
+            longest_downtime_minutes=result.longest_downtime,
+            created_at=datetime.now()
+        )
+
+        stmt = stmt.on_duplicate_key_update(
+            uptime_minutes=stmt.inserted.uptime_minutes,
+            downtime_minutes=stmt.inserted.downtime_minutes,
+            uptime_percentage=stmt.inserted.uptime_percentage,
+            operating_hours_minutes=stmt.inserted.operating_hours_minutes,
+            avg_wait_time=stmt.inserted.avg_wait_time,
+            min_wait_time=stmt.inserted.min_wait_time,
+            max_wait_time=stmt.inserted.max_wait_time,
+            peak_wait_time=stmt.inserted.peak_wait_time,
+            status_changes=stmt.inserted.status_changes,
+            longest_downtime_minutes=stmt.inserted.longest_downtime_minutes
+        )
+
+        session.execute(stmt)
+        return True
+
+    def _query_ride_stats(self, session, ride_id: int, day_start_utc: datetime, day_end_utc: datetime):
+        """
+        Daily statistics for a ride from the raw snapshot tables.
+
+        Returns the aggregate row, or None if the ride has no snapshots in the range.
+        """
         # Build the aggregation query (same logic as aggregate_daily.py)
         rss = RideStatusSnapshot.__table__.alias('rss')
         r = Ride.__table__.alias('r')
@@ -238,7 +507,7 @@ class DailyStatsRecomputer:
 
         snapshot_count = session.execute(check_query).scalar()
         if not snapshot_count:
-            return False
+            return None
 
         # Calculate if ride operated (for downtime filter)
         ride_operated = func.sum(
@@ -415,47 +684,7 @@ class DailyStatsRecomputer:
             )
         )
 
-        result = session.execute(agg_query).first()
-
-        if result is None:
-            return False
-
-        if self.dry_run:
-            logger.debug(f"  Would upsert ride {ride.name}: uptime={result.uptime_percentage}%, downtime={result.downtime_minutes}min")
-            return True
-
-        # UPSERT (idempotent)
-        stmt = mysql_insert(RideDailyStats).values(
-            ride_id=ride_id,
-            stat_date=target_date,
-            uptime_minutes=int(result.uptime_minutes or 0),
-            downtime_minutes=int(result.downtime_minutes or 0),
-            uptime_percentage=float(result.uptime_percentage or 0),
-            operating_hours_minutes=int(result.operating_hours_minutes or 0),
-            avg_wait_time=float(result.avg_wait_time) if result.avg_wait_time is not None else None,
-            min_wait_time=result.min_wait_time,
-            max_wait_time=result.max_wait_time,
-            peak_wait_time=result.peak_wait_time,
-            status_changes=int(result.status_changes or 0),
-            longest_downtime_minutes=result.longest_downtime,
-            created_at=datetime.now()
-        )
-
-        stmt = stmt.on_duplicate_key_update(
-            uptime_minutes=stmt.inserted.uptime_minutes,
-            downtime_minutes=stmt.inserted.downtime_minutes,
-            uptime_percentage=stmt.inserted.uptime_percentage,
-            operating_hours_minutes=stmt.inserted.operating_hours_minutes,
-            avg_wait_time=stmt.inserted.avg_wait_time,
-            min_wait_time=stmt.inserted.min_wait_time,
-            max_wait_time=stmt.inserted.max_wait_time,
-            peak_wait_time=stmt.inserted.peak_wait_time,
-            status_changes=stmt.inserted.status_changes,
-            longest_downtime_minutes=stmt.inserted.longest_downtime_minutes
-        )
-
-        session.execute(stmt)
-        return True
+        return session.execute(agg_query).first()
 
     def _recompute_park(self, session, park, target_date: date) -> bool:
         """
@@ -610,20 +839,31 @@ class DailyStatsRecomputer:
         return True
 
     def _print_progress(self):
-        """Print progress with estimated time remaining."""
-        elapsed = time.time() - self.stats['start_time']
+        """
+        Print progress with throughput and estimated time remaining.
+
+        Days resumed from checkpoints finish instantly, so throughput and ETA
+        are based only on days that were actually recomputed.
+        """
+        elapsed = max(time.time() - self.stats['start_time'], 1e-6)
         days_done = self.stats['days_processed']
         days_total = self.stats['days_total']
+        days_computed = days_done - self.stats['days_skipped']
         pct = (days_done / days_total) * 100
 
-        if days_done > 0:
-            avg_time_per_day = elapsed / days_done
-            remaining = (days_total - days_done) * avg_time_per_day
+        rides_per_sec = self.stats['rides_processed'] / elapsed
+        days_per_hour = days_computed / elapsed * 3600
+
+        if days_computed > 0:
+            remaining = (days_total - days_done) * (elapsed / days_computed)
             eta = timedelta(seconds=int(remaining))
         else:
             eta = "unknown"
 
-        logger.info(f"Progress: {days_done}/{days_total} days ({pct:.1f}%) - ETA: {eta}")
+        logger.info(
+            f"Progress: {days_done}/{days_total} days ({pct:.1f}%, {self.stats['days_skipped']} resumed) - "
+            f"{rides_per_sec:.1f} rides/s, {days_per_hour:.1f} days/h - ETA: {eta}"
+        )
 
     def _print_summary(self):
         """Print final summary."""
@@ -635,6 +875,8 @@ class DailyStatsRecomputer:
         logger.info("=" * 60)
         logger.info(f"Date range: {self.start_date} to {self.end_date}")
         logger.info(f"Days processed: {self.stats['days_processed']}/{self.stats['days_total']}")
+        logger.info(f"Days resumed from checkpoint: {self.stats['days_skipped']}")
+        logger.info(f"Chunks processed: {self.stats['chunks_processed']} (skipped: {self.stats['chunks_skipped']})")
         logger.info(f"Rides processed: {self.stats['rides_processed']}")
         logger.info(f"Parks processed: {self.stats['parks_processed']}")
         logger.info(f"Errors: {self.stats['errors']}")
@@ -643,12 +885,57 @@ class DailyStatsRecomputer:
         logger.info("=" * 60)
 
         # Extrapolate to 90 days
-        if self.stats['days_processed'] > 0:
-            time_per_day = elapsed / self.stats['days_processed']
+        days_computed = self.stats['days_processed'] - self.stats['days_skipped']
+        if days_computed > 0:
+            logger.info(f"Throughput: {self.stats['rides_processed'] / max(elapsed, 1e-6):.1f} rides/s")
+            time_per_day = elapsed / days_computed
             extrapolated_90 = time_per_day * 90
             logger.info(f"Extrapolated 90-day time: {timedelta(seconds=int(extrapolated_90))}")
 
 
+def recompute_date_unit(
+    target_date: date,
+    metrics_version: int,
+    dry_run: bool,
+    force: bool,
+    chunk_size: int = RECOMPUTE_CHUNK_SIZE,
+    completed_units: Optional[List[str]] = None,
+    archive_dir: Optional[str] = None
+) -> Dict[str, int]:
+    """
+    Scheduler work unit: recompute one date in its own session.
+
+    Module-level so it can be pickled to AggregationScheduler worker processes.
+
+    Returns:
+        Counters for the date (rides/parks/chunks processed, errors, did_work)
+    """
+    recomputer = DailyStatsRecomputer(
+        start_date=target_date,
+        end_date=target_date,
+        metrics_version=metrics_version,
+        dry_run=dry_run,
+        force=force,
+        chunk_size=chunk_size,
+        archive_dir=archive_dir
+    )
+
+    with get_db_session() as session:
+        did_work = recomputer._process_date(
+            session, target_date, RideRepository(session), ParkRepository(session),
+            set(completed_units or [])
+        )
+        if dry_run:
+            session.rollback()
+
+    counters = {
+        key: recomputer.stats[key]
+        for key in ('rides_processed', 'parks_processed', 'errors', 'chunks_processed', 'chunks_skipped')
+    }
+    counters['did_work'] = did_work
+    return counters
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -660,6 +947,9 @@ Examples:
   %(prog)s --start-date 2025-12-01      # Recompute from Dec 1 to yesterday
   %(prog)s --start-date 2025-12-01 --end-date 2025-12-10  # Specific range
   %(prog)s --start-date 2025-12-01 --dry-run  # Preview without changes
+  %(prog)s --days 90 --workers 8        # Recompute 90 days on 8 processes
+  %(prog)s --days 90 --no-resume        # Ignore checkpoints from earlier runs
+  %(prog)s --start-date 2025-06-01 --source archive  # Dates already cleaned up
         """
     )
 
@@ -695,9 +985,42 @@ Examples:
         action='store_true',
         help='Continue on errors instead of stopping'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=AGGREGATION_WORKERS,
+        help=f'Worker processes, one date per unit (default: AGGREGATION_WORKERS={AGGREGATION_WORKERS})'
+    )
+    parser.add_argument(
+        '--no-resume',
+        action='store_true',
+        help='Recompute every chunk, ignoring checkpoints from earlier runs'
+    )
+    parser.add_argument(
+        '--chunk-size',
+        type=int,
+        default=RECOMPUTE_CHUNK_SIZE,
+        help=f'Rides per checkpointed chunk (default: {RECOMPUTE_CHUNK_SIZE})'
+    )
+    parser.add_argument(
+        '--source',
+        choices=['database', 'archive'],
+        default='database',
+        help='Read raw snapshots from the database tables or the columnar archive (default: database)'
+    )
+    parser.add_argument(
+        '--archive-dir',
+        type=str,
+        default=SNAPSHOT_ARCHIVE_DIR,
+        help='Snapshot archive directory for --source archive (default: SNAPSHOT_ARCHIVE_DIR)'
+    )
 
     args = parser.parse_args()
 
+    if args.source == 'archive' and not args.archive_dir:
+        logger.error("--source archive needs --archive-dir or SNAPSHOT_ARCHIVE_DIR")
+        sys.exit(1)
+
     # Determine date range
     yesterday = get_today_pacific() - timedelta(days=1)
 
@@ -729,7 +1052,11 @@ Examples:
         end_date=end_date,
         metrics_version=args.metrics_version,
         dry_run=args.dry_run,
-        force=args.force
+        force=args.force,
+        workers=args.workers,
+        resume=not args.no_resume,
+        chunk_size=args.chunk_size,
+        archive_dir=args.archive_dir if args.source == 'archive' else None
     )
     recomputer.run()
 
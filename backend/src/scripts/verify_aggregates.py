@@ -13,6 +13,7 @@ Usage:
     python -m scripts.verify_aggregates --date 2025-12-17 --full
     python -m scripts.verify_aggregates --backfill --days 7
     python -m scripts.verify_aggregates --yesterday
+    python -m scripts.verify_aggregates --date 2025-06-01 --archive-dir /opt/themeparkhallofshame/archive
 
 Options:
     --date YYYY-MM-DD    Specific date to verify (Pacific timezone)
@@ -24,6 +25,8 @@ Options:
     --full               Run full audit (daily + hourly + special checks)
     --verbose            Show detailed mismatch information
     --json               Output results as JSON
+    --archive-dir DIR    Recalculate ride daily stats from the columnar snapshot
+                         archive (for dates already removed by cleanup_raw_data)
 
 Special Checks (included in --hourly and --full):
     - Disney/Universal DOWN status: Verifies DOWN status is counted correctly
@@ -50,6 +53,7 @@ from utils.logger import logger
 from utils.timezone import get_today_pacific
 from database.connection import get_db_connection
 from database.audit import AggregateVerifier, AuditSummary
+from database.snapshot_archive import SnapshotArchive
 
 
 def verify_date(
@@ -57,7 +61,8 @@ def verify_date(
     table: Optional[str] = None,
     hourly: bool = False,
     full: bool = False,
-    verbose: bool = False
+    verbose: bool = False,
+    archive_dir: Optional[str] = None
 ) -> AuditSummary:
     """
     Verify aggregations for a specific date.
@@ -68,6 +73,7 @@ def verify_date(
         hourly: Run hourly verification only
         full: Run full audit (daily + hourly + special checks)
         verbose: Show detailed output
+        archive_dir: Snapshot archive to recalculate ride daily stats from
 
     Returns:
         AuditSummary with verification results
@@ -75,7 +81,8 @@ def verify_date(
     from datetime import datetime
 
     with get_db_connection() as conn:
-        verifier = AggregateVerifier(conn)
+        archive = SnapshotArchive(archive_dir) if archive_dir else None
+        verifier = AggregateVerifier(conn, archive=archive)
 
         if full:
             # Run complete verification (daily + hourly + special checks)
@@ -169,6 +176,11 @@ def main():
         action='store_true',
         help='Output results as JSON'
     )
+    parser.add_argument(
+        '--archive-dir',
+        type=str,
+        help='Recalculate ride daily stats from this snapshot archive instead of the raw tables'
+    )
 
     args = parser.parse_args()
 
@@ -204,7 +216,8 @@ def main():
             table=args.table,
             hourly=args.hourly,
             full=args.full,
-            verbose=args.verbose
+            verbose=args.verbose,
+            archive_dir=args.archive_dir
         )
         all_summaries.append(summary)
         total_critical += summary.critical_failures
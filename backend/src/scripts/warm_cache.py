@@ -3,24 +3,46 @@
 Cache Warming Script
 ====================
 
-Warms the API cache by hitting all main endpoints after data collection.
-This ensures users always get fast cached responses.
+Warms the API cache after data collection so users always get fast
+cached responses.
 
 Run after collect_snapshots completes:
     python -m scripts.warm_cache
+    python -m scripts.warm_cache --all --top 20   # every combination, 20 slowest
+
+Modes:
+    inprocess  Renders endpoints through the route handlers in this process
+               (api.cache_warming.warm), with bounded DB concurrency. Entries
+               land in the configured cache backend, so this is the default
+               when QUERY_CACHE_BACKEND is shared (sqlite): one run warms
+               every gunicorn worker.
+    http       Requests each URL from the running API over HTTP. Default for
+               the per-worker memory backend, where only the worker that
+               answers a request gets the entry.
+
+By default the page-load ENDPOINTS below are warmed; --all warms every
+combination registered by the route modules (all periods, filters and
+sort orders). In-process runs print the compute time of each cache key.
 
 Should complete in ~20 seconds on cold cache, <1 second on warm cache.
 """
 
+import argparse
 import sys
 import time
 import urllib.request
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+# Add src to path
+backend_src = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_src.absolute()))
 
 # API base URL (internal, bypasses HTTPS)
 BASE_URL = "http://127.0.0.1:5001"
 
-# Endpoints to warm - these are the main page load requests
+# Default endpoints to warm - the main page load requests (also published as
+# static snapshots by scripts/publish_static.py)
 ENDPOINTS = [
     # LIVE period (default view on page load)
     "/api/parks/downtime?period=live&filter=all-parks&limit=50",
@@ -59,14 +81,14 @@ ENDPOINTS = [
 ]
 
 
-def warm_endpoint(endpoint: str) -> tuple[str, float, bool]:
+def warm_endpoint(endpoint: str, base_url: str = BASE_URL) -> tuple[str, float, bool]:
     """
-    Hit an endpoint to warm its cache.
+    Hit an endpoint over HTTP to warm its cache.
 
     Returns:
         (endpoint, duration_seconds, success)
     """
-    url = f"{BASE_URL}{endpoint}"
+    url = f"{base_url}{endpoint}"
     start = time.time()
     success = False
 
@@ -83,29 +105,100 @@ def warm_endpoint(endpoint: str) -> tuple[str, float, bool]:
     return (endpoint, duration, success)
 
 
-def main():
-    """Warm all cached endpoints."""
-    print(f"Warming {len(ENDPOINTS)} endpoints...")
-    start_time = time.time()
-
-    # Use thread pool for concurrent requests (4 threads = 4 workers)
+def warm_http(endpoints: list[str], base_url: str, concurrency: int) -> bool:
+    """Warm endpoints over HTTP. Returns True if all succeeded."""
     results = []
-    with ThreadPoolExecutor(max_workers=4) as executor:
-        futures = {executor.submit(warm_endpoint, ep): ep for ep in ENDPOINTS}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(warm_endpoint, ep, base_url): ep for ep in endpoints}
         for future in as_completed(futures):
             endpoint, duration, success = future.result()
             status = "OK" if success else "FAIL"
             print(f"  [{status}] {endpoint[:50]:50} {duration:.2f}s")
             results.append((endpoint, duration, success))
 
-    total_time = time.time() - start_time
     success_count = sum(1 for _, _, s in results if s)
+    print(f"  Endpoints: {success_count}/{len(endpoints)} succeeded")
+    return success_count == len(endpoints)
+
+
+def warm_inprocess(endpoints: list[str], concurrency: int, top: int) -> bool:
+    """Warm endpoints in-process and report the slowest cache keys. Returns True if all succeeded."""
+    from api.cache_warming import warm
+
+    results = warm(endpoints, concurrency=concurrency)
+    failed = [r for r in results if not r.ok]
+    for r in failed:
+        print(f"  [FAIL] {r.url} {r.error or f'HTTP {r.status}'}", file=sys.stderr)
+
+    timings = sorted(
+        ((key, seconds, r.url) for r in results for key, seconds in r.computed),
+        key=lambda t: t[1],
+        reverse=True
+    )
+    hits = sum(1 for r in results if r.ok and not r.computed)
+    print(f"  Endpoints: {len(results) - len(failed)}/{len(results)} succeeded "
+          f"({len(timings)} keys computed, {hits} already cached)")
+    if timings:
+        print("  Slowest cache keys (compute seconds):")
+        for key, seconds, url in timings[:top]:
+            print(f"    {seconds:7.2f}s  {key:32} {url}")
+    return not failed
+
+
+def main():
+    """Warm cached endpoints."""
+    from utils.config import QUERY_CACHE_BACKEND, WARM_CACHE_CONCURRENCY
+
+    parser = argparse.ArgumentParser(description='Warm the API query cache')
+    parser.add_argument(
+        '--mode',
+        choices=['inprocess', 'http'],
+        default='http' if QUERY_CACHE_BACKEND == 'memory' else 'inprocess',
+        help='Render in this process (shared cache backends) or request over HTTP '
+             '(default: inprocess unless QUERY_CACHE_BACKEND=memory)'
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Warm every registered parameter combination, not just page-load endpoints'
+    )
+    parser.add_argument(
+        '--base-url',
+        default=BASE_URL,
+        help=f'API base URL for http mode (default: {BASE_URL})'
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=WARM_CACHE_CONCURRENCY,
+        help=f'Parallel requests / DB queries (default: {WARM_CACHE_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=10,
+        help='Number of slowest cache keys to report in inprocess mode (default: 10)'
+    )
+    args = parser.parse_args()
+
+    if args.all:
+        from api.cache_warming import warm_targets
+        endpoints = warm_targets()
+    else:
+        endpoints = ENDPOINTS
+
+    print(f"Warming {len(endpoints)} endpoints ({args.mode})...")
+    start_time = time.time()
+
+    if args.mode == 'inprocess':
+        success = warm_inprocess(endpoints, args.concurrency, args.top)
+    else:
+        success = warm_http(endpoints, args.base_url, args.concurrency)
 
     print("\nCache warming complete:")
-    print(f"  Endpoints: {success_count}/{len(ENDPOINTS)} succeeded")
-    print(f"  Total time: {total_time:.2f}s")
+    print(f"  Total time: {time.time() - start_time:.2f}s")
 
-    if success_count < len(ENDPOINTS):
+    if not success:
         sys.exit(1)
 
 
@@ -2,12 +2,14 @@
 Query Result Cache with TTL
 ===========================
 
-A simple, thread-safe in-memory cache for query results.
+A bounded, thread-safe in-memory cache for query results.
 
 Features:
 - Configurable TTL (default 5 minutes)
 - Thread-safe operations
-- Automatic expiration
+- Automatic expiration, with an amortized sweep of expired entries
+- LRU eviction bounded by entry count and approximate byte size
+- Request coalescing: concurrent misses for a key share one computation
 - Key generation from query parameters
 
 Usage:
@@ -25,96 +27,422 @@ Performance Impact:
     - First request: Executes query, caches result
     - Subsequent requests (within TTL): Returns cached result instantly
     - After TTL: Recomputes and caches new result
+    - Concurrent requests during a recompute wait for it instead of each
+      running the same query (single-flight)
+
+Backends:
+    QueryCache keeps entries in process memory, so each gunicorn worker has
+    its own copy. SharedQueryCache (utils/shared_cache.py) keeps them in a
+    SQLite file shared by every worker on the host, with the same interface.
+
+Memory:
+    Every distinct query string (period/filter/limit/sort combination, or
+    one key per ride/park details page) creates an entry. The cache keeps
+    at most max_entries entries and max_bytes of estimated payload, so
+    per-worker memory stays flat however many distinct URLs are requested.
 """
 
+import sys
 import time
 import hashlib
-from typing import Any, Callable, Optional, TypeVar
-from threading import Lock
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, TypeVar
+from datetime import datetime, timezone
+from threading import Event, Lock, Thread, local
+
+from utils.config import (
+    QUERY_CACHE_MAX_ENTRIES,
+    QUERY_CACHE_MAX_BYTES,
+    QUERY_CACHE_COMPUTE_TIMEOUT_SECONDS,
+    QUERY_CACHE_STALE_SECONDS,
+    QUERY_CACHE_BACKEND,
+    QUERY_CACHE_PATH,
+)
+from utils.logger import logger
 
 T = TypeVar('T')
 
+# Per-thread warming and lookup-recording state (see warming(), record_lookups())
+_thread_state = local()
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate the in-memory size of a cached value in bytes.
+
+    Walks dicts, lists, tuples, sets and __slots__ objects (the shapes
+    route handlers cache) and sums sys.getsizeof of every object reached. Shared objects are
+    counted once. This is an estimate for eviction, not an exact figure.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Estimated size in bytes
+    """
+    seen: set[int] = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(type(obj), '__slots__'):
+            stack.extend(getattr(obj, name) for name in type(obj).__slots__ if hasattr(obj, name))
+    return total
+
+
+class _CacheEntry:
+    """
+    A cached value with the time it was stored, its estimated size, its own
+    TTL and the data epoch it was computed at.
+    """
+
+    __slots__ = ('value', 'stored_at', 'size', 'ttl', 'epoch', 'last_used')
+
+    def __init__(
+        self,
+        value: Any,
+        stored_at: float,
+        size: int,
+        ttl: float,
+        epoch: Optional[str] = None,
+        last_used: Optional[float] = None
+    ):
+        self.value = value
+        self.stored_at = stored_at
+        self.size = size
+        self.ttl = ttl
+        self.epoch = epoch
+        self.last_used = last_used
+
+    def is_fresh(self, now: float, epoch: Optional[str] = None) -> bool:
+        """Within TTL and, if the caller knows the current epoch, computed at it."""
+        return now - self.stored_at < self.ttl and (epoch is None or epoch == self.epoch)
+
+
+class _Flight:
+    """An in-progress computation that other callers can wait on."""
+
+    __slots__ = ('done', 'result', 'stored_at', 'error')
+
+    def __init__(self):
+        self.done = Event()
+        self.result: Any = None
+        self.stored_at: float = 0.0
+        self.error: Optional[BaseException] = None
+
+
+@contextmanager
+def warming() -> Iterator[list[tuple[str, float]]]:
+    """
+    Warm the cache from the current thread.
+
+    Inside the block, get_or_compute never serves stale entries: an expired
+    entry is recomputed in the calling thread, not in a background refresh
+    that a short-lived warming process might not wait for. Every value
+    computed by this thread is recorded as (cache key, compute seconds).
+
+    Usage:
+        with warming() as timings:
+            handler()
+        for key, seconds in timings: ...
+    """
+    timings: list[tuple[str, float]] = []
+    previous = getattr(_thread_state, 'timings', None)
+    _thread_state.timings = timings
+    try:
+        yield timings
+    finally:
+        _thread_state.timings = previous
+
+
+def record_lookups() -> list[str]:
+    """
+    Start recording the outcome of every cache lookup made by this thread.
+
+    Outcomes are 'hit', 'stale' (served stale while refreshing) and 'miss'.
+    Used by the request timing middleware; recording continues until
+    stop_recording_lookups() and replaces any previous recording.
+
+    Returns:
+        The list that outcomes are appended to
+    """
+    _thread_state.lookups = []
+    return _thread_state.lookups
+
+
+def stop_recording_lookups() -> None:
+    """Stop recording cache lookups for this thread."""
+    _thread_state.lookups = None
+
+
+def _record_lookup(outcome: str) -> None:
+    lookups = getattr(_thread_state, 'lookups', None)
+    if lookups is not None:
+        lookups.append(outcome)
+
 
 class QueryCache:
     """
-    Thread-safe in-memory cache with configurable TTL.
+    Thread-safe in-memory LRU cache with configurable TTL.
+
+    Entries are fresh for ttl_seconds (the soft TTL; callers may pass a
+    per-entry ttl). With a stale window configured they stay servable for
+    stale_ttl_seconds longer (the hard TTL is the sum):
+    get_or_compute(serve_stale=True) returns such a value immediately and
+    refreshes it in one background thread.
+
+    Callers that know the current data epoch (see utils.data_epoch) pass
+    it with each lookup. An entry computed at an older epoch is treated as
+    expired, however young it is, so responses refresh exactly when new
+    data lands rather than on a blind timer.
 
     Attributes:
-        _cache: Dictionary storing (value, timestamp) tuples
+        _cache: OrderedDict of key -> _CacheEntry, least recently used first
         _lock: Threading lock for thread safety
-        _ttl: Time-to-live in seconds
+        _ttl: Time-to-live (soft TTL) in seconds
+        _stale_ttl: Extra seconds an expired entry may be served stale
+        _max_entries: Maximum number of entries (0 = unbounded)
+        _max_bytes: Maximum estimated payload size in bytes (0 = unbounded)
+        _bytes: Current estimated payload size in bytes
+        _inflight: Keys currently being computed by get_or_compute
+        _compute_timeout: Seconds a waiting caller waits before computing itself
     """
 
-    def __init__(self, ttl_seconds: int = 300):
+    def __init__(
+        self,
+        ttl_seconds: int = 300,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        sweep_interval_seconds: Optional[float] = None,
+        compute_timeout_seconds: Optional[float] = None,
+        stale_ttl_seconds: int = 0
+    ):
         """
-        Initialize cache with TTL.
+        Initialize cache with TTL and size bounds.
 
         Args:
             ttl_seconds: Time-to-live for cached entries (default 5 minutes)
+            max_entries: Maximum number of entries before LRU eviction (0 = unbounded)
+            max_bytes: Maximum estimated size in bytes before LRU eviction (0 = unbounded)
+            sweep_interval_seconds: Minimum time between sweeps of expired
+                entries, run from set() (default: ttl_seconds)
+            compute_timeout_seconds: How long get_or_compute waits on another
+                caller's computation of the same key before computing the
+                value itself (None = wait indefinitely)
+            stale_ttl_seconds: How long after ttl_seconds an entry may still be
+                served stale while it is refreshed (0 = never serve stale)
         """
-        self._cache: dict[str, tuple[Any, float]] = {}
+        self._cache: OrderedDict[str, _CacheEntry] = OrderedDict()
         self._lock = Lock()
         self._ttl = ttl_seconds
-
-    def get(self, key: str) -> Optional[Any]:
+        self._stale_ttl = stale_ttl_seconds
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._sweep_interval = ttl_seconds if sweep_interval_seconds is None else sweep_interval_seconds
+        self._last_sweep = time.time()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._oversized = 0
+        self._inflight: dict[str, _Flight] = {}
+        self._compute_timeout = compute_timeout_seconds
+        self._coalesced = 0
+        self._coalesce_timeouts = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+
+    def _is_gone(self, entry: _CacheEntry, now: float) -> bool:
+        """Past its hard TTL (entry TTL plus stale window)."""
+        return now - entry.stored_at >= entry.ttl + self._stale_ttl
+
+    def get(self, key: str, epoch: Optional[str] = None) -> Optional[Any]:
         """
         Get cached value if valid.
 
+        A hit marks the entry as most recently used; an entry past its hard
+        TTL is removed on access. Stale values are never returned here.
+
         Args:
             key: Cache key
+            epoch: Current data epoch; entries from another epoch are misses
 
         Returns:
             Cached value if valid, None otherwise
         """
         with self._lock:
-            if key in self._cache:
-                value, timestamp = self._cache[key]
-                if time.time() - timestamp < self._ttl:
-                    return value
+            entry = self._lookup(key)
+            if entry is not None:
+                now = time.time()
+                if entry.is_fresh(now, epoch):
+                    self._touch(key, entry, now)
+                    self._hits += 1
+                    _record_lookup('hit')
+                    return entry.value
+                if self._is_gone(entry, now):
+                    self._remove(key)
+                    self._expirations += 1
+            self._misses += 1
+        _record_lookup('miss')
         return None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, epoch: Optional[str] = None, ttl: Optional[float] = None) -> None:
         """
         Store value in cache.
 
+        Sweeps expired entries if the sweep interval has passed, then evicts
+        least recently used entries until the cache is within its bounds.
+        A value larger than max_bytes on its own is not cached.
+
         Args:
             key: Cache key
             value: Value to cache
+            epoch: Data epoch the value was computed at
+            ttl: TTL for this entry in seconds (default: the cache TTL)
         """
-        with self._lock:
-            self._cache[key] = (value, time.time())
-
-    def get_or_compute(self, key: str, compute_fn: Callable[[], T]) -> T:
+        self._store(key, value, time.time(), epoch, ttl)
+
+    def get_or_compute(
+        self,
+        key: str,
+        compute_fn: Callable[[], T],
+        timeout: Optional[float] = None,
+        serve_stale: bool = False,
+        epoch: Optional[str] = None,
+        ttl: Optional[float] = None
+    ) -> T:
         """
-        Get cached value or compute and cache new value.
+        Get cached value or compute and cache new value (single-flight).
 
         Thread-safe implementation:
         1. Check cache under lock
         2. If valid cached value exists, return it
-        3. Otherwise, release lock, compute value
-        4. Re-acquire lock, cache and return value
-
-        This approach prevents blocking during expensive computations.
+        3. If serve_stale and the value is within its stale window, return
+           it immediately and start one background refresh for the key
+        4. Otherwise, the first caller for the key registers an in-flight
+           computation and runs compute_fn outside the lock
+        5. Concurrent callers for the same key wait for that computation
+           and receive its result (or its exception) instead of running
+           compute_fn again
+        6. A waiter that is still waiting after the timeout computes the
+           value itself, so one stuck query cannot block every request
+
+        Other keys are never blocked by a computation in progress.
+        A None result is returned but not cached.
 
         Args:
             key: Cache key
             compute_fn: Function to compute value if not cached
+            timeout: Seconds to wait on another caller's computation
+                (default: the cache's compute_timeout_seconds)
+            serve_stale: Return an expired value within the stale window
+                while it is refreshed in the background
+            epoch: Current data epoch; an entry computed at another epoch
+                is expired (and may be served stale while refreshing)
+            ttl: TTL for a newly computed entry (default: the cache TTL)
 
         Returns:
             Cached or computed value
         """
-        # Check cache first
-        cached = self.get(key)
-        if cached is not None:
-            return cached
-
-        # Compute value outside lock to avoid blocking other threads
-        result = compute_fn()
+        value, _ = self.get_or_compute_with_timestamp(key, compute_fn, timeout, serve_stale, epoch, ttl)
+        return value
+
+    def get_or_compute_with_timestamp(
+        self,
+        key: str,
+        compute_fn: Callable[[], T],
+        timeout: Optional[float] = None,
+        serve_stale: bool = False,
+        epoch: Optional[str] = None,
+        ttl: Optional[float] = None
+    ) -> tuple[T, float]:
+        """
+        Same as get_or_compute, also returning when the value was computed.
 
-        # Cache the result
-        self.set(key, result)
+        Route handlers use the timestamp to tell clients how fresh the
+        response is (see with_cache_freshness).
 
-        return result
+        Returns:
+            Tuple of (value, epoch seconds when the value was computed)
+        """
+        refresh = None
+        if getattr(_thread_state, 'timings', None) is not None:
+            serve_stale = False
+        with self._lock:
+            now = time.time()
+            entry = self._lookup(key)
+            if entry is not None:
+                if entry.is_fresh(now, epoch):
+                    self._touch(key, entry, now)
+                    self._hits += 1
+                    _record_lookup('hit')
+                    return entry.value, entry.stored_at
+                gone = self._is_gone(entry, now)
+                if serve_stale and not gone:
+                    self._touch(key, entry, now)
+                    self._stale_hits += 1
+                    _record_lookup('stale')
+                    if key not in self._inflight:
+                        refresh = _Flight()
+                        self._inflight[key] = refresh
+                        self._refreshes += 1
+                    stale = entry
+                elif gone:
+                    self._remove(key)
+                    self._expirations += 1
+                    entry = None
+                else:
+                    entry = None
+            if entry is None:
+                self._misses += 1
+                _record_lookup('miss')
+                flight = self._inflight.get(key)
+                is_leader = flight is None
+                if is_leader:
+                    flight = _Flight()
+                    self._inflight[key] = flight
+                else:
+                    self._coalesced += 1
+
+        if entry is not None:
+            if refresh is not None:
+                Thread(
+                    target=self._refresh_in_background,
+                    args=(key, compute_fn, refresh, epoch, ttl),
+                    name=f"cache-refresh:{key}",
+                    daemon=True
+                ).start()
+            return stale.value, stale.stored_at
+
+        if not is_leader:
+            wait = self._compute_timeout if timeout is None else timeout
+            if flight.done.wait(wait):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result, flight.stored_at
+            # Leader is taking too long - compute without waiting further
+            with self._lock:
+                self._coalesce_timeouts += 1
+            result = compute_fn()
+            stored_at = time.time()
+            if result is not None:
+                self._store(key, result, stored_at, epoch, ttl)
+            return result, stored_at
+
+        self._run_flight(key, compute_fn, flight, epoch, ttl)
+        return flight.result, flight.stored_at
 
     def invalidate(self, key: Optional[str] = None) -> None:
         """
@@ -125,9 +453,19 @@ class QueryCache:
         """
         with self._lock:
             if key is not None:
-                self._cache.pop(key, None)
+                self._remove(key)
             else:
-                self._cache.clear()
+                self._clear()
+
+    def sweep_expired(self) -> int:
+        """
+        Remove all expired entries now.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            return self._sweep_expired(time.time())
 
     def get_stats(self) -> dict[str, Any]:
         """
@@ -138,16 +476,198 @@ class QueryCache:
         """
         with self._lock:
             now = time.time()
-            valid_entries = sum(
-                1 for _, (_, ts) in self._cache.items()
-                if now - ts < self._ttl
+            entries = list(self._iter_entries())
+            valid_entries = sum(1 for entry in entries if entry.is_fresh(now))
+            stale_entries = sum(
+                1 for entry in entries
+                if not entry.is_fresh(now) and not self._is_gone(entry, now)
             )
+            lookups = self._hits + self._stale_hits + self._misses
             return {
-                "total_entries": len(self._cache),
+                "backend": self.backend_name,
+                "total_entries": len(entries),
                 "valid_entries": valid_entries,
-                "ttl_seconds": self._ttl
+                "stale_entries": stale_entries,
+                "ttl_seconds": self._ttl,
+                "stale_ttl_seconds": self._stale_ttl,
+                "max_entries": self._max_entries,
+                "max_bytes": self._max_bytes,
+                "bytes": self._stored_bytes(),
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "hit_rate": round((self._hits + self._stale_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "oversized": self._oversized,
+                "inflight": len(self._inflight),
+                "coalesced": self._coalesced,
+                "coalesce_timeouts": self._coalesce_timeouts,
+                "refreshes": self._refreshes,
+                "refresh_errors": self._refresh_errors,
             }
 
+    def _run_flight(
+        self,
+        key: str,
+        compute_fn: Callable[[], Any],
+        flight: _Flight,
+        epoch: Optional[str] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        """
+        Compute a value for a registered flight and wake its waiters.
+
+        The exception, if any, is recorded on the flight for waiters and
+        re-raised to the caller.
+        """
+        try:
+            if not self._acquire_lease(key):
+                # Another process is computing this key - use its result
+                shared = self._wait_for_entry(key, epoch)
+                if shared is not None:
+                    flight.result, flight.stored_at = shared.value, shared.stored_at
+                    return
+            try:
+                # Compute value outside lock to avoid blocking other keys
+                started = time.monotonic()
+                result = compute_fn()
+                flight.stored_at = time.time()
+                timings = getattr(_thread_state, 'timings', None)
+                if timings is not None:
+                    timings.append((key, time.monotonic() - started))
+                if result is not None:
+                    self._store(key, result, flight.stored_at, epoch, ttl)
+                flight.result = result
+            finally:
+                self._release_lease(key)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight.done.set()
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        compute_fn: Callable[[], Any],
+        flight: _Flight,
+        epoch: Optional[str] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        """Refresh a stale entry; on failure the stale value keeps being served."""
+        try:
+            self._run_flight(key, compute_fn, flight, epoch, ttl)
+        except Exception as e:
+            with self._lock:
+                self._refresh_errors += 1
+            logger.warning(f"Background cache refresh failed for {key}: {e}")
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        now: float,
+        epoch: Optional[str] = None,
+        ttl: Optional[float] = None
+    ) -> None:
+        """Insert an entry computed at the given time, sweeping and evicting as needed."""
+        entry = self._make_entry(value, now, self._ttl if ttl is None else ttl, epoch)
+        with self._lock:
+            if now - self._last_sweep >= self._sweep_interval:
+                self._sweep_expired(now)
+
+            if self._max_bytes and entry.size > self._max_bytes:
+                self._remove(key)
+                self._oversized += 1
+                return
+
+            self._insert(key, entry)
+
+    # Storage primitives. The caller holds self._lock. A shared backend
+    # (utils.shared_cache) overrides these to keep entries outside the process.
+
+    backend_name = "memory"
+
+    def _make_entry(self, value: Any, now: float, ttl: float, epoch: Optional[str]) -> _CacheEntry:
+        """Build the entry to store for a value (computed outside the lock)."""
+        return _CacheEntry(value, now, estimate_size(value), ttl, epoch)
+
+    def _lookup(self, key: str) -> Optional[_CacheEntry]:
+        """Return the entry for a key, fresh or not."""
+        return self._cache.get(key)
+
+    def _touch(self, key: str, entry: _CacheEntry, now: float) -> None:
+        """Mark an entry as most recently used."""
+        self._cache.move_to_end(key)
+
+    def _insert(self, key: str, entry: _CacheEntry) -> None:
+        """Insert or replace an entry, then evict down to the size bounds."""
+        self._remove(key)
+        self._cache[key] = entry
+        self._bytes += entry.size
+        self._evict()
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its size accounting."""
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _clear(self) -> None:
+        """Drop all entries."""
+        self._cache.clear()
+        self._bytes = 0
+
+    def _iter_entries(self):
+        """Iterate over all entries (values may be omitted)."""
+        return iter(self._cache.values())
+
+    def _stored_bytes(self) -> int:
+        """Total size of stored entries in bytes."""
+        return self._bytes
+
+    def _acquire_lease(self, key: str) -> bool:
+        """
+        Claim the right to compute a key across processes.
+
+        In-process coalescing is handled by _inflight, so a process-local
+        cache always succeeds.
+        """
+        return True
+
+    def _release_lease(self, key: str) -> None:
+        """Release a lease taken by _acquire_lease."""
+
+    def _wait_for_entry(self, key: str, epoch: Optional[str]) -> Optional[_CacheEntry]:
+        """Wait for another process to store a fresh entry (None = compute locally)."""
+        return None
+
+    def _sweep_expired(self, now: float) -> int:
+        """Remove expired entries."""
+        expired = [
+            key for key, entry in self._cache.items()
+            if self._is_gone(entry, now)
+        ]
+        for key in expired:
+            self._remove(key)
+        self._expirations += len(expired)
+        self._last_sweep = now
+        return len(expired)
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within bounds."""
+        while self._cache and (
+            (self._max_entries and len(self._cache) > self._max_entries)
+            or (self._max_bytes and self._bytes > self._max_bytes)
+        ):
+            _, entry = self._cache.popitem(last=False)
+            self._bytes -= entry.size
+            self._evictions += 1
+
 
 def generate_cache_key(endpoint: str, **params) -> str:
     """
@@ -174,6 +694,50 @@ def generate_cache_key(endpoint: str, **params) -> str:
     return f"{endpoint}:{hash_value}"
 
 
+def _create_query_cache() -> QueryCache:
+    """
+    Build the global cache with the configured backend and size bounds.
+
+    QUERY_CACHE_BACKEND=sqlite shares one cache between all gunicorn
+    workers on the host (see utils.shared_cache); the default keeps a
+    private in-memory cache per worker.
+    """
+    options = dict(
+        ttl_seconds=300,
+        max_entries=QUERY_CACHE_MAX_ENTRIES,
+        max_bytes=QUERY_CACHE_MAX_BYTES,
+        compute_timeout_seconds=QUERY_CACHE_COMPUTE_TIMEOUT_SECONDS,
+        stale_ttl_seconds=QUERY_CACHE_STALE_SECONDS
+    )
+    if QUERY_CACHE_BACKEND == 'sqlite':
+        from utils.shared_cache import SharedQueryCache, default_cache_path
+
+        return SharedQueryCache(path=QUERY_CACHE_PATH or default_cache_path(), **options)
+    if QUERY_CACHE_BACKEND != 'memory':
+        logger.warning(f"Unknown QUERY_CACHE_BACKEND '{QUERY_CACHE_BACKEND}', using in-memory cache")
+    return QueryCache(**options)
+
+
+def with_cache_freshness(payload: dict[str, Any], cached_at: float) -> dict[str, Any]:
+    """
+    Add cache freshness fields to a response payload.
+
+    Returns a shallow copy, so the cached payload itself is never modified.
+
+    Args:
+        payload: Response dictionary (as cached)
+        cached_at: Epoch seconds when the payload was computed
+
+    Returns:
+        Payload with "cached_at" (ISO 8601 UTC) and "cache_age_seconds"
+    """
+    return {
+        **payload,
+        "cached_at": datetime.fromtimestamp(cached_at, tz=timezone.utc).isoformat().replace('+00:00', 'Z'),
+        "cache_age_seconds": max(0, int(time.time() - cached_at)),
+    }
+
+
 # Global cache instance (5 minutes = 300 seconds TTL)
 _query_cache: Optional[QueryCache] = None
 _cache_lock = Lock()
@@ -193,7 +757,7 @@ def get_query_cache() -> QueryCache:
         with _cache_lock:
             # Double-check locking pattern
             if _query_cache is None:
-                _query_cache = QueryCache(ttl_seconds=300)
+                _query_cache = _create_query_cache()
     return _query_cache
 
 
@@ -201,8 +765,32 @@ def reset_query_cache() -> None:
     """
     Reset the global cache (useful for testing).
 
-    Creates a new cache instance, discarding all cached entries.
+    Creates a new cache instance, discarding all cached entries (including
+    those in a shared backend).
+    """
+    global _query_cache
+    with _cache_lock:
+        _query_cache = _create_query_cache()
+        _query_cache.invalidate()
+
+
+def set_query_cache(cache: Optional[QueryCache]) -> Optional[QueryCache]:
+    """
+    Install a specific cache as the global instance.
+
+    Batch jobs that render responses in-process (scripts/publish_static.py)
+    use this to work against a private, empty cache instead of the
+    configured (possibly shared) one.
+
+    Args:
+        cache: Cache to use for subsequent get_query_cache() calls
+            (None = create the configured cache on next use)
+
+    Returns:
+        The previous global cache (or None), to restore afterwards
     """
     global _query_cache
     with _cache_lock:
-        _query_cache = QueryCache(ttl_seconds=300)
+        previous = _query_cache
+        _query_cache = cache
+    return previous
@@ -180,6 +180,78 @@ COLLECTION_INTERVAL_MINUTES = config.get_int('COLLECTION_INTERVAL_MINUTES', 10)
 MAX_RETRY_ATTEMPTS = config.get_int('MAX_RETRY_ATTEMPTS', 3)
 RETRY_BACKOFF_MULTIPLIER = config.get_int('RETRY_BACKOFF_MULTIPLIER', 2)
 
+# Concurrent fetch stage for collect_snapshots
+# Per-host limit stays below requests' default connection pool size (10)
+COLLECTOR_FETCH_WORKERS = config.get_int('COLLECTOR_FETCH_WORKERS', 16)
+COLLECTOR_MAX_CONCURRENT_PER_HOST = config.get_int('COLLECTOR_MAX_CONCURRENT_PER_HOST', 8)
+
+# Optional persistent last-status cache for collect_snapshots change detection
+# (empty = disabled; state older than max age is ignored and reloaded from DB)
+COLLECTOR_STATE_FILE = config.get('COLLECTOR_STATE_FILE', '')
+COLLECTOR_STATE_MAX_AGE_MINUTES = config.get_int('COLLECTOR_STATE_MAX_AGE_MINUTES', 30)
+
+# Parallel aggregation scheduler (aggregate_daily --workers, recompute_daily_stats --workers)
+# Default parallelism is one worker process per CPU core
+AGGREGATION_WORKERS = config.get_int('AGGREGATION_WORKERS', os.cpu_count() or 1)
+AGGREGATION_MAX_ATTEMPTS = config.get_int('AGGREGATION_MAX_ATTEMPTS', 3)
+
+# Live rankings: the collector applies each cycle incrementally and runs the
+# full snapshot-scan rebuild once per period as a consistency check (0 = always full)
+LIVE_RANKINGS_FULL_REBUILD_MINUTES = config.get_int('LIVE_RANKINGS_FULL_REBUILD_MINUTES', 60)
+
+# In-memory API query cache (per gunicorn worker). Entries are evicted
+# least-recently-used once either bound is exceeded.
+QUERY_CACHE_MAX_ENTRIES = config.get_int('QUERY_CACHE_MAX_ENTRIES', 2048)
+QUERY_CACHE_MAX_BYTES = config.get_int('QUERY_CACHE_MAX_BYTES', 64 * 1024 * 1024)
+# Callers waiting on another request's computation of the same key give up
+# and compute it themselves after this long
+QUERY_CACHE_COMPUTE_TIMEOUT_SECONDS = config.get_int('QUERY_CACHE_COMPUTE_TIMEOUT_SECONDS', 30)
+# Ranking endpoints serve an expired entry for up to this long while one
+# background refresh recomputes it (stale-while-revalidate; 0 = disabled)
+QUERY_CACHE_STALE_SECONDS = config.get_int('QUERY_CACHE_STALE_SECONDS', 600)
+# Cached API responses stay valid until the data epoch (latest live rankings
+# refresh / successful aggregation) advances; epochs are re-read this often
+DATA_EPOCH_CHECK_SECONDS = config.get_int('DATA_EPOCH_CHECK_SECONDS', 10)
+# Cache backend: 'memory' (per worker) or 'sqlite' (one file shared by all
+# workers on the host; empty path = private 0700 directory under ~/.cache.
+# The file must be owned by the API user and not writable by others)
+QUERY_CACHE_BACKEND = config.get('QUERY_CACHE_BACKEND', 'memory')
+QUERY_CACHE_PATH = config.get('QUERY_CACHE_PATH', '')
+# Static JSON snapshots of the page-load responses, published after each
+# collection/aggregation run for Apache to serve (empty dir = disabled)
+STATIC_SNAPSHOT_DIR = config.get('STATIC_SNAPSHOT_DIR', '')
+STATIC_SNAPSHOT_KEEP = config.get_int('STATIC_SNAPSHOT_KEEP', 3)
+STATIC_SNAPSHOT_PRECOMPRESS = config.get_bool('STATIC_SNAPSHOT_PRECOMPRESS', True)
+# Cache warming (scripts/warm_cache.py): endpoints rendered in parallel,
+# i.e. concurrent DB queries (capped at DB_POOL_SIZE)
+WARM_CACHE_CONCURRENCY = config.get_int('WARM_CACHE_CONCURRENCY', 4)
+# Requests running more SQL statements than this are logged as a warning
+# (catches N+1 query loops; 0 = disabled)
+REQUEST_STATEMENT_WARN_THRESHOLD = config.get_int('REQUEST_STATEMENT_WARN_THRESHOLD', 25)
+# Last run of each cron job (duration, exit code, row counts), written by
+# scripts/cron_wrapper.py and exposed by /api/metrics (empty = system temp dir)
+CRON_STATE_FILE = config.get('CRON_STATE_FILE', '')
+# Daily partitions of the raw snapshot tables pre-created ahead of time by
+# scripts/maintain_partitions.py
+SNAPSHOT_PARTITION_DAYS_AHEAD = config.get_int('SNAPSHOT_PARTITION_DAYS_AHEAD', 3)
+# Ride snapshot storage: 'full' (one row per ride per cycle) or 'compact'
+# (one ride_status_intervals row per change; database/snapshot_storage.py).
+# Must match the database layout set by scripts/convert_snapshot_storage.py
+SNAPSHOT_STORAGE_MODE = config.get('SNAPSHOT_STORAGE_MODE', 'full')
+# Compact mode: wait time changes up to this many minutes do not start a new
+# interval (0 = exact; readers then see the same rows as in full mode)
+SNAPSHOT_WAIT_TIME_TOLERANCE = config.get_int('SNAPSHOT_WAIT_TIME_TOLERANCE', 0)
+# Columnar archive of raw snapshots written by scripts/cleanup_raw_data.py
+# before it deletes them (database/snapshot_archive.py; empty = disabled)
+SNAPSHOT_ARCHIVE_DIR = config.get('SNAPSHOT_ARCHIVE_DIR', '')
+# Chunked deletes in scripts/cleanup_raw_data.py (database/chunked_delete.py):
+# rows per batch, pause between batches, rate cap and runtime cap (0 = none).
+# A run stopped by the runtime cap is continued by the next one
+CLEANUP_BATCH_SIZE = config.get_int('CLEANUP_BATCH_SIZE', 5000)
+CLEANUP_BATCH_SLEEP_MS = config.get_int('CLEANUP_BATCH_SLEEP_MS', 200)
+CLEANUP_MAX_ROWS_PER_SECOND = config.get_int('CLEANUP_MAX_ROWS_PER_SECOND', 0)
+CLEANUP_MAX_RUNTIME_SECONDS = config.get_int('CLEANUP_MAX_RUNTIME_SECONDS', 0)
+
 # Geographic filter for testing phase (US-only)
 FILTER_COUNTRY = config.get('FILTER_COUNTRY', 'US')  # Set to empty string '' for all countries
 
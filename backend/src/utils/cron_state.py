@@ -0,0 +1,147 @@
+"""
+Theme Park Downtime Tracker - Cron Job State File
+Last run of each cron job (duration, exit code, row counts) in a local JSON
+file, written by scripts/cron_wrapper.py and read by /api/metrics.
+
+Row counts come from the job itself: cron_wrapper passes a per-run stats
+file path in CRON_JOB_STATS_FILE, and the job's main() calls
+report_job_stats(stats) before exiting. Jobs run without the wrapper skip
+reporting.
+
+State file format (CRON_STATE_FILE):
+    {
+      "collect_snapshots": {
+        "status": "success", "exit_code": 0, "duration_seconds": 84.2,
+        "finished_at": 1767225600.0, "last_success_at": 1767225600.0,
+        "rows": {"snapshots_created": 4210, "status_changes": 37, ...}
+      },
+      ...
+    }
+"""
+
+import fcntl
+import json
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from utils.config import CRON_STATE_FILE
+from utils.logger import logger
+
+# Environment variable naming the file a wrapped job reports its stats to
+JOB_STATS_ENV = 'CRON_JOB_STATS_FILE'
+
+
+def default_state_path() -> str:
+    """Default state file location (system temp directory)."""
+    return os.path.join(tempfile.gettempdir(), 'themepark_cron_state.json')
+
+
+def state_path() -> str:
+    """Configured state file path."""
+    return CRON_STATE_FILE or default_state_path()
+
+
+def numeric_stats(stats: Dict[str, Any]) -> Dict[str, float]:
+    """The numeric entries of a job's stats dict (row counts, seconds)."""
+    return {
+        name: value for name, value in stats.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+
+
+def report_job_stats(stats: Dict[str, Any]) -> None:
+    """
+    Report a job's stats to the wrapper running it (no-op without one).
+
+    Only numeric entries are kept. Never raises: reporting must not fail
+    the job.
+
+    Args:
+        stats: The job's stats dict (e.g. SnapshotCollector.stats)
+    """
+    path = os.environ.get(JOB_STATS_ENV)
+    if not path:
+        return
+    try:
+        with open(path, 'w') as f:
+            json.dump(numeric_stats(stats), f)
+    except Exception as e:
+        logger.warning(f"Failed to report job stats to {path}: {e}")
+
+
+def read_job_stats(path: str) -> Dict[str, float]:
+    """Stats reported by a job run (empty if it reported nothing)."""
+    try:
+        with open(path) as f:
+            stats = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return numeric_stats(stats) if isinstance(stats, dict) else {}
+
+
+def load_job_state(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Last run of every recorded job.
+
+    Returns:
+        Job name -> last run (empty if the file is missing or unreadable)
+    """
+    try:
+        with open(path or state_path()) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+@contextmanager
+def _locked(path: str) -> Iterator[None]:
+    """Serialize read-modify-write of the state file between processes."""
+    with open(path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def record_job_run(
+    job: str,
+    exit_code: int,
+    duration_seconds: float,
+    finished_at: float,
+    rows: Optional[Dict[str, float]] = None,
+    path: Optional[str] = None
+) -> None:
+    """
+    Record a job run as its last run in the state file.
+
+    The file is replaced atomically, so readers never see a partial write.
+
+    Args:
+        job: Job name (e.g. 'collect_snapshots')
+        exit_code: Process exit code (0 = success)
+        duration_seconds: Wall time of the run
+        finished_at: Epoch seconds when the run ended
+        rows: Row counts / stats reported by the job
+        path: State file (default: CRON_STATE_FILE)
+    """
+    path = path or state_path()
+    with _locked(path):
+        state = load_job_state(path)
+        previous = state.get(job, {})
+        run = {
+            "status": "success" if exit_code == 0 else "failure",
+            "exit_code": exit_code,
+            "duration_seconds": round(duration_seconds, 3),
+            "finished_at": finished_at,
+            "last_success_at": finished_at if exit_code == 0 else previous.get("last_success_at"),
+            "rows": rows or {},
+        }
+        state[job] = run
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
@@ -0,0 +1,187 @@
+"""
+Theme Park Downtime Tracker - Data Epochs for Cache Invalidation
+Tells the API query cache when the data behind a response has changed.
+
+Live data only changes when collect_snapshots finishes a cycle and
+refreshes park_live_rankings; historical data only changes when an
+aggregation job (hourly/daily/weekly/monthly) logs a successful run.
+Each of those leaves a monotonically advancing marker:
+
+- live epoch:       MAX(park_live_rankings.calculated_at) plus the latest
+                    successful aggregation run id (TODAY rankings also read
+                    hourly stats)
+- historical epoch: latest successful daily/weekly/monthly aggregation run id
+
+Only run-level aggregation_log rows count (unit_key IS NULL): per-unit
+checkpoints of the parallel scheduler and of recompute_daily_stats are
+written many times during a run. Hourly runs only advance the live epoch,
+so yesterday/last_week/last_month entries survive until a daily, weekly or
+monthly aggregation finishes.
+
+Cached responses are stored with the epoch they were computed at and stay
+valid until it advances, instead of expiring on a blind 5-minute TTL.
+The epochs are read with one small query at most once per
+DATA_EPOCH_CHECK_SECONDS per worker.
+"""
+
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Any, Dict, Optional
+
+from utils.config import DATA_EPOCH_CHECK_SECONDS
+from utils.logger import logger
+from utils.timezone import PERIOD_ALIASES, get_now_pacific
+
+# Periods whose data changes with every collection cycle
+LIVE_PERIODS = ('live', 'today')
+
+# Aggregations whose completion changes yesterday/last_week/last_month data
+HISTORICAL_AGGREGATION_TYPES = ('daily', 'weekly', 'monthly')
+
+# Safety cap for live entries in case the epoch query keeps failing
+LIVE_MAX_AGE_SECONDS = 3600
+
+
+@dataclass(frozen=True)
+class DataEpochs:
+    """Current data markers (None when unavailable)."""
+    live: Optional[str] = None
+    historical: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    How a response for a period should be cached.
+
+    Attributes:
+        epoch: Entry is valid while this matches the current epoch (None = TTL only)
+        ttl_seconds: Maximum age of the entry (None = cache default TTL)
+        key_params: Extra cache key parameters (the Pacific date the
+            period is relative to, so day rollover never serves the old day)
+    """
+    epoch: Optional[str]
+    ttl_seconds: Optional[int]
+    key_params: Dict[str, Any] = field(default_factory=dict)
+
+
+_epochs: DataEpochs = DataEpochs()
+_epochs_checked_at: float = 0.0
+_epochs_lock = Lock()
+
+
+def _read_epochs() -> DataEpochs:
+    """Read both epochs from the database in a single round trip."""
+    from sqlalchemy import func, select
+
+    from database.connection import get_db_session
+    from models import AggregationLog, AggregationStatus, AggregationType, ParkLiveRankings
+
+    successful_run = (
+        select(func.max(AggregationLog.log_id))
+        .where(AggregationLog.status == AggregationStatus.SUCCESS)
+        .where(AggregationLog.unit_key.is_(None))
+    )
+    last_run_id = successful_run.scalar_subquery()
+    last_historical_id = successful_run.where(
+        AggregationLog.aggregation_type.in_([AggregationType(t) for t in HISTORICAL_AGGREGATION_TYPES])
+    ).scalar_subquery()
+    last_live_calc = select(func.max(ParkLiveRankings.calculated_at)).scalar_subquery()
+
+    with get_db_session() as session:
+        calculated_at, run_id, historical_id = session.execute(
+            select(last_live_calc, last_run_id, last_historical_id)
+        ).one()
+
+    historical = str(historical_id) if historical_id is not None else None
+    live = f"{calculated_at.isoformat() if calculated_at else ''}|{run_id if run_id is not None else ''}"
+    return DataEpochs(live=live, historical=historical)
+
+
+def get_data_epochs() -> DataEpochs:
+    """
+    Get the current data epochs, re-reading them at most once per
+    DATA_EPOCH_CHECK_SECONDS.
+
+    On a database error the epochs are reported as unknown (None), so
+    callers fall back to plain TTL caching.
+
+    Returns:
+        DataEpochs
+    """
+    global _epochs, _epochs_checked_at
+    now = time.monotonic()
+    if _epochs_checked_at and now - _epochs_checked_at < DATA_EPOCH_CHECK_SECONDS:
+        return _epochs
+
+    with _epochs_lock:
+        # Another thread may have refreshed while we waited
+        if _epochs_checked_at and time.monotonic() - _epochs_checked_at < DATA_EPOCH_CHECK_SECONDS:
+            return _epochs
+        try:
+            _epochs = _read_epochs()
+        except Exception as e:
+            logger.warning(f"Could not read data epochs, falling back to TTL caching: {e}")
+            _epochs = DataEpochs()
+        _epochs_checked_at = time.monotonic()
+        return _epochs
+
+
+def reset_data_epochs() -> None:
+    """Forget the memoized epochs (useful for testing)."""
+    global _epochs, _epochs_checked_at
+    with _epochs_lock:
+        _epochs = DataEpochs()
+        _epochs_checked_at = 0.0
+
+
+def seconds_until_pacific_midnight(now: Optional[datetime] = None) -> int:
+    """
+    Seconds until the next Pacific day boundary.
+
+    Args:
+        now: Current Pacific datetime (defaults to get_now_pacific())
+
+    Returns:
+        Seconds (at least 1)
+    """
+    now = now or get_now_pacific()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=now.tzinfo)
+    return max(1, int((midnight - now).total_seconds()))
+
+
+def cache_policy_for_period(period: Optional[str]) -> CachePolicy:
+    """
+    Build the cache policy for a response covering a period.
+
+    LIVE/TODAY responses (and period-less live endpoints, period=None) are
+    valid until the live epoch advances. Historical periods (yesterday,
+    last_week, last_month) are valid until the historical epoch advances,
+    for at most the rest of the Pacific day.
+
+    Args:
+        period: API period name (aliases such as '7days' are accepted), or
+            None for endpoints that always show live data
+
+    Returns:
+        CachePolicy
+    """
+    period = PERIOD_ALIASES.get(period, period)
+    now = get_now_pacific()
+    epochs = get_data_epochs()
+    key_params = {'as_of': now.date().isoformat()}
+
+    if period is None or period in LIVE_PERIODS:
+        if epochs.live is None:
+            return CachePolicy(epoch=None, ttl_seconds=None, key_params=key_params)
+        return CachePolicy(epoch=epochs.live, ttl_seconds=LIVE_MAX_AGE_SECONDS, key_params=key_params)
+
+    if epochs.historical is None:
+        return CachePolicy(epoch=None, ttl_seconds=None, key_params=key_params)
+    return CachePolicy(
+        epoch=epochs.historical,
+        ttl_seconds=seconds_until_pacific_midnight(now),
+        key_params=key_params
+    )
@@ -119,14 +119,15 @@ def log_aggregation_error(error: Exception, aggregation_type: str):
     }, exc_info=True)
 
 
-def log_api_request(method: str, path: str, status_code: int, duration_ms: float):
-    """Log API request metrics."""
+def log_api_request(method: str, path: str, status_code: int, duration_ms: float, **fields):
+    """Log API request metrics (extra fields, e.g. DB time, are logged as-is)."""
     logger.info("API request", extra={
         "event_type": "api_request",
         "method": method,
         "path": path,
         "status_code": status_code,
-        "duration_ms": duration_ms
+        "duration_ms": duration_ms,
+        **fields
     })
 
 
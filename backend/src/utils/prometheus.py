@@ -0,0 +1,147 @@
+"""
+Theme Park Downtime Tracker - Prometheus Metrics
+Minimal Prometheus-style histograms and text exposition format rendering
+for the /api/metrics endpoint (no prometheus_client dependency).
+
+Metrics live in process memory, so each gunicorn worker reports its own
+observations; every sample carries a worker="<pid>" label so scrapes that
+land on different workers produce separate, individually monotonic series.
+"""
+
+import math
+import os
+from threading import Lock
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# Request latency buckets (seconds): cache hits are ~1ms, cold rankings ~seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Connection pool checkout wait buckets (seconds)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    """Render a label set as {name="value",...} (empty string if none)."""
+    if not labels:
+        return ""
+    parts = []
+    for name, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        parts.append(f'{name}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def format_value(value: float) -> str:
+    """Render a sample value (integers without a decimal point)."""
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+        return str(int(value))
+    return repr(float(value))
+
+
+def worker_labels() -> Dict[str, str]:
+    """Labels identifying this process."""
+    return {"worker": str(os.getpid())}
+
+
+class Histogram:
+    """
+    Cumulative histogram with a fixed label set.
+
+    Usage:
+        latency = Histogram('http_request_duration_seconds', 'Request latency',
+                            labels=('route',), buckets=LATENCY_BUCKETS)
+        latency.observe(0.042, route='/api/parks/downtime')
+    """
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = Lock()
+        # label values -> [bucket counts..., count, sum]
+        self._series: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation."""
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [0] * len(self.buckets) + [0, 0.0]
+                self._series[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def snapshot(self) -> Dict[LabelValues, Dict[str, float]]:
+        """Count and sum per label set (for tests and JSON consumers)."""
+        with self._lock:
+            return {key: {"count": s[-2], "sum": s[-1]} for key, s in self._series.items()}
+
+    def reset(self) -> None:
+        """Drop all observations."""
+        with self._lock:
+            self._series.clear()
+
+    def render(self, prefix: str = "", extra_labels: Dict[str, str] = None) -> List[str]:
+        """Exposition format lines (HELP, TYPE, buckets, sum, count)."""
+        name = prefix + self.name
+        lines = [f"# HELP {name} {self.help_text}", f"# TYPE {name} histogram"]
+        with self._lock:
+            series = sorted((key, list(values)) for key, values in self._series.items())
+        for key, values in series:
+            labels = dict(zip(self.label_names, key))
+            labels.update(extra_labels or {})
+            for bound, count in zip(self.buckets, values):
+                lines.append(f"{name}_bucket{format_labels({**labels, 'le': format_value(bound)})} {count}")
+            lines.append(f"{name}_bucket{format_labels({**labels, 'le': '+Inf'})} {values[-2]}")
+            lines.append(f"{name}_sum{format_labels(labels)} {format_value(values[-1])}")
+            lines.append(f"{name}_count{format_labels(labels)} {values[-2]}")
+        return lines
+
+
+def render_gauges(
+    name: str,
+    help_text: str,
+    samples: Iterable[Tuple[Dict[str, str], float]],
+    metric_type: str = "gauge"
+) -> List[str]:
+    """
+    Exposition format lines for a gauge or counter.
+
+    Args:
+        name: Full metric name
+        help_text: HELP text
+        samples: (labels, value) pairs; NaN and None values are skipped
+        metric_type: 'gauge' or 'counter'
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        if value is None or (isinstance(value, float) and math.isnan(value)):
+            continue
+        lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+    return lines
+
+
+# Process-wide histograms, filled by the request timing middleware and the
+# database connection pool
+request_latency = Histogram(
+    'http_request_duration_seconds',
+    'API request latency by route and period',
+    labels=('route', 'period', 'method', 'status'),
+    buckets=LATENCY_BUCKETS
+)
+
+pool_checkout_wait = Histogram(
+    'db_pool_checkout_wait_seconds',
+    'Time spent waiting for a connection from the SQLAlchemy pool',
+    buckets=POOL_WAIT_BUCKETS
+)
@@ -236,7 +236,7 @@ class RideStatusQuery:
             stmt = stmt.where(RideStatusSnapshot.ride_id == ride_id)
 
         if park_id:
-            stmt = stmt.join(Ride).where(Ride.park_id == park_id)
+            stmt = stmt.join(Ride, Ride.ride_id == RideStatusSnapshot.ride_id).where(Ride.park_id == park_id)
 
         return stmt.order_by(RideStatusSnapshot.recorded_at)
 
@@ -450,7 +450,7 @@ class ParkStatusQuery:
         # Subquery for parks with park_appears_open snapshots
         open_parks_subquery = (
             select(RideStatusSnapshot.ride_id)
-            .join(Ride)
+            .join(Ride, Ride.ride_id == RideStatusSnapshot.ride_id)
             .where(RideStatusSnapshot.recorded_at >= start_time)
             .where(RideStatusSnapshot.recorded_at < end_time)
             .where(RideStatusSnapshot.park_appears_open == True)
@@ -0,0 +1,344 @@
+"""
+Shared Query Cache (SQLite)
+===========================
+
+A QueryCache whose entries live in one SQLite file shared by every
+gunicorn worker on the host, instead of in each worker's memory.
+
+Why:
+    With N workers and a per-process cache, every expensive query runs up
+    to N times per TTL window and scripts/warm_cache.py only warms the
+    workers that happen to receive its requests. With a shared file, a
+    value computed (or warmed) by one worker is a hit for all of them.
+
+How:
+    - Entries are pickled into a cache_entries table together with the
+      time they were stored, their TTL, data epoch and last use. The byte
+      bound applies to the pickled size.
+    - LRU eviction deletes by last_used. Hits only write last_used back
+      when it is more than a second old, so steady-state hits are reads.
+    - Cross-process single-flight: before computing a key, a worker takes
+      a row in cache_leases. Workers that find the lease taken poll for the
+      other worker's entry instead of running the same query, and compute
+      it themselves if the lease holder fails or the timeout passes.
+    - WAL journal mode lets readers proceed while one worker writes.
+
+Usage is identical to QueryCache; select it with QUERY_CACHE_BACKEND=sqlite.
+
+Security:
+    Entries are unpickled, so anyone who can write the file can run code in
+    the API process. The file (and its -wal/-shm companions) must be owned
+    by the API's user and not group/world-writable, and its directory must
+    not let other users replace it; otherwise the cache refuses to open.
+    Without QUERY_CACHE_PATH the file lives in a private (0700) directory
+    under the user's cache directory, never in the shared temp directory.
+    Unreadable rows (corrupt file, unpicklable value) are treated as misses.
+"""
+
+import os
+import pickle
+import sqlite3
+import stat
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+from utils.cache import QueryCache, _CacheEntry
+from utils.config import ConfigurationError
+from utils.logger import logger
+
+# Seconds between checks while waiting on another worker's computation
+LEASE_POLL_INTERVAL_SECONDS = 0.05
+
+# Minimum time between last_used writes for one entry
+TOUCH_INTERVAL_SECONDS = 1.0
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS cache_entries (
+        key TEXT PRIMARY KEY,
+        value BLOB NOT NULL,
+        stored_at REAL NOT NULL,
+        size INTEGER NOT NULL,
+        ttl REAL NOT NULL,
+        epoch TEXT,
+        last_used REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_cache_entries_last_used ON cache_entries (last_used)",
+    """
+    CREATE TABLE IF NOT EXISTS cache_leases (
+        key TEXT PRIMARY KEY,
+        owner TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """,
+)
+
+
+# Files SQLite keeps next to the database in WAL mode
+_COMPANION_SUFFIXES = ('', '-wal', '-shm')
+
+
+def default_cache_path() -> str:
+    """
+    Default SQLite cache file location.
+
+    A directory private to the API's user (created 0700) under
+    XDG_CACHE_HOME or ~/.cache - not the shared temp directory.
+    """
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    directory = os.path.join(cache_home, 'themeparkhallofshame')
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    return os.path.join(directory, 'query_cache.sqlite3')
+
+
+def verify_private(path: str) -> None:
+    """
+    Refuse cache files other users could have written.
+
+    Raises:
+        ConfigurationError: If the file or a WAL companion is not owned by
+            this process's user or is group/world-writable, or the directory
+            lets other users replace files (writable without the sticky bit)
+    """
+    uid = os.getuid() if hasattr(os, 'getuid') else None
+    directory = os.path.dirname(os.path.abspath(path))
+    dir_mode = os.stat(directory).st_mode
+    if dir_mode & (stat.S_IWGRP | stat.S_IWOTH) and not dir_mode & stat.S_ISVTX:
+        raise ConfigurationError(f"Query cache directory {directory} is writable by other users")
+    for suffix in _COMPANION_SUFFIXES:
+        try:
+            info = os.lstat(path + suffix)
+        except FileNotFoundError:
+            continue
+        if not stat.S_ISREG(info.st_mode):
+            raise ConfigurationError(f"Query cache file {path + suffix} is not a regular file")
+        if uid is not None and info.st_uid != uid:
+            raise ConfigurationError(f"Query cache file {path + suffix} is owned by another user (uid {info.st_uid})")
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise ConfigurationError(f"Query cache file {path + suffix} is group/world-writable")
+
+
+class SharedQueryCache(QueryCache):
+    """
+    QueryCache backed by a SQLite file shared across processes.
+
+    Per-process counters (hits, misses, coalesced, ...) in get_stats() are
+    for this worker; entry counts and bytes are for the shared file.
+    """
+
+    backend_name = "sqlite"
+
+    def __init__(self, path: str, lease_seconds: Optional[float] = None, **kwargs):
+        """
+        Initialize shared cache.
+
+        Args:
+            path: SQLite database file (created if missing)
+            lease_seconds: How long a worker's claim on computing a key lasts
+                before other workers stop waiting (default: the compute
+                timeout, or 60 seconds)
+            **kwargs: QueryCache options (ttl_seconds, max_entries, max_bytes, ...)
+        """
+        super().__init__(**kwargs)
+        self._path = path
+        self._lease_seconds = lease_seconds or self._compute_timeout or 60
+        self._local = threading.local()
+        # Create the schema up front so configuration errors surface at startup
+        self._conn()
+
+    def _conn(self) -> sqlite3.Connection:
+        """
+        Connection for the current thread and process.
+
+        Connections are never shared across a fork: a worker that inherits
+        the app from a preloading master opens its own.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            verify_private(self._path)
+            if not os.path.exists(self._path):
+                # Create private (0600) so SQLite's companion files inherit it
+                os.close(os.open(self._path, os.O_CREAT | os.O_WRONLY, 0o600))
+            conn = sqlite3.connect(self._path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @property
+    def _owner(self) -> str:
+        """Lease owner id for this process."""
+        return f"{os.getpid()}:{id(self)}"
+
+    def _make_entry(self, value: Any, now: float, ttl: float, epoch: Optional[str]) -> _CacheEntry:
+        """Pickle once; the stored size is the exact pickled size."""
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return _CacheEntry(blob, now, len(blob), ttl, epoch)
+
+    def _lookup(self, key: str) -> Optional[_CacheEntry]:
+        try:
+            row = self._conn().execute(
+                "SELECT value, stored_at, size, ttl, epoch, last_used FROM cache_entries WHERE key = ?",
+                (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache read failed for {key}: {e}")
+            return None
+        if row is None:
+            return None
+        blob, stored_at, size, ttl, epoch, last_used = row
+        try:
+            value = pickle.loads(blob)
+        except Exception as e:
+            logger.warning(f"Shared cache entry {key} is unreadable, treating as a miss: {e}")
+            self._remove(key)
+            return None
+        return _CacheEntry(value, stored_at, size, ttl, epoch, last_used)
+
+    def _touch(self, key: str, entry: _CacheEntry, now: float) -> None:
+        if entry.last_used is not None and now - entry.last_used < TOUCH_INTERVAL_SECONDS:
+            return
+        try:
+            self._conn().execute("UPDATE cache_entries SET last_used = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as e:
+            logger.debug(f"Shared cache touch failed for {key}: {e}")
+
+    def _insert(self, key: str, entry: _CacheEntry) -> None:
+        conn = self._conn()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, value, stored_at, size, ttl, epoch, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.value, entry.stored_at, entry.size, entry.ttl, entry.epoch, time.time())
+            )
+            self._evict()
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"Shared cache write failed for {key}: {e}")
+
+    def _remove(self, key: str) -> None:
+        try:
+            self._conn().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache delete failed for {key}: {e}")
+
+    def _clear(self) -> None:
+        try:
+            conn = self._conn()
+            conn.execute("DELETE FROM cache_entries")
+            conn.execute("DELETE FROM cache_leases")
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache clear failed: {e}")
+
+    def _iter_entries(self) -> Iterator[_CacheEntry]:
+        try:
+            rows = self._conn().execute("SELECT stored_at, size, ttl, epoch FROM cache_entries").fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache scan failed: {e}")
+            rows = []
+        return (_CacheEntry(None, stored_at, size, ttl, epoch) for stored_at, size, ttl, epoch in rows)
+
+    def _stored_bytes(self) -> int:
+        try:
+            return self._conn().execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache size query failed: {e}")
+            return 0
+
+    def _sweep_expired(self, now: float) -> int:
+        conn = self._conn()
+        try:
+            removed = conn.execute(
+                "DELETE FROM cache_entries WHERE ? - stored_at >= ttl + ?",
+                (now, self._stale_ttl)
+            ).rowcount
+            conn.execute("DELETE FROM cache_leases WHERE expires_at < ?", (now,))
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache sweep failed: {e}")
+            return 0
+        self._expirations += removed
+        self._last_sweep = now
+        return removed
+
+    def _evict(self) -> None:
+        """Delete least recently used rows until within bounds (inside the insert transaction)."""
+        conn = self._conn()
+        count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries").fetchone()
+
+        if self._max_entries and count > self._max_entries:
+            excess = count - self._max_entries
+            evicted = conn.execute(
+                "DELETE FROM cache_entries WHERE key IN "
+                "(SELECT key FROM cache_entries ORDER BY last_used LIMIT ?)",
+                (excess,)
+            ).rowcount
+            self._evictions += evicted
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache_entries").fetchone()[0]
+
+        if self._max_bytes and total > self._max_bytes:
+            victims = []
+            for key, size in conn.execute("SELECT key, size FROM cache_entries ORDER BY last_used"):
+                if total <= self._max_bytes:
+                    break
+                victims.append((key,))
+                total -= size
+            conn.executemany("DELETE FROM cache_entries WHERE key = ?", victims)
+            self._evictions += len(victims)
+
+    def _acquire_lease(self, key: str) -> bool:
+        now = time.time()
+        try:
+            claimed = self._conn().execute(
+                "INSERT INTO cache_leases (key, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at "
+                "WHERE cache_leases.expires_at < ?",
+                (key, self._owner, now + self._lease_seconds, now)
+            ).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache lease failed for {key}, computing locally: {e}")
+            return True
+        return claimed == 1
+
+    def _release_lease(self, key: str) -> None:
+        try:
+            self._conn().execute(
+                "DELETE FROM cache_leases WHERE key = ? AND owner = ?",
+                (key, self._owner)
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache lease release failed for {key}: {e}")
+
+    def _lease_held(self, key: str) -> bool:
+        """Whether any process still holds an unexpired lease on the key."""
+        try:
+            row = self._conn().execute(
+                "SELECT 1 FROM cache_leases WHERE key = ? AND expires_at >= ?",
+                (key, time.time())
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache lease check failed for {key}: {e}")
+            return False
+        return row is not None
+
+    def _wait_for_entry(self, key: str, epoch: Optional[str]) -> Optional[_CacheEntry]:
+        deadline = time.monotonic() + self._lease_seconds
+        while time.monotonic() < deadline:
+            time.sleep(LEASE_POLL_INTERVAL_SECONDS)
+            with self._lock:
+                entry = self._lookup(key)
+            if entry is not None and entry.is_fresh(time.time(), epoch):
+                return entry
+            if not self._lease_held(key):
+                # Holder finished without storing (error or None result)
+                return None
+        with self._lock:
+            self._coalesce_timeouts += 1
+        return None
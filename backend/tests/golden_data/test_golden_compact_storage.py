@@ -0,0 +1,231 @@
+"""
+Golden Data Parity Tests for Compact Snapshot Storage
+
+Converts the golden dataset's ride_status_snapshots to compact, change-only
+storage (database/snapshot_storage.py) and verifies that the expanding view
+is indistinguishable from the table for its readers:
+
+- the snapshots themselves and a raw SQL ride ranking
+- the hourly (HourlyAggregator) and daily (AggregationService) aggregation
+  of the golden day: the stats rows they write
+- the TODAY and YESTERDAY ride and park ranking query classes, which read
+  those stats and the latest snapshots
+
+while storing at least 10x fewer rows. The database is converted back
+afterwards. Snapshots without a park activity row for their cycle cannot be
+compacted; the conversion drops them (allow_drop), so they are missing from
+the test database after this module.
+
+Usage:
+    pytest tests/golden_data/test_golden_compact_storage.py -v -m golden_data -s
+"""
+
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from freezegun import freeze_time
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from database.queries.today.today_park_rankings import TodayParkRankingsQuery
+from database.queries.today.today_ride_rankings import TodayRideRankingsQuery
+from database.queries.yesterday.yesterday_park_rankings import YesterdayParkRankingsQuery
+from database.queries.yesterday.yesterday_ride_rankings import YesterdayRideRankingsQuery
+from database.snapshot_storage import (
+    STORAGE_COMPACT,
+    STORAGE_FULL,
+    convert_to_compact,
+    convert_to_full,
+    storage_mode,
+)
+from models import ParkDailyStats, ParkHourlyStats, RideDailyStats, RideHourlyStats
+from processor.aggregation_service import AggregationService
+from scripts.aggregate_hourly import HourlyAggregator
+from tests.golden_data.conftest import GOLDEN_DATA_DIR, load_sql_via_cli
+
+GOLDEN_DATE = date(2025, 12, 21)
+# Hours of Dec 21, 2025 Pacific, in UTC
+DAY_HOURS = [datetime(2025, 12, 21, 8) + timedelta(hours=n) for n in range(24)]
+# Last second of Dec 21 Pacific: TODAY is the golden day
+TODAY_TIME = datetime(2025, 12, 22, 7, 59, 59, tzinfo=timezone.utc)
+# Noon of Dec 22 Pacific: YESTERDAY is the golden day
+YESTERDAY_TIME = datetime(2025, 12, 22, 20, 0, 0, tzinfo=timezone.utc)
+
+# Stats columns that differ between two runs on identical input
+RUN_COLUMNS = {'id', 'stat_id', 'created_at', 'updated_at'}
+
+# Every stored snapshot that has its park's activity row for the cycle
+SNAPSHOTS_QUERY = text("""
+    SELECT rss.ride_id, rss.recorded_at, rss.status, rss.computed_is_open,
+           rss.is_open, rss.wait_time
+    FROM ride_status_snapshots rss
+    JOIN rides r ON r.ride_id = rss.ride_id
+    JOIN park_activity_snapshots pas ON pas.park_id = r.park_id
+        AND pas.recorded_at = rss.recorded_at
+    ORDER BY rss.ride_id, rss.recorded_at
+""")
+
+# Ride downtime ranking for "yesterday" (as in test_golden_rankings.py)
+RIDE_RANKINGS_QUERY = text("""
+    SELECT
+        r.ride_id,
+        COUNT(*) as total_snapshots,
+        SUM(CASE
+            WHEN pas.park_appears_open = 1 AND (
+                (p.is_disney = 1 OR p.is_universal = 1) AND rss.status = 'DOWN'
+                OR (p.is_disney = 0 AND p.is_universal = 0) AND rss.status IN ('DOWN', 'CLOSED')
+            ) THEN 1 ELSE 0
+        END) as down_snapshots,
+        SUM(rss.computed_is_open) as open_snapshots,
+        AVG(rss.wait_time) as avg_wait_time
+    FROM rides r
+    JOIN parks p ON r.park_id = p.park_id
+    JOIN ride_status_snapshots rss ON r.ride_id = rss.ride_id
+    JOIN park_activity_snapshots pas ON p.park_id = pas.park_id
+        AND pas.recorded_at = rss.recorded_at
+    WHERE DATE(CONVERT_TZ(rss.recorded_at, '+00:00', 'America/Los_Angeles')) = '2025-12-21'
+      AND r.is_active = 1
+    GROUP BY r.ride_id
+    ORDER BY down_snapshots DESC, r.ride_id
+""")
+
+
+@contextmanager
+def _session_scope(engine):
+    """get_db_session() equivalent on the test engine."""
+    with Session(engine) as session:
+        yield session
+        session.commit()
+
+
+def _stats_rows(session, model, *where):
+    """Stats rows without their surrogate key and write timestamps."""
+    columns = [column for column in model.__table__.columns if column.name not in RUN_COLUMNS]
+    rows = session.execute(select(*columns).where(*where).order_by(*columns[:2])).mappings()
+    return [dict(row) for row in rows]
+
+
+def _read_storage(engine):
+    """Snapshots and raw ranking, then the aggregation pipeline and ranking query classes."""
+    with engine.begin() as conn:
+        results = {
+            "snapshots": conn.execute(SNAPSHOTS_QUERY).fetchall(),
+            "rankings": conn.execute(RIDE_RANKINGS_QUERY).fetchall(),
+        }
+        # Aggregate from scratch: the aggregators skip logged hours and days
+        conn.execute(text("DELETE FROM ride_hourly_stats WHERE hour_start_utc >= :start AND hour_start_utc < :end"),
+                     {"start": DAY_HOURS[0], "end": DAY_HOURS[-1] + timedelta(hours=1)})
+        conn.execute(text("DELETE FROM park_hourly_stats WHERE hour_start_utc >= :start AND hour_start_utc < :end"),
+                     {"start": DAY_HOURS[0], "end": DAY_HOURS[-1] + timedelta(hours=1)})
+        conn.execute(text("DELETE FROM ride_daily_stats WHERE stat_date = :day"), {"day": GOLDEN_DATE})
+        conn.execute(text("DELETE FROM park_daily_stats WHERE stat_date = :day"), {"day": GOLDEN_DATE})
+        conn.execute(text("DELETE FROM aggregation_log WHERE aggregation_date BETWEEN :first AND :last"),
+                     {"first": GOLDEN_DATE - timedelta(days=1), "last": GOLDEN_DATE + timedelta(days=1)})
+
+    with patch('scripts.aggregate_hourly.get_db_session', lambda: _session_scope(engine)), \
+            freeze_time(TODAY_TIME):
+        for hour in DAY_HOURS:
+            HourlyAggregator(target_hour=hour).run()
+
+    with freeze_time(YESTERDAY_TIME), _session_scope(engine) as session:
+        daily = AggregationService(session).aggregate_daily(GOLDEN_DATE)
+    results["daily_processed"] = (daily["parks_processed"], daily["rides_processed"])
+
+    with Session(engine) as session:
+        hours = (DAY_HOURS[0], DAY_HOURS[-1])
+        results["ride_hourly_stats"] = _stats_rows(session, RideHourlyStats, RideHourlyStats.hour_start_utc.between(*hours))
+        results["park_hourly_stats"] = _stats_rows(session, ParkHourlyStats, ParkHourlyStats.hour_start_utc.between(*hours))
+        results["ride_daily_stats"] = _stats_rows(session, RideDailyStats, RideDailyStats.stat_date == GOLDEN_DATE)
+        results["park_daily_stats"] = _stats_rows(session, ParkDailyStats, ParkDailyStats.stat_date == GOLDEN_DATE)
+
+        with freeze_time(TODAY_TIME):
+            results["today.ride_rankings"] = TodayRideRankingsQuery(session).get_rankings()
+            results["today.park_rankings"] = TodayParkRankingsQuery(session).get_rankings()
+        with freeze_time(YESTERDAY_TIME):
+            results["yesterday.ride_rankings"] = YesterdayRideRankingsQuery(session).get_rankings()
+            results["yesterday.park_rankings"] = YesterdayParkRankingsQuery(session).get_rankings()
+    return results
+
+
+@pytest.fixture(scope="module")
+def golden_full_and_compact(mysql_engine):
+    """
+    Query and aggregation results on the golden dataset in full and in compact storage.
+
+    Module-scoped: the dataset is loaded, aggregated and converted once.
+    """
+    dataset_path = GOLDEN_DATA_DIR / "2025-12-21"
+    if not (dataset_path / "snapshots.sql").exists():
+        pytest.skip("Golden dataset 2025-12-21 snapshots not found")
+    for sql_file in ["parks.sql", "rides.sql", "snapshots.sql"]:
+        load_sql_via_cli(dataset_path / sql_file)
+
+    with mysql_engine.begin() as conn:
+        if storage_mode(conn) != STORAGE_FULL:
+            pytest.skip("Test database is not in full snapshot storage")
+    full = _read_storage(mysql_engine)
+
+    try:
+        with mysql_engine.begin() as conn:
+            stats = convert_to_compact(conn, allow_drop=True)
+            assert storage_mode(conn) == STORAGE_COMPACT
+        compact = _read_storage(mysql_engine)
+        yield {"full": full, "compact": compact, "stats": stats}
+    finally:
+        with mysql_engine.begin() as conn:
+            if storage_mode(conn) == STORAGE_COMPACT:
+                convert_to_full(conn)
+
+
+class TestCompactStorageParity:
+    """The expanding view must be indistinguishable from the table."""
+
+    @pytest.mark.golden_data
+    def test_snapshots_are_identical(self, golden_full_and_compact):
+        full = golden_full_and_compact["full"]["snapshots"]
+        compact = golden_full_and_compact["compact"]["snapshots"]
+
+        assert len(full) > 0
+        assert [tuple(row) for row in compact] == [tuple(row) for row in full]
+
+    @pytest.mark.golden_data
+    def test_ride_rankings_are_identical(self, golden_full_and_compact):
+        full = golden_full_and_compact["full"]["rankings"]
+        compact = golden_full_and_compact["compact"]["rankings"]
+
+        assert len(full) >= 5
+        assert [tuple(row) for row in compact] == [tuple(row) for row in full]
+
+    @pytest.mark.golden_data
+    @pytest.mark.parametrize("table", [
+        "ride_hourly_stats", "park_hourly_stats", "ride_daily_stats", "park_daily_stats",
+    ])
+    def test_aggregated_stats_are_identical(self, golden_full_and_compact, table):
+        full = golden_full_and_compact["full"]
+        compact = golden_full_and_compact["compact"]
+
+        assert len(full[table]) > 0
+        assert compact[table] == full[table]
+        assert compact["daily_processed"] == full["daily_processed"]
+
+    @pytest.mark.golden_data
+    @pytest.mark.parametrize("query", [
+        "today.ride_rankings", "today.park_rankings", "yesterday.ride_rankings", "yesterday.park_rankings",
+    ])
+    def test_ranking_queries_are_identical(self, golden_full_and_compact, query):
+        full = golden_full_and_compact["full"][query]
+        compact = golden_full_and_compact["compact"][query]
+
+        assert len(full) > 0
+        assert compact == full
+
+    @pytest.mark.golden_data
+    def test_intervals_store_ten_times_fewer_rows(self, golden_full_and_compact):
+        stats = golden_full_and_compact["stats"]
+        kept = stats["snapshots"] - stats["skipped"]
+
+        ratio = kept / max(stats["intervals"], 1)
+        print(f"{kept:,} snapshots -> {stats['intervals']:,} intervals ({ratio:.1f}x)")
+        assert ratio >= 10
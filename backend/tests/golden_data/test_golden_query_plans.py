@@ -0,0 +1,56 @@
+"""
+Golden Data Query Plan Regression Tests
+
+Runs every query class in QUERY_CASES (database/audit/query_plans.py)
+against the golden dataset and EXPLAINs the SQL it sends. A query that
+scans a time-series table with no usable index fails - so an edit that
+wraps an indexed column in a function or drops a leading key column is
+caught here instead of in production.
+
+A query that raises fails as well. Only a missing MySQL server or golden
+dataset skips. Warnings (filesorts, temporary tables, scans the optimizer
+chose on the small dataset) are only printed; see scripts/check_query_plans.py.
+
+Usage:
+    pytest tests/golden_data/test_golden_query_plans.py -v -m golden_data -s
+"""
+
+import pytest
+
+from database.audit.query_plans import QUERY_CASES, QueryPlanAuditor
+from tests.golden_data.conftest import GOLDEN_DATA_DIR, load_sql_via_cli
+
+
+@pytest.fixture(scope="module")
+def plan_auditor(mysql_session):
+    """Auditor and representative parameters on the loaded golden dataset."""
+    dataset_path = GOLDEN_DATA_DIR / "2025-12-21"
+    sql_files = ["parks.sql", "rides.sql", "snapshots.sql"]
+    missing = [name for name in sql_files if not (dataset_path / name).exists()]
+    if missing:
+        pytest.skip(f"Golden dataset 2025-12-21 incomplete, missing: {', '.join(missing)}")
+    for sql_file in sql_files:
+        load_sql_via_cli(dataset_path / sql_file)
+
+    auditor = QueryPlanAuditor(mysql_session)
+    return auditor, auditor.representative_context()
+
+
+class TestQueryPlans:
+    """Every query class must be able to use an index on the time-series tables."""
+
+    @pytest.mark.golden_data
+    @pytest.mark.parametrize("case", QUERY_CASES, ids=lambda case: case.name)
+    def test_query_uses_indexes(self, plan_auditor, case):
+        auditor, context = plan_auditor
+
+        report = auditor.audit_case(case, context)
+
+        if report.error:
+            pytest.fail(f"Query failed on the golden dataset: {report.error}")
+        for finding in report.findings:
+            print(f"{case.name}: {finding.severity} {finding.problem} {finding.table or ''} {finding.detail}")
+        for suggestion in report.suggestions:
+            print(f"{case.name}: suggest {suggestion.ddl}")
+        assert report.statements > 0
+        assert report.passed, [f for f in report.findings if f.severity == 'CRITICAL']
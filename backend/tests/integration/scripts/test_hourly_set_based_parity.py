@@ -0,0 +1,130 @@
+"""
+Parity tests: set-based vs per-ride hourly aggregation.
+
+Runs HourlyAggregator's per-ride/per-park statements and the set-based
+GROUP BY statements against the same seeded hour and asserts that
+ride_hourly_stats and park_hourly_stats rows are identical.
+
+Both paths take the session explicitly, so the seeded rows are visible
+inside the test transaction and rolled back afterwards.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from scripts.aggregate_hourly import HourlyAggregator
+
+
+HOUR = datetime(2025, 12, 5, 18, 0)
+
+RIDE_COLUMNS = (
+    "ride_id, park_id, avg_wait_time_minutes, operating_snapshots, down_snapshots, "
+    "downtime_hours, uptime_percentage, snapshot_count, ride_operated"
+)
+PARK_COLUMNS = (
+    "park_id, shame_score, avg_wait_time_minutes, rides_operating, rides_down, "
+    "total_downtime_hours, weighted_downtime_hours, effective_park_weight, "
+    "snapshot_count, park_was_open"
+)
+
+
+@pytest.fixture
+def seeded_hour(mysql_session):
+    """
+    Two parks (one Disney) with a mix of OPERATING/DOWN/CLOSED rides across
+    one hour, plus one ride with no snapshots in the hour.
+    """
+    parks = [
+        {'id': 9601, 'disney': True},
+        {'id': 9602, 'disney': False},
+    ]
+    rides = []
+    for park in parks:
+        mysql_session.execute(text("""
+            INSERT INTO parks (park_id, queue_times_id, name, city, state_province, country,
+                               timezone, is_disney, is_universal, is_active)
+            VALUES (:id, :id, :name, 'Orlando', 'FL', 'US', 'America/New_York', :disney, FALSE, TRUE)
+        """), {'id': park['id'], 'name': f"Parity Park {park['id']}", 'disney': park['disney']})
+
+        for idx in range(4):
+            ride_id = park['id'] * 10 + idx
+            mysql_session.execute(text("""
+                INSERT INTO rides (ride_id, queue_times_id, park_id, name, is_active, category)
+                VALUES (:id, :id, :park_id, :name, TRUE, 'ATTRACTION')
+            """), {'id': ride_id, 'park_id': park['id'], 'name': f"Parity Ride {ride_id}"})
+            rides.append(SimpleNamespace(ride_id=ride_id, park_id=park['id'], name=f"Parity Ride {ride_id}"))
+
+        for minute in range(0, 60, 5):
+            ts = HOUR + timedelta(minutes=minute)
+            mysql_session.execute(text("""
+                INSERT INTO park_activity_snapshots (park_id, recorded_at, park_appears_open,
+                                                     rides_open, rides_closed, avg_wait_time)
+                VALUES (:park_id, :ts, :open, 2, 1, 25.0)
+            """), {'park_id': park['id'], 'ts': ts, 'open': minute < 50})
+
+            for idx, status in enumerate(('OPERATING', 'DOWN', 'CLOSED')):
+                # Ride 0 flips to DOWN halfway through the hour
+                if idx == 0 and minute >= 30:
+                    status = 'DOWN'
+                is_open = status == 'OPERATING'
+                mysql_session.execute(text("""
+                    INSERT INTO ride_status_snapshots (ride_id, recorded_at, status, computed_is_open, wait_time)
+                    VALUES (:ride_id, :ts, :status, :is_open, :wait_time)
+                """), {
+                    'ride_id': park['id'] * 10 + idx,
+                    'ts': ts,
+                    'status': status,
+                    'is_open': is_open,
+                    'wait_time': 10 + minute if is_open else None,
+                })
+
+    parks_ns = [SimpleNamespace(park_id=p['id'], name=f"Parity Park {p['id']}") for p in parks]
+    # Ride 0 of each park operated today; ride 1 (DOWN all hour) only counts for Disney
+    operated_today = {9601 * 10, 9601 * 10 + 1, 9602 * 10}
+    return parks_ns, rides, operated_today
+
+
+def _fetch(session, table, columns, key):
+    return session.execute(text(f"""
+        SELECT {columns} FROM {table}
+        WHERE hour_start_utc = :hour AND park_id IN (9601, 9602)
+        ORDER BY {key}
+    """), {'hour': HOUR}).fetchall()
+
+
+def _clear(session):
+    for table in ('park_hourly_stats', 'ride_hourly_stats'):
+        session.execute(text(f"""
+            DELETE FROM {table} WHERE hour_start_utc = :hour AND park_id IN (9601, 9602)
+        """), {'hour': HOUR})
+
+
+class TestHourlySetBasedParity:
+
+    def test_ride_and_park_rows_match_per_ride_path(self, mysql_session, seeded_hour):
+        parks, rides, operated_today = seeded_hour
+
+        per_ride = HourlyAggregator(target_hour=HOUR, set_based=False)
+        for ride in rides:
+            per_ride._aggregate_ride(mysql_session, ride, operated_today)
+        for park in parks:
+            per_ride._aggregate_park(mysql_session, park)
+        expected_rides = _fetch(mysql_session, 'ride_hourly_stats', RIDE_COLUMNS, 'ride_id')
+        expected_parks = _fetch(mysql_session, 'park_hourly_stats', PARK_COLUMNS, 'park_id')
+
+        _clear(mysql_session)
+
+        # Chunk size smaller than the ride count exercises multiple statements
+        set_based = HourlyAggregator(target_hour=HOUR, ride_chunk_size=3)
+        set_based._aggregate_rides_set_based(mysql_session, rides, operated_today)
+        set_based._aggregate_parks_set_based(mysql_session, parks)
+        actual_rides = _fetch(mysql_session, 'ride_hourly_stats', RIDE_COLUMNS, 'ride_id')
+        actual_parks = _fetch(mysql_session, 'park_hourly_stats', PARK_COLUMNS, 'park_id')
+
+        assert len(expected_rides) == 6  # ride 3 in each park has no snapshots
+        assert actual_rides == expected_rides
+        assert actual_parks == expected_parks
+        assert set_based.stats['errors'] == 0
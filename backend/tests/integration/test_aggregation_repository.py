@@ -230,3 +230,30 @@ class TestAggregationLogRepository:
         status = repo.get_aggregation_status(date(2099, 12, 31), 'daily')
 
         assert status is None
+
+    def test_unit_entries_do_not_mark_date_aggregated(self, mysql_session):
+        """Per-unit checkpoint rows are ignored by run-level checks."""
+        repo = AggregationLogRepository(mysql_session)
+
+        target_date = date(2099, 1, 15)
+        repo.record_completed_unit(target_date, 'recompute:v1:parks', parks_processed=3)
+
+        assert repo.is_date_aggregated(target_date, 'daily') is False
+        assert repo.get_aggregation_status(target_date, 'daily') is None
+
+    def test_get_completed_unit_keys(self, mysql_session):
+        """Completed unit keys are grouped by date and filtered by prefix."""
+        repo = AggregationLogRepository(mysql_session)
+
+        day1, day2 = date(2099, 2, 1), date(2099, 2, 2)
+        repo.record_completed_unit(day1, 'recompute:v1:rides:1-250', rides_processed=250)
+        repo.record_completed_unit(day1, 'recompute:v1:parks', parks_processed=5)
+        repo.record_completed_unit(day2, 'recompute:v1:rides:1-250', rides_processed=250)
+        repo.record_completed_unit(day2, 'recompute:v2:parks', parks_processed=5)
+
+        completed = repo.get_completed_unit_keys(day1, day2, 'recompute:v1:')
+
+        assert completed == {
+            day1: {'recompute:v1:rides:1-250', 'recompute:v1:parks'},
+            day2: {'recompute:v1:rides:1-250'},
+        }
@@ -344,6 +344,40 @@ class TestRideRepositoryQueries:
         assert len(rides) == 2
         assert all(r.is_active in (True, 1) for r in rides)
 
+    def test_get_all_active_identities_pairs_wiki_ids(self, mysql_session, sample_park_data):
+        """
+        get_all_active_identities() should pair active rides with their wiki UUID.
+
+        Given: 1 mapped active ride, 1 unmapped active ride, 1 inactive ride
+        When: get_all_active_identities() is called
+        Then: Return 2 (themeparks_wiki_id, Ride) tuples
+        """
+        from sqlalchemy import text
+        from tests.conftest import insert_sample_park, insert_sample_ride
+
+        conn = mysql_session.connection()
+        park_id = insert_sample_park(conn, sample_park_data)
+
+        ride_ids = []
+        for idx in range(3):
+            ride_ids.append(insert_sample_ride(conn, {
+                'queue_times_id': 2001 + idx,
+                'park_id': park_id,
+                'name': f'Ride {idx}',
+                'land_area': None,
+                'tier': 2,
+                'is_active': 1 if idx < 2 else 0
+            }))
+        conn.execute(
+            text("UPDATE rides SET themeparks_wiki_id = :wiki_id WHERE ride_id = :ride_id"),
+            {'wiki_id': 'abc-123', 'ride_id': ride_ids[0]}
+        )
+
+        repo = RideRepository(mysql_session)
+        identities = dict((ride.ride_id, wiki_id) for wiki_id, ride in repo.get_all_active_identities())
+
+        assert identities == {ride_ids[0]: 'abc-123', ride_ids[1]: None}
+
     def test_get_unclassified_rides(self, mysql_session, sample_park_data):
         """
         get_unclassified_rides() should return rides without tier classification.
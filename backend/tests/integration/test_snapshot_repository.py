@@ -116,6 +116,47 @@ class TestRideStatusSnapshotRepository:
         assert latest is not None
         assert latest['wait_time'] == 45  # Latest snapshot
 
+    def test_get_latest_by_rides_single_query(self, mysql_session):
+        """Get most recent snapshot for every ride in a park with one query."""
+        from models import Park, Ride
+        from datetime import timedelta
+
+        park = Park(
+            queue_times_id=103,
+            name='Epcot',
+            city='Orlando',
+            country='US',
+            timezone='America/New_York',
+            is_active=True
+        )
+        mysql_session.add(park)
+        mysql_session.flush()
+
+        rides = [
+            Ride(queue_times_id=1003 + idx, park_id=park.park_id, name=f'Ride {idx}',
+                 is_active=True, category='ATTRACTION')
+            for idx in range(2)
+        ]
+        mysql_session.add_all(rides)
+        mysql_session.flush()
+
+        repo = RideStatusSnapshotRepository(mysql_session)
+        base_time = datetime.now()
+        repo.insert_many([
+            {'ride_id': rides[0].ride_id, 'recorded_at': base_time - timedelta(minutes=10),
+             'wait_time': 30, 'is_open': 1, 'computed_is_open': 1, 'status': 'OPERATING'},
+            {'ride_id': rides[0].ride_id, 'recorded_at': base_time,
+             'wait_time': None, 'is_open': 0, 'computed_is_open': 0, 'status': 'DOWN'},
+            {'ride_id': rides[1].ride_id, 'recorded_at': base_time,
+             'wait_time': 15, 'is_open': 1, 'computed_is_open': 1, 'status': 'OPERATING'},
+        ])
+
+        latest = repo.get_latest_by_rides(park_id=park.park_id)
+
+        assert set(latest) == {rides[0].ride_id, rides[1].ride_id}
+        assert latest[rides[0].ride_id]['status'] == 'DOWN'
+        assert latest[rides[1].ride_id]['wait_time'] == 15
+
     def test_get_latest_by_ride_not_found(self, mysql_session):
         """Get latest snapshot for nonexistent ride."""
         repo = RideStatusSnapshotRepository(mysql_session)
@@ -0,0 +1,117 @@
+"""
+Hourly Aggregation Timing Benchmark
+===================================
+
+Seeds one hour of production-scale snapshot data (80 parks x 4,200 rides at
+5-minute intervals) and times HourlyAggregator's per-ride path against the
+set-based GROUP BY path.
+
+Run with: pytest tests/performance/test_hourly_aggregation_timing.py -v -s
+
+Note: Requires a local MariaDB/MySQL (TEST_DB_* env vars). All seeded rows
+are rolled back after measurement.
+"""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+
+from scripts.aggregate_hourly import HourlyAggregator
+
+
+PARK_COUNT = 80
+RIDES_PER_PARK = 53  # ~4,200 rides total
+HOUR = datetime(2000, 1, 1, 18, 0)
+ID_BASE = 900000
+
+
+def _seed(session):
+    parks, rides, park_rows, ride_rows, pas_rows, rss_rows = [], [], [], [], [], []
+    for p in range(PARK_COUNT):
+        park_id = ID_BASE + p
+        park_rows.append({'id': park_id, 'name': f"Bench Park {p}", 'disney': p % 4 == 0})
+        parks.append(SimpleNamespace(park_id=park_id, name=f"Bench Park {p}"))
+        for r in range(RIDES_PER_PARK):
+            ride_id = ID_BASE * 10 + p * RIDES_PER_PARK + r
+            ride_rows.append({'id': ride_id, 'park_id': park_id, 'name': f"Bench Ride {ride_id}"})
+            rides.append(SimpleNamespace(ride_id=ride_id, park_id=park_id, name=f"Bench Ride {ride_id}"))
+
+    for minute in range(0, 60, 5):
+        ts = HOUR + timedelta(minutes=minute)
+        for park in parks:
+            pas_rows.append({'park_id': park.park_id, 'ts': ts})
+        for ride in rides:
+            status = 'DOWN' if (ride.ride_id + minute) % 7 == 0 else 'OPERATING'
+            rss_rows.append({'ride_id': ride.ride_id, 'ts': ts, 'status': status,
+                             'is_open': status == 'OPERATING', 'wait_time': 20})
+
+    session.execute(text("""
+        INSERT INTO parks (park_id, queue_times_id, name, city, state_province, country,
+                           timezone, is_disney, is_universal, is_active)
+        VALUES (:id, :id, :name, 'Orlando', 'FL', 'US', 'America/New_York', :disney, FALSE, TRUE)
+    """), park_rows)
+    session.execute(text("""
+        INSERT INTO rides (ride_id, queue_times_id, park_id, name, is_active, category)
+        VALUES (:id, :id, :park_id, :name, TRUE, 'ATTRACTION')
+    """), ride_rows)
+    session.execute(text("""
+        INSERT INTO park_activity_snapshots (park_id, recorded_at, park_appears_open,
+                                             rides_open, rides_closed, avg_wait_time)
+        VALUES (:park_id, :ts, TRUE, 45, 8, 20.0)
+    """), pas_rows)
+    session.execute(text("""
+        INSERT INTO ride_status_snapshots (ride_id, recorded_at, status, computed_is_open, wait_time)
+        VALUES (:ride_id, :ts, :status, :is_open, :wait_time)
+    """), rss_rows)
+    return parks, rides, {ride.ride_id for ride in rides}
+
+
+def _clear(session):
+    for table in ('park_hourly_stats', 'ride_hourly_stats'):
+        session.execute(text(f"DELETE FROM {table} WHERE hour_start_utc = :hour"), {'hour': HOUR})
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.requires_db
+class TestHourlyAggregationTiming:
+    """Wall-clock for one hour of aggregation at production scale."""
+
+    def test_set_based_outperforms_per_ride(self, mysql_session):
+        try:
+            parks, rides, operated_today = _seed(mysql_session)
+
+            per_ride = HourlyAggregator(target_hour=HOUR, set_based=False)
+            start = time.perf_counter()
+            for ride in rides:
+                per_ride._aggregate_ride(mysql_session, ride, operated_today)
+            for park in parks:
+                per_ride._aggregate_park(mysql_session, park)
+            per_ride_seconds = time.perf_counter() - start
+
+            _clear(mysql_session)
+
+            set_based = HourlyAggregator(target_hour=HOUR)
+            start = time.perf_counter()
+            set_based._aggregate_rides_set_based(mysql_session, rides, operated_today)
+            set_based._aggregate_parks_set_based(mysql_session, parks)
+            set_based_seconds = time.perf_counter() - start
+        finally:
+            mysql_session.rollback()
+
+        chunks = -(-len(rides) // set_based.ride_chunk_size)
+
+        print(f"\n{'='*60}")
+        print("Hourly aggregation timing")
+        print(f"{'='*60}")
+        print(f"  Parks / rides:  {len(parks)} / {len(rides)}")
+        print(f"  Per-ride:       {per_ride_seconds:.2f}s ({2 * (len(rides) + len(parks))} statements)")
+        print(f"  Set-based:      {set_based_seconds:.2f}s ({chunks + 1} statements)")
+        print(f"  Speedup:        {per_ride_seconds / set_based_seconds:.1f}x")
+        print(f"{'='*60}")
+
+        assert set_based.stats['errors'] == 0
+        assert set_based_seconds < per_ride_seconds
@@ -0,0 +1,82 @@
+"""
+Snapshot Insert Throughput Benchmark
+====================================
+
+Compares rows/sec for the per-row insert() path (one INSERT + flush round
+trip per ride) against the multi-row insert_many() path used by
+collect_snapshots.
+
+Run with: pytest tests/performance/test_snapshot_insert_throughput.py -v -s
+
+Note: Requires a local MariaDB/MySQL (TEST_DB_* env vars) with at least one
+ride. All rows are rolled back after measurement.
+"""
+
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from database.repositories.snapshot_repository import RideStatusSnapshotRepository
+
+
+ROWS_PER_RUN = 2000
+
+
+def _build_snapshots(ride_id: int, count: int):
+    recorded_at = datetime(2000, 1, 1, 0, 0, 0)
+    return [
+        {
+            'ride_id': ride_id,
+            'recorded_at': recorded_at,
+            'wait_time': i % 90,
+            'is_open': True,
+            'computed_is_open': True,
+            'status': 'OPERATING',
+            'last_updated_api': recorded_at,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+@pytest.mark.requires_db
+class TestSnapshotInsertThroughput:
+    """Rows/sec for ride_status_snapshots insert paths."""
+
+    def test_insert_many_outperforms_per_row_insert(self, mysql_session):
+        ride_id = mysql_session.execute(text("SELECT ride_id FROM rides LIMIT 1")).scalar()
+        if ride_id is None:
+            pytest.skip("Benchmark requires at least one ride in the database")
+
+        repo = RideStatusSnapshotRepository(mysql_session)
+        snapshots = _build_snapshots(ride_id, ROWS_PER_RUN)
+
+        try:
+            start = time.perf_counter()
+            for snapshot in snapshots:
+                repo.insert(snapshot)
+            per_row_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            repo.insert_many(snapshots)
+            mysql_session.flush()
+            bulk_seconds = time.perf_counter() - start
+        finally:
+            mysql_session.rollback()
+
+        per_row_rate = ROWS_PER_RUN / per_row_seconds
+        bulk_rate = ROWS_PER_RUN / bulk_seconds
+
+        print(f"\n{'='*60}")
+        print("ride_status_snapshots insert throughput")
+        print(f"{'='*60}")
+        print(f"  Rows:        {ROWS_PER_RUN}")
+        print(f"  insert():      {per_row_rate:,.0f} rows/sec ({per_row_seconds:.3f}s)")
+        print(f"  insert_many(): {bulk_rate:,.0f} rows/sec ({bulk_seconds:.3f}s)")
+        print(f"  Speedup:     {bulk_rate / per_row_rate:.1f}x")
+        print(f"{'='*60}")
+
+        assert bulk_rate > per_row_rate
@@ -17,6 +17,7 @@ from datetime import date
 from unittest.mock import Mock, patch
 
 from processor.aggregation_service import AggregationService
+from models import RideMonthlyStats
 
 
 class TestAggregationServiceInit:
@@ -360,3 +361,187 @@ class TestRetryLogicSupport:
                         # Both should succeed
                         assert result1['status'] == 'success'
                         assert result2['status'] == 'success'
+
+
+def _compiled(stmt):
+    """Render a statement with the MySQL dialect and literal values."""
+    from sqlalchemy.dialects import mysql
+    return str(stmt.compile(dialect=mysql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+class TestBatchDailyRideStats:
+    """Test batch mode daily ride aggregation (one grouped query per timezone)."""
+
+    def _sessions(self):
+        from datetime import datetime
+        return {
+            1: {'session_start_utc': datetime(2024, 7, 15, 13), 'session_end_utc': datetime(2024, 7, 16, 2),
+                'operating_minutes': 780},
+            2: {'session_start_utc': datetime(2024, 7, 15, 14), 'session_end_utc': datetime(2024, 7, 16, 1),
+                'operating_minutes': 660},
+        }
+
+    def test_one_grouped_query_and_one_upsert(self):
+        from types import SimpleNamespace
+        mock_session = Mock()
+        grouped = Mock()
+        grouped.all.return_value = [
+            SimpleNamespace(ride_id=10, park_id=1, total_snapshots=4, uptime_snapshots=3,
+                            downtime_snapshots=1, avg_wait_time=22.5, min_wait_time=5, max_wait_time=45),
+            SimpleNamespace(ride_id=20, park_id=2, total_snapshots=0, uptime_snapshots=0,
+                            downtime_snapshots=0, avg_wait_time=None, min_wait_time=None, max_wait_time=None),
+        ]
+        mock_session.execute.side_effect = [grouped, Mock()]
+
+        service = AggregationService(mock_session)
+        with patch.object(service.change_detector, 'detect_status_changes_for_rides', return_value={
+            10: [{'new_status': False, 'downtime_duration_minutes': None},
+                 {'new_status': True, 'downtime_duration_minutes': 30}],
+        }) as detect:
+            count = service._aggregate_rides_daily_stats_batch(date(2024, 7, 15), self._sessions())
+
+        assert count == 2
+        assert mock_session.execute.call_count == 2
+        # Only rides with snapshots are scanned for status changes
+        assert list(detect.call_args[0][0]) == [10]
+
+        grouped_sql = _compiled(mock_session.execute.call_args_list[0][0][0])
+        assert 'GROUP BY rides.ride_id, rides.park_id' in grouped_sql
+        assert 'LEFT OUTER JOIN ride_status_snapshots' in grouped_sql
+
+        upsert_sql = _compiled(mock_session.execute.call_args_list[1][0][0])
+        assert 'ON DUPLICATE KEY UPDATE' in upsert_sql
+        assert '(10, ' in upsert_sql and '(20, ' in upsert_sql
+
+    def test_build_row_matches_per_ride_formula(self):
+        from types import SimpleNamespace
+        service = AggregationService(Mock())
+        stats = SimpleNamespace(total_snapshots=4, uptime_snapshots=3, avg_wait_time=22.456,
+                                min_wait_time=5, max_wait_time=45)
+        changes = [{'new_status': False}, {'new_status': True, 'downtime_duration_minutes': 30}]
+
+        row = service._build_ride_daily_stats_row(10, date(2024, 7, 15), stats, 600, changes)
+
+        assert row['uptime_minutes'] == 450
+        assert row['downtime_minutes'] == 150
+        assert row['uptime_percentage'] == 75.0
+        assert row['avg_wait_time'] == 22.46
+        assert row['peak_wait_time'] == 45
+        assert row['status_changes'] == 1
+        assert row['longest_downtime_minutes'] == 30
+
+    def test_per_ride_mode_keeps_legacy_path(self):
+        mock_session = Mock()
+        service = AggregationService(mock_session, batch_mode=False)
+        assert service.batch_mode is False
+
+
+class TestBatchPeriodStats:
+    """Test batch mode weekly/monthly aggregation."""
+
+    def test_rides_weekly_batch_uses_previous_week_dict(self):
+        from types import SimpleNamespace
+        mock_session = Mock()
+        sums = Mock()
+        sums.all.return_value = [
+            SimpleNamespace(ride_id=10, uptime_minutes=900, downtime_minutes=120, operating_hours_minutes=1020,
+                            status_changes=3, peak_wait_time=60, weighted_wait_sum=30600,
+                            total_operating_minutes=1020),
+            SimpleNamespace(ride_id=11, uptime_minutes=None, downtime_minutes=None, operating_hours_minutes=None,
+                            status_changes=None, peak_wait_time=None, weighted_wait_sum=None,
+                            total_operating_minutes=None),
+        ]
+        previous = [(10, 100)]
+        mock_session.execute.side_effect = [sums, iter(previous), Mock()]
+
+        service = AggregationService(mock_session)
+        with patch.object(service, '_upsert_many') as upsert:
+            count = service._aggregate_rides_weekly_stats(2024, 1, date(2024, 1, 1))
+
+        assert count == 2
+        rows = upsert.call_args[0][1]
+        assert len(rows) == 1
+        assert rows[0]['trend_vs_previous_week'] == 20.0
+        assert rows[0]['avg_wait_time'] == 30.0
+        assert rows[0]['uptime_percentage'] == 88.24
+
+        previous_sql = _compiled(mock_session.execute.call_args_list[1][0][0])
+        # Week 1 of 2024 looks back to week 52 of 2023
+        assert 'ride_weekly_stats.year = 2023' in previous_sql
+        assert 'ride_weekly_stats.week_number = 52' in previous_sql
+
+    def test_parks_monthly_batch_single_grouped_query(self):
+        from types import SimpleNamespace
+        mock_session = Mock()
+        rollup = Mock()
+        rollup.all.return_value = [
+            SimpleNamespace(park_id=1, total_rides_tracked=5, avg_uptime_percentage=91.234,
+                            total_downtime_hours=12.5, rides_with_downtime=2, weighted_wait_sum=None,
+                            total_operating_minutes=3000, peak_wait_time=90),
+        ]
+        mock_session.execute.side_effect = [rollup, iter([]), Mock()]
+
+        service = AggregationService(mock_session)
+        count = service._aggregate_parks_monthly_stats(2024, 3)
+
+        assert count == 1
+        assert 'GROUP BY rides.park_id' in _compiled(mock_session.execute.call_args_list[0][0][0])
+        upsert_sql = _compiled(mock_session.execute.call_args_list[2][0][0])
+        assert 'INSERT INTO park_monthly_stats' in upsert_sql
+        assert 'trend_vs_previous_month = VALUES(trend_vs_previous_month)' in upsert_sql
+
+    def test_upsert_many_chunks_and_skips_key_columns(self):
+        mock_session = Mock()
+        service = AggregationService(mock_session)
+        rows = [{'ride_id': i, 'year': 2024, 'month': 3, 'uptime_minutes': i} for i in range(2500)]
+
+        service._upsert_many(RideMonthlyStats, rows, key_columns=('ride_id', 'year', 'month'))
+
+        assert mock_session.execute.call_count == 3
+        sql = _compiled(mock_session.execute.call_args_list[-1][0][0])
+        update_clause = sql.split('ON DUPLICATE KEY UPDATE')[1]
+        assert 'uptime_minutes' in update_clause
+        assert 'ride_id' not in update_clause
+
+    def test_percentage_change(self):
+        assert AggregationService._percentage_change(120, 100) == 20.0
+        assert AggregationService._percentage_change(50, 0) is None
+        assert AggregationService._percentage_change(50, None) is None
+
+
+class TestBatchStatusChangeDetection:
+    """Test StatusChangeDetector.detect_status_changes_for_rides()."""
+
+    def test_applies_each_ride_window(self):
+        from datetime import datetime
+        from types import SimpleNamespace
+        from processor.status_change_detector import StatusChangeDetector
+
+        def snap(ride_id, hour, is_open):
+            mapping = {'snapshot_id': 1, 'ride_id': ride_id,
+                       'recorded_at': datetime(2024, 7, 15, hour), 'computed_is_open': is_open}
+            return SimpleNamespace(_mapping=mapping, **mapping)
+
+        mock_session = Mock()
+        mock_session.execute.return_value = [
+            snap(1, 8, True), snap(1, 10, False), snap(1, 11, True),
+            # Ride 2's window starts at 10:00, so the 9:00 transition is excluded
+            snap(2, 9, True), snap(2, 10, False), snap(2, 11, False),
+        ]
+
+        detector = StatusChangeDetector(mock_session)
+        changes = detector.detect_status_changes_for_rides({
+            1: (datetime(2024, 7, 15, 8), datetime(2024, 7, 15, 12)),
+            2: (datetime(2024, 7, 15, 10), datetime(2024, 7, 15, 12)),
+        })
+
+        assert mock_session.execute.call_count == 1
+        assert [c['new_status'] for c in changes[1]] == [False, True]
+        assert changes[1][1]['downtime_duration_minutes'] == 60
+        assert 2 not in changes
+
+    def test_no_rides_no_query(self):
+        from processor.status_change_detector import StatusChangeDetector
+        mock_session = Mock()
+        assert StatusChangeDetector(mock_session).detect_status_changes_for_rides({}) == {}
+        mock_session.execute.assert_not_called()
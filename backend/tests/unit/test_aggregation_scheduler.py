@@ -0,0 +1,205 @@
+"""
+Unit Tests: AggregationScheduler
+
+Verifies that work units run in parallel worker processes, that failed units
+are retried up to max_attempts, and that every unit gets its own
+aggregation_log entry marked success or failed.
+"""
+
+import os
+import time
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models import AggregationType
+from processor.aggregation_scheduler import (
+    AggregationScheduler,
+    AggregationUnitsFailed,
+    WorkUnit,
+)
+
+
+DAY = date(2025, 12, 1)
+
+
+# Worker functions must be module-level so they can be pickled to the pool
+
+def _echo_unit(value):
+    return {'parks_processed': value, 'rides_processed': value * 10, 'pid': os.getpid()}
+
+
+def _sleepy_unit(value):
+    time.sleep(0.3)
+    return {'parks_processed': 1}
+
+
+def _flaky_unit(marker):
+    """Fail on the first attempt, succeed once the marker file exists."""
+    path = Path(marker)
+    if not path.exists():
+        path.write_text('attempted')
+        raise RuntimeError("transient failure")
+    return {'rides_processed': 5}
+
+
+def _failing_unit(value):
+    raise ValueError(f"bad unit {value}")
+
+
+def _unit(key, **params):
+    return WorkUnit(DAY, AggregationType.DAILY, key, params)
+
+
+@pytest.fixture
+def unit_logs():
+    """Capture per-unit log calls instead of writing aggregation_log."""
+    with patch.object(AggregationScheduler, '_start_unit_log', side_effect=lambda unit: f"log-{unit.unit_key}") as start, \
+            patch.object(AggregationScheduler, '_finish_unit_log') as finish:
+        yield start, finish
+
+
+class TestInlineExecution:
+    """max_workers=1 runs units in the current process."""
+
+    def test_results_preserve_input_order(self, unit_logs):
+        scheduler = AggregationScheduler(_echo_unit, max_workers=1)
+
+        results = scheduler.run([_unit('b', value=2), _unit('a', value=1)])
+
+        assert [r.unit.unit_key for r in results] == ['b', 'a']
+        assert all(r.succeeded and r.attempts == 1 for r in results)
+        assert results[0].result['pid'] == os.getpid()
+
+    def test_failed_unit_retried_until_max_attempts(self, unit_logs):
+        scheduler = AggregationScheduler(_failing_unit, max_workers=1, max_attempts=3)
+
+        [result] = scheduler.run([_unit('tz:UTC', value=7)])
+
+        assert not result.succeeded
+        assert result.attempts == 3
+        assert result.error == "ValueError: bad unit 7"
+
+    def test_flaky_unit_succeeds_on_retry(self, unit_logs, tmp_path):
+        scheduler = AggregationScheduler(_flaky_unit, max_workers=1, max_attempts=2)
+
+        [result] = scheduler.run([_unit('tz:UTC', marker=str(tmp_path / 'marker'))])
+
+        assert result.succeeded
+        assert result.attempts == 2
+
+    def test_empty_units(self, unit_logs):
+        assert AggregationScheduler(_echo_unit, max_workers=4).run([]) == []
+
+
+class TestPoolExecution:
+    """max_workers>1 fans units out to worker processes."""
+
+    def test_units_run_in_worker_processes(self, unit_logs):
+        scheduler = AggregationScheduler(_echo_unit, max_workers=2)
+
+        results = scheduler.run([_unit(f'tz:{i}', value=i) for i in range(4)])
+
+        assert [r.result['parks_processed'] for r in results] == [0, 1, 2, 3]
+        assert all(r.result['pid'] != os.getpid() for r in results)
+
+    def test_wall_clock_is_roughly_slowest_unit(self, unit_logs):
+        scheduler = AggregationScheduler(_sleepy_unit, max_workers=4)
+
+        start = time.monotonic()
+        scheduler.run([_unit(f'tz:{i}', value=i) for i in range(4)])
+        elapsed = time.monotonic() - start
+
+        # Serial would be 1.2s plus pool startup
+        assert elapsed < 1.0
+
+    def test_failed_unit_is_resubmitted(self, unit_logs, tmp_path):
+        scheduler = AggregationScheduler(_flaky_unit, max_workers=2, max_attempts=3)
+
+        results = scheduler.run([
+            _unit('tz:a', marker=str(tmp_path / 'a')),
+            _unit('tz:b', marker=str(tmp_path / 'b')),
+        ])
+
+        assert all(r.succeeded and r.attempts == 2 for r in results)
+
+    def test_on_result_called_once_per_unit(self, unit_logs):
+        seen = []
+        scheduler = AggregationScheduler(_echo_unit, max_workers=2, on_result=seen.append)
+
+        scheduler.run([_unit(f'tz:{i}', value=i) for i in range(3)])
+
+        assert sorted(r.unit.unit_key for r in seen) == ['tz:0', 'tz:1', 'tz:2']
+
+
+class TestUnitLogging:
+    """Each unit is recorded in aggregation_log."""
+
+    def test_each_unit_logged_with_final_status(self, unit_logs):
+        start, finish = unit_logs
+        scheduler = AggregationScheduler(_failing_unit, max_workers=1, max_attempts=1)
+
+        scheduler.run([_unit('tz:a', value=1), _unit('tz:b', value=2)])
+
+        assert [c.args[0].unit_key for c in start.call_args_list] == ['tz:a', 'tz:b']
+        finished = {c.args[0]: c.args[1].status for c in finish.call_args_list}
+        assert finished == {'log-tz:a': 'failed', 'log-tz:b': 'failed'}
+
+    def test_log_units_false_skips_log_writes(self):
+        with patch('database.connection.get_db_session') as get_session:
+            AggregationScheduler(_echo_unit, max_workers=1, log_units=False).run([_unit('a', value=1)])
+
+        get_session.assert_not_called()
+
+    def test_finish_log_records_counts(self):
+        session = MagicMock()
+        scheduler = AggregationScheduler(_echo_unit, max_workers=1)
+
+        with patch('database.connection.get_db_session') as get_session, \
+                patch('database.repositories.aggregation_repository.AggregationLogRepository') as repo_cls:
+            get_session.return_value.__enter__.return_value = session
+            repo_cls.return_value.insert.return_value = 42
+            scheduler.run([_unit('tz:UTC', value=3)])
+
+        insert_data = repo_cls.return_value.insert.call_args.args[0]
+        assert insert_data['unit_key'] == 'tz:UTC'
+        assert insert_data['status'] == 'running'
+        repo_cls.return_value.mark_complete.assert_called_once_with(
+            42, parks_processed=3, rides_processed=30
+        )
+
+
+class TestAggregateDailyParallel:
+    """AggregationService.aggregate_daily(max_workers>1) uses the scheduler."""
+
+    def test_failed_timezone_fails_whole_day(self):
+        from processor.aggregation_service import AggregationService
+        from processor.aggregation_scheduler import UnitResult
+
+        service = AggregationService(MagicMock())
+        failed = UnitResult(_unit('tz:Asia/Tokyo'), 'failed', 3, error='boom')
+        ok = UnitResult(_unit('tz:UTC'), 'success', 1, result={'parks_processed': 2, 'rides_processed': 9})
+
+        with patch('processor.aggregation_scheduler.AggregationScheduler.run', return_value=[ok, failed]):
+            with pytest.raises(AggregationUnitsFailed, match='tz:Asia/Tokyo'):
+                service._aggregate_daily_parallel(DAY, ['UTC', 'Asia/Tokyo'], max_workers=2)
+
+    def test_sums_unit_counts(self):
+        from processor.aggregation_service import AggregationService
+        from processor.aggregation_scheduler import UnitResult
+
+        service = AggregationService(MagicMock())
+        results = [
+            UnitResult(_unit('tz:UTC'), 'success', 1, result={'parks_processed': 2, 'rides_processed': 9}),
+            UnitResult(_unit('tz:Asia/Tokyo'), 'success', 2, result={'parks_processed': 1, 'rides_processed': 4}),
+        ]
+
+        with patch('processor.aggregation_scheduler.AggregationScheduler.run', return_value=results) as run:
+            totals = service._aggregate_daily_parallel(DAY, ['UTC', 'Asia/Tokyo'], max_workers=2)
+
+        assert totals == (3, 13)
+        units = run.call_args.args[0]
+        assert [u.unit_key for u in units] == ['tz:UTC', 'tz:Asia/Tokyo']
+        assert units[0].params == {'aggregation_date': DAY, 'timezone': 'UTC'}
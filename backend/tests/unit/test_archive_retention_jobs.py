@@ -0,0 +1,156 @@
+"""
+Archive Coverage Across Retention Jobs
+======================================
+
+maintain_partitions (03:30) drops whole expired days of the raw snapshot
+tables and cleanup_raw_data (04:00) deletes the partial day. With
+SNAPSHOT_ARCHIVE_DIR set, every row either job removes must reach the
+snapshot archive first.
+"""
+
+import importlib.util
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from database.partitioning import partition_day, partition_name  # noqa: E402
+from database.snapshot_archive import NULL, SnapshotArchive  # noqa: E402
+from scripts.maintain_partitions import run_maintenance  # noqa: E402
+
+CLEANUP_SCRIPT = Path(__file__).parents[2] / 'scripts' / 'cleanup_raw_data.py'
+
+START = datetime(2026, 1, 12)
+THRESHOLD = datetime(2026, 1, 14, 6, 0)
+SNAPSHOT_TIMES = [START + timedelta(hours=n) for n in range(60)]  # through 2026-01-14 11:00
+
+
+def _load_cleanup_script():
+    spec = importlib.util.spec_from_file_location('cleanup_raw_data', CLEANUP_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class Result:
+    """The parts of a SQLAlchemy result the jobs use."""
+
+    def __init__(self, rows=(), value=None):
+        self.rows = list(rows)
+        self.value = value
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def scalar(self):
+        return self.value
+
+    def mappings(self):
+        return SimpleNamespace(all=lambda: self.rows)
+
+
+class FakeDatabase:
+    """One ride in one park, hourly snapshots, day-partitioned snapshot tables."""
+
+    def __init__(self):
+        self.snapshots = [
+            {'recorded_at': t, 'ride_id': 1, 'status': 'OPERATING', 'computed_is_open': 1,
+             'is_open': 1, 'wait_time': 20}
+            for t in SNAPSHOT_TIMES
+        ]
+        self.activity = {t: 1 for t in SNAPSHOT_TIMES}
+        self.partitions = {
+            table: {t.date() for t in SNAPSHOT_TIMES}
+            for table in ('ride_status_snapshots', 'park_activity_snapshots')
+        }
+
+    def commit(self):
+        pass
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        params = params or {}
+        if 'information_schema.PARTITIONS' in sql:
+            days = sorted(self.partitions[params['table']])
+            return Result([SimpleNamespace(name=name) for name in [partition_name(d) for d in days] + ['p_future']])
+        if 'information_schema.TABLES' in sql:
+            return Result(value='BASE TABLE')
+        if 'REORGANIZE PARTITION' in sql:
+            table = sql.split()[2]
+            self.partitions[table].update(partition_day(name) for name in re.findall(r'p\d{8}', sql))
+            return Result()
+        if 'DROP PARTITION' in sql:
+            table = sql.split()[2]
+            days = {partition_day(name) for name in re.findall(r'p\d{8}', sql)}
+            self.partitions[table] -= days
+            if table == 'ride_status_snapshots':
+                self.snapshots = [row for row in self.snapshots if row['recorded_at'].date() not in days]
+            else:
+                self.activity = {t: v for t, v in self.activity.items() if t.date() not in days}
+            return Result()
+        if 'PARTITION (' in sql:
+            return Result(value=0)
+        if 'SELECT LEAST' in sql:
+            return Result(value=min([row['recorded_at'] for row in self.snapshots] + [params['threshold']]))
+        if 'DISTINCT park_id' in sql:
+            return Result([SimpleNamespace(park_id=1)])
+        if 'FROM ride_status_snapshots rss' in sql:
+            return Result([
+                {**row, 'park_appears_open': self.activity.get(row['recorded_at'])}
+                for row in self.snapshots
+                if params['since'] <= row['recorded_at'] < params['until']
+            ])
+        if 'FROM ride_status_changes rsc' in sql:
+            return Result([])
+        raise AssertionError(f"Unexpected statement: {sql}")
+
+
+class FakeDeleter:
+    """Row deletes of cleanup_raw_data against the fake database."""
+
+    def __init__(self, db):
+        self.db = db
+
+    def delete_before(self, table, key, time_column, threshold):
+        deleted = 0
+        if table == 'ride_status_snapshots':
+            kept = [row for row in self.db.snapshots if row['recorded_at'] >= threshold]
+            deleted = len(self.db.snapshots) - len(kept)
+            self.db.snapshots = kept
+        elif table == 'park_activity_snapshots':
+            kept = {t: v for t, v in self.db.activity.items() if t >= threshold}
+            deleted = len(self.db.activity) - len(kept)
+            self.db.activity = kept
+        return {'deleted': deleted, 'complete': True}
+
+
+class TestArchiveCoverage:
+    """Partition drops and row deletes both archive first."""
+
+    def test_every_removed_snapshot_is_archived(self, tmp_path):
+        db = FakeDatabase()
+        expired = [t for t in SNAPSHOT_TIMES if t < THRESHOLD]
+
+        stats = run_maintenance(db, THRESHOLD, THRESHOLD.date(), 1, archive_dir=str(tmp_path))
+        _load_cleanup_script().execute_cleanup(
+            db, THRESHOLD, THRESHOLD - timedelta(days=30), archive_dir=str(tmp_path), deleter=FakeDeleter(db)
+        )
+
+        assert stats['ride_status_snapshots']['dropped'] == 2
+        assert [row['recorded_at'] for row in db.snapshots] == [t for t in SNAPSHOT_TIMES if t >= THRESHOLD]
+        archived = SnapshotArchive(tmp_path).ride_snapshots(1, 1, START, THRESHOLD)
+        assert len(archived['recorded_at']) == len(expired)
+        # park activity was joined before its partitions were dropped
+        assert NULL not in archived['park_appears_open'].tolist()
+
+    def test_dry_run_does_not_archive(self, tmp_path):
+        db = FakeDatabase()
+
+        run_maintenance(db, THRESHOLD, THRESHOLD.date(), 1, dry_run=True, archive_dir=str(tmp_path))
+
+        assert SnapshotArchive(tmp_path).days() == []
+        assert len(db.snapshots) == len(SNAPSHOT_TIMES)
@@ -0,0 +1,140 @@
+"""
+Cache Warming Tests
+===================
+
+Route modules register their cacheable endpoints with api.cache_warming;
+warm() renders every combination in-process with bounded concurrency and
+reports per-key compute times.
+"""
+
+import threading
+import time
+
+import pytest
+from flask import Flask, jsonify, request
+
+from api.cache_warming import WarmableEndpoint, warm, warm_targets
+from utils.cache import QueryCache, warming
+
+
+class TestWarmableEndpoint:
+    """Test expansion of registered parameter values."""
+
+    def test_urls_are_cartesian_product(self):
+        endpoint = WarmableEndpoint('/parks/downtime', {
+            'period': ('live', 'today'),
+            'filter': ('all-parks', 'disney-universal'),
+        })
+
+        urls = endpoint.urls()
+
+        assert len(urls) == 4
+        assert '/api/parks/downtime?filter=all-parks&period=live' in urls
+        assert '/api/parks/downtime?filter=disney-universal&period=today' in urls
+
+    def test_no_params(self):
+        assert WarmableEndpoint('/search/index').urls() == ['/api/search/index']
+
+
+class TestRegistry:
+    """Test the endpoints registered by the route modules."""
+
+    def test_route_modules_register_page_load_endpoints(self):
+        targets = warm_targets()
+
+        assert '/api/search/index' in targets
+        assert '/api/live/status-summary?filter=disney-universal' in targets
+        assert '/api/parks/downtime?filter=all-parks&limit=50&period=last_week&sort_by=rides_down' in targets
+        assert '/api/rides/downtime?filter=all-parks&limit=100&period=live&sort_by=downtime_hours' in targets
+        assert len(targets) == len(set(targets))
+
+
+class TestWarmingContext:
+    """Test utils.cache.warming()."""
+
+    def test_records_compute_time_per_key(self):
+        cache = QueryCache(ttl_seconds=300)
+
+        with warming() as timings:
+            cache.get_or_compute("a", lambda: 1)
+            cache.get_or_compute("a", lambda: 1)
+            cache.get_or_compute("b", lambda: 2)
+
+        assert [key for key, _ in timings] == ["a", "b"]
+        assert all(seconds >= 0 for _, seconds in timings)
+
+    def test_expired_entries_are_recomputed_not_served_stale(self, monkeypatch):
+        from utils import cache as cache_module
+
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+        cache = QueryCache(ttl_seconds=60, stale_ttl_seconds=600)
+        cache.get_or_compute("k", lambda: "v1", serve_stale=True)
+        now[0] += 61
+
+        with warming():
+            assert cache.get_or_compute("k", lambda: "v2", serve_stale=True) == "v2"
+        assert cache.get_stats()["refreshes"] == 0
+
+    def test_other_threads_unaffected(self):
+        cache = QueryCache(ttl_seconds=300)
+        seen = []
+
+        with warming() as timings:
+            worker = threading.Thread(target=lambda: seen.append(cache.get_or_compute("k", lambda: 1)))
+            worker.start()
+            worker.join()
+
+        assert seen == [1]
+        assert timings == []
+
+
+class TestWarm:
+    """Test warm() against a small app."""
+
+    @pytest.fixture
+    def app(self):
+        app = Flask(__name__)
+        cache = QueryCache(ttl_seconds=300)
+        app.active = 0
+        app.max_active = 0
+        lock = threading.Lock()
+
+        @app.route('/api/slow')
+        def slow():
+            def compute():
+                with lock:
+                    app.active += 1
+                    app.max_active = max(app.max_active, app.active)
+                time.sleep(0.05)
+                with lock:
+                    app.active -= 1
+                return {"n": request.args.get('n')}
+            return jsonify(cache.get_or_compute(f"slow:{request.args.get('n')}", compute))
+
+        @app.route('/api/broken')
+        def broken():
+            return jsonify({"success": False}), 500
+
+        return app
+
+    def test_reports_computed_keys_then_hits(self, app):
+        urls = [f'/api/slow?n={n}' for n in range(3)]
+
+        first = warm(urls, concurrency=2, app=app)
+        second = warm(urls, concurrency=2, app=app)
+
+        assert all(r.ok for r in first + second)
+        assert sorted(key for r in first for key, _ in r.computed) == ['slow:0', 'slow:1', 'slow:2']
+        assert all(r.computed == [] for r in second)
+
+    def test_concurrency_is_bounded(self, app):
+        warm([f'/api/slow?n={n}' for n in range(8)], concurrency=2, app=app)
+
+        assert app.max_active <= 2
+
+    def test_failures_are_reported(self, app):
+        results = warm(['/api/broken'], app=app)
+
+        assert not results[0].ok
+        assert results[0].status == 500
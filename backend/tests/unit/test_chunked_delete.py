@@ -0,0 +1,141 @@
+"""
+Chunked Delete Tests
+====================
+
+cleanup_raw_data deletes expired rows in primary-key batches that commit
+separately, pause between batches, and stop at a runtime cap; a capped run
+must leave the rest for the next run to pick up.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from database.chunked_delete import ChunkedDeleter
+
+
+class FakeTable:
+    """Connection stand-in holding one table of {key: time} rows."""
+
+    def __init__(self, rows):
+        self.rows = dict(rows)
+        self.commits = 0
+        self.deletes = []
+
+    def execute(self, statement, params):
+        sql = str(statement)
+        if sql.lstrip().startswith('DELETE'):
+            end = params.get('end')
+            doomed = [
+                key for key, when in self.rows.items()
+                if key >= params['start'] and when < params['threshold']
+                and (key < end if end is not None else key <= params['last'])
+            ]
+            for key in doomed:
+                del self.rows[key]
+            self.deletes.append(len(doomed))
+            return SimpleNamespace(rowcount=len(doomed))
+        if 'MIN(' in sql:
+            expired = [key for key, when in self.rows.items() if when < params['threshold']]
+            row = SimpleNamespace(first_key=min(expired, default=None), last_key=max(expired, default=None))
+            return SimpleNamespace(fetchone=lambda: row)
+        offset = int(sql.split('OFFSET')[1])
+        keys = sorted(key for key in self.rows if params['start'] <= key <= params['last'])
+        return SimpleNamespace(scalar=lambda: keys[offset] if offset < len(keys) else None)
+
+    def commit(self):
+        self.commits += 1
+
+
+class FakeClock:
+    """Clock advanced by sleeps and by a fixed cost per reading."""
+
+    def __init__(self, tick=0.0):
+        self.now = 0.0
+        self.tick = tick
+        self.sleeps = []
+
+    def __call__(self):
+        self.now += self.tick
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _deleter(table, clock=None, **kwargs):
+    clock = clock or FakeClock()
+    return ChunkedDeleter(table, clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def _table():
+    # keys 1-25 expired (time < 100) except 10, keys 26-30 current
+    return FakeTable({key: (150 if key == 10 or key > 25 else key) for key in range(1, 31)})
+
+
+class TestChunkedDeleter:
+    """Test batching, throttling and the runtime cap."""
+
+    def test_deletes_only_expired_rows_in_batches(self):
+        table = _table()
+
+        stats = _deleter(table, batch_size=10).delete_before('t', 'id', 'at', 100)
+
+        assert stats['deleted'] == 24
+        assert stats['complete'] is True
+        assert table.deletes == [9, 10, 5]
+        assert table.commits == 3
+        assert sorted(table.rows) == [10, 26, 27, 28, 29, 30]
+
+    def test_nothing_expired(self):
+        table = _table()
+
+        stats = _deleter(table).delete_before('t', 'id', 'at', 0)
+
+        assert (stats['deleted'], stats['batches'], stats['complete']) == (0, 0, True)
+        assert table.commits == 0
+
+    def test_sleeps_between_batches(self):
+        table, clock = _table(), FakeClock()
+
+        _deleter(table, clock, batch_size=10, batch_sleep_ms=250).delete_before('t', 'id', 'at', 100)
+
+        assert clock.sleeps == [0.25, 0.25]
+
+    def test_rate_cap_extends_pause(self):
+        table, clock = _table(), FakeClock()
+
+        stats = _deleter(table, clock, batch_size=10, max_rows_per_second=5).delete_before('t', 'id', 'at', 100)
+
+        assert clock.sleeps == [pytest.approx(9 / 5), pytest.approx(10 / 5)]
+        assert stats['rows_per_second'] == pytest.approx(24 / 3.8, abs=0.1)
+
+    def test_runtime_cap_stops_and_next_run_resumes(self):
+        table = _table()
+
+        first = _deleter(table, FakeClock(tick=1.0), batch_size=5, max_runtime_seconds=6).delete_before(
+            't', 'id', 'at', 100
+        )
+
+        assert first['complete'] is False
+        assert 0 < first['deleted'] < 24
+
+        second = _deleter(table, batch_size=5).delete_before('t', 'id', 'at', 100)
+
+        assert second['complete'] is True
+        assert first['deleted'] + second['deleted'] == 24
+        assert sorted(table.rows) == [10, 26, 27, 28, 29, 30]
+
+    def test_runtime_cap_spans_tables(self):
+        table, clock = _table(), FakeClock()
+        deleter = _deleter(table, clock, max_runtime_seconds=5)
+        clock.now = 10
+
+        stats = deleter.delete_before('t', 'id', 'at', 100)
+
+        assert (stats['deleted'], stats['complete']) == (0, False)
+
+    def test_rejects_empty_batches(self):
+        with pytest.raises(ValueError):
+            _deleter(_table(), batch_size=0)
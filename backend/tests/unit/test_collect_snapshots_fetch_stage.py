@@ -0,0 +1,152 @@
+"""
+Unit Tests: SnapshotCollector concurrent fetch stage
+
+Verifies that live data for all parks is fetched in parallel with a
+per-host concurrency limit, that failures are captured per park, and that
+the ordered write stage shares one snapshot_timestamp across parks.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.collect_snapshots import (
+    SnapshotCollector,
+    ParkFetchResult,
+    PROVIDER_THEMEPARKS_WIKI,
+    PROVIDER_QUEUE_TIMES,
+)
+
+
+def _park(park_id, wiki_id=None, queue_times_id=None):
+    return SimpleNamespace(
+        park_id=park_id,
+        name=f"Park {park_id}",
+        themeparks_wiki_id=wiki_id,
+        queue_times_id=queue_times_id,
+    )
+
+
+@pytest.fixture
+def collector_factory():
+    """Build collectors with mocked provider clients."""
+    def _make(**kwargs):
+        with patch('scripts.collect_snapshots.QueueTimesClient') as qt_cls, \
+                patch('scripts.collect_snapshots.get_themeparks_wiki_client') as wiki_factory:
+            qt_cls.return_value = MagicMock()
+            wiki_factory.return_value = MagicMock()
+            return SnapshotCollector(**kwargs)
+    return _make
+
+
+class TestFetchAllParks:
+    """Tests for SnapshotCollector._fetch_all_parks()."""
+
+    def test_routes_parks_to_their_provider(self, collector_factory):
+        collector = collector_factory()
+        collector.themeparks_wiki_client.get_park_live_data.return_value = ['wiki-ride']
+        collector.queue_times_client.get_park_wait_times.return_value = {'rides': []}
+
+        parks = [_park(1, wiki_id='abc'), _park(2, queue_times_id=99)]
+        results = collector._fetch_all_parks(parks)
+
+        assert results[1].provider == PROVIDER_THEMEPARKS_WIKI
+        assert results[1].data == ['wiki-ride']
+        assert results[2].provider == PROVIDER_QUEUE_TIMES
+        assert results[2].data == {'rides': []}
+        collector.themeparks_wiki_client.get_park_live_data.assert_called_once_with('abc')
+        collector.queue_times_client.get_park_wait_times.assert_called_once_with(99)
+
+    def test_captures_errors_per_park(self, collector_factory):
+        collector = collector_factory()
+        collector.queue_times_client.get_park_wait_times.side_effect = [
+            Exception("Connection timeout"),
+            {'rides': []},
+        ]
+
+        parks = [_park(1, queue_times_id=10), _park(2, queue_times_id=20)]
+        results = collector._fetch_all_parks(parks)
+
+        errors = [r for r in results.values() if r.error is not None]
+        assert len(results) == 2
+        assert len(errors) == 1
+        assert str(errors[0].error) == "Connection timeout"
+
+    def test_wall_clock_is_roughly_slowest_park(self, collector_factory):
+        collector = collector_factory(max_workers=10, max_concurrent_per_host=10)
+
+        def slow_fetch(_park_id):
+            time.sleep(0.2)
+            return {'rides': []}
+
+        collector.queue_times_client.get_park_wait_times.side_effect = slow_fetch
+
+        parks = [_park(i, queue_times_id=i) for i in range(8)]
+        start = time.monotonic()
+        results = collector._fetch_all_parks(parks)
+        elapsed = time.monotonic() - start
+
+        assert len(results) == 8
+        # Serial would be 1.6s; concurrent should be close to a single fetch
+        assert elapsed < 0.8
+
+    def test_per_host_limit_bounds_in_flight_requests(self, collector_factory):
+        collector = collector_factory(max_workers=10, max_concurrent_per_host=2)
+        lock = threading.Lock()
+        in_flight = {'now': 0, 'max': 0}
+
+        def tracked_fetch(_park_id):
+            with lock:
+                in_flight['now'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['now'])
+            time.sleep(0.05)
+            with lock:
+                in_flight['now'] -= 1
+            return {'rides': []}
+
+        collector.queue_times_client.get_park_wait_times.side_effect = tracked_fetch
+
+        collector._fetch_all_parks([_park(i, queue_times_id=i) for i in range(6)])
+
+        assert in_flight['max'] <= 2
+
+    def test_empty_park_list(self, collector_factory):
+        collector = collector_factory()
+        assert collector._fetch_all_parks([]) == {}
+
+
+class TestProcessParkWriteStage:
+    """Tests for the ordered write stage consuming prefetched results."""
+
+    def test_fetch_error_counts_as_single_park_error(self, collector_factory):
+        collector = collector_factory()
+        park = _park(1, queue_times_id=10)
+        result = ParkFetchResult(park_id=1, provider=PROVIDER_QUEUE_TIMES, error=Exception("boom"))
+
+        collector._process_park(park, result, *[MagicMock() for _ in range(6)])
+
+        assert collector.stats['parks_processed'] == 1
+        assert collector.stats['errors'] == 1
+        assert collector.stats['snapshots_created'] == 0
+
+    def test_parks_share_cycle_snapshot_timestamp(self, collector_factory):
+        collector = collector_factory()
+        parks = [_park(1, wiki_id='a'), _park(2, queue_times_id=20)]
+        collector.themeparks_wiki_client.get_park_live_data.return_value = []
+        collector.queue_times_client.get_park_wait_times.return_value = {'rides': []}
+
+        with patch('scripts.collect_snapshots.get_db_session') as get_session, \
+                patch('scripts.collect_snapshots.ParkRepository') as park_repo_cls, \
+                patch.object(SnapshotCollector, '_refresh_schedules_if_needed'), \
+                patch.object(SnapshotCollector, '_aggregate_live_rankings'), \
+                patch.object(SnapshotCollector, '_process_park') as process_park:
+            get_session.return_value.__enter__.return_value = MagicMock()
+            park_repo_cls.return_value.get_all_active.return_value = parks
+            collector.run()
+
+        assert [c.args[0].park_id for c in process_park.call_args_list] == [1, 2]
+        timestamps = {c.args[-1] for c in process_park.call_args_list}
+        assert len(timestamps) == 1
@@ -0,0 +1,70 @@
+"""
+Cron Job State Tests
+====================
+
+cron_wrapper records the last run of each job, with the row counts the job
+reported, in a local state file read by /api/metrics.
+"""
+
+from utils.cron_state import (
+    JOB_STATS_ENV, load_job_state, read_job_stats, record_job_run, report_job_stats
+)
+
+
+class TestReportJobStats:
+    """Test the job side of stats reporting."""
+
+    def test_writes_numeric_stats_to_wrapper_file(self, tmp_path, monkeypatch):
+        stats_file = tmp_path / 'stats.json'
+        monkeypatch.setenv(JOB_STATS_ENV, str(stats_file))
+
+        report_job_stats({'rides_processed': 12, 'fetch_seconds': 1.5, 'mode': 'full',
+                          'errors': [], 'ok': True})
+
+        assert read_job_stats(str(stats_file)) == {'rides_processed': 12, 'fetch_seconds': 1.5}
+
+    def test_no_op_without_wrapper(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(JOB_STATS_ENV, raising=False)
+
+        report_job_stats({'rides_processed': 12})
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unreported_run_has_no_stats(self, tmp_path):
+        empty = tmp_path / 'stats.json'
+        empty.write_text('')
+
+        assert read_job_stats(str(empty)) == {}
+
+
+class TestRecordJobRun:
+    """Test the state file written by cron_wrapper."""
+
+    def test_records_last_run_per_job(self, tmp_path):
+        path = str(tmp_path / 'state.json')
+
+        record_job_run('aggregate_hourly', 0, 12.5, 1000.0, rows={'rides_processed': 900}, path=path)
+        record_job_run('aggregate_daily', 0, 60.0, 1100.0, path=path)
+
+        state = load_job_state(path)
+        assert set(state) == {'aggregate_hourly', 'aggregate_daily'}
+        assert state['aggregate_hourly']['rows'] == {'rides_processed': 900}
+        assert state['aggregate_hourly']['status'] == 'success'
+
+    def test_failure_keeps_last_success_time(self, tmp_path):
+        path = str(tmp_path / 'state.json')
+
+        record_job_run('collect_snapshots', 0, 80.0, 1000.0, path=path)
+        record_job_run('collect_snapshots', 124, 300.0, 2000.0, path=path)
+
+        run = load_job_state(path)['collect_snapshots']
+        assert run['status'] == 'failure'
+        assert run['finished_at'] == 2000.0
+        assert run['last_success_at'] == 1000.0
+
+    def test_missing_or_corrupt_state_is_empty(self, tmp_path):
+        corrupt = tmp_path / 'state.json'
+        corrupt.write_text('{not json')
+
+        assert load_job_state(str(tmp_path / 'missing.json')) == {}
+        assert load_job_state(str(corrupt)) == {}
@@ -0,0 +1,160 @@
+"""
+Unit Tests: Data epochs for cache invalidation
+
+Verifies that cached API responses are tied to the live or historical
+data epoch for their period, that epochs are read at most once per check
+interval, and that a failing epoch read falls back to plain TTL caching.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from utils.data_epoch import (
+    LIVE_MAX_AGE_SECONDS,
+    DataEpochs,
+    cache_policy_for_period,
+    get_data_epochs,
+    reset_data_epochs,
+    seconds_until_pacific_midnight,
+)
+
+
+PACIFIC = ZoneInfo('America/Los_Angeles')
+NOW = datetime(2025, 12, 20, 22, 30, tzinfo=PACIFIC)
+EPOCHS = DataEpochs(live='2025-12-21T06:20:00|981', historical='981')
+
+
+@pytest.fixture(autouse=True)
+def fresh_epochs():
+    reset_data_epochs()
+    yield
+    reset_data_epochs()
+
+
+def _policy(period, epochs=EPOCHS):
+    with patch('utils.data_epoch.get_data_epochs', return_value=epochs), \
+            patch('utils.data_epoch.get_now_pacific', return_value=NOW):
+        return cache_policy_for_period(period)
+
+
+class TestCachePolicy:
+    """Periods map to the epoch their data depends on."""
+
+    @pytest.mark.parametrize("period", ['live', 'today', None])
+    def test_live_periods_follow_live_epoch(self, period):
+        policy = _policy(period)
+
+        assert policy.epoch == EPOCHS.live
+        assert policy.ttl_seconds == LIVE_MAX_AGE_SECONDS
+
+    @pytest.mark.parametrize("period", ['yesterday', 'last_week', 'last_month', '7days', '30days'])
+    def test_historical_periods_cached_until_midnight(self, period):
+        policy = _policy(period)
+
+        assert policy.epoch == EPOCHS.historical
+        assert policy.ttl_seconds == 90 * 60
+
+    def test_key_includes_pacific_date(self):
+        assert _policy('yesterday').key_params == {'as_of': '2025-12-20'}
+
+    def test_unknown_epochs_fall_back_to_default_ttl(self):
+        policy = _policy('yesterday', DataEpochs())
+
+        assert policy.epoch is None
+        assert policy.ttl_seconds is None
+
+
+class TestEpochReads:
+    """Epochs are memoized per worker and failures degrade gracefully."""
+
+    def test_read_once_per_check_interval(self):
+        with patch('utils.data_epoch._read_epochs', return_value=EPOCHS) as read:
+            assert get_data_epochs() == EPOCHS
+            assert get_data_epochs() == EPOCHS
+
+        read.assert_called_once()
+
+    def test_reread_after_interval(self):
+        with patch('utils.data_epoch._read_epochs', return_value=EPOCHS) as read, \
+                patch('utils.data_epoch.DATA_EPOCH_CHECK_SECONDS', 0):
+            get_data_epochs()
+            get_data_epochs()
+
+        assert read.call_count == 2
+
+    def test_read_failure_reports_unknown_epochs(self):
+        with patch('utils.data_epoch._read_epochs', side_effect=Exception("db down")):
+            assert get_data_epochs() == DataEpochs()
+
+
+class TestMidnight:
+    """TTL for historical periods ends at the Pacific day boundary."""
+
+    def test_seconds_until_midnight(self):
+        assert seconds_until_pacific_midnight(datetime(2025, 12, 20, 23, 59, 30, tzinfo=PACIFIC)) == 30
+
+    def test_never_zero(self):
+        assert seconds_until_pacific_midnight(datetime(2025, 12, 20, 23, 59, 59, 999999, tzinfo=PACIFIC)) == 1
+
+
+class TestEpochQuery:
+    """Which aggregation_log rows advance each epoch."""
+
+    @pytest.fixture
+    def log(self, monkeypatch):
+        from contextlib import contextmanager
+        from datetime import date
+
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        import database.connection
+        from models import AggregationLog, AggregationStatus, AggregationType, ParkLiveRankings
+        from utils.data_epoch import _read_epochs
+
+        engine = create_engine("sqlite://")
+        AggregationLog.__table__.create(engine)
+        ParkLiveRankings.__table__.create(engine)
+
+        @contextmanager
+        def session_scope():
+            with Session(engine) as session:
+                yield session
+                session.commit()
+
+        monkeypatch.setattr(database.connection, "get_db_session", session_scope)
+
+        def add(aggregation_type, unit_key=None, status=AggregationStatus.SUCCESS, day=date(2025, 12, 20)):
+            with session_scope() as session:
+                entry = AggregationLog(
+                    aggregation_date=day, aggregation_type=AggregationType(aggregation_type),
+                    started_at=datetime(2025, 12, 21, 8), status=status, unit_key=unit_key,
+                )
+                session.add(entry)
+                session.flush()
+                return entry.log_id
+
+        return add, _read_epochs
+
+    def test_daily_run_advances_historical_epoch(self, log):
+        add, read = log
+        daily = add('daily')
+
+        assert read().historical == str(daily)
+
+    def test_hourly_and_unit_rows_do_not_advance_historical_epoch(self, log):
+        add, read = log
+        daily = add('daily')
+        before = read()
+
+        hourly = add('hourly')
+        add('daily', unit_key='park:12', day=datetime(2025, 12, 19).date())
+        add('weekly', status='failed')
+        after = read()
+
+        assert after.historical == before.historical == str(daily)
+        # TODAY responses read hourly stats, so the live epoch still moves
+        assert after.live.endswith(f"|{hourly}")
@@ -0,0 +1,77 @@
+"""
+Unit Tests: HourlyAggregator set-based mode
+
+Verifies statement counts and parameters for the chunked GROUP BY path.
+Row-level parity with the per-ride path is covered by
+tests/integration/scripts/test_hourly_set_based_parity.py.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from scripts.aggregate_hourly import HourlyAggregator
+
+
+HOUR = datetime(2025, 12, 5, 18, 0)
+
+
+def _rides(count):
+    return [SimpleNamespace(ride_id=i + 1, park_id=1, name=f"Ride {i + 1}") for i in range(count)]
+
+
+class TestSetBasedRides:
+
+    def test_one_statement_per_chunk(self):
+        session = MagicMock()
+        aggregator = HourlyAggregator(target_hour=HOUR, ride_chunk_size=4)
+
+        aggregator._aggregate_rides_set_based(session, _rides(10), operated_today_ride_ids={2, 9})
+
+        assert session.execute.call_count == 3
+        chunks = [c.args[1]['ride_ids'] for c in session.execute.call_args_list]
+        assert chunks == [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10]]
+        operated = [c.args[1]['operated_ride_ids'] for c in session.execute.call_args_list]
+        assert operated == [[2], [0], [9]]
+        assert aggregator.stats['rides_processed'] == 10
+
+    def test_statement_uses_shared_status_helpers(self):
+        session = MagicMock()
+        aggregator = HourlyAggregator(target_hour=HOUR)
+
+        aggregator._aggregate_rides_set_based(session, _rides(1), operated_today_ride_ids=set())
+
+        sql = str(session.execute.call_args.args[0])
+        assert "GROUP BY rss.ride_id" in sql
+        assert "park_appears_open = TRUE OR pas.rides_open > 0" in sql
+        assert "is_disney" in sql  # RideStatusSQL.is_down() park-type rule
+
+    def test_failed_chunk_counts_one_error_and_continues(self):
+        session = MagicMock()
+        session.execute.side_effect = [Exception("lock wait timeout"), MagicMock()]
+        aggregator = HourlyAggregator(target_hour=HOUR, ride_chunk_size=5)
+
+        aggregator._aggregate_rides_set_based(session, _rides(10), operated_today_ride_ids=set())
+
+        assert aggregator.stats['errors'] == 1
+        assert aggregator.stats['rides_processed'] == 5
+
+
+class TestSetBasedParks:
+
+    def test_single_statement_for_all_parks(self):
+        session = MagicMock()
+        aggregator = HourlyAggregator(target_hour=HOUR)
+        parks = [SimpleNamespace(park_id=i, name=f"Park {i}") for i in range(1, 81)]
+
+        aggregator._aggregate_parks_set_based(session, parks)
+
+        assert session.execute.call_count == 1
+        assert session.execute.call_args.args[1]['park_ids'] == list(range(1, 81))
+        assert "GROUP BY pas.park_id" in str(session.execute.call_args.args[0])
+        assert aggregator.stats['parks_processed'] == 80
+
+    def test_no_parks_no_statement(self):
+        session = MagicMock()
+        HourlyAggregator(target_hour=HOUR)._aggregate_parks_set_based(session, [])
+        session.execute.assert_not_called()
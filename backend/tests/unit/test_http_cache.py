@@ -0,0 +1,146 @@
+"""
+Pre-serialized Response Cache Tests
+===================================
+
+cached_json_response() caches final JSON bytes (plain and gzip) with an
+ETag, so cache hits skip jsonify and repeat loads get 304 Not Modified.
+"""
+
+import gzip
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify
+
+from api.middleware.http_cache import (
+    GZIP_MIN_BYTES,
+    SerializedResponse,
+    cached_json_response,
+    serialize_response,
+)
+from utils.cache import QueryCache, estimate_size
+
+
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+
+class TestSerializeResponse:
+    """Test serialization of response payloads."""
+
+    def test_body_matches_jsonify(self, app):
+        """The cached bytes should be what jsonify produces for the same payload."""
+        payload = {"b": 1, "a": [Decimal("1.5"), date(2025, 1, 2)], "name": "Café"}
+
+        serialized = serialize_response(payload, 1_700_000_000.0)
+
+        expected = dict(payload, cached_at="2023-11-14T22:13:20Z")
+        with app.app_context():
+            assert serialized.body == jsonify(expected).get_data()
+
+    def test_large_body_is_gzipped(self):
+        """Bodies over the threshold should carry a gzip copy."""
+        payload = {"rows": ["x" * 100] * (GZIP_MIN_BYTES // 50)}
+
+        serialized = serialize_response(payload, 0.0)
+
+        assert gzip.decompress(serialized.gzip_body) == serialized.body
+        assert serialize_response({"ok": True}, 0.0).gzip_body is None
+
+    def test_etag_is_stable_for_same_payload(self):
+        """Same payload and timestamp should give the same ETag."""
+        first = serialize_response({"a": 1}, 10.0)
+        second = serialize_response({"a": 1}, 10.0)
+
+        assert first.etag == second.etag
+        assert serialize_response({"a": 2}, 10.0).etag != first.etag
+
+    def test_size_estimate_counts_bytes(self):
+        """Cache size accounting should include the body bytes."""
+        serialized = SerializedResponse(b"x" * 10_000, None, "tag", 0.0)
+
+        assert estimate_size(serialized) > 10_000
+
+
+class TestCachedJsonResponse:
+    """Test conditional and compressed responses from the cache."""
+
+    def test_hit_does_not_recompute(self, app):
+        """A second request should be served from the cached bytes."""
+        cache = QueryCache(ttl_seconds=300)
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"success": True}
+
+        with app.test_request_context('/'):
+            first = cached_json_response(cache, "k", compute)
+        with app.test_request_context('/'):
+            second = cached_json_response(cache, "k", compute)
+
+        assert calls == [1]
+        assert first.status_code == second.status_code == 200
+        assert json.loads(second.get_data())["success"] is True
+        assert second.headers["Cache-Control"] == "no-cache"
+        assert "Age" in second.headers
+
+    def test_if_none_match_returns_304(self, app):
+        """A matching If-None-Match should get 304 with no body."""
+        cache = QueryCache(ttl_seconds=300)
+
+        with app.test_request_context('/'):
+            first = cached_json_response(cache, "k", lambda: {"success": True})
+        etag = first.headers["ETag"]
+
+        with app.test_request_context('/', headers={"If-None-Match": etag}):
+            second = cached_json_response(cache, "k", lambda: {"success": True})
+
+        assert second.status_code == 304
+        assert second.get_data() == b""
+        assert second.headers["ETag"] == etag
+
+    def test_stale_etag_returns_full_body(self, app):
+        """A non-matching ETag should get the current body."""
+        cache = QueryCache(ttl_seconds=300)
+
+        with app.test_request_context('/', headers={"If-None-Match": 'W/"old"'}):
+            response = cached_json_response(cache, "k", lambda: {"success": True})
+
+        assert response.status_code == 200
+
+    def test_gzip_served_when_accepted(self, app):
+        """Clients accepting gzip should get the pre-compressed body."""
+        cache = QueryCache(ttl_seconds=300)
+        payload = {"rows": ["x" * 100] * (GZIP_MIN_BYTES // 50)}
+
+        with app.test_request_context('/', headers={"Accept-Encoding": "gzip, deflate"}):
+            compressed = cached_json_response(cache, "k", lambda: payload)
+        with app.test_request_context('/'):
+            plain = cached_json_response(cache, "k", lambda: payload)
+
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        assert compressed.headers["Vary"] == "Accept-Encoding"
+        assert gzip.decompress(compressed.get_data()) == plain.get_data()
+        assert "Content-Encoding" not in plain.headers
+
+    def test_none_result_is_not_cached(self, app):
+        """compute_fn returning None should give None and cache nothing."""
+        cache = QueryCache(ttl_seconds=300)
+
+        with app.test_request_context('/'):
+            assert cached_json_response(cache, "k", lambda: None) is None
+            assert cached_json_response(cache, "k", lambda: {"a": 1}).status_code == 200
+
+    def test_serialized_entries_do_not_collide_with_dict_entries(self, app):
+        """A dict cached under the same key should not be served as bytes."""
+        cache = QueryCache(ttl_seconds=300)
+        cache.set("k", {"old": True})
+
+        with app.test_request_context('/'):
+            response = cached_json_response(cache, "k", lambda: {"new": True})
+
+        assert json.loads(response.get_data())["new"] is True
@@ -0,0 +1,119 @@
+"""
+Unit Tests: Last-status prefetch for status-change detection
+
+Verifies LastStatusCache round-trips and staleness handling, and that
+SnapshotCollector serves previous snapshots from the prefetched map
+instead of querying per ride.
+"""
+
+import json
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from collector.last_status_cache import LastStatusCache
+from scripts.collect_snapshots import SnapshotCollector
+
+
+SAVED_AT = datetime(2025, 12, 1, 18, 0, 0)
+
+
+def _snapshot(ride_id, status, is_open, recorded_at=SAVED_AT):
+    return {'ride_id': ride_id, 'status': status, 'computed_is_open': is_open, 'recorded_at': recorded_at}
+
+
+class TestLastStatusCache:
+    """Tests for the JSON state file."""
+
+    def test_round_trip(self, tmp_path):
+        cache = LastStatusCache(str(tmp_path / 'state' / 'last_status.json'), max_age_minutes=30)
+        cache.save({1: _snapshot(1, 'DOWN', False), 2: _snapshot(2, None, True)}, saved_at=SAVED_AT)
+
+        loaded = cache.load(now=SAVED_AT + timedelta(minutes=10))
+
+        assert loaded == {1: _snapshot(1, 'DOWN', False), 2: _snapshot(2, None, True)}
+
+    def test_stale_state_is_ignored(self, tmp_path):
+        cache = LastStatusCache(str(tmp_path / 'last_status.json'), max_age_minutes=30)
+        cache.save({1: _snapshot(1, 'OPERATING', True)}, saved_at=SAVED_AT)
+
+        assert cache.load(now=SAVED_AT + timedelta(minutes=31)) is None
+
+    def test_missing_or_corrupt_file_returns_none(self, tmp_path):
+        path = tmp_path / 'last_status.json'
+        cache = LastStatusCache(str(path))
+        assert cache.load() is None
+
+        path.write_text('{not json')
+        assert cache.load() is None
+
+        path.write_text(json.dumps({'version': 999, 'saved_at': SAVED_AT.isoformat(), 'rides': {}}))
+        assert cache.load(now=SAVED_AT) is None
+
+
+class TestCollectorPrefetch:
+    """Tests for SnapshotCollector previous-snapshot prefetch."""
+
+    def _collector(self, state_file=''):
+        with patch('scripts.collect_snapshots.QueueTimesClient'), \
+                patch('scripts.collect_snapshots.get_themeparks_wiki_client'):
+            return SnapshotCollector(state_file=state_file)
+
+    def test_prefetch_uses_single_set_based_query(self):
+        collector = self._collector()
+        snapshot_repo = MagicMock()
+        snapshot_repo.get_latest_by_rides.return_value = {1: _snapshot(1, 'OPERATING', True)}
+
+        collector._load_latest_snapshots(snapshot_repo)
+
+        assert collector._get_previous_snapshot(1, snapshot_repo)['status'] == 'OPERATING'
+        assert collector._get_previous_snapshot(2, snapshot_repo) is None
+        snapshot_repo.get_latest_by_rides.assert_called_once_with()
+        snapshot_repo.get_latest_by_ride.assert_not_called()
+
+    def test_fresh_state_file_skips_database(self, tmp_path):
+        path = tmp_path / 'last_status.json'
+        LastStatusCache(str(path)).save({1: _snapshot(1, 'OPERATING', True)})
+        collector = self._collector(state_file=str(path))
+        snapshot_repo = MagicMock()
+
+        collector._load_latest_snapshots(snapshot_repo)
+
+        assert collector.latest_snapshots[1]['status'] == 'OPERATING'
+        snapshot_repo.get_latest_by_rides.assert_not_called()
+
+    def test_change_detected_against_prefetched_status(self):
+        collector = self._collector()
+        snapshot_repo = MagicMock()
+        snapshot_repo.get_latest_by_rides.return_value = {
+            1: _snapshot(1, 'OPERATING', True, recorded_at=datetime.now() - timedelta(minutes=10))
+        }
+        collector._load_latest_snapshots(snapshot_repo)
+
+        collector._detect_status_change_rich(1, 'DOWN', snapshot_repo, MagicMock())
+
+        assert len(collector._pending_status_changes) == 1
+        change = collector._pending_status_changes[0]
+        assert change['previous_status'] is True
+        assert change['new_status'] is False
+        snapshot_repo.get_latest_by_ride.assert_not_called()
+
+    def test_flushed_snapshots_update_prefetched_map(self):
+        collector = self._collector()
+        collector.latest_snapshots = {}
+        collector._pending_snapshots = [_snapshot(5, 'CLOSED', False)]
+        snapshot_repo = MagicMock()
+        snapshot_repo.insert_many.side_effect = len
+
+        collector._flush_ride_writes(snapshot_repo, MagicMock())
+
+        assert collector.latest_snapshots[5]['status'] == 'CLOSED'
+
+    def test_without_prefetch_falls_back_to_per_ride_lookup(self):
+        collector = self._collector()
+        snapshot_repo = MagicMock()
+        snapshot_repo.get_latest_by_ride.return_value = None
+
+        assert collector._get_previous_snapshot(7, snapshot_repo) is None
+        snapshot_repo.get_latest_by_ride.assert_called_once_with(7)
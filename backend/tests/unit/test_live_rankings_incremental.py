@@ -0,0 +1,303 @@
+"""
+Unit Tests: Incremental live rankings
+
+Verifies that a collection cycle's in-memory results update the current
+state columns directly, advance the cumulative "today" columns by the
+cycle's delta, and that the full rebuild only runs when it is due.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from scripts.aggregate_live_rankings import (
+    DOWNTIME_MINUTES_PER_SNAPSHOT,
+    LiveCycleResult,
+    LiveRankingsAggregator,
+    build_park_rows,
+    build_ride_rows,
+    is_ride_down,
+)
+
+
+NOW = datetime(2025, 12, 20, 20, 0)
+PACIFIC = ZoneInfo('America/Los_Angeles')
+
+
+def _ride(ride_id, park_id=1, tier_weight=2, disney=False, operated_days_ago=1):
+    return {
+        'ride_id': ride_id,
+        'park_id': park_id,
+        'queue_times_id': ride_id + 1000,
+        'name': f"Ride {ride_id}",
+        'category': 'ATTRACTION',
+        'last_operated_at': NOW - timedelta(days=operated_days_ago),
+        'park_queue_times_id': 500 + park_id,
+        'park_name': f"Park {park_id}",
+        'city': 'Orlando',
+        'state_province': 'FL',
+        'timezone': 'America/New_York',
+        'is_disney': disney,
+        'is_universal': False,
+        'tier': 1,
+        'tier_weight': tier_weight,
+    }
+
+
+def _cycle(rides, park_open=True, shame_score=2.5, status_changes=None):
+    return LiveCycleResult(
+        recorded_at=NOW,
+        parks={1: {'park_appears_open': park_open, 'shame_score': shame_score}},
+        rides=rides,
+        status_changes=status_changes or {},
+    )
+
+
+def _state(status, wait_time=None, computed_is_open=None):
+    if computed_is_open is None:
+        computed_is_open = status == 'OPERATING'
+    return {'status': status, 'computed_is_open': computed_is_open, 'wait_time': wait_time}
+
+
+class TestIsRideDown:
+    """Python port of the park-type aware SQL CASE."""
+
+    @pytest.mark.parametrize("status,computed_is_open,strict,expected", [
+        ('DOWN', False, True, True),
+        ('CLOSED', False, True, False),
+        ('CLOSED', False, False, True),
+        ('OPERATING', True, False, False),
+        (None, False, False, True),
+        (None, True, False, False),
+        (None, False, True, False),
+    ])
+    def test_matches_sql_rule(self, status, computed_is_open, strict, expected):
+        assert is_ride_down(status, computed_is_open, strict) is expected
+
+
+class TestBuildParkRows:
+    """Park rows: current state from the cycle, downtime as a delta."""
+
+    def test_current_state_and_delta(self):
+        rides = {1: _ride(1, tier_weight=3), 2: _ride(2), 3: _ride(3)}
+        cycle = _cycle({1: _state('DOWN'), 2: _state('CLOSED'), 3: _state('OPERATING', 20)})
+        existing = {1: SimpleNamespace(total_downtime_hours=Decimal('1.00'),
+                                       weighted_downtime_hours=Decimal('2.50'))}
+
+        [row] = build_park_rows(cycle, rides, existing, NOW)
+
+        # Non-Disney park: DOWN and CLOSED both count
+        assert row['rides_down'] == 2
+        assert row['total_rides'] == 3
+        assert row['total_park_weight'] == Decimal('7.00')
+        assert row['shame_score'] == Decimal('2.5')
+        assert row['total_downtime_hours'] == Decimal('1.00') + round(Decimal(10) / 60, 2)
+        # (5 * 3 + 5 * 2) weighted minutes this cycle
+        assert row['weighted_downtime_hours'] == round(Decimal('2.50') + Decimal(25) / 60, 2)
+        assert row['location'] == 'Orlando, FL'
+
+    def test_closed_park_adds_no_downtime(self):
+        rides = {1: _ride(1)}
+        cycle = _cycle({1: _state('DOWN')}, park_open=False)
+        existing = {1: SimpleNamespace(total_downtime_hours=Decimal('1.50'),
+                                       weighted_downtime_hours=Decimal('3.00'))}
+
+        [row] = build_park_rows(cycle, rides, existing, NOW)
+
+        assert row['rides_down'] == 0
+        assert row['total_downtime_hours'] == Decimal('1.50')
+
+    def test_stale_ride_counts_downtime_but_not_rides_down(self):
+        rides = {1: _ride(1), 2: _ride(2, operated_days_ago=30)}
+        cycle = _cycle({1: _state('OPERATING', 10), 2: _state('DOWN')})
+
+        [row] = build_park_rows(cycle, rides, {}, NOW)
+
+        assert row['rides_down'] == 0
+        assert row['total_rides'] == 1
+        assert row['total_downtime_hours'] == round(Decimal(DOWNTIME_MINUTES_PER_SNAPSHOT) / 60, 2)
+
+    def test_park_without_eligible_rides_is_skipped(self):
+        rides = {1: _ride(1, operated_days_ago=30)}
+        cycle = _cycle({1: _state('DOWN')})
+
+        assert build_park_rows(cycle, rides, {}, NOW) == []
+
+
+class TestBuildRideRows:
+    """Ride rows: running totals and entry on first downtime."""
+
+    def test_existing_row_folds_in_cycle(self):
+        rides = {1: _ride(1)}
+        cycle = _cycle({1: _state('OPERATING', 40)})
+        existing = {1: SimpleNamespace(downtime_hours=Decimal('0.50'), avg_wait_time=Decimal('20.0'),
+                                       max_wait_time=35, wait_time_samples=3,
+                                       last_status_change=NOW - timedelta(hours=1))}
+
+        [row] = build_ride_rows(cycle, rides, existing, {}, NOW)
+
+        assert row['is_down'] is False
+        assert row['current_status'] == 'OPERATING'
+        assert row['current_wait_time'] == 40
+        assert row['downtime_hours'] == Decimal('0.50')
+        assert row['avg_wait_time'] == Decimal('25.0')
+        assert row['wait_time_samples'] == 4
+        assert row['max_wait_time'] == 40
+        assert row['last_status_change'] == NOW - timedelta(hours=1)
+
+    def test_down_ride_accumulates_downtime_and_change_time(self):
+        rides = {1: _ride(1, disney=True)}
+        changed_at = NOW - timedelta(minutes=2)
+        cycle = _cycle({1: _state('DOWN')}, status_changes={1: changed_at})
+        existing = {1: SimpleNamespace(downtime_hours=Decimal('0.25'), avg_wait_time=None,
+                                       max_wait_time=None, wait_time_samples=0,
+                                       last_status_change=None)}
+
+        [row] = build_ride_rows(cycle, rides, existing, {}, NOW)
+
+        assert row['is_down'] is True
+        assert row['downtime_hours'] == round(Decimal('0.25') + Decimal(5) / 60, 2)
+        assert row['last_status_change'] == changed_at
+        assert row['avg_wait_time'] is None
+
+    def test_new_down_ride_seeded_from_day_stats(self):
+        rides = {1: _ride(1)}
+        cycle = _cycle({1: _state('DOWN')})
+        day_stats = {1: {'avg_wait_time': Decimal('31.25'), 'max_wait_time': 60, 'wait_time_samples': 8}}
+
+        [row] = build_ride_rows(cycle, rides, {}, day_stats, NOW)
+
+        assert row['downtime_hours'] == round(Decimal(5) / 60, 2)
+        assert row['avg_wait_time'] == Decimal('31.2')
+        assert row['max_wait_time'] == 60
+        assert row['wait_time_samples'] == 8
+        assert row['tier_weight'] == Decimal(2)
+
+    def test_new_ride_without_downtime_is_not_ranked(self):
+        rides = {1: _ride(1), 2: _ride(2, disney=True)}
+        # Disney CLOSED is not downtime
+        cycle = _cycle({1: _state('OPERATING', 15), 2: _state('CLOSED')})
+
+        assert build_ride_rows(cycle, rides, {}, {}, NOW) == []
+
+    def test_unknown_or_stale_rides_skipped(self):
+        rides = {2: _ride(2, operated_days_ago=30)}
+        cycle = _cycle({1: _state('DOWN'), 2: _state('DOWN')})
+
+        assert build_ride_rows(cycle, rides, {}, {}, NOW) == []
+
+
+class TestRebuildScheduling:
+    """Full rebuild runs periodically and on the first cycle of the day."""
+
+    def _needs_full_rebuild(self, now_pacific, last_calculated, period=60):
+        session = MagicMock()
+        session.execute.return_value.scalar.return_value = last_calculated
+        with patch('scripts.aggregate_live_rankings.get_now_pacific', return_value=now_pacific), \
+                patch('scripts.aggregate_live_rankings.LIVE_RANKINGS_FULL_REBUILD_MINUTES', period), \
+                patch('scripts.aggregate_live_rankings.COLLECTION_INTERVAL_MINUTES', 10):
+            return LiveRankingsAggregator().needs_full_rebuild(session)
+
+    def test_mid_period_cycle_is_incremental(self):
+        now = datetime(2025, 12, 20, 12, 25, tzinfo=PACIFIC)
+        assert self._needs_full_rebuild(now, datetime(2025, 12, 20, 20, 15)) is False
+
+    def test_first_interval_of_period_rebuilds(self):
+        now = datetime(2025, 12, 20, 12, 4, tzinfo=PACIFIC)
+        assert self._needs_full_rebuild(now, datetime(2025, 12, 20, 20, 0)) is True
+
+    def test_rows_from_previous_day_rebuild(self):
+        now = datetime(2025, 12, 20, 0, 35, tzinfo=PACIFIC)
+        # 07:55 UTC is before Pacific midnight (08:00 UTC in winter)
+        assert self._needs_full_rebuild(now, datetime(2025, 12, 20, 7, 55)) is True
+
+    def test_empty_table_rebuilds(self):
+        now = datetime(2025, 12, 20, 12, 25, tzinfo=PACIFIC)
+        assert self._needs_full_rebuild(now, None) is True
+
+    def test_disabled_always_rebuilds(self):
+        now = datetime(2025, 12, 20, 12, 25, tzinfo=PACIFIC)
+        assert self._needs_full_rebuild(now, datetime(2025, 12, 20, 20, 15), period=0) is True
+
+
+class TestRunModes:
+    """run() picks incremental or full rebuild."""
+
+    @pytest.fixture
+    def aggregator(self):
+        aggregator = LiveRankingsAggregator()
+        aggregator._apply_cycle = MagicMock()
+        aggregator._aggregate_park_rankings = MagicMock()
+        aggregator._aggregate_ride_rankings = MagicMock()
+        return aggregator
+
+    def test_cycle_applied_incrementally(self, aggregator):
+        cycle = _cycle({})
+        with patch('scripts.aggregate_live_rankings.get_db_session'), \
+                patch.object(LiveRankingsAggregator, 'needs_full_rebuild', return_value=False):
+            stats = aggregator.run(cycle=cycle)
+
+        assert stats['mode'] == 'incremental'
+        aggregator._apply_cycle.assert_called_once()
+        aggregator._aggregate_park_rankings.assert_not_called()
+
+    def test_no_cycle_runs_full_rebuild(self, aggregator):
+        with patch('scripts.aggregate_live_rankings.get_db_session'):
+            stats = aggregator.run()
+
+        assert stats['mode'] == 'full'
+        aggregator._apply_cycle.assert_not_called()
+        aggregator._aggregate_park_rankings.assert_called_once()
+        aggregator._aggregate_ride_rankings.assert_called_once()
+
+
+class TestCollectorCycleCapture:
+    """SnapshotCollector records what it wrote and hands it over."""
+
+    @pytest.fixture
+    def collector(self):
+        with patch('scripts.collect_snapshots.QueueTimesClient'), \
+                patch('scripts.collect_snapshots.get_themeparks_wiki_client'):
+            from scripts.collect_snapshots import SnapshotCollector
+            return SnapshotCollector()
+
+    def test_flushes_record_cycle_and_pass_to_aggregator(self, collector):
+        collector._cycle_recorded_at = NOW
+        collector._pending_snapshots = [
+            {'ride_id': 7, 'recorded_at': NOW, 'wait_time': None, 'is_open': False,
+             'computed_is_open': False, 'status': 'DOWN', 'last_updated_api': NOW},
+        ]
+        collector._pending_status_changes = [{'ride_id': 7, 'changed_at': NOW}]
+        collector._pending_park_activity = [
+            {'park_id': 1, 'recorded_at': NOW, 'park_appears_open': True, 'shame_score': 1.5},
+        ]
+        snapshot_repo, change_repo, activity_repo = MagicMock(), MagicMock(), MagicMock()
+        snapshot_repo.insert_many.return_value = 1
+        change_repo.insert_many.return_value = 1
+
+        collector._flush_ride_writes(snapshot_repo, change_repo)
+        collector._flush_park_activity(activity_repo)
+
+        with patch('scripts.aggregate_live_rankings.LiveRankingsAggregator') as aggregator_cls:
+            aggregator_cls.return_value.run.return_value = {'mode': 'incremental'}
+            collector._aggregate_live_rankings()
+
+        cycle = aggregator_cls.return_value.run.call_args.kwargs['cycle']
+        assert cycle.recorded_at == NOW
+        assert cycle.parks == {1: {'park_appears_open': True, 'shame_score': 1.5}}
+        assert cycle.rides == {7: {'status': 'DOWN', 'computed_is_open': False, 'wait_time': None}}
+        assert cycle.status_changes == {7: NOW}
+        assert collector.stats['live_rankings_mode'] == 'incremental'
+
+    def test_failed_write_not_in_cycle(self, collector):
+        collector._pending_park_activity = [{'park_id': 1, 'park_appears_open': True, 'shame_score': 0}]
+        activity_repo = MagicMock()
+        activity_repo.insert_many.side_effect = Exception("deadlock")
+
+        collector._flush_park_activity(activity_repo)
+
+        assert collector._cycle_parks == {}
@@ -0,0 +1,124 @@
+"""
+Metrics Endpoint Tests
+======================
+
+/api/metrics renders request latency histograms, query cache, connection
+pool and cron job metrics in the Prometheus text exposition format.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flask import Flask, jsonify
+
+from api.middleware.request_timing import register_request_timing
+from api.routes.metrics import metrics_bp
+from utils.cron_state import record_job_run
+from utils.prometheus import Histogram, format_labels, request_latency
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+    register_request_timing(app)
+    app.register_blueprint(metrics_bp, url_prefix='/api')
+
+    @app.route('/api/parks/<int:park_id>/details')
+    def park_details(park_id):
+        return jsonify({"park_id": park_id})
+
+    request_latency.reset()
+    yield app
+    request_latency.reset()
+
+
+@pytest.fixture
+def pool():
+    pool = MagicMock()
+    pool.size.return_value = 10
+    pool.checkedout.return_value = 3
+    pool.checkedin.return_value = 7
+    pool.overflow.return_value = -7
+    with patch('api.routes.metrics.db') as db:
+        db.get_engine.return_value.pool = pool
+        yield pool
+
+
+def sample(body, name, **labels):
+    """Value of the first sample with this name whose labels include `labels`."""
+    for line in body.splitlines():
+        if line.startswith('#') or not line.startswith(name):
+            continue
+        series, value = line.rsplit(' ', 1)
+        if series.split('{')[0] == name and all(f'{k}="{v}"' in series for k, v in labels.items()):
+            return float(value)
+    return None
+
+
+class TestHistogram:
+    """Test utils.prometheus.Histogram."""
+
+    def test_buckets_are_cumulative(self):
+        histogram = Histogram('latency_seconds', 'Latency', labels=('route',), buckets=(0.1, 1.0))
+        histogram.observe(0.05, route='/a')
+        histogram.observe(0.5, route='/a')
+        histogram.observe(5.0, route='/a')
+
+        body = "\n".join(histogram.render())
+
+        assert sample(body, 'latency_seconds_bucket', le='0.1') == 1
+        assert sample(body, 'latency_seconds_bucket', le='1') == 2
+        assert sample(body, 'latency_seconds_bucket', le='+Inf') == 3
+        assert sample(body, 'latency_seconds_count') == 3
+        assert sample(body, 'latency_seconds_sum') == pytest.approx(5.55)
+
+    def test_label_values_are_escaped(self):
+        assert format_labels({"route": 'a"b\\c'}) == '{route="a\\"b\\\\c"}'
+
+
+class TestMetricsEndpoint:
+    """Test GET /api/metrics."""
+
+    def test_latency_by_route_pattern_and_period(self, app, pool):
+        client = app.test_client()
+        client.get('/api/parks/1/details?period=today')
+        client.get('/api/parks/2/details?period=not-a-period')
+
+        response = client.get('/api/metrics')
+        body = response.get_data(as_text=True)
+
+        assert response.content_type.startswith('text/plain; version=0.0.4')
+        assert sample(body, 'themepark_http_request_duration_seconds_count',
+                      route='/api/parks/<int:park_id>/details', period='today') == 1
+        assert sample(body, 'themepark_http_request_duration_seconds_count',
+                      route='/api/parks/<int:park_id>/details', period='other') == 1
+
+    def test_cache_and_pool_metrics(self, app, pool):
+        body = app.test_client().get('/api/metrics').get_data(as_text=True)
+
+        assert sample(body, 'themepark_query_cache_hit_ratio') is not None
+        assert sample(body, 'themepark_query_cache_entries') is not None
+        assert sample(body, 'themepark_db_pool_checked_out') == 3
+        assert sample(body, 'themepark_db_pool_overflow') == -7
+        assert '# TYPE themepark_db_pool_checkout_wait_seconds histogram' in body
+
+    def test_cron_job_metrics(self, app, pool, tmp_path):
+        state_file = str(tmp_path / 'cron_state.json')
+        record_job_run('collect_snapshots', 0, 84.2, 1767225600.0,
+                       rows={'snapshots_created': 4210}, path=state_file)
+
+        with patch('utils.cron_state.CRON_STATE_FILE', state_file):
+            body = app.test_client().get('/api/metrics').get_data(as_text=True)
+
+        assert sample(body, 'themepark_cron_job_last_duration_seconds', job='collect_snapshots') == 84.2
+        assert sample(body, 'themepark_cron_job_last_exit_code', job='collect_snapshots') == 0
+        assert sample(body, 'themepark_cron_job_last_rows',
+                      job='collect_snapshots', stat='snapshots_created') == 4210
+
+    def test_failing_section_does_not_fail_scrape(self, app):
+        with patch('api.routes.metrics.db') as db:
+            db.get_engine.side_effect = RuntimeError("no database")
+            response = app.test_client().get('/api/metrics')
+
+        assert response.status_code == 200
+        assert 'themepark_query_cache_hit_ratio' in response.get_data(as_text=True)
@@ -0,0 +1,157 @@
+"""
+Snapshot Partitioning Tests
+===========================
+
+The raw snapshot tables are range-partitioned by UTC day; maintenance
+pre-creates future days and drops days older than the cleanup threshold.
+"""
+
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+
+from database.partitioning import (
+    FUTURE_PARTITION,
+    PARTITIONED_TABLES,
+    SnapshotPartitionManager,
+    days_to_create,
+    days_to_drop,
+    partition_by_clause,
+    partition_day,
+    partition_name,
+)
+
+
+class FakeConnection:
+    """Records statements; serves information_schema partition listings."""
+
+    def __init__(self, partitions, rows=0):
+        self.partitions = partitions
+        self.rows = rows
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append(sql)
+        if 'information_schema.PARTITIONS' in sql:
+            return [SimpleNamespace(name=name) for name in self.partitions.get(params['table'], [])]
+        return SimpleNamespace(scalar=lambda: self.rows)
+
+    def ddl(self):
+        return [sql for sql in self.statements if sql.startswith('ALTER TABLE')]
+
+
+class TestPartitionNames:
+    """Test day <-> partition name mapping."""
+
+    def test_round_trip(self):
+        assert partition_name(date(2026, 1, 15)) == 'p20260115'
+        assert partition_day('p20260115') == date(2026, 1, 15)
+
+    def test_catch_all_has_no_day(self):
+        assert partition_day(FUTURE_PARTITION) is None
+
+    def test_partition_by_clause(self):
+        clause = partition_by_clause([date(2026, 1, 16), date(2026, 1, 15)])
+
+        assert clause.startswith('PARTITION BY RANGE COLUMNS(recorded_at)')
+        assert clause.index('p20260115') < clause.index('p20260116')
+        assert "PARTITION p20260116 VALUES LESS THAN ('2026-01-17 00:00:00')" in clause
+        assert 'PARTITION p_future VALUES LESS THAN (MAXVALUE)' in clause
+
+
+class TestPlanning:
+    """Test which days are created and dropped."""
+
+    def test_creates_missing_future_days(self):
+        existing = [date(2026, 1, 14), date(2026, 1, 15)]
+
+        assert days_to_create(existing, date(2026, 1, 15), days_ahead=2) == [
+            date(2026, 1, 16), date(2026, 1, 17)
+        ]
+
+    def test_nothing_to_create_when_far_enough_ahead(self):
+        assert days_to_create([date(2026, 1, 20)], date(2026, 1, 15), days_ahead=3) == []
+
+    def test_only_whole_days_before_threshold_are_dropped(self):
+        existing = [date(2026, 1, 13), date(2026, 1, 14), date(2026, 1, 15)]
+
+        # 2026-01-14 ends at 2026-01-15 00:00, before the threshold; the 15th is partial
+        assert days_to_drop(existing, datetime(2026, 1, 15, 8, 0)) == [
+            date(2026, 1, 13), date(2026, 1, 14)
+        ]
+        assert days_to_drop(existing, datetime(2026, 1, 14, 23, 59)) == [date(2026, 1, 13)]
+
+
+class TestSnapshotPartitionManager:
+    """Test the DDL issued by the manager."""
+
+    def partitions(self):
+        names = ['p20260113', 'p20260114', 'p20260115', FUTURE_PARTITION]
+        return {'ride_status_snapshots': names, 'park_activity_snapshots': names}
+
+    def test_maintain_creates_and_drops(self):
+        conn = FakeConnection(self.partitions(), rows=500)
+
+        stats = SnapshotPartitionManager(conn).maintain(
+            datetime(2026, 1, 15, 8, 0), today=date(2026, 1, 15), days_ahead=1
+        )
+
+        assert stats['ride_status_snapshots'] == {'created': 1, 'dropped': 2, 'rows_dropped': 500}
+        ddl = conn.ddl()
+        assert any('REORGANIZE PARTITION p_future' in sql and 'p20260116' in sql for sql in ddl)
+        assert 'ALTER TABLE ride_status_snapshots DROP PARTITION p20260113, p20260114' in ddl
+
+    def test_dry_run_issues_no_ddl(self):
+        conn = FakeConnection(self.partitions(), rows=500)
+
+        stats = SnapshotPartitionManager(conn).maintain(
+            datetime(2026, 1, 15, 8, 0), today=date(2026, 1, 15), days_ahead=1, dry_run=True
+        )
+
+        assert stats['park_activity_snapshots']['rows_dropped'] == 500
+        assert conn.ddl() == []
+
+    def test_unpartitioned_tables_are_left_alone(self):
+        conn = FakeConnection({})
+        manager = SnapshotPartitionManager(conn)
+
+        assert manager.maintain(datetime(2026, 1, 15), date(2026, 1, 15), 3) == {}
+        assert manager.drop_expired('ride_status_snapshots', datetime(2026, 1, 15)) == 0
+        assert conn.ddl() == []
+
+
+class TestPartitionedTableDeclarations:
+    """ORM and Core declarations match the partitioned layout of migration f3a9c1d7e482."""
+
+    @pytest.fixture(params=['orm', 'core'])
+    def tables(self, request):
+        if request.param == 'orm':
+            from models import ParkActivitySnapshot, RideStatusSnapshot
+            declared = [RideStatusSnapshot.__table__, ParkActivitySnapshot.__table__]
+        else:
+            from database.schema.snapshot_tables import park_activity_snapshots, ride_status_snapshots
+            declared = [ride_status_snapshots, park_activity_snapshots]
+        return {table.name: table for table in declared}
+
+    def test_primary_key_includes_partitioning_column(self, tables):
+        for name in PARTITIONED_TABLES:
+            assert [column.name for column in tables[name].primary_key] == ['snapshot_id', 'recorded_at']
+            assert tables[name].c.snapshot_id.autoincrement is True
+
+    def test_no_foreign_keys(self, tables):
+        for name in PARTITIONED_TABLES:
+            assert tables[name].foreign_keys == set()
+
+    def test_relationships_join_without_foreign_keys(self):
+        from models import Park, ParkActivitySnapshot, Ride, RideStatusSnapshot
+
+        rides = str(select(Ride.name).join(Ride.ride_snapshots).compile(dialect=mysql.dialect()))
+        parks = str(select(ParkActivitySnapshot.snapshot_id).join(ParkActivitySnapshot.park)
+                    .compile(dialect=mysql.dialect()))
+
+        assert 'ON rides.ride_id = ride_status_snapshots.ride_id' in rides
+        assert 'ON park_activity_snapshots.park_id = parks.park_id' in parks
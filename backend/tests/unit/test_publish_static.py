@@ -0,0 +1,187 @@
+"""
+Static Snapshot Publisher Tests
+===============================
+
+publish_static renders page-load API responses in-process and publishes
+them as a versioned set of static JSON files behind an atomically swapped
+"current" symlink.
+"""
+
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+from flask import Flask, jsonify
+
+from scripts.publish_static import (
+    PUBLISHED_ENDPOINTS,
+    StaticSnapshotPublisher,
+    publish_static_snapshots,
+    static_path,
+)
+
+
+@pytest.fixture
+def fake_app():
+    """App standing in for api.app.create_app()."""
+    app = Flask(__name__)
+    calls = []
+
+    @app.route('/api/parks/downtime')
+    def parks_downtime():
+        from flask import request
+        from utils.cache import get_query_cache
+        calls.append((request.args.get('period'), get_query_cache()))
+        return jsonify({"success": True, "period": request.args.get('period')})
+
+    @app.route('/api/broken')
+    def broken():
+        return jsonify({"success": False}), 500
+
+    app.calls = calls
+    with patch('api.app.create_app', return_value=app):
+        yield app
+
+
+ENDPOINTS = [
+    "/api/parks/downtime?period=live&filter=all-parks&limit=50",
+    "/api/parks/downtime?period=today&filter=all-parks&limit=50",
+]
+
+
+class TestStaticPath:
+    """Test endpoint to file name mapping (mirrored in api-client.js)."""
+
+    def test_params_are_sorted(self):
+        assert static_path("/api/parks/downtime?period=live&filter=all-parks&limit=50") == \
+            "parks/downtime/filter=all-parks,limit=50,period=live.json"
+
+    def test_no_params(self):
+        assert static_path("/api/search/index") == "search/index/default.json"
+
+
+class TestStaticSnapshotPublisher:
+    """Test publishing versions."""
+
+    def test_publishes_files_and_manifest(self, tmp_path, fake_app):
+        """Rendered responses and the manifest should be reachable via current/."""
+        stats = StaticSnapshotPublisher(str(tmp_path), endpoints=ENDPOINTS).run()
+
+        current = tmp_path / "current"
+        assert current.is_symlink()
+        body = (current / "parks/downtime/filter=all-parks,limit=50,period=live.json").read_bytes()
+        assert json.loads(body)["period"] == "live"
+        assert gzip.decompress(
+            (current / "parks/downtime/filter=all-parks,limit=50,period=live.json.gz").read_bytes()
+        ) == body
+
+        manifest = json.loads((current / "manifest.json").read_text())
+        assert manifest["version"] == stats["version"]
+        assert set(manifest["files"]) == {static_path(ep) for ep in ENDPOINTS}
+        assert stats["published"] == 2
+
+    def test_renders_against_private_cache(self, tmp_path, fake_app):
+        """Rendering should not read or fill the configured global cache."""
+        from utils.cache import get_query_cache
+
+        global_cache = get_query_cache()
+        StaticSnapshotPublisher(str(tmp_path), endpoints=ENDPOINTS).run()
+
+        assert all(cache is not global_cache for _, cache in fake_app.calls)
+        assert get_query_cache() is global_cache
+
+    def test_failed_endpoints_are_left_out(self, tmp_path, fake_app):
+        """A non-200 response should not be published."""
+        stats = StaticSnapshotPublisher(str(tmp_path), endpoints=ENDPOINTS + ["/api/broken"]).run()
+
+        manifest = json.loads((tmp_path / "current" / "manifest.json").read_text())
+        assert stats["failed"] == 1
+        assert "broken/default.json" not in manifest["files"]
+
+    def test_nothing_rendered_keeps_current_version(self, tmp_path, fake_app):
+        """If every render fails the previous version stays current."""
+        first = StaticSnapshotPublisher(str(tmp_path), endpoints=ENDPOINTS).run()
+        current_target = (tmp_path / "current").resolve()
+
+        stats = StaticSnapshotPublisher(str(tmp_path), endpoints=["/api/broken"]).run()
+
+        assert stats["published"] == 0
+        assert (tmp_path / "current").resolve() == current_target
+        assert first["version"] in current_target.name
+
+    def test_old_versions_are_pruned(self, tmp_path, fake_app):
+        """Only the newest `keep` versions should remain."""
+        for pid in (101, 102, 103):
+            with patch('scripts.publish_static.os.getpid', return_value=pid):
+                StaticSnapshotPublisher(str(tmp_path), endpoints=ENDPOINTS, keep=2).run()
+
+        releases = sorted(p.name for p in (tmp_path / "releases").iterdir())
+        assert len(releases) == 2
+        assert (tmp_path / "current").resolve().name == releases[-1]
+
+
+class TestClientStaticCheck:
+    """Every published endpoint should be served by api-client.js _getStatic."""
+
+    # config.js STATIC_MAX_AGE_SECONDS
+    STATIC_MAX_AGE = timedelta(seconds=1200)
+
+    @staticmethod
+    def client_path(endpoint):
+        """api-client.js _staticPath: endpoint path without /api, params sorted by name."""
+        parts = urlsplit(endpoint)
+        params = dict(parse_qsl(parts.query))
+        name = ",".join(f"{key}={params[key]}" for key in sorted(params)) or "default"
+        return f"{parts.path[len('/api'):].strip('/')}/{name}.json"
+
+    def client_accepts(self, current, endpoint, now):
+        """api-client.js check: listed in a manifest that is not too old."""
+        manifest = json.loads((current / "manifest.json").read_text())
+        generated_at = datetime.fromisoformat(manifest["generated_at"].replace('Z', '+00:00'))
+        path = self.client_path(endpoint)
+        return (
+            now - generated_at <= self.STATIC_MAX_AGE
+            and path in manifest["files"]
+            and (current / path).is_file()
+        )
+
+    @pytest.fixture
+    def plain_app(self):
+        """Routes answering like /api/parks/waittimes: plain JSON without cached_at."""
+        app = Flask(__name__)
+
+        @app.route('/api/<path:endpoint>')
+        def plain(endpoint):
+            return jsonify({"success": True, "endpoint": endpoint})
+
+        with patch('api.app.create_app', return_value=app):
+            yield app
+
+    def test_every_published_endpoint_passes(self, tmp_path, plain_app):
+        StaticSnapshotPublisher(str(tmp_path), endpoints=PUBLISHED_ENDPOINTS).run()
+        now = datetime.now(timezone.utc)
+
+        rejected = [ep for ep in PUBLISHED_ENDPOINTS if not self.client_accepts(tmp_path / "current", ep, now)]
+        assert rejected == []
+
+    def test_stale_manifest_is_rejected(self, tmp_path, plain_app):
+        StaticSnapshotPublisher(str(tmp_path), endpoints=PUBLISHED_ENDPOINTS).run()
+        later = datetime.now(timezone.utc) + self.STATIC_MAX_AGE + timedelta(seconds=1)
+
+        assert not any(self.client_accepts(tmp_path / "current", ep, later) for ep in PUBLISHED_ENDPOINTS)
+
+
+class TestPublishStaticSnapshots:
+    """Test the hook called by collect_snapshots and aggregate_daily."""
+
+    def test_disabled_without_directory(self):
+        with patch('scripts.publish_static.STATIC_SNAPSHOT_DIR', ''):
+            assert publish_static_snapshots() is None
+
+    def test_errors_are_not_raised(self, tmp_path):
+        with patch('scripts.publish_static.STATIC_SNAPSHOT_DIR', str(tmp_path)), \
+                patch.object(StaticSnapshotPublisher, 'run', side_effect=OSError("disk full")):
+            assert publish_static_snapshots() is None
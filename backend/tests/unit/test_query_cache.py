@@ -302,3 +302,446 @@ class TestCacheThreadSafety:
         assert call_count == initial_calls, (
             f"Cache should prevent recomputation, but got {call_count - initial_calls} extra calls"
         )
+
+
+class TestBoundedCache:
+    """Test LRU eviction, size accounting and expired-entry sweeps."""
+
+    def test_lru_evicts_least_recently_used_entry(self):
+        """Exceeding max_entries should evict the least recently used key."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=300, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_bound_evicts_until_within_limit(self):
+        """Estimated bytes should never stay above max_bytes."""
+        from utils.cache import QueryCache, estimate_size
+
+        payload = {"rankings": [{"ride_id": i, "name": f"Ride {i}"} for i in range(50)]}
+        size = estimate_size(payload)
+        cache = QueryCache(ttl_seconds=300, max_bytes=size * 3)
+
+        for i in range(10):
+            cache.set(f"key_{i}", {"rankings": list(payload["rankings"])})
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= size * 3
+        assert stats["total_entries"] < 10
+        assert cache.get("key_9") is not None
+
+    def test_oversized_value_is_not_cached(self):
+        """A single value larger than max_bytes should not be stored."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=300, max_bytes=1000)
+        cache.set("small", "x")
+        cache.set("huge", ["x" * 100 for _ in range(100)])
+
+        assert cache.get("huge") is None
+        assert cache.get("small") == "x"
+        assert cache.get_stats()["oversized"] == 1
+
+    def test_memory_stays_flat_for_many_distinct_keys(self):
+        """Crawling many distinct keys should not grow the cache without bound."""
+        from utils.cache import QueryCache, generate_cache_key
+
+        cache = QueryCache(ttl_seconds=300, max_entries=100)
+        for ride_id in range(5000):
+            cache.set(generate_cache_key("ride_details", ride_id=ride_id), {"ride_id": ride_id})
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 100
+        assert stats["evictions"] == 4900
+
+    def test_byte_accounting_follows_replace_and_invalidate(self):
+        """Replacing or invalidating an entry should adjust the byte count."""
+        from utils.cache import QueryCache, estimate_size
+
+        cache = QueryCache(ttl_seconds=300)
+        cache.set("k", [1, 2, 3])
+        cache.set("k", "replacement")
+        assert cache.get_stats()["bytes"] == estimate_size("replacement")
+
+        cache.invalidate(key="k")
+        assert cache.get_stats()["bytes"] == 0
+
+    def test_expired_entries_swept_on_set(self, monkeypatch):
+        """set() should drop expired entries once the sweep interval has passed."""
+        from utils import cache as cache_module
+
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+        cache = cache_module.QueryCache(ttl_seconds=60)
+        for i in range(5):
+            cache.set(f"old_{i}", i)
+
+        now[0] += 61
+        cache.set("new", "value")
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 1
+        assert stats["expirations"] == 5
+        assert stats["bytes"] == cache_module.estimate_size("value")
+
+    def test_stats_count_hits_and_misses(self):
+        """get_stats should report hit, miss and hit-rate counters."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=300)
+        cache.get_or_compute(key="k", compute_fn=lambda: "v")
+        cache.get_or_compute(key="k", compute_fn=lambda: "v")
+        cache.get_or_compute(key="k", compute_fn=lambda: "v")
+
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+        assert stats["hit_rate"] == pytest.approx(2 / 3, abs=1e-4)
+
+    def test_global_cache_is_bounded(self):
+        """The global cache should use the configured bounds."""
+        from utils.cache import reset_query_cache, get_query_cache
+        from utils.config import QUERY_CACHE_MAX_ENTRIES, QUERY_CACHE_MAX_BYTES
+
+        reset_query_cache()
+        stats = get_query_cache().get_stats()
+
+        assert stats["max_entries"] == QUERY_CACHE_MAX_ENTRIES > 0
+        assert stats["max_bytes"] == QUERY_CACHE_MAX_BYTES > 0
+
+
+class TestSingleFlight:
+    """Test request coalescing in get_or_compute."""
+
+    def test_concurrent_misses_compute_once(self):
+        """Concurrent callers for an expired key should share one computation."""
+        from utils.cache import QueryCache
+        import threading
+
+        cache = QueryCache(ttl_seconds=300)
+        call_count = 0
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_query():
+            nonlocal call_count
+            call_count += 1
+            started.set()
+            release.wait(5)
+            return "result"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(cache.get_or_compute("k", slow_query)))
+        leader.start()
+        started.wait(5)
+
+        followers = [
+            threading.Thread(target=lambda: results.append(cache.get_or_compute("k", slow_query)))
+            for _ in range(9)
+        ]
+        for t in followers:
+            t.start()
+        while cache.get_stats()["coalesced"] < 9:
+            time.sleep(0.001)
+        release.set()
+        for t in [leader] + followers:
+            t.join()
+
+        assert call_count == 1
+        assert results == ["result"] * 10
+        assert cache.get_stats()["inflight"] == 0
+
+    def test_waiters_receive_leader_exception(self):
+        """A failing computation should fail its waiters without recomputing."""
+        from utils.cache import QueryCache
+        import threading
+
+        cache = QueryCache(ttl_seconds=300)
+        started = threading.Event()
+        release = threading.Event()
+        errors = []
+
+        def failing_query():
+            started.set()
+            release.wait(5)
+            raise RuntimeError("db down")
+
+        def worker():
+            try:
+                cache.get_or_compute("k", failing_query)
+            except RuntimeError as e:
+                errors.append(str(e))
+
+        leader = threading.Thread(target=worker)
+        leader.start()
+        started.wait(5)
+        follower = threading.Thread(target=worker)
+        follower.start()
+        while cache.get_stats()["coalesced"] < 1:
+            time.sleep(0.001)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert errors == ["db down", "db down"]
+        # Failure is not cached - next caller computes again
+        assert cache.get_or_compute("k", lambda: "recovered") == "recovered"
+
+    def test_waiter_computes_itself_after_timeout(self):
+        """A waiter should stop waiting on a stuck leader after the timeout."""
+        from utils.cache import QueryCache
+        import threading
+
+        cache = QueryCache(ttl_seconds=300, compute_timeout_seconds=0.05)
+        started = threading.Event()
+        release = threading.Event()
+
+        def stuck_query():
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        leader = threading.Thread(target=lambda: cache.get_or_compute("k", stuck_query))
+        leader.start()
+        started.wait(5)
+
+        result = cache.get_or_compute("k", lambda: "fallback")
+        release.set()
+        leader.join()
+
+        assert result == "fallback"
+        assert cache.get_stats()["coalesce_timeouts"] == 1
+
+    def test_other_keys_not_blocked(self):
+        """A computation in progress should not block other keys."""
+        from utils.cache import QueryCache
+        import threading
+
+        cache = QueryCache(ttl_seconds=300)
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_query():
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        leader = threading.Thread(target=lambda: cache.get_or_compute("slow", slow_query))
+        leader.start()
+        started.wait(5)
+
+        assert cache.get_or_compute("fast", lambda: "fast") == "fast"
+        release.set()
+        leader.join()
+
+    def test_none_result_is_not_cached(self):
+        """None (e.g. entity not found) should be returned but not cached."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=300)
+
+        assert cache.get_or_compute("k", lambda: None) is None
+        assert cache.get_or_compute("k", lambda: "found") == "found"
+
+    def test_route_handlers_coalesce_concurrent_requests(self):
+        """Concurrent /live/status-summary requests should run the query once."""
+        from unittest.mock import MagicMock, patch
+        from api.app import create_app
+        from utils.cache import reset_query_cache
+        from utils.data_epoch import DataEpochs
+        import threading
+
+        reset_query_cache()
+        app = create_app()
+        call_count = 0
+        release = threading.Event()
+
+        def slow_summary(**kwargs):
+            nonlocal call_count
+            call_count += 1
+            release.wait(5)
+            return {"DOWN": 3, "OPERATING": 40}
+
+        statuses = []
+
+        def request_summary():
+            with app.test_client() as client:
+                statuses.append(client.get('/api/live/status-summary').status_code)
+
+        with patch('api.routes.rides.get_db_connection', MagicMock()), \
+                patch('utils.data_epoch.get_data_epochs', return_value=DataEpochs(live='e1', historical='1')), \
+                patch('api.routes.rides.StatusSummaryQuery') as query_cls:
+            query_cls.return_value.get_summary.side_effect = slow_summary
+            threads = [threading.Thread(target=request_summary) for _ in range(5)]
+            for t in threads:
+                t.start()
+            time.sleep(0.2)
+            release.set()
+            for t in threads:
+                t.join()
+
+        reset_query_cache()
+        assert statuses == [200] * 5
+        assert call_count == 1
+
+
+class TestStaleWhileRevalidate:
+    """Test soft/hard TTL serving with background refresh."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from utils import cache as cache_module
+
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+        return now
+
+    def _wait_for_refresh(self, cache):
+        deadline = time.monotonic() + 5
+        while cache.get_stats()["inflight"] and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_stale_value_served_while_refreshing(self, clock):
+        """Between soft and hard TTL the old value is returned immediately."""
+        from utils.cache import QueryCache
+        import threading
+
+        cache = QueryCache(ttl_seconds=60, stale_ttl_seconds=600)
+        cache.get_or_compute("k", lambda: "v1", serve_stale=True)
+        clock[0] += 61
+
+        release = threading.Event()
+        refresh_calls = []
+
+        def slow_refresh():
+            refresh_calls.append(1)
+            release.wait(5)
+            return "v2"
+
+        first, cached_at = cache.get_or_compute_with_timestamp("k", slow_refresh, serve_stale=True)
+        second = cache.get_or_compute("k", slow_refresh, serve_stale=True)
+
+        assert (first, second) == ("v1", "v1")
+        assert cached_at == 1000.0
+        release.set()
+        self._wait_for_refresh(cache)
+
+        assert refresh_calls == [1]
+        assert cache.get_or_compute("k", slow_refresh, serve_stale=True) == "v2"
+        stats = cache.get_stats()
+        assert stats["stale_hits"] == 2
+        assert stats["refreshes"] == 1
+
+    def test_past_hard_ttl_computes_synchronously(self, clock):
+        """After the hard TTL the caller waits for a fresh value."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=60, stale_ttl_seconds=120)
+        cache.get_or_compute("k", lambda: "v1", serve_stale=True)
+        clock[0] += 181
+
+        assert cache.get_or_compute("k", lambda: "v2", serve_stale=True) == "v2"
+
+    def test_stale_not_served_without_opt_in(self, clock):
+        """Callers that do not pass serve_stale recompute after the soft TTL."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=60, stale_ttl_seconds=600)
+        cache.set("k", "v1")
+        clock[0] += 61
+
+        assert cache.get("k") is None
+        assert cache.get_or_compute("k", lambda: "v2") == "v2"
+
+    def test_failed_refresh_keeps_stale_value(self, clock):
+        """A failing background refresh should leave the stale entry servable."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=60, stale_ttl_seconds=600)
+        cache.set("k", "v1")
+        clock[0] += 61
+
+        def failing():
+            raise RuntimeError("db down")
+
+        assert cache.get_or_compute("k", failing, serve_stale=True) == "v1"
+        self._wait_for_refresh(cache)
+
+        assert cache.get_stats()["refresh_errors"] == 1
+        assert cache.get_or_compute("k", failing, serve_stale=True) == "v1"
+
+    def test_stale_entries_survive_sweep_until_hard_ttl(self, clock):
+        """The expired-entry sweep should use the hard TTL."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=60, stale_ttl_seconds=600)
+        cache.set("k", "v1")
+        clock[0] += 61
+        cache.set("other", "x")
+        assert cache.get_stats()["stale_entries"] == 1
+
+        clock[0] += 600
+        cache.set("other", "y")
+        assert cache.get_stats()["total_entries"] == 1
+
+    def test_freshness_fields(self, clock):
+        """with_cache_freshness should add cached_at and age without mutating the payload."""
+        from utils.cache import with_cache_freshness
+
+        payload = {"success": True}
+        clock[0] = 1_700_000_090.0
+
+        result = with_cache_freshness(payload, 1_700_000_000.0)
+
+        assert result["cached_at"] == "2023-11-14T22:13:20Z"
+        assert result["cache_age_seconds"] == 90
+        assert "cached_at" not in payload
+
+
+class TestEpochValidity:
+    """Test entries that stay valid until the data epoch advances."""
+
+    def test_entry_from_older_epoch_is_a_miss(self):
+        """A young entry computed at an older epoch should be recomputed."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=300)
+        cache.get_or_compute("k", lambda: "v1", epoch="e1")
+
+        assert cache.get("k", epoch="e1") == "v1"
+        assert cache.get("k", epoch="e2") is None
+        assert cache.get_or_compute("k", lambda: "v2", epoch="e2") == "v2"
+
+    def test_per_entry_ttl_outlives_default(self, monkeypatch):
+        """Immutable periods can be cached longer than the default TTL."""
+        from utils import cache as cache_module
+
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "time", lambda: now[0])
+        cache = cache_module.QueryCache(ttl_seconds=300)
+        cache.get_or_compute("yesterday", lambda: "v1", epoch="42", ttl=86400)
+        now[0] += 3600
+
+        assert cache.get_or_compute("yesterday", lambda: "v2", epoch="42", ttl=86400) == "v1"
+
+    def test_epoch_change_serves_stale_and_refreshes(self):
+        """With serve_stale, an epoch change refreshes in the background."""
+        from utils.cache import QueryCache
+
+        cache = QueryCache(ttl_seconds=300, stale_ttl_seconds=600)
+        cache.get_or_compute("k", lambda: "v1", serve_stale=True, epoch="e1")
+
+        assert cache.get_or_compute("k", lambda: "v2", serve_stale=True, epoch="e2") == "v1"
+        deadline = time.monotonic() + 5
+        while cache.get("k", epoch="e2") is None and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        assert cache.get_or_compute("k", lambda: "v3", serve_stale=True, epoch="e2") == "v2"
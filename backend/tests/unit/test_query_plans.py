@@ -0,0 +1,176 @@
+"""
+Query Plan Verification Tests
+=============================
+
+QueryPlanAuditor reads EXPLAIN FORMAT=JSON plans of the query classes:
+full scans of time-series tables without a usable index are CRITICAL,
+other scans, filesorts and temporary tables are warnings, and covering
+indexes are suggested from the observed access pattern.
+"""
+
+from unittest.mock import MagicMock
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+
+from database.audit.query_plans import (
+    QueryCase,
+    QueryPlanAuditor,
+    PlanContext,
+    analyze_plan,
+    suggest_index,
+    table_aliases,
+)
+
+SQL = """
+    SELECT r.ride_id, AVG(rss.wait_time)
+    FROM rides AS r
+    JOIN ride_status_snapshots rss ON rss.ride_id = r.ride_id
+    WHERE rss.recorded_at >= %(start)s
+    GROUP BY r.ride_id
+    ORDER BY 2 DESC
+"""
+
+
+def _plan(snapshots_node):
+    return {
+        "query_block": {
+            "select_id": 1,
+            "ordering_operation": {
+                "using_filesort": True,
+                "grouping_operation": {
+                    "using_temporary_table": True,
+                    "nested_loop": [
+                        {"table": {"table_name": "r", "access_type": "ALL", "rows_examined_per_scan": 120,
+                                   "possible_keys": ["PRIMARY"], "used_columns": ["ride_id"]}},
+                        {"table": snapshots_node},
+                    ],
+                },
+            },
+        }
+    }
+
+
+def _snapshots_node(**overrides):
+    node = {
+        "table_name": "rss",
+        "access_type": "ALL",
+        "rows_examined_per_scan": 130000,
+        "used_columns": ["ride_id", "recorded_at", "wait_time"],
+        "attached_condition": "((`test`.`rss`.`ride_id` = `test`.`r`.`ride_id`) and "
+                              "(cast(`test`.`rss`.`recorded_at` as date) >= '2025-12-21'))",
+    }
+    node.update(overrides)
+    return node
+
+
+class TestTableAliases:
+    """Test alias resolution from the statement."""
+
+    def test_aliases(self):
+        assert table_aliases(SQL) == {
+            'rides': 'rides', 'r': 'rides',
+            'ride_status_snapshots': 'ride_status_snapshots', 'rss': 'ride_status_snapshots',
+        }
+
+    def test_keywords_are_not_aliases(self):
+        assert table_aliases("SELECT 1 FROM parks WHERE 1") == {'parks': 'parks'}
+
+
+class TestAnalyzePlan:
+    """Test findings from a plan."""
+
+    def test_full_scan_without_usable_index_is_critical(self):
+        findings, _ = analyze_plan(SQL, _plan(_snapshots_node()))
+
+        problems = {(f.problem, f.severity, f.table) for f in findings}
+        assert ('NO_USABLE_INDEX', 'CRITICAL', 'ride_status_snapshots') in problems
+        assert ('FILESORT', 'WARNING', None) in problems
+        assert ('TEMPORARY_TABLE', 'WARNING', None) in problems
+        # small dimension table scans are not reported
+        assert not any(f.table == 'rides' for f in findings)
+
+    def test_scan_with_possible_keys_is_a_warning(self):
+        node = _snapshots_node(possible_keys=["idx_ride_recorded"])
+
+        findings, _ = analyze_plan(SQL, _plan(node))
+
+        assert [(f.problem, f.severity) for f in findings if f.table] == [('FULL_SCAN', 'WARNING')]
+
+    def test_covering_range_access_is_clean(self):
+        node = _snapshots_node(access_type="range", key="idx_ride_recorded", using_index=True,
+                               possible_keys=["idx_ride_recorded"])
+
+        findings, suggestions = analyze_plan(SQL, _plan(node))
+
+        assert not any(f.table for f in findings)
+        assert suggestions == []
+
+    def test_large_other_tables_are_reported(self):
+        findings, _ = analyze_plan(SQL, _plan(_snapshots_node(access_type="ref", using_index=True)), min_rows=100)
+
+        assert [(f.problem, f.table) for f in findings if f.table] == [('FULL_SCAN', 'rides')]
+
+
+class TestSuggestIndex:
+    """Test covering index suggestions."""
+
+    def test_equality_then_range_then_read_columns(self):
+        node = _snapshots_node(attached_condition=(
+            "((`test`.`rss`.`ride_id` = `test`.`r`.`ride_id`) and "
+            "(`test`.`rss`.`recorded_at` >= TIMESTAMP'2025-12-21 08:00:00'))"
+        ))
+
+        suggestion = suggest_index('ride_status_snapshots', node)
+
+        assert suggestion.columns == ['ride_id', 'recorded_at', 'wait_time']
+        assert suggestion.covering
+        assert suggestion.declared_as == 'idx_ride_recorded'
+        assert suggestion.ddl.startswith('CREATE INDEX idx_ride_status_snapshots_ride_id_recorded_at_wait_time ON')
+
+    def test_ref_access_uses_key_parts(self):
+        node = {"table_name": "pas", "access_type": "ref", "used_key_parts": ["park_id"],
+                "used_columns": ["park_id", "recorded_at", "park_appears_open"]}
+
+        suggestion = suggest_index('park_activity_snapshots', node)
+
+        assert suggestion.columns[:1] == ['park_id']
+
+    def test_wide_reads_suggest_key_only(self):
+        node = _snapshots_node(used_columns=[f"c{n}" for n in range(8)])
+
+        suggestion = suggest_index('ride_status_snapshots', node)
+
+        assert suggestion.columns == ['ride_id']
+        assert not suggestion.covering
+
+    def test_no_indexable_predicate(self):
+        assert suggest_index('ride_status_snapshots', {"table_name": "rss", "access_type": "ALL"}) is None
+
+
+class TestQueryPlanAuditor:
+    """Test running a query case."""
+
+    def test_explains_captured_statements(self):
+        session = Session(create_engine("sqlite://"))
+        auditor = QueryPlanAuditor(session)
+        auditor.explain = MagicMock(return_value=_plan(_snapshots_node()))
+        case = QueryCase('select', lambda s, c: s.execute(text("SELECT :park_id"), {"park_id": c.park_id}))
+
+        report = auditor.audit_case(case, PlanContext(7, None))
+
+        assert report.statements == 1
+        statement, parameters = auditor.explain.call_args.args
+        assert statement.startswith("SELECT") and 7 in tuple(parameters)
+        assert report.findings
+
+    def test_failed_query_is_reported(self):
+        session = Session(create_engine("sqlite://"))
+
+        def fail(s, c):
+            raise RuntimeError("boom")
+
+        report = QueryPlanAuditor(session).audit_case(QueryCase('broken', fail), PlanContext(1, None))
+
+        assert report.error == "RuntimeError: boom"
+        assert report.passed
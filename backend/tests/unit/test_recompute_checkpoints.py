@@ -0,0 +1,245 @@
+"""
+Unit Tests: Resumable recompute_daily_stats
+
+Verifies that recomputation commits in (date, metrics_version, ride chunk)
+units with a checkpoint per chunk, that a rerun skips checkpointed chunks,
+and that progress reports throughput and an ETA based on recomputed days.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from scripts.recompute_daily_stats import DailyStatsRecomputer, recompute_date_unit
+
+
+DAY = date(2025, 12, 1)
+
+
+def _rides(*ride_ids):
+    return [SimpleNamespace(ride_id=ride_id, name=f"Ride {ride_id}") for ride_id in ride_ids]
+
+
+@pytest.fixture
+def repos():
+    ride_repo = MagicMock()
+    # Deliberately unordered: chunks are built in ride_id order
+    ride_repo.get_all_active.return_value = _rides(5, 1, 4, 2, 3)
+    park_repo = MagicMock()
+    park_repo.get_all_active.return_value = [SimpleNamespace(park_id=1, name="Park 1")]
+    return ride_repo, park_repo
+
+
+@pytest.fixture
+def log_repo():
+    with patch('scripts.recompute_daily_stats.AggregationLogRepository') as repo_cls:
+        yield repo_cls.return_value
+
+
+def _recomputer(**kwargs):
+    recomputer = DailyStatsRecomputer(DAY, DAY, chunk_size=2, **kwargs)
+    recomputer._recompute_ride = MagicMock(return_value=True)
+    recomputer._recompute_park = MagicMock(return_value=True)
+    return recomputer
+
+
+def _checkpointed_keys(log_repo):
+    return [c.args[1] for c in log_repo.record_completed_unit.call_args_list]
+
+
+class TestChunkCheckpoints:
+    """Each chunk commits together with its checkpoint entry."""
+
+    def test_fresh_run_checkpoints_every_chunk(self, repos, log_repo):
+        session = MagicMock()
+        recomputer = _recomputer()
+
+        did_work = recomputer._process_date(session, DAY, *repos)
+
+        assert did_work is True
+        assert _checkpointed_keys(log_repo) == [
+            'recompute:v1:rides:1-2',
+            'recompute:v1:rides:3-4',
+            'recompute:v1:rides:5-5',
+            'recompute:v1:parks',
+        ]
+        assert session.commit.call_count == 4
+        assert recomputer.stats['rides_processed'] == 5
+        assert recomputer.stats['chunks_processed'] == 4
+
+    def test_metrics_version_in_unit_key(self, repos, log_repo):
+        _recomputer(metrics_version=2)._process_date(MagicMock(), DAY, *repos)
+
+        assert all(key.startswith('recompute:v2:') for key in _checkpointed_keys(log_repo))
+
+    def test_resume_skips_completed_chunks(self, repos, log_repo):
+        recomputer = _recomputer()
+        completed = {'recompute:v1:rides:1-2', 'recompute:v1:rides:3-4'}
+
+        recomputer._process_date(MagicMock(), DAY, *repos, completed)
+
+        recomputed = [c.args[1].ride_id for c in recomputer._recompute_ride.call_args_list]
+        assert recomputed == [5]
+        # Parks roll up ride stats, so they are redone after any ride chunk
+        recomputer._recompute_park.assert_called_once()
+        assert recomputer.stats['chunks_skipped'] == 2
+
+    def test_fully_checkpointed_date_is_skipped(self, repos, log_repo):
+        session = MagicMock()
+        recomputer = _recomputer()
+        completed = {
+            'recompute:v1:rides:1-2', 'recompute:v1:rides:3-4',
+            'recompute:v1:rides:5-5', 'recompute:v1:parks',
+        }
+
+        did_work = recomputer._process_date(session, DAY, *repos, completed)
+
+        assert did_work is False
+        recomputer._recompute_ride.assert_not_called()
+        recomputer._recompute_park.assert_not_called()
+        session.commit.assert_not_called()
+
+    def test_forced_chunk_errors_are_committed_but_not_checkpointed(self, repos, log_repo):
+        session = MagicMock()
+        recomputer = _recomputer(force=True)
+
+        def recompute_ride(_session, ride, *_args):
+            if ride.ride_id == 3:
+                raise RuntimeError("boom")
+            return True
+
+        recomputer._recompute_ride.side_effect = recompute_ride
+
+        recomputer._process_date(session, DAY, *repos)
+
+        assert 'recompute:v1:rides:3-4' not in _checkpointed_keys(log_repo)
+        assert session.commit.call_count == 4
+        assert recomputer.stats['errors'] == 1
+
+    def test_error_without_force_stops_before_checkpoint(self, repos, log_repo):
+        recomputer = _recomputer()
+        recomputer._recompute_ride.side_effect = RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            recomputer._process_date(MagicMock(), DAY, *repos)
+
+        log_repo.record_completed_unit.assert_not_called()
+
+    def test_dry_run_never_commits(self, repos, log_repo):
+        session = MagicMock()
+
+        _recomputer(dry_run=True)._process_date(session, DAY, *repos)
+
+        session.commit.assert_not_called()
+        log_repo.record_completed_unit.assert_not_called()
+
+
+class TestResumeLoading:
+    """Checkpoints are loaded once per run for the metrics_version."""
+
+    def test_load_checkpoints_uses_version_prefix(self):
+        recomputer = DailyStatsRecomputer(DAY, date(2025, 12, 3), metrics_version=3)
+
+        with patch('scripts.recompute_daily_stats.get_db_session'), \
+                patch('scripts.recompute_daily_stats.AggregationLogRepository') as repo_cls:
+            repo_cls.return_value.get_completed_unit_keys.return_value = {DAY: {'recompute:v3:parks'}}
+            completed = recomputer._load_checkpoints()
+
+        repo_cls.return_value.get_completed_unit_keys.assert_called_once_with(
+            DAY, date(2025, 12, 3), 'recompute:v3:'
+        )
+        assert completed == {DAY: {'recompute:v3:parks'}}
+
+    def test_no_resume_ignores_checkpoints(self):
+        recomputer = DailyStatsRecomputer(DAY, DAY, resume=False)
+
+        with patch('scripts.recompute_daily_stats.get_db_session') as get_session:
+            assert recomputer._load_checkpoints() == {}
+
+        get_session.assert_not_called()
+
+    def test_worker_unit_passes_completed_chunks(self, repos, log_repo):
+        with patch('scripts.recompute_daily_stats.get_db_session'), \
+                patch('scripts.recompute_daily_stats.RideRepository', return_value=repos[0]), \
+                patch('scripts.recompute_daily_stats.ParkRepository', return_value=repos[1]), \
+                patch.object(DailyStatsRecomputer, '_recompute_ride', return_value=True) as recompute_ride, \
+                patch.object(DailyStatsRecomputer, '_recompute_park', return_value=True):
+            counters = recompute_date_unit(
+                DAY, 1, dry_run=False, force=False, chunk_size=2,
+                completed_units=['recompute:v1:rides:1-2']
+            )
+
+        assert recompute_ride.call_count == 3
+        assert counters['did_work'] is True
+        assert counters['chunks_skipped'] == 1
+        assert counters['rides_processed'] == 3
+
+
+class TestProgress:
+    """Progress reports throughput and ETA from recomputed days only."""
+
+    def test_eta_excludes_resumed_days(self):
+        recomputer = DailyStatsRecomputer(DAY, date(2025, 12, 10))
+        recomputer.stats.update({
+            'start_time': 1000.0,
+            'days_processed': 6,
+            'days_skipped': 4,
+            'rides_processed': 200,
+        })
+
+        with patch('scripts.recompute_daily_stats.time.time', return_value=1100.0), \
+                patch('scripts.recompute_daily_stats.logger') as log:
+            recomputer._print_progress()
+
+        message = log.info.call_args.args[0]
+        # 2 recomputed days in 100s -> 4 remaining days take 200s
+        assert "6/10 days (60.0%, 4 resumed)" in message
+        assert "2.0 rides/s" in message
+        assert "72.0 days/h" in message
+        assert "ETA: 0:03:20" in message
+
+
+class TestCheckpointRows:
+    """Checkpoint rows coexist with the run-level entry of the same date and type."""
+
+    @pytest.fixture
+    def session(self):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        from models import AggregationLog
+
+        engine = create_engine("sqlite://")
+        AggregationLog.__table__.create(engine)
+        with Session(engine) as session:
+            yield session
+
+    def test_no_unique_date_type_declaration(self):
+        from database.schema.stats_tables import aggregation_log
+        from models import AggregationLog
+
+        for table in (AggregationLog.__table__, aggregation_log):
+            unique = [
+                [column.name for column in constraint.columns]
+                for constraint in list(table.indexes) + list(table.constraints)
+                if getattr(constraint, 'unique', False) or type(constraint).__name__ == 'UniqueConstraint'
+            ]
+            assert ['aggregation_date', 'aggregation_type'] not in unique
+            assert 'unit_key' in table.c
+
+    def test_checkpoints_share_date_with_run_entry(self, session):
+        from database.repositories.aggregation_repository import AggregationLogRepository
+
+        from datetime import datetime
+
+        repo = AggregationLogRepository(session)
+        repo.insert({'aggregation_date': DAY, 'aggregation_type': 'daily', 'started_at': datetime(2025, 12, 2, 1)})
+        repo.record_completed_unit(DAY, 'recompute:v3:rides:1-250', rides_processed=250)
+        repo.record_completed_unit(DAY, 'recompute:v3:parks', parks_processed=5)
+        session.commit()
+
+        assert repo.get_completed_unit_keys(DAY, DAY, 'recompute:v3:') == {
+            DAY: {'recompute:v3:rides:1-250', 'recompute:v3:parks'},
+        }
@@ -0,0 +1,140 @@
+"""
+Request Timing Middleware Tests
+===============================
+
+register_request_timing() reports total, DB, serialization and cache
+timings per request in a Server-Timing header and the "API request" log
+line, and warns when a request runs too many SQL statements.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from flask import Flask, jsonify
+from sqlalchemy import create_engine, text
+
+from api.middleware.http_cache import cached_json_response
+from api.middleware.request_timing import register_request_timing, server_timing_header, RequestTiming
+from utils.cache import QueryCache, stop_recording_lookups
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def app(engine):
+    app = Flask(__name__)
+    register_request_timing(app)
+    cache = QueryCache(ttl_seconds=300)
+
+    @app.route('/api/queries/<int:n>')
+    def queries(n):
+        with engine.connect() as conn:
+            for _ in range(n):
+                conn.execute(text("SELECT 1"))
+        return jsonify({"n": n})
+
+    @app.route('/api/failing')
+    def failing():
+        with engine.connect() as conn:
+            try:
+                conn.execute(text("SELECT * FROM missing_table"))
+            except Exception:
+                conn.rollback()
+            conn.execute(text("SELECT 1"))
+            app.leftover = dict(conn.info)
+        return jsonify({"success": True})
+
+    @app.route('/api/cached')
+    def cached():
+        return cached_json_response(cache, "cached", lambda: {"success": True})
+
+    return app
+
+
+def parse_server_timing(header):
+    """Server-Timing header -> {metric: {param: value}}."""
+    metrics = {}
+    for metric in header.split(", "):
+        name, *params = metric.split(";")
+        metrics[name] = dict(param.split("=", 1) for param in params)
+    return metrics
+
+
+class TestServerTimingHeader:
+    """Test the Server-Timing header on responses."""
+
+    def test_counts_statements(self, app):
+        response = app.test_client().get('/api/queries/3')
+
+        metrics = parse_server_timing(response.headers['Server-Timing'])
+        assert metrics['db']['desc'] == '"3 statements"'
+        assert float(metrics['total']['dur']) >= float(metrics['db']['dur'])
+        assert 'serialize' in metrics
+
+    def test_cache_miss_then_hit(self, app):
+        client = app.test_client()
+
+        first = parse_server_timing(client.get('/api/cached').headers['Server-Timing'])
+        second = parse_server_timing(client.get('/api/cached').headers['Server-Timing'])
+
+        assert first['cache']['desc'] == '"miss"'
+        assert second['cache']['desc'] == '"hit"'
+
+    def test_no_cache_metric_without_lookups(self, app):
+        metrics = parse_server_timing(app.test_client().get('/api/queries/0').headers['Server-Timing'])
+
+        assert 'cache' not in metrics
+
+    def test_worst_cache_outcome_is_reported(self):
+        timing = RequestTiming()
+        timing.lookups.extend(['hit', 'miss', 'stale'])
+        stop_recording_lookups()
+
+        assert 'cache;desc="miss"' in server_timing_header(timing, 1.0)
+
+
+class TestRequestLogging:
+    """Test the structured log line and the statement threshold."""
+
+    def test_logs_request_fields(self, app):
+        with patch('api.middleware.request_timing.log_api_request') as log:
+            app.test_client().get('/api/queries/2?x=1')
+
+        args, fields = log.call_args
+        assert args[:3] == ('GET', '/api/queries/2?x=1', 200)
+        assert fields['sql_statements'] == 2
+        assert fields['too_many_statements'] is False
+
+    def test_warns_above_statement_threshold(self, app):
+        with patch('api.middleware.request_timing.REQUEST_STATEMENT_WARN_THRESHOLD', 5), \
+                patch('api.middleware.request_timing.logger') as logger, \
+                patch('api.middleware.request_timing.log_api_request') as log:
+            app.test_client().get('/api/queries/6')
+
+        assert log.call_args[1]['too_many_statements'] is True
+        logger.warning.assert_called_once()
+
+    def test_threshold_zero_disables_warning(self, app):
+        with patch('api.middleware.request_timing.REQUEST_STATEMENT_WARN_THRESHOLD', 0), \
+                patch('api.middleware.request_timing.logger') as logger:
+            app.test_client().get('/api/queries/50')
+
+        logger.warning.assert_not_called()
+
+    def test_statements_outside_requests_are_ignored(self, app, engine):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        metrics = parse_server_timing(app.test_client().get('/api/queries/1').headers['Server-Timing'])
+        assert metrics['db']['desc'] == '"1 statements"'
+
+    def test_failed_statements_are_counted_and_cleaned_up(self, app):
+        metrics = parse_server_timing(app.test_client().get('/api/failing').headers['Server-Timing'])
+
+        assert metrics['db']['desc'] == '"2 statements"'
+        assert not any(key.startswith('request_timing') for key in app.leftover)
@@ -0,0 +1,71 @@
+"""
+Unit Tests: RideIdentityMap
+
+Verifies the collector's per-cycle ride lookup serves known rides from
+memory and only falls back to the database once per unknown ID.
+"""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from collector.ride_identity_map import RideIdentityMap
+from models.ride import Ride
+
+
+def _ride(ride_id, queue_times_id, category='ATTRACTION', tier=2):
+    now = datetime(2025, 12, 1)
+    return Ride(
+        ride_id=ride_id, queue_times_id=queue_times_id, park_id=1, name=f'Ride {ride_id}',
+        land_area=None, tier=tier, category=category, is_active=True,
+        created_at=now, updated_at=now,
+    )
+
+
+@pytest.fixture
+def ride_repo():
+    repo = MagicMock()
+    repo.get_all_active_identities.return_value = [
+        ('wiki-1', _ride(1, 101)),
+        (None, _ride(2, 102, category='SHOW')),
+    ]
+    repo.get_by_themeparks_wiki_id.return_value = None
+    repo.get_by_queue_times_id.return_value = None
+    return repo
+
+
+class TestRideIdentityMap:
+    """Tests for RideIdentityMap lookups."""
+
+    def test_load_indexes_by_both_provider_ids(self, ride_repo):
+        ride_map = RideIdentityMap(ride_repo)
+
+        assert ride_map.load() == 2
+        assert ride_map.get_by_themeparks_wiki_id('wiki-1').ride_id == 1
+        assert ride_map.get_by_queue_times_id(101).ride_id == 1
+        assert ride_map.get_by_queue_times_id(102).category == 'SHOW'
+        ride_repo.get_by_themeparks_wiki_id.assert_not_called()
+        ride_repo.get_by_queue_times_id.assert_not_called()
+        assert ride_map.db_fallbacks == 0
+
+    def test_unknown_ids_fall_back_to_db_once(self, ride_repo):
+        ride_map = RideIdentityMap(ride_repo)
+        ride_map.load()
+
+        assert ride_map.get_by_themeparks_wiki_id('unmapped') is None
+        assert ride_map.get_by_themeparks_wiki_id('unmapped') is None
+        assert ride_map.get_by_queue_times_id(999) is None
+        assert ride_map.get_by_queue_times_id(999) is None
+
+        ride_repo.get_by_themeparks_wiki_id.assert_called_once_with('unmapped')
+        ride_repo.get_by_queue_times_id.assert_called_once_with(999)
+        assert ride_map.db_fallbacks == 2
+
+    def test_fallback_hit_is_memoized(self, ride_repo):
+        ride_repo.get_by_queue_times_id.return_value = _ride(3, 103)
+        ride_map = RideIdentityMap(ride_repo)
+
+        assert ride_map.get_by_queue_times_id(103).ride_id == 3
+        assert ride_map.get_by_queue_times_id(103).ride_id == 3
+        ride_repo.get_by_queue_times_id.assert_called_once_with(103)
@@ -0,0 +1,135 @@
+"""
+Unit Tests: ScheduleIndex
+
+Verifies that the in-memory schedule index answers the same open/closed and
+recent-schedule questions as ScheduleRepository without per-park queries.
+"""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database.repositories.schedule_repository import ScheduleIndex
+from database.queries.charts.park_shame_history import ParkShameHistoryQuery
+from scripts.collect_snapshots import SnapshotCollector
+
+
+NOW = datetime(2025, 12, 20, 18, 0)
+TODAY = NOW.date()
+YESTERDAY = TODAY - timedelta(days=1)
+
+
+@pytest.fixture
+def index():
+    return ScheduleIndex(
+        start_date=YESTERDAY,
+        end_date=TODAY,
+        intervals=[
+            # Park 1: regular day
+            (1, TODAY, datetime(2025, 12, 20, 15, 0), datetime(2025, 12, 21, 2, 0)),
+            # Park 2: overnight interval from yesterday still running
+            (2, YESTERDAY, datetime(2025, 12, 19, 20, 0), datetime(2025, 12, 20, 19, 0)),
+            # Park 3: long interval overlapping a later short one
+            (3, TODAY, datetime(2025, 12, 20, 10, 0), datetime(2025, 12, 20, 23, 0)),
+            (3, TODAY, datetime(2025, 12, 20, 12, 0), datetime(2025, 12, 20, 13, 0)),
+            # Park 4: closed for the day
+            (4, TODAY, datetime(2025, 12, 20, 8, 0), datetime(2025, 12, 20, 12, 0)),
+        ],
+        last_fetched={
+            1: NOW - timedelta(hours=2),
+            4: NOW - timedelta(hours=30),
+        },
+    )
+
+
+class TestIsParkOpenNow:
+
+    def test_open_within_interval(self, index):
+        assert index.is_park_open_now(1, NOW) is True
+
+    def test_closed_before_opening(self, index):
+        assert index.is_park_open_now(1, datetime(2025, 12, 20, 14, 59)) is False
+
+    def test_closing_time_is_inclusive(self, index):
+        assert index.is_park_open_now(4, datetime(2025, 12, 20, 12, 0)) is True
+        assert index.is_park_open_now(4, NOW) is False
+
+    def test_overnight_interval_from_yesterday(self, index):
+        assert index.is_park_open_now(2, NOW) is True
+
+    def test_overlapping_intervals(self, index):
+        # Latest opening (12:00-13:00) has closed, but the 10:00-23:00 interval hasn't
+        assert index.is_park_open_now(3, NOW) is True
+
+    def test_unknown_park_is_closed(self, index):
+        assert index.is_park_open_now(99, NOW) is False
+
+
+class TestHasRecentSchedule:
+
+    def test_recent_fetch(self, index):
+        assert index.has_recent_schedule(1, max_age_hours=24, now_utc=NOW) is True
+
+    def test_stale_fetch(self, index):
+        assert index.has_recent_schedule(4, max_age_hours=24, now_utc=NOW) is False
+        assert index.has_recent_schedule(4, max_age_hours=48, now_utc=NOW) is True
+
+    def test_never_fetched(self, index):
+        assert index.has_recent_schedule(2, max_age_hours=48, now_utc=NOW) is False
+
+
+class TestOperatingHours:
+
+    def test_covers_window(self, index):
+        assert index.covers(TODAY)
+        assert index.covers(YESTERDAY)
+        assert not index.covers(TODAY + timedelta(days=1))
+
+    def test_earliest_interval_for_date(self, index):
+        hours = index.get_operating_hours(3, TODAY)
+        assert hours == {
+            'opening_time': datetime(2025, 12, 20, 10, 0),
+            'closing_time': datetime(2025, 12, 20, 23, 0),
+        }
+
+    def test_no_schedule_for_date(self, index):
+        assert index.get_operating_hours(1, YESTERDAY) is None
+
+    def test_chart_query_uses_index_for_covered_dates(self, index):
+        session = MagicMock()
+        query = ParkShameHistoryQuery(session, use_hourly_tables=True, schedule_index=index)
+
+        assert query._get_schedule_for_date(3, TODAY)['opening_time'] == datetime(2025, 12, 20, 10, 0)
+        assert query._get_schedule_for_date(1, YESTERDAY) is None
+        session.execute.assert_not_called()
+
+
+class TestCollectorUsesIndex:
+
+    def test_schedule_checks_skip_repository(self, index):
+        with patch('scripts.collect_snapshots.QueueTimesClient'), \
+                patch('scripts.collect_snapshots.get_themeparks_wiki_client'):
+            collector = SnapshotCollector()
+        collector.schedule_index = index
+        schedule_repo = MagicMock()
+
+        source = collector._get_schedule_source(schedule_repo)
+        assert source is index
+
+        parks = [SimpleNamespace(park_id=1, name='Park 1', themeparks_wiki_id='abc')]
+        with patch.object(index, 'has_recent_schedule', return_value=True):
+            refreshed = collector._refresh_schedules_if_needed(parks, schedule_repo)
+
+        assert refreshed == 0
+        schedule_repo.has_recent_schedule.assert_not_called()
+        schedule_repo.fetch_and_store_schedule.assert_not_called()
+
+    def test_falls_back_to_repository_without_index(self):
+        with patch('scripts.collect_snapshots.QueueTimesClient'), \
+                patch('scripts.collect_snapshots.get_themeparks_wiki_client'):
+            collector = SnapshotCollector()
+        schedule_repo = MagicMock()
+
+        assert collector._get_schedule_source(schedule_repo) is schedule_repo
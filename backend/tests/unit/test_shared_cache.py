@@ -0,0 +1,278 @@
+"""
+Shared Query Cache Tests
+========================
+
+SharedQueryCache keeps QueryCache semantics (TTL, LRU bounds, epochs,
+stale-while-revalidate) with entries in a SQLite file, so that all
+gunicorn workers on a host share one cache and one computation per key.
+"""
+
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from utils.config import ConfigurationError
+from utils.shared_cache import SharedQueryCache, default_cache_path
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "query_cache.sqlite3")
+
+
+def _compute_in_child(path, counter_path, results):
+    """Worker process: compute a slow value through the shared cache."""
+    cache = SharedQueryCache(path=path, ttl_seconds=60)
+
+    def compute():
+        with open(counter_path, "a") as f:
+            f.write("x")
+        time.sleep(0.5)
+        return {"rows": [1, 2, 3]}
+
+    results.put(cache.get_or_compute("parks_downtime:abc", compute))
+
+
+class TestSharedQueryCache:
+    """Basic cache behaviour against the SQLite backend."""
+
+    def test_get_set_roundtrip(self, cache_path):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=60)
+
+        cache.set("k", {"parks": [{"id": 1, "name": "Magic Kingdom"}]})
+
+        assert cache.get("k") == {"parks": [{"id": 1, "name": "Magic Kingdom"}]}
+        assert cache.get("missing") is None
+
+    def test_entries_visible_to_other_instances(self, cache_path):
+        writer = SharedQueryCache(path=cache_path, ttl_seconds=60)
+        reader = SharedQueryCache(path=cache_path, ttl_seconds=60)
+
+        writer.set("k", [1, 2, 3])
+
+        assert reader.get("k") == [1, 2, 3]
+        reader.invalidate("k")
+        assert writer.get("k") is None
+
+    def test_expired_entry_is_a_miss(self, cache_path, monkeypatch):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=10)
+        now = [1000.0]
+        monkeypatch.setattr("utils.cache.time.time", lambda: now[0])
+        monkeypatch.setattr("utils.shared_cache.time.time", lambda: now[0])
+
+        cache.set("k", "v")
+        now[0] += 11
+
+        assert cache.get("k") is None
+        assert cache.get_stats()["total_entries"] == 0
+
+    def test_epoch_mismatch_is_a_miss(self, cache_path):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=60)
+
+        cache.set("k", "v", epoch="e1")
+
+        assert cache.get("k", epoch="e1") == "v"
+        assert cache.get("k", epoch="e2") is None
+
+    def test_lru_eviction_by_entry_count(self, cache_path, monkeypatch):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=60, max_entries=2)
+        now = [1000.0]
+        monkeypatch.setattr("utils.cache.time.time", lambda: now[0])
+        monkeypatch.setattr("utils.shared_cache.time.time", lambda: now[0])
+
+        cache.set("a", 1)
+        now[0] += 2
+        cache.set("b", 2)
+        now[0] += 2
+        assert cache.get("a") == 1  # a is now more recently used than b
+        now[0] += 2
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_byte_bound_uses_pickled_size(self, cache_path):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=60, max_bytes=3000)
+
+        for i in range(10):
+            cache.set(f"k{i}", "x" * 1000)
+
+        stats = cache.get_stats()
+        assert stats["bytes"] <= 3000
+        assert stats["total_entries"] < 10
+        assert cache.get("k9") == "x" * 1000
+
+    def test_stats_report_backend(self, cache_path):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=60)
+        cache.set("k", "v")
+
+        stats = cache.get_stats()
+
+        assert stats["backend"] == "sqlite"
+        assert stats["total_entries"] == 1
+
+    def test_stale_value_served_while_refreshing(self, cache_path, monkeypatch):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=10, stale_ttl_seconds=60)
+        now = [1000.0]
+        monkeypatch.setattr("utils.cache.time.time", lambda: now[0])
+        monkeypatch.setattr("utils.shared_cache.time.time", lambda: now[0])
+        cache.set("k", "old")
+        now[0] += 15
+        refreshed = threading.Event()
+
+        def compute():
+            refreshed.set()
+            return "new"
+
+        assert cache.get_or_compute("k", compute, serve_stale=True) == "old"
+        assert refreshed.wait(2)
+        for _ in range(100):
+            if cache.get("k") == "new":
+                break
+            time.sleep(0.01)
+        assert cache.get("k") == "new"
+
+
+class TestCrossProcessCoalescing:
+    """Concurrent misses in different processes compute once."""
+
+    def test_lease_blocks_second_claim(self, cache_path):
+        first = SharedQueryCache(path=cache_path, ttl_seconds=60)
+        second = SharedQueryCache(path=cache_path, ttl_seconds=60)
+
+        assert first._acquire_lease("k") is True
+        assert second._acquire_lease("k") is False
+        first._release_lease("k")
+        assert second._acquire_lease("k") is True
+
+    def test_expired_lease_can_be_taken_over(self, cache_path):
+        first = SharedQueryCache(path=cache_path, ttl_seconds=60, lease_seconds=0.01)
+        second = SharedQueryCache(path=cache_path, ttl_seconds=60)
+
+        assert first._acquire_lease("k") is True
+        time.sleep(0.05)
+
+        assert second._acquire_lease("k") is True
+
+    def test_waiter_computes_when_holder_stores_nothing(self, cache_path):
+        holder = SharedQueryCache(path=cache_path, ttl_seconds=60)
+        waiter = SharedQueryCache(path=cache_path, ttl_seconds=60)
+        holder._acquire_lease("k")
+        threading.Timer(0.1, holder._release_lease, args=("k",)).start()
+
+        assert waiter.get_or_compute("k", lambda: "computed") == "computed"
+
+    def test_concurrent_processes_compute_once(self, cache_path, tmp_path):
+        counter_path = str(tmp_path / "computes.txt")
+        open(counter_path, "w").close()
+        # Create the schema before the workers race on it
+        SharedQueryCache(path=cache_path)
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+
+        workers = [
+            ctx.Process(target=_compute_in_child, args=(cache_path, counter_path, results))
+            for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        values = [results.get(timeout=30) for _ in workers]
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert values == [{"rows": [1, 2, 3]}] * 4
+        with open(counter_path) as f:
+            assert f.read() == "x"
+
+
+class TestFileSafety:
+    """Files other users could have written are refused (entries are pickles)."""
+
+    def test_new_file_is_private(self, cache_path):
+        SharedQueryCache(path=cache_path)
+
+        assert os.stat(cache_path).st_mode & 0o777 == 0o600
+
+    def test_refuses_world_writable_file(self, cache_path):
+        SharedQueryCache(path=cache_path)
+        os.chmod(cache_path, 0o666)
+
+        with pytest.raises(ConfigurationError, match="group/world-writable"):
+            SharedQueryCache(path=cache_path)
+
+    @pytest.mark.skipif(not hasattr(os, "getuid") or os.getuid() != 0, reason="chown needs root")
+    def test_refuses_file_owned_by_another_user(self, cache_path):
+        open(cache_path, "w").close()
+        os.chmod(cache_path, 0o600)
+        os.chown(cache_path, 65534, 65534)
+
+        with pytest.raises(ConfigurationError, match="owned by another user"):
+            SharedQueryCache(path=cache_path)
+
+    def test_refuses_shared_directory_without_sticky_bit(self, tmp_path):
+        shared = tmp_path / "shared"
+        shared.mkdir()
+        os.chmod(shared, 0o777)
+
+        with pytest.raises(ConfigurationError, match="writable by other users"):
+            SharedQueryCache(path=str(shared / "cache.sqlite3"))
+
+    def test_default_path_is_private_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        path = default_cache_path()
+
+        assert path.startswith(str(tmp_path))
+        assert os.stat(os.path.dirname(path)).st_mode & 0o777 == 0o700
+
+    def test_unreadable_entry_is_a_miss(self, cache_path):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=60)
+        cache.set("k", "value")
+        conn = sqlite3.connect(cache_path)
+        conn.execute("UPDATE cache_entries SET value = ?", (b"not a pickle",))
+        conn.commit()
+
+        assert cache.get("k") is None
+        assert cache.get_or_compute("k", lambda: "recomputed") == "recomputed"
+
+    def test_database_errors_are_not_raised(self, cache_path):
+        cache = SharedQueryCache(path=cache_path, ttl_seconds=60)
+        cache.set("k", "value")
+        conn = sqlite3.connect(cache_path)
+        conn.execute("DROP TABLE cache_entries")
+        conn.commit()
+
+        assert cache.get("k") is None
+        cache.invalidate("k")
+        cache.invalidate()
+        assert cache.get_stats()["bytes"] == 0
+
+
+class TestBackendSelection:
+    """The global cache backend is chosen by QUERY_CACHE_BACKEND."""
+
+    def test_sqlite_backend_selected(self, cache_path, monkeypatch):
+        import utils.cache as cache_module
+
+        monkeypatch.setattr(cache_module, "QUERY_CACHE_BACKEND", "sqlite")
+        monkeypatch.setattr(cache_module, "QUERY_CACHE_PATH", cache_path)
+
+        cache = cache_module._create_query_cache()
+
+        assert isinstance(cache, SharedQueryCache)
+        assert cache.get_stats()["max_entries"] == cache_module.QUERY_CACHE_MAX_ENTRIES
+
+    def test_unknown_backend_falls_back_to_memory(self, monkeypatch):
+        import utils.cache as cache_module
+
+        monkeypatch.setattr(cache_module, "QUERY_CACHE_BACKEND", "redis")
+
+        cache = cache_module._create_query_cache()
+
+        assert cache.backend_name == "memory"
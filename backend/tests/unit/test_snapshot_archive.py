@@ -0,0 +1,176 @@
+"""
+Columnar Snapshot Archive Tests
+===============================
+
+Raw snapshots archived before cleanup must read back unchanged and give the
+same daily ride statistics as recompute_daily_stats computes from MySQL.
+"""
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from database.snapshot_archive import (  # noqa: E402
+    NULL,
+    SnapshotArchive,
+    encode_changes,
+    encode_snapshots,
+    ride_day_counts,
+    ride_daily_stats,
+    to_epoch,
+)
+
+DAY = datetime(2026, 1, 14)
+START = DAY + timedelta(hours=15)
+
+
+def _snapshot(ride_id, recorded_at, status='OPERATING', wait_time=30, park_appears_open=1):
+    return {
+        'recorded_at': recorded_at,
+        'ride_id': ride_id,
+        'status': status,
+        'computed_is_open': status == 'OPERATING',
+        'is_open': status == 'OPERATING',
+        'wait_time': wait_time if status == 'OPERATING' else None,
+        'park_appears_open': park_appears_open,
+    }
+
+
+def _change(ride_id, changed_at, new_status, duration):
+    return {
+        'changed_at': changed_at,
+        'ride_id': ride_id,
+        'new_status': new_status,
+        'duration_in_previous_status': duration,
+    }
+
+
+def _cycles(count, start=START):
+    return [start + timedelta(minutes=5 * n) for n in range(count)]
+
+
+class TestEncoding:
+    """Test row -> column encoding."""
+
+    def test_nulls_and_status_codes(self):
+        columns = encode_snapshots([
+            _snapshot(2, START, status='DOWN', park_appears_open=None),
+            {**_snapshot(1, START), 'status': None},
+        ])
+
+        assert columns['status'].tolist() == [1, NULL]
+        assert columns['wait_time'].tolist() == [NULL, 30]
+        assert columns['park_appears_open'].tolist() == [NULL, 1]
+        assert columns['recorded_at'].dtype == np.int64
+
+    def test_empty(self):
+        assert all(len(array) == 0 for array in encode_changes([]).values())
+
+
+class TestSnapshotArchive:
+    """Test appending to and reading from the archive."""
+
+    def test_round_trip_is_memory_mapped(self, tmp_path):
+        archive = SnapshotArchive(tmp_path)
+        rows = [_snapshot(ride_id, t) for t in _cycles(4) for ride_id in (3, 1)]
+        archive.append_park(DAY.date(), 7, encode_snapshots(rows), encode_changes([]), DAY + timedelta(days=1))
+
+        columns = SnapshotArchive(tmp_path).ride_snapshots(7, 1, START, START + timedelta(minutes=10))
+
+        assert columns['recorded_at'].tolist() == [to_epoch(t) for t in _cycles(2)]
+        assert isinstance(SnapshotArchive(tmp_path).load_park(DAY.date(), 7)['snapshots']['ride_id'], np.memmap)
+        assert archive.days() == [DAY.date()]
+
+    def test_append_merges_into_new_version(self, tmp_path):
+        archive = SnapshotArchive(tmp_path)
+        first, second = _cycles(3), _cycles(3, START + timedelta(minutes=15))
+        archive.append_park(DAY.date(), 7, encode_snapshots([_snapshot(1, t) for t in first]),
+                            encode_changes([]), second[0])
+        archive.append_park(DAY.date(), 7, encode_snapshots([_snapshot(1, t) for t in second]),
+                            encode_changes([_change(1, second[0], 1, 45)]), DAY + timedelta(days=1))
+
+        manifest = archive.read_manifest(DAY.date())
+        park_dir = tmp_path / DAY.date().isoformat() / 'park_7'
+
+        assert manifest['parks']['7'] == {
+            'version': 2, 'snapshots': 6, 'changes': 1,
+            'archived_until': (DAY + timedelta(days=1)).isoformat(),
+        }
+        assert sorted(path.name for path in park_dir.iterdir()) == ['v2']
+        assert len(archive.ride_snapshots(7, 1, DAY, DAY + timedelta(days=1))['ride_id']) == 6
+
+    def test_empty_append_only_advances_archived_until(self, tmp_path):
+        archive = SnapshotArchive(tmp_path)
+        until = START + timedelta(hours=1)
+
+        archive.append_park(DAY.date(), 7, encode_snapshots([]), encode_changes([]), until)
+
+        assert archive.archived_until(DAY.date(), 7) == until
+        assert archive.load_park(DAY.date(), 7) is None
+        assert len(archive.ride_snapshots(7, 1, DAY, until)['ride_id']) == 0
+
+    def test_reads_span_utc_days(self, tmp_path):
+        archive = SnapshotArchive(tmp_path)
+        midnight = DAY + timedelta(days=1)
+        for t in (midnight - timedelta(minutes=5), midnight):
+            archive.append_park(t.date(), 7, encode_snapshots([_snapshot(1, t)]),
+                                encode_changes([]), t + timedelta(minutes=5))
+
+        columns = archive.ride_snapshots(7, 1, midnight - timedelta(hours=1), midnight + timedelta(hours=1))
+
+        assert len(columns['ride_id']) == 2
+
+
+class TestRideDailyStats:
+    """Test daily statistics match the recompute_daily_stats SQL rules."""
+
+    def test_statistics(self):
+        rows = (
+            [_snapshot(1, t, wait_time=w) for t, w in zip(_cycles(3), (10, 20, 25))]
+            + [_snapshot(1, t, status='DOWN') for t in _cycles(2, START + timedelta(minutes=15))]
+            + [_snapshot(1, t, status='CLOSED', park_appears_open=0) for t in _cycles(2, START + timedelta(hours=1))]
+            + [_snapshot(1, START + timedelta(hours=2), wait_time=90, park_appears_open=None)]
+        )
+        changes = [_change(1, START + timedelta(minutes=15), 0, 15),
+                   _change(1, START + timedelta(minutes=25), 1, 10)]
+
+        stats = ride_daily_stats(encode_snapshots(rows), encode_changes(changes), 5)
+
+        assert (stats.uptime_minutes, stats.downtime_minutes, stats.operating_hours_minutes) == (15, 10, 25)
+        assert stats.uptime_percentage == Decimal('60.00')
+        assert stats.avg_wait_time == Decimal('18.33')
+        assert (stats.min_wait_time, stats.max_wait_time, stats.peak_wait_time) == (10, 25, 25)
+        assert (stats.status_changes, stats.longest_downtime) == (2, 10)
+
+    def test_never_operated_has_no_downtime(self):
+        rows = [_snapshot(1, t, status='DOWN') for t in _cycles(4)]
+
+        stats = ride_daily_stats(encode_snapshots(rows), encode_changes([]), 5)
+
+        assert (stats.downtime_minutes, stats.uptime_percentage) == (0, Decimal(0))
+        assert stats.avg_wait_time is None
+
+    def test_no_snapshots(self):
+        assert ride_daily_stats(encode_snapshots([]), encode_changes([]), 5) is None
+
+
+class TestRideDayCounts:
+    """Test the snapshot counts used by AggregateVerifier."""
+
+    def test_counts(self):
+        rows = (
+            [_snapshot(1, t) for t in _cycles(2)]
+            + [_snapshot(1, START + timedelta(minutes=10), status='DOWN')]
+            + [_snapshot(1, START + timedelta(minutes=15), status='CLOSED', park_appears_open=0)]
+            + [_snapshot(1, START + timedelta(minutes=20), park_appears_open=None)]
+        )
+
+        assert ride_day_counts(encode_snapshots(rows)) == {
+            'snapshots': 4, 'park_open': 3, 'uptime': 2, 'down': 1, 'operating': 2,
+        }
+
+    def test_without_park_activity(self):
+        assert ride_day_counts(encode_snapshots([_snapshot(1, START, park_appears_open=None)])) is None
@@ -0,0 +1,158 @@
+"""
+Unit Tests: Bulk snapshot insert paths
+
+Verifies insert_many() on the snapshot and status change repositories
+issues chunked multi-row INSERTs, and that SnapshotCollector buffers its
+writes into those bulk paths instead of inserting row by row.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import mysql
+
+from database.repositories.snapshot_repository import (
+    RideStatusSnapshotRepository,
+    ParkActivitySnapshotRepository,
+)
+from database.repositories.status_change_repository import RideStatusChangeRepository
+from scripts.collect_snapshots import SnapshotCollector, ParkFetchResult, PROVIDER_QUEUE_TIMES
+
+
+RECORDED_AT = datetime(2025, 12, 1, 18, 0, 0)
+
+
+def _snapshot(ride_id):
+    return {
+        'ride_id': ride_id,
+        'recorded_at': RECORDED_AT,
+        'wait_time': 30,
+        'is_open': True,
+        'computed_is_open': True,
+        'status': 'OPERATING',
+        'last_updated_api': '2025-12-01T17:58:00Z',
+    }
+
+
+def _executed_statements(session):
+    return [c.args[0] for c in session.execute.call_args_list]
+
+
+class TestRideStatusSnapshotInsertMany:
+    """Tests for RideStatusSnapshotRepository.insert_many()."""
+
+    def test_empty_input_issues_no_statements(self):
+        session = MagicMock()
+        assert RideStatusSnapshotRepository(session).insert_many([]) == 0
+        session.execute.assert_not_called()
+
+    def test_chunks_rows_into_multi_row_inserts(self):
+        session = MagicMock()
+        repo = RideStatusSnapshotRepository(session)
+
+        inserted = repo.insert_many([_snapshot(i) for i in range(25)], batch_size=10)
+
+        assert inserted == 25
+        statements = _executed_statements(session)
+        assert len(statements) == 3
+        session.flush.assert_not_called()
+
+        compiled = statements[0].compile(dialect=mysql.dialect())
+        assert 'INSERT INTO ride_status_snapshots' in str(compiled)
+        assert str(compiled).count('(%s, %s, %s, %s, %s, %s, %s)') == 10
+
+    def test_parses_iso_last_updated_api(self):
+        row = RideStatusSnapshotRepository._to_row(_snapshot(1))
+        assert row['last_updated_api'] == datetime(2025, 12, 1, 17, 58, 0)
+
+
+class TestParkActivityInsertMany:
+    """Tests for ParkActivitySnapshotRepository.insert_many()."""
+
+    def test_single_statement_for_cycle(self):
+        session = MagicMock()
+        repo = ParkActivitySnapshotRepository(session)
+        activities = [
+            {'park_id': park_id, 'recorded_at': RECORDED_AT, 'park_appears_open': True, 'shame_score': 1.5}
+            for park_id in range(80)
+        ]
+
+        assert repo.insert_many(activities) == 80
+        assert len(_executed_statements(session)) == 1
+
+
+class TestRideStatusChangeInsertMany:
+    """Tests for RideStatusChangeRepository.insert_many()."""
+
+    def test_ignores_non_column_keys(self):
+        session = MagicMock()
+        repo = RideStatusChangeRepository(session)
+        change = {
+            'ride_id': 1,
+            'changed_at': RECORDED_AT,
+            'previous_status': True,
+            'new_status': False,
+            'previous_status_enum': 'OPERATING',
+            'new_status_enum': 'DOWN',
+            'duration_in_previous_status': 40,
+            'wait_time_at_change': None,
+        }
+
+        assert repo.insert_many([change]) == 1
+        compiled = str(_executed_statements(session)[0].compile(dialect=mysql.dialect()))
+        assert 'status_enum' not in compiled
+
+
+class TestCollectorBuffering:
+    """Tests that SnapshotCollector writes through the bulk paths."""
+
+    def _collector(self):
+        with patch('scripts.collect_snapshots.QueueTimesClient'), \
+                patch('scripts.collect_snapshots.get_themeparks_wiki_client'):
+            return SnapshotCollector()
+
+    def test_park_rides_written_in_one_bulk_call(self):
+        collector = self._collector()
+        park = SimpleNamespace(park_id=1, name='Test Park', themeparks_wiki_id=None, queue_times_id=10)
+        rides = [{'id': i, 'name': f'Ride {i}', 'wait_time': 20, 'is_open': True} for i in range(5)]
+        fetch_result = ParkFetchResult(park_id=1, provider=PROVIDER_QUEUE_TIMES, data={'rides': rides})
+
+        ride_repo = MagicMock()
+        ride_repo.get_by_queue_times_id.side_effect = lambda qt_id: SimpleNamespace(
+            ride_id=100 + qt_id, name=f'Ride {qt_id}', category='ATTRACTION'
+        )
+        snapshot_repo = MagicMock()
+        snapshot_repo.get_latest_by_ride.return_value = None
+        snapshot_repo.insert_many.side_effect = len
+        status_change_repo = MagicMock()
+        park_activity_repo = MagicMock()
+        schedule_repo = MagicMock()
+        schedule_repo.is_park_open_now.return_value = True
+
+        with patch.object(SnapshotCollector, 'calculate_shame_score', return_value=0.0):
+            collector._process_park(park, fetch_result, park_activity_repo, ride_repo, snapshot_repo,
+                                    status_change_repo, schedule_repo, MagicMock(), RECORDED_AT)
+
+        snapshot_repo.insert.assert_not_called()
+        snapshot_repo.insert_many.assert_called_once()
+        assert len(snapshot_repo.insert_many.call_args.args[0]) == 5
+        assert collector.stats['snapshots_created'] == 5
+        status_change_repo.insert_many.assert_not_called()
+
+        # Park activity is held until the end of the cycle
+        park_activity_repo.insert.assert_not_called()
+        collector._flush_park_activity(park_activity_repo)
+        park_activity_repo.insert_many.assert_called_once()
+
+    def test_failed_bulk_write_counts_error(self):
+        collector = self._collector()
+        collector._pending_snapshots = [_snapshot(1)]
+        snapshot_repo = MagicMock()
+        snapshot_repo.insert_many.side_effect = Exception("deadlock")
+
+        collector._flush_ride_writes(snapshot_repo, MagicMock())
+
+        assert collector.stats['errors'] == 1
+        assert collector.stats['snapshots_created'] == 0
+        assert collector._pending_snapshots == []
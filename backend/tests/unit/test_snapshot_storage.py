@@ -0,0 +1,211 @@
+"""
+Compact Snapshot Storage Tests
+==============================
+
+In compact storage mode ride snapshots are stored as change-only intervals
+and expanded back over each park's collection cycles; expanding must give
+back exactly the snapshots that were stored.
+"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import mysql
+
+from database.repositories.snapshot_repository import RideStatusSnapshotRepository
+from database.snapshot_storage import (
+    STORAGE_COMPACT,
+    compact_snapshots,
+    convert_to_compact,
+    expand_intervals,
+    plan_intervals,
+    same_state,
+)
+
+START = datetime(2026, 1, 15, 14, 0)
+CYCLES = [START + timedelta(minutes=5 * n) for n in range(8)]
+
+
+def _snapshot(ride_id, recorded_at, status='OPERATING', wait_time=30, park_id=1):
+    return {
+        'park_id': park_id,
+        'ride_id': ride_id,
+        'recorded_at': recorded_at,
+        'status': status,
+        'computed_is_open': status == 'OPERATING',
+        'is_open': status == 'OPERATING',
+        'wait_time': wait_time if status == 'OPERATING' else None,
+        'last_updated_api': recorded_at - timedelta(minutes=1),
+    }
+
+
+def _state(row):
+    return (row['ride_id'], row['recorded_at'], row['status'], bool(row['computed_is_open']),
+            row['is_open'], row['wait_time'])
+
+
+class TestSameState:
+    """Test when a snapshot may extend an interval."""
+
+    def test_identical_state(self):
+        assert same_state(_snapshot(1, START), _snapshot(1, CYCLES[1]))
+
+    def test_status_change(self):
+        assert not same_state(_snapshot(1, START), _snapshot(1, CYCLES[1], status='DOWN'))
+
+    def test_wait_time_tolerance(self):
+        interval = _snapshot(1, START, wait_time=30)
+
+        assert not same_state(interval, _snapshot(1, CYCLES[1], wait_time=35))
+        assert same_state(interval, _snapshot(1, CYCLES[1], wait_time=35), tolerance=5)
+        assert not same_state(interval, _snapshot(1, CYCLES[1], wait_time=36), tolerance=5)
+
+    def test_null_wait_time_only_matches_null(self):
+        interval = _snapshot(1, START, wait_time=None)
+
+        assert not same_state(interval, _snapshot(1, CYCLES[1], wait_time=0), tolerance=5)
+
+    def test_mysql_booleans(self):
+        interval = {**_snapshot(1, START), 'computed_is_open': 1, 'is_open': 1}
+
+        assert same_state(interval, _snapshot(1, CYCLES[1]))
+
+
+class TestPlanIntervals:
+    """Test the rows upserted for one collection cycle."""
+
+    def test_extends_matching_open_interval(self):
+        open_interval = {**_snapshot(1, START), 'interval_id': 7, 'valid_from': START,
+                         'valid_to': START, 'samples': 1}
+
+        [row] = plan_intervals([_snapshot(1, CYCLES[1])], {1: open_interval})
+
+        assert row['interval_id'] == 7
+        assert (row['valid_from'], row['valid_to'], row['samples']) == (START, CYCLES[1], 2)
+
+    def test_change_or_no_open_interval_starts_new_one(self):
+        open_interval = {**_snapshot(1, START), 'interval_id': 7, 'valid_from': START,
+                         'valid_to': START, 'samples': 1}
+
+        rows = plan_intervals(
+            [_snapshot(1, CYCLES[1], status='DOWN'), _snapshot(2, CYCLES[1])], {1: open_interval}
+        )
+
+        assert [row['interval_id'] for row in rows] == [None, None]
+        assert all(row['valid_from'] == row['valid_to'] == CYCLES[1] for row in rows)
+
+
+class TestRoundTrip:
+    """Compacting then expanding gives back the stored snapshots."""
+
+    def snapshots(self):
+        rows = []
+        for n, recorded_at in enumerate(CYCLES):
+            rows.append(_snapshot(1, recorded_at, status='DOWN' if 3 <= n <= 4 else 'OPERATING'))
+            if n != 5:  # ride 2 missing from one cycle
+                rows.append(_snapshot(2, recorded_at, wait_time=10 + n))
+        return sorted(rows, key=lambda row: (row['ride_id'], row['recorded_at']))
+
+    def test_exact_round_trip(self):
+        snapshots = self.snapshots()
+
+        intervals, skipped = compact_snapshots(snapshots, {1: CYCLES})
+        expanded = list(expand_intervals(intervals, {1: 1, 2: 1}, {1: CYCLES}))
+
+        assert skipped == 0
+        # ride 1: OPERATING, DOWN, OPERATING; ride 2 changes wait time every cycle
+        assert len([i for i in intervals if i['ride_id'] == 1]) == 3
+        assert sorted(map(_state, expanded)) == sorted(map(_state, snapshots))
+
+    def test_gap_in_reporting_is_not_filled(self):
+        snapshots = [_snapshot(1, CYCLES[0]), _snapshot(1, CYCLES[2])]
+
+        intervals, _ = compact_snapshots(snapshots, {1: CYCLES})
+        expanded = list(expand_intervals(intervals, {1: 1}, {1: CYCLES}))
+
+        assert len(intervals) == 2
+        assert [row['recorded_at'] for row in expanded] == [CYCLES[0], CYCLES[2]]
+
+    def test_tolerance_merges_small_wait_time_changes(self):
+        snapshots = [s for s in self.snapshots() if s['ride_id'] == 2]
+
+        intervals, _ = compact_snapshots(snapshots, {1: CYCLES}, tolerance=10)
+
+        # the missing cycle still splits the run
+        assert len(intervals) == 2
+        assert sum(interval['samples'] for interval in intervals) == len(snapshots)
+
+    def test_snapshots_without_park_cycle_are_skipped(self):
+        snapshots = [_snapshot(1, CYCLES[0]), _snapshot(1, CYCLES[0] + timedelta(minutes=1))]
+
+        intervals, skipped = compact_snapshots(snapshots, {1: CYCLES})
+
+        assert (len(intervals), skipped) == (1, 1)
+
+
+class TestConvertToCompact:
+    """Conversion refuses to drop snapshots it cannot represent."""
+
+    def conn(self, snapshots, cycles):
+        """Connection answering the conversion's reads; records every statement."""
+        conn = MagicMock()
+        statements = []
+
+        def execute(statement, *args):
+            sql = str(statement)
+            statements.append(sql)
+            result = MagicMock()
+            if 'FROM park_activity_snapshots ORDER BY' in sql:
+                result.__iter__.return_value = [SimpleNamespace(park_id=1, recorded_at=c) for c in cycles]
+            elif 'rss.last_updated_api' in sql:
+                result.mappings.return_value = snapshots
+            elif 'COUNT(*) FROM ride_status_snapshots' in sql:
+                result.scalar.return_value = len(snapshots)
+            elif 'COUNT(*) FROM (' in sql:
+                result.scalar.return_value = len(snapshots) - 1
+            return result
+
+        conn.execute.side_effect = execute
+        conn.statements = statements
+        return conn
+
+    def snapshots(self):
+        # the second snapshot has no park cycle
+        return [_snapshot(1, CYCLES[0]), _snapshot(1, CYCLES[0] + timedelta(minutes=1)), _snapshot(1, CYCLES[1])]
+
+    def test_aborts_before_changing_anything(self):
+        conn = self.conn(self.snapshots(), CYCLES)
+
+        with pytest.raises(RuntimeError, match="1 snapshots .* would be dropped"):
+            convert_to_compact(conn)
+
+        assert not any(sql.lstrip().startswith(('DELETE', 'RENAME', 'CREATE', 'TRUNCATE'))
+                       for sql in conn.statements)
+
+    def test_allow_drop_converts(self):
+        conn = self.conn(self.snapshots(), CYCLES)
+
+        stats = convert_to_compact(conn, allow_drop=True)
+
+        assert stats == {"snapshots": 3, "intervals": 1, "skipped": 1}
+        assert any(sql.startswith('CREATE VIEW ride_status_snapshots') for sql in conn.statements)
+
+
+class TestCompactRepository:
+    """Test RideStatusSnapshotRepository writes in compact mode."""
+
+    def test_insert_many_upserts_intervals(self):
+        session = MagicMock()
+        session.execute.return_value = []
+        repo = RideStatusSnapshotRepository(session, storage_mode=STORAGE_COMPACT)
+
+        recorded = repo.insert_many([_snapshot(ride_id, START) for ride_id in (1, 2, 3)])
+
+        assert recorded == 3
+        lookup, upsert = [c.args[0] for c in session.execute.call_args_list]
+        assert 'valid_to = (' in str(lookup)
+        sql = str(upsert.compile(dialect=mysql.dialect()))
+        assert sql.startswith('INSERT INTO ride_status_intervals')
+        assert 'ON DUPLICATE KEY UPDATE' in sql
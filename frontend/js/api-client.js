@@ -21,6 +21,12 @@ class APIClient {
         this._cache = {};
         this._cacheTTL = 5 * 60 * 1000; // 5 minutes in milliseconds
 
+        // Static snapshots (see config.js STATIC_API_BASE_URL)
+        this.staticBaseUrl = (window.APP_CONFIG && window.APP_CONFIG.STATIC_API_BASE_URL) || null;
+        this._staticMaxAge = ((window.APP_CONFIG && window.APP_CONFIG.STATIC_MAX_AGE_SECONDS) || 1200) * 1000;
+        this._staticManifest = null; // { files: Set, generatedAt, loadedAt }
+        this._staticManifestTTL = 60 * 1000; // Re-read manifest every minute
+
         console.log(`API Client initialized with base URL: ${this.baseUrl}`);
     }
 
@@ -63,6 +69,74 @@ class APIClient {
         };
     }
 
+    /**
+     * Static snapshot file path for a request, as built by publish_static.py
+     * (params sorted by name, joined with commas; "default" when none)
+     * @param {string} endpoint - API endpoint (e.g., '/parks/downtime')
+     * @param {Object} params - Query parameters
+     * @returns {string} Relative file path
+     */
+    _staticPath(endpoint, params) {
+        const names = Object.keys(params)
+            .filter(key => params[key] !== null && params[key] !== undefined)
+            .sort();
+        const name = names.map(key => `${key}=${params[key]}`).join(',') || 'default';
+        return `${endpoint.replace(/^\/+|\/+$/g, '')}/${name}.json`;
+    }
+
+    /**
+     * Load the static snapshot manifest (cached for a minute)
+     * @returns {Promise<Set|null>} Published file paths, or null if unavailable or too old
+     */
+    async _getStaticFiles() {
+        const now = Date.now();
+        if (!this._staticManifest || (now - this._staticManifest.loadedAt) >= this._staticManifestTTL) {
+            try {
+                const response = await fetch(`${this.staticBaseUrl}/manifest.json`, { cache: 'no-cache' });
+                const manifest = response.ok ? await response.json() : {};
+                this._staticManifest = {
+                    files: manifest.files ? new Set(Object.keys(manifest.files)) : null,
+                    generatedAt: Date.parse(manifest.generated_at),
+                    loadedAt: now
+                };
+            } catch (error) {
+                this._staticManifest = { files: null, generatedAt: NaN, loadedAt: now };
+            }
+        }
+
+        // Every file of a version was rendered when its manifest was written,
+        // so the manifest's age is the age of all of them (response bodies do
+        // not all carry cached_at). Too old: the publisher stopped running.
+        const { files, generatedAt } = this._staticManifest;
+        if (!files || !(now - generatedAt <= this._staticMaxAge)) return null;
+        return files;
+    }
+
+    /**
+     * Read a response from the published static snapshots
+     * @param {string} endpoint - API endpoint (e.g., '/parks/downtime')
+     * @param {Object} params - Query parameters
+     * @returns {Promise<Object|null>} Response data, or null to use the API
+     */
+    async _getStatic(endpoint, params) {
+        if (!this.staticBaseUrl || endpoint.includes('?')) return null;
+
+        const files = await this._getStaticFiles();
+        const path = this._staticPath(endpoint, params);
+        if (!files || !files.has(path)) return null;
+
+        try {
+            const response = await fetch(`${this.staticBaseUrl}/${path}`, { cache: 'no-cache' });
+            if (!response.ok) return null;
+
+            const data = await response.json();
+            console.log(`API STATIC HIT: ${path}`);
+            return data;
+        } catch (error) {
+            return null;
+        }
+    }
+
     /**
      * Make a GET request to the API
      * @param {string} endpoint - API endpoint (e.g., '/parks/downtime')
@@ -96,6 +170,13 @@ class APIClient {
                 return cached;
             }
 
+            // Published static snapshot, with the API as the fallback
+            const staticData = await this._getStatic(endpoint, params);
+            if (staticData) {
+                this._setCache(cacheKey, staticData);
+                return staticData;
+            }
+
             console.log(`API GET: ${url.href}`);
 
             const response = await fetch(url, {
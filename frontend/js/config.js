@@ -33,6 +33,17 @@ const CONFIG = {
     // For production deployment, uncomment and set your backend URL:
     // API_BASE_URL: 'https://your-backend-api.com/api',
 
+    // Static JSON snapshots published by backend/src/scripts/publish_static.py
+    // (served by Apache from STATIC_SNAPSHOT_DIR/current). Requests listed in
+    // the snapshot manifest are read from there first, with the API as the
+    // fallback. null disables static snapshots (local development).
+    STATIC_API_BASE_URL: (['localhost', '127.0.0.1'].includes(window.location.hostname) || window.location.protocol === 'file:')
+        ? null
+        : '/static-api',
+
+    // Snapshots older than this are ignored in favour of the API (seconds)
+    STATIC_MAX_AGE_SECONDS: 1200,
+
     // Feature Flags (for future use)
     FEATURES: {
         PARK_DETAILS: true,